@@ -0,0 +1,194 @@
+"""
+ASGI altında olay döngüsünü bloklamadan çalışan herkese açık uç noktalar.
+
+Veritabanı okumaları async ORM, önbellek okumaları async önbellek
+çağrılarıyla yapılır; önbellek ve veritabanı beklenirken işçi başka
+istekleri işleyebilir. WSGI altında da çalışırlar, ancak orada her istek
+yine bir iş parçacığını meşgul eder.
+"""
+
+import hashlib
+import json
+
+from django import forms
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.http import require_safe
+
+from ayarlar.models import Il, Ilce
+from ilanlar.models import (
+    CalismaModeliChoices,
+    CalismaYeriChoices,
+    DeneyimDuzeyiChoices,
+    EgitimDuzeyiChoices,
+    IlanDurumChoices,
+    IsBilgileri,
+)
+from ortak.istatistik import aistatistikler
+from ortak.onbellek import ahesapla_veya_getir, asurumler
+from ortak.sorgu_profili import sorgu_butcesi
+
+from .pagination import KimlikCursorPagination
+from .serializers import IlceSerializer, IlSerializer, IsBilgileriSerializer
+
+
+class IlanAramaFormu(forms.Form):
+    """
+    İlan listesi filtreleri.
+
+    İlişkiler kimlikle filtrelenir; alanlar veritabanı sorgusu yapmadan
+    doğrulanır.
+    """
+
+    il = forms.IntegerField(required=False, min_value=1)
+    ilce = forms.IntegerField(required=False, min_value=1)
+    sektor = forms.IntegerField(required=False, min_value=1)
+    calisma_modeli = forms.ChoiceField(
+        required=False, choices=CalismaModeliChoices.choices
+    )
+    calisma_yeri = forms.ChoiceField(required=False, choices=CalismaYeriChoices.choices)
+    egitim_duzey = forms.ChoiceField(
+        required=False, choices=EgitimDuzeyiChoices.choices
+    )
+    deneyim_duzey = forms.ChoiceField(
+        required=False, choices=DeneyimDuzeyiChoices.choices
+    )
+    one_cikartilmis = forms.NullBooleanField(required=False)
+    sonra = forms.IntegerField(required=False, min_value=1)
+    limit = forms.IntegerField(
+        required=False, min_value=1, max_value=KimlikCursorPagination.max_page_size
+    )
+
+    def filtreler(self):
+        return {
+            ad: deger
+            for ad, deger in self.cleaned_data.items()
+            if ad not in ("sonra", "limit") and deger not in (None, "")
+        }
+
+
+def _json(veri):
+    return json.dumps(veri, cls=DjangoJSONEncoder, ensure_ascii=False).encode()
+
+
+def _json_yanit(icerik):
+    return HttpResponse(icerik, content_type="application/json")
+
+
+# Bulunamayan kayıtlar da önbelleğe alınır; None saklanmadığı için boş içerik
+# "bulunamadı" anlamına gelir.
+BULUNAMADI = b""
+
+
+def _istek_anahtari(ad, parametreler=None, surumler=None):
+    """
+    Uç nokta adı ve doğrulanmış parametrelerden önbellek anahtarı üret.
+
+    Anahtar ham sorgu dizesinden üretilmez; tanınmayan parametreler veya
+    farklı parametre sırası aynı kayda düşer.
+    """
+    degerler = sorted(
+        (alan, deger)
+        for alan, deger in (parametreler or {}).items()
+        if deger not in (None, "")
+    )
+    ozet = hashlib.md5(_json(degerler), usedforsecurity=False).hexdigest()
+    surum = ".".join(str(deger) for deger in (surumler or {}).values())
+    return f"api:{ad}:{ozet}:{surum}"
+
+
+@require_safe
+@sorgu_butcesi(3)
+async def ilanlar(request):
+    """
+    Yayındaki ilanlar; ``/api/v1/ilanlar/`` ile aynı filtreleri ve gösterimi
+    kullanır.
+
+    Sayfalama ``?sonra=<id>`` ile yapılır; yanıttaki ``sonraki`` değeri bir
+    sonraki sayfanın imlecidir. Yanıt ilan sürümüne bağlı önbellekte tutulur.
+    """
+    form = IlanAramaFormu(request.GET)
+    if not form.is_valid():
+        return JsonResponse(form.errors, status=400)
+
+    async def olustur():
+        limit = form.cleaned_data["limit"] or KimlikCursorPagination.page_size
+        queryset = (
+            IsBilgileri.objects.filter(
+                durum=IlanDurumChoices.YAYINDA, **form.filtreler()
+            )
+            .select_related("firma", "sektor", "il", "ilce")
+            .prefetch_related("anahtar_kelimeler", "istenen_diller")
+            .order_by("-id")
+        )
+        if form.cleaned_data["sonra"]:
+            queryset = queryset.filter(pk__lt=form.cleaned_data["sonra"])
+        kayitlar = [ilan async for ilan in queryset[: limit + 1]]
+        sayfa = kayitlar[:limit]
+        return _json(
+            {
+                "sonraki": sayfa[-1].pk if len(kayitlar) > limit else None,
+                "sonuclar": IsBilgileriSerializer(sayfa, many=True).data,
+            }
+        )
+
+    return _json_yanit(
+        await ahesapla_veya_getir(
+            _istek_anahtari("ilanlar", form.cleaned_data, await asurumler("ilan")),
+            olustur,
+            settings.SAYFA_ONBELLEK_SURESI,
+        )
+    )
+
+
+@require_safe
+@sorgu_butcesi(1)
+async def iller(request):
+    """Tüm iller."""
+
+    async def olustur():
+        return _json([IlSerializer(il).data async for il in Il.objects.all()])
+
+    return _json_yanit(
+        await ahesapla_veya_getir(
+            _istek_anahtari("iller", surumler=await asurumler("cografya")),
+            olustur,
+            settings.SAYFA_ONBELLEK_SURESI,
+        )
+    )
+
+
+@require_safe
+@sorgu_butcesi(2)
+async def ilceler(request, il):
+    """Slug'ı verilen ilin ilçeleri; il bulunamazsa 404."""
+
+    async def olustur():
+        il_kimligi = (
+            await Il.objects.filter(slug=il).values_list("pk", flat=True).afirst()
+        )
+        if il_kimligi is None:
+            return BULUNAMADI
+        return _json(
+            [
+                IlceSerializer(ilce).data
+                async for ilce in Ilce.objects.filter(il_id=il_kimligi)
+            ]
+        )
+
+    icerik = await ahesapla_veya_getir(
+        _istek_anahtari("ilceler", {"il": il}, await asurumler("cografya")),
+        olustur,
+        settings.SAYFA_ONBELLEK_SURESI,
+    )
+    if icerik == BULUNAMADI:
+        return JsonResponse({"detail": "Bulunamadı."}, status=404)
+    return _json_yanit(icerik)
+
+
+@require_safe
+@sorgu_butcesi(1)
+async def istatistikler(request):
+    """Platform istatistikleri."""
+    return JsonResponse(await aistatistikler())
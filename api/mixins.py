@@ -0,0 +1,120 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from ortak.onbellek import surumler
+
+
+class SeciliAlanlarMixin:
+    """
+    ``?fields=a,b`` parametresiyle yalnızca istenen alanları döndüren serializer.
+
+    Parametre verilmezse tüm alanlar döndürülür; tanımsız alan adları yok
+    sayılır.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        istenen = istenen_alanlar(self.context.get("request"))
+        if istenen is None:
+            return
+        for alan_adi in set(self.fields) - istenen:
+            self.fields.pop(alan_adi)
+
+
+def istenen_alanlar(request):
+    """İstekteki ``fields`` parametresini küme olarak döndür; yoksa None."""
+    if request is None:
+        return None
+    deger = request.query_params.get("fields")
+    if not deger:
+        return None
+    return {alan.strip() for alan in deger.split(",") if alan.strip()}
+
+
+class SeciliPrefetchMixin:
+    """
+    Yalnızca istenen alanların ihtiyaç duyduğu ilişkileri önceden yükler.
+
+    ``prefetch_alanlari`` serializer alan adını prefetch ifadesine eşler.
+    """
+
+    prefetch_alanlari = {}
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        istenen = istenen_alanlar(self.request)
+        prefetchler = [
+            prefetch
+            for alan_adi, prefetch in self.prefetch_alanlari.items()
+            if istenen is None or alan_adi in istenen
+        ]
+        return queryset.prefetch_related(*prefetchler)
+
+
+class KosulluGetMixin:
+    """
+    ``guncelleme_tarihi`` alanından ETag ve Last-Modified üreten viewset eki.
+
+    İstemci önceki yanıtın ETag değerini gönderirse ve kayıtlar değişmemişse,
+    serileştirme yapılmadan 304 döndürülür. Liste için imza, filtrelenmiş
+    kümedeki en son güncelleme tarihi ile kayıt sayısından tek bir toplama
+    sorgusuyla hesaplanır. Yanıtta gösterilen ilişkili kayıtlar (firma adı,
+    il, anahtar kelimeler vb.) ``guncelleme_tarihi`` alanını değiştirmediği
+    için imzaya ``surum_adlari`` sürümleri de eklenir. Aynı nedenle
+    ``If-Modified-Since`` ile 304 verilmez; Last-Modified yalnızca bilgi
+    amaçlıdır.
+    """
+
+    degisiklik_alani = "guncelleme_tarihi"
+    surum_adlari = ()
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        ozet = queryset.order_by().aggregate(
+            son=Max(self.degisiklik_alani), adet=Count("pk")
+        )
+        return self._kosullu(
+            request,
+            ozet["son"],
+            f"{ozet['son']}:{ozet['adet']}",
+            lambda: super(KosulluGetMixin, self).list(request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        son = (
+            self.get_queryset()
+            .prefetch_related(None)
+            .filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+            .values_list(self.degisiklik_alani, flat=True)
+            .first()
+        )
+        return self._kosullu(
+            request,
+            son,
+            str(son),
+            lambda: super(KosulluGetMixin, self).retrieve(request, *args, **kwargs),
+        )
+
+    def _kosullu(self, request, son, imza, yanit_uret):
+        if son is None:
+            return yanit_uret()
+
+        surum = ".".join(str(deger) for deger in surumler(*self.surum_adlari).values())
+        etag = quote_etag(
+            hashlib.md5(
+                f"{request.get_full_path()}|{surum}|{imza}".encode(),
+                usedforsecurity=False,
+            ).hexdigest()
+        )
+        son_degisiklik = int(son.timestamp())
+
+        yanit = get_conditional_response(request, etag=etag)
+        if yanit is None:
+            yanit = yanit_uret()
+        yanit.headers["ETag"] = etag
+        yanit.headers["Last-Modified"] = http_date(son_degisiklik)
+        return yanit
@@ -0,0 +1,15 @@
+from rest_framework.pagination import CursorPagination
+
+
+class KimlikCursorPagination(CursorPagination):
+    """
+    Birincil anahtara göre imleçli sayfalama.
+
+    OFFSET kullanmadığı için derin sayfalarda da sabit maliyetlidir ve
+    sayfalar arasında eklenen kayıtlar tekrar veya atlamaya yol açmaz.
+    """
+
+    ordering = "-id"
+    page_size = 20
+    page_size_query_param = "limit"
+    max_page_size = 100
@@ -0,0 +1,152 @@
+from rest_framework import serializers
+
+from ayarlar.models import Il, Ilce, Meslek, Sektor
+from hesap.models import Firma, UstalikAlani, Vatandas
+from ilanlar.models import IlanDil, IsBilgileri
+
+from .mixins import SeciliAlanlarMixin
+
+
+class IlSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Il
+        fields = ("ad", "slug")
+
+
+class IlceSerializer(serializers.ModelSerializer):
+    # Ilce.__str__ il sorgusu yaptığı için yalnızca ilçenin kendi alanları
+    class Meta:
+        model = Ilce
+        fields = ("ad", "slug")
+
+
+class SektorSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Sektor
+        fields = ("ad", "slug")
+
+
+class MeslekSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Meslek
+        fields = ("ad", "slug")
+
+
+class FirmaOzetSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Firma
+        fields = ("ad", "slug")
+
+
+class IlanDilSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = IlanDil
+        fields = ("dil", "seviye", "zorunlu")
+
+
+class IsBilgileriSerializer(SeciliAlanlarMixin, serializers.ModelSerializer):
+    """Yayındaki iş ilanlarının herkese açık gösterimi."""
+
+    firma = FirmaOzetSerializer(read_only=True)
+    sektor = SektorSerializer(read_only=True)
+    il = IlSerializer(read_only=True)
+    ilce = IlceSerializer(read_only=True)
+    maas_bilgisi = serializers.SerializerMethodField()
+    anahtar_kelimeler = serializers.SlugRelatedField(
+        many=True, read_only=True, slug_field="anahtar_kelime"
+    )
+    istenen_diller = IlanDilSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = IsBilgileri
+        fields = (
+            "uuid",
+            "slug",
+            "baslik",
+            "pozisyon",
+            "firma",
+            "sektor",
+            "departman",
+            "aciklama",
+            "calisma_modeli",
+            "calisma_yeri",
+            "il",
+            "ilce",
+            "gerekli_nitelikler",
+            "tercih_nitelikleri",
+            "egitim_duzey",
+            "deneyim_duzey",
+            "maas_bilgisi",
+            "yan_haklar",
+            "basvuru_baslangic",
+            "basvuru_bitis",
+            "alinacak_kisi",
+            "one_cikartilmis",
+            "anahtar_kelimeler",
+            "istenen_diller",
+            "yayinlanma_tarihi",
+            "guncelleme_tarihi",
+        )
+
+    def get_maas_bilgisi(self, obj):
+        return None if obj.maas_gizli else obj.maas_bilgisi
+
+
+class FirmaSerializer(SeciliAlanlarMixin, serializers.ModelSerializer):
+    """Aktif firmaların herkese açık gösterimi."""
+
+    il = IlSerializer(read_only=True)
+    ilce = IlceSerializer(read_only=True)
+    sektorler = SektorSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Firma
+        fields = (
+            "slug",
+            "ad",
+            "logo",
+            "aciklama",
+            "email",
+            "telefon",
+            "web_sitesi",
+            "il",
+            "ilce",
+            "sektorler",
+            "kurulus_yili",
+            "calisan_sayisi",
+            "guncelleme_tarihi",
+        )
+
+
+class UstalikAlaniSerializer(serializers.ModelSerializer):
+    meslek = MeslekSerializer(read_only=True)
+
+    class Meta:
+        model = UstalikAlani
+        fields = ("meslek", "deneyim_yili", "aciklama", "fiyat_bilgisi")
+
+
+class UstaSerializer(SeciliAlanlarMixin, serializers.ModelSerializer):
+    """Usta profillerinin herkese açık gösterimi (iletişim bilgileri hariç)."""
+
+    ad_soyad = serializers.SerializerMethodField()
+    il = IlSerializer(read_only=True)
+    ilce = IlceSerializer(read_only=True)
+    ustalik_alanlari = UstalikAlaniSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Vatandas
+        fields = (
+            "uuid",
+            "ad_soyad",
+            "profil_fotografi",
+            "usta_unvani",
+            "usta_aciklama",
+            "il",
+            "ilce",
+            "ustalik_alanlari",
+            "guncelleme_tarihi",
+        )
+
+    def get_ad_soyad(self, obj):
+        return obj.kullanici.get_full_name() or obj.kullanici.username
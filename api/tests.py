@@ -0,0 +1,277 @@
+import asyncio
+import datetime
+import time
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from ayarlar.models import Il, Ilce, Sektor
+from hesap.models import Firma, Kullanici, Vatandas
+from ilanlar.models import (
+    BasvuruCevap,
+    IlanBasvuru,
+    IlanDegisiklik,
+    IlanDurumChoices,
+    IlanSoru,
+    IsBilgileri,
+)
+
+
+def _ilan(firma, baslik, durum=IlanDurumChoices.YAYINDA, **alanlar):
+    return IsBilgileri.objects.create(
+        baslik=baslik,
+        firma=firma,
+        pozisyon="Geliştirici",
+        aciklama="Açıklama",
+        gerekli_nitelikler="Nitelikler",
+        basvuru_baslangic=datetime.date.today(),
+        durum=durum,
+        sektor=firma.sektorler.first(),
+        il=firma.il,
+        ilce=firma.ilce,
+        **alanlar,
+    )
+
+
+def _firma():
+    il = Il.objects.create(ad="Sivas")
+    ilce = Ilce.objects.create(il=il, ad="Merkez")
+    firma = Firma.objects.create(ad="Firma A", il=il, ilce=ilce)
+    firma.sektorler.add(Sektor.objects.create(ad="Bilişim"))
+    return firma
+
+
+class AsenkronIlcelerTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    async def test_bulunamayan_il_eszamanli_isteklerde_beklemez(self):
+        baslangic = time.monotonic()
+        yanitlar = await asyncio.gather(
+            *(
+                self.async_client.get("/api/v1/asenkron/iller/yok/ilceler/")
+                for _ in range(3)
+            )
+        )
+        self.assertEqual({yanit.status_code for yanit in yanitlar}, {404})
+        self.assertLess(time.monotonic() - baslangic, 2)
+
+    def test_bulunamadi_ve_fazladan_parametreler_onbellekten_doner(self):
+        Il.objects.create(ad="Sivas")
+        self.assertEqual(
+            self.client.get("/api/v1/asenkron/iller/yok/ilceler/").status_code, 404
+        )
+        with CaptureQueriesContext(connection) as sorgular:
+            yanit = self.client.get("/api/v1/asenkron/iller/yok/ilceler/?x=1")
+            self.client.get("/api/v1/asenkron/iller/?x=1&y=2")
+            self.client.get("/api/v1/asenkron/iller/?y=3")
+        self.assertEqual(yanit.status_code, 404)
+        # Yalnızca ilk iller isteği veritabanına gider
+        self.assertEqual(len(sorgular), 1)
+
+
+class BasvurTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        firma = _firma()
+        cls.ilan = _ilan(firma, "Yayındaki İlan")
+        cls.taslak = _ilan(firma, "Taslak İlan", durum=IlanDurumChoices.TASLAK)
+        cls.soru = IlanSoru.objects.create(
+            ilan=cls.ilan,
+            soru="Ehliyetiniz var mı?",
+            soru_tipi=IlanSoru.SoruTipiChoices.EVET_HAYIR,
+        )
+        cls.kullanici = Kullanici.objects.create_user("vatandas")
+        cls.vatandas = Vatandas.objects.create(kullanici=cls.kullanici)
+        cls.yol = f"/api/v1/ilanlar/{cls.ilan.slug}/basvur/"
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.client.force_login(self.kullanici)
+
+    def _basvur(self, cevaplar, yol=None):
+        return self.client.post(
+            yol or self.yol, {"cevaplar": cevaplar}, content_type="application/json"
+        )
+
+    def test_basvuru_olusturulur(self):
+        yanit = self._basvur({str(self.soru.pk): "evet"})
+        self.assertEqual(yanit.status_code, 201)
+        basvuru = IlanBasvuru.objects.get(uuid=yanit.json()["uuid"])
+        self.assertEqual(basvuru.vatandas, self.vatandas)
+        self.assertEqual(
+            list(BasvuruCevap.objects.values_list("soru_id", "cevap")),
+            [(self.soru.pk, "evet")],
+        )
+
+    def test_mukerrer_basvuru_409(self):
+        self.assertEqual(self._basvur({str(self.soru.pk): "evet"}).status_code, 201)
+        yanit = self._basvur({str(self.soru.pk): "hayir"})
+        self.assertEqual(yanit.status_code, 409)
+        self.assertEqual(IlanBasvuru.objects.count(), 1)
+
+    def test_dogrulama_hatasi_400(self):
+        for cevaplar in ({str(self.soru.pk): "belki"}, {}, ["evet"]):
+            with self.subTest(cevaplar=cevaplar):
+                self.assertEqual(self._basvur(cevaplar).status_code, 400)
+        self.assertFalse(IlanBasvuru.objects.exists())
+
+    def test_vatandas_profili_olmadan_403(self):
+        self.client.force_login(Kullanici.objects.create_user("firma"))
+        self.assertEqual(self._basvur({str(self.soru.pk): "evet"}).status_code, 403)
+
+    def test_giris_yapmadan_basvurulamaz(self):
+        self.client.logout()
+        self.assertIn(self._basvur({}).status_code, (401, 403))
+        self.assertFalse(IlanBasvuru.objects.exists())
+
+    def test_yayinda_olmayan_ilan_404(self):
+        yanit = self._basvur({}, yol=f"/api/v1/ilanlar/{self.taslak.slug}/basvur/")
+        self.assertEqual(yanit.status_code, 404)
+
+    def test_get_sorulari_listeler(self):
+        sorular = self.client.get(self.yol).json()["sorular"]
+        self.assertEqual([soru["id"] for soru in sorular], [self.soru.pk])
+
+
+class DegisikliklerTests(TestCase):
+    yol = "/api/v1/ilanlar/degisiklikler/"
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        firma = _firma()
+        self.ilanlar = [_ilan(firma, f"İlan {sira}") for sira in range(3)]
+
+    def _oku(self, **parametreler):
+        yanit = self.client.get(self.yol, parametreler)
+        self.assertEqual(yanit.status_code, 200)
+        return yanit.json()
+
+    def _konum(self, kayit):
+        return f"{kayit.islem_kimligi}.{kayit.pk}"
+
+    def test_imlecle_sayfalama(self):
+        kayitlar = list(IlanDegisiklik.objects.order_by("islem_kimligi", "pk"))
+        self.assertEqual(len(kayitlar), 3)
+
+        sayfa = self._oku(limit=2)
+        self.assertEqual(
+            [degisiklik["uuid"] for degisiklik in sayfa["degisiklikler"]],
+            [str(ilan.uuid) for ilan in self.ilanlar[:2]],
+        )
+        self.assertTrue(sayfa["daha_var"])
+        self.assertEqual(sayfa["sonraki"], self._konum(kayitlar[1]))
+
+        sayfa = self._oku(sonra=sayfa["sonraki"], limit=2)
+        self.assertEqual(len(sayfa["degisiklikler"]), 1)
+        self.assertEqual(sayfa["degisiklikler"][0]["ilan"]["baslik"], "İlan 2")
+        self.assertFalse(sayfa["daha_var"])
+
+        # Yeni kayıt yoksa imleç yerinde kalır
+        son = sayfa["sonraki"]
+        sayfa = self._oku(sonra=son)
+        self.assertEqual(sayfa["degisiklikler"], [])
+        self.assertEqual(sayfa["sonraki"], son)
+
+    def test_eski_tamsayi_imleci_kaydin_konumuna_cevrilir(self):
+        ilk = IlanDegisiklik.objects.order_by("islem_kimligi", "pk").first()
+        eski = self._oku(sonra=str(ilk.pk))
+        yeni = self._oku(sonra=self._konum(ilk))
+        self.assertEqual(eski, yeni)
+        self.assertEqual(len(eski["degisiklikler"]), 2)
+
+    def test_ayni_ilanin_kayitlari_birlestirilir(self):
+        son = self._oku()["sonraki"]
+        ilan = self.ilanlar[0]
+        for baslik in ("Yeni Başlık", "Son Başlık"):
+            ilan.baslik = baslik
+            ilan.save()
+        self.ilanlar[1].save()
+
+        degisiklikler = self._oku(sonra=son)["degisiklikler"]
+        self.assertEqual(
+            [degisiklik["uuid"] for degisiklik in degisiklikler],
+            [str(ilan.uuid), str(self.ilanlar[1].uuid)],
+        )
+        self.assertEqual(degisiklikler[0]["ilan"]["baslik"], "Son Başlık")
+        son_kayit = IlanDegisiklik.objects.filter(ilan_id=ilan.pk).last()
+        self.assertEqual(degisiklikler[0]["sira"], self._konum(son_kayit))
+
+    def test_iz_kayitlari(self):
+        son = self._oku()["sonraki"]
+        silinen, kaldirilan, sessiz = self.ilanlar
+        silinen_uuid = str(silinen.uuid)
+        silinen.delete()
+        kaldirilan.durum = IlanDurumChoices.DURDURULDU
+        kaldirilan.save()
+        # Sinyalsiz toplu güncellemeyle yayından çıkan ilanın kaydı
+        sessiz.save()
+        IsBilgileri.objects.filter(pk=sessiz.pk).update(durum=IlanDurumChoices.TASLAK)
+
+        degisiklikler = {
+            degisiklik["uuid"]: (degisiklik["islem"], degisiklik["ilan"])
+            for degisiklik in self._oku(sonra=son)["degisiklikler"]
+        }
+        self.assertEqual(
+            degisiklikler,
+            {
+                silinen_uuid: ("silindi", None),
+                str(kaldirilan.uuid): ("yayindan_kaldirildi", None),
+                str(sessiz.uuid): ("yayindan_kaldirildi", None),
+            },
+        )
+
+    def test_gecersiz_parametreler_400(self):
+        for parametreler in (
+            {"sonra": "abc"},
+            {"sonra": "1.x"},
+            {"limit": "x"},
+            {"limit": 0},
+            {"limit": -5},
+        ):
+            with self.subTest(parametreler=parametreler):
+                yanit = self.client.get(self.yol, parametreler)
+                self.assertEqual(yanit.status_code, 400)
+
+
+class KosulluGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.firma = _firma()
+        cls.ilan = _ilan(cls.firma, "Koşullu İlan")
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _etag(self, yol):
+        yanit = self.client.get(yol)
+        self.assertEqual(yanit.status_code, 200)
+        return yanit["ETag"]
+
+    def test_ayni_etag_ile_304(self):
+        for yol in ("/api/v1/ilanlar/", f"/api/v1/ilanlar/{self.ilan.slug}/"):
+            with self.subTest(yol=yol):
+                etag = self._etag(yol)
+                yanit = self.client.get(yol, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(yanit.status_code, 304)
+                self.assertEqual(yanit.content, b"")
+                self.assertEqual(yanit["ETag"], etag)
+
+    def test_iliskili_kayit_degisince_etag_degisir(self):
+        yol = "/api/v1/ilanlar/"
+        etag = self._etag(yol)
+        # Firma adı ilanın guncelleme_tarihi alanını değiştirmez; ilan
+        # sürümü işlem sonunda artırılır
+        with self.captureOnCommitCallbacks(execute=True):
+            self.firma.ad = "Firma B"
+            self.firma.save()
+        yanit = self.client.get(yol, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(yanit.status_code, 200)
+        self.assertNotEqual(yanit["ETag"], etag)
+        self.assertEqual(yanit.json()["results"][0]["firma"]["ad"], "Firma B")
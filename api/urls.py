@@ -0,0 +1,34 @@
+from django.urls import path
+from rest_framework.routers import DefaultRouter
+
+from ortak.sorgu_profili import sorgu_butcesi
+
+from . import asenkron, views
+
+app_name = "api"
+
+router = DefaultRouter()
+router.register("ilanlar", views.IsBilgileriViewSet, basename="ilan")
+router.register("firmalar", views.FirmaViewSet, basename="firma")
+router.register("ustalar", views.UstaViewSet, basename="usta")
+
+urlpatterns = router.urls + [
+    path(
+        "anahtar-kelimeler/",
+        sorgu_butcesi(1)(views.AnahtarKelimeOnerileriView.as_view()),
+        name="anahtar-kelimeler",
+    ),
+    # ASGI altında olay döngüsünü bloklamayan uç noktalar
+    path("asenkron/ilanlar/", asenkron.ilanlar, name="asenkron-ilanlar"),
+    path("asenkron/iller/", asenkron.iller, name="asenkron-iller"),
+    path(
+        "asenkron/iller/<slug:il>/ilceler/",
+        asenkron.ilceler,
+        name="asenkron-ilceler",
+    ),
+    path(
+        "asenkron/istatistikler/",
+        asenkron.istatistikler,
+        name="asenkron-istatistikler",
+    ),
+]
@@ -0,0 +1,271 @@
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import Prefetch, Q
+from django.shortcuts import get_object_or_404
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from hesap.beceri import beceri_kosullari, becerilere_sahip
+from hesap.models import Firma, UstalikAlani, Vatandas
+from ilanlar.anahtar import oneriler
+from ilanlar.basvuru import basvuru_yap
+from ilanlar.models import (
+    AnahtarKelime,
+    IlanDegisiklik,
+    IlanDegisiklikIslemChoices,
+    IlanDurumChoices,
+    IsBilgileri,
+)
+from ilanlar.soru_semasi import soru_semasi
+from ortak.ifadeler import AcikIslemSiniri
+
+from .mixins import KosulluGetMixin, SeciliPrefetchMixin
+from .serializers import FirmaSerializer, IsBilgileriSerializer, UstaSerializer
+
+
+def _konum(deger):
+    """
+    ``sonra`` parametresini ``(islem_kimligi, id)`` konumuna çevir.
+
+    Konum ``"<islem_kimligi>.<id>"`` biçimindedir. Eski istemcilerin
+    gönderdiği yalın sıra numarası o kaydın konumuna çevrilir; kayıt
+    sıkıştırılarak silinmişse akış, kayıt atlamamak için baştan okunur.
+    """
+    if not deger:
+        return (-1, 0)
+    islem_kimligi, ayrac, kimlik = deger.partition(".")
+    if ayrac:
+        return int(islem_kimligi), int(kimlik)
+    kimlik = int(deger)
+    islem_kimligi = (
+        IlanDegisiklik.objects.filter(pk=kimlik)
+        .values_list("islem_kimligi", flat=True)
+        .first()
+    )
+    return (islem_kimligi if islem_kimligi is not None else 0), kimlik
+
+
+def _konum_metni(kayit):
+    return f"{kayit.islem_kimligi}.{kayit.pk}"
+
+
+class IsBilgileriViewSet(
+    KosulluGetMixin, SeciliPrefetchMixin, viewsets.ReadOnlyModelViewSet
+):
+    """Yayındaki iş ilanları."""
+
+    queryset = IsBilgileri.objects.filter(
+        durum=IlanDurumChoices.YAYINDA
+    ).select_related("firma", "sektor", "il", "ilce")
+    serializer_class = IsBilgileriSerializer
+    lookup_field = "slug"
+    surum_adlari = ("ilan",)
+    prefetch_alanlari = {
+        "anahtar_kelimeler": "anahtar_kelimeler",
+        "istenen_diller": "istenen_diller",
+    }
+    filterset_fields = (
+        "il",
+        "ilce",
+        "sektor",
+        "calisma_modeli",
+        "calisma_yeri",
+        "egitim_duzey",
+        "deneyim_duzey",
+        "one_cikartilmis",
+    )
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        # ?anahtar=python: yazılıştan bağımsız anahtar kelime filtresi
+        anahtar = self.request.query_params.get("anahtar")
+        if anahtar:
+            queryset = queryset.filter(
+                anahtar_kelimeler__kelime__normal=AnahtarKelime.normallestir(anahtar)
+            )
+        return queryset
+
+    @action(detail=False, url_path="degisiklikler", filter_backends=[])
+    def degisiklikler(self, request):
+        """
+        ``?sonra=<sira>`` konumundan sonra değişen ilanları döndür.
+
+        Aynı ilana ait birden fazla kayıt tek bir değişiklik olarak verilir.
+        Yayında olmayan veya silinen ilanlar ``ilan: null`` ile iz kaydı
+        olarak döner. Yanıttaki ``sonraki`` değeri bir sonraki istekte
+        ``sonra`` olarak gönderilmelidir. Kayıtlar ekleyen işlemin
+        kimliğine göre sıralanır ve hâlâ açık olan en eski işlemin
+        kimliğinden küçük olanlar verilir; böylece ne kadar geç onaylanırsa
+        onaylansın bir işlemin kaydı imlecin gerisinde kalmaz.
+        """
+        try:
+            sonra = _konum(request.query_params.get("sonra"))
+            limit = int(request.query_params.get("limit", 500))
+        except ValueError:
+            raise serializers.ValidationError(
+                {"sonra": _("Geçersiz konum veya limit.")}
+            )
+        if limit < 1:
+            raise serializers.ValidationError({"limit": _("Limit en az 1 olmalıdır.")})
+        limit = min(limit, 1000)
+
+        islem_kimligi, kimlik = sonra
+        kayitlar = IlanDegisiklik.objects.filter(
+            Q(islem_kimligi__gt=islem_kimligi)
+            | Q(islem_kimligi=islem_kimligi, pk__gt=kimlik)
+        )
+        if connections[kayitlar.db].vendor == "postgresql":
+            kayitlar = kayitlar.filter(islem_kimligi__lt=AcikIslemSiniri())
+        kayitlar = list(kayitlar.order_by("islem_kimligi", "pk")[:limit])
+
+        # Her ilan için yalnızca en son kayıt
+        son_kayitlar = {kayit.ilan_id: kayit for kayit in kayitlar}
+        guncel_kimlikler = [
+            kayit.ilan_id
+            for kayit in son_kayitlar.values()
+            if kayit.islem == IlanDegisiklikIslemChoices.GUNCELLENDI
+        ]
+        ilanlar = {
+            ilan.pk: ilan
+            for ilan in self.get_queryset().filter(pk__in=guncel_kimlikler)
+        }
+
+        degisiklikler = []
+        for kayit in sorted(
+            son_kayitlar.values(), key=lambda kayit: (kayit.islem_kimligi, kayit.pk)
+        ):
+            ilan = ilanlar.get(kayit.ilan_id)
+            islem = kayit.islem
+            if ilan is None and islem == IlanDegisiklikIslemChoices.GUNCELLENDI:
+                islem = IlanDegisiklikIslemChoices.YAYINDAN_KALDIRILDI
+            degisiklikler.append(
+                {
+                    "sira": _konum_metni(kayit),
+                    "uuid": kayit.ilan_uuid,
+                    "islem": islem,
+                    "ilan": (
+                        self.get_serializer(ilan).data if ilan is not None else None
+                    ),
+                }
+            )
+
+        return Response(
+            {
+                "sonraki": (
+                    _konum_metni(kayitlar[-1]) if kayitlar else "%d.%d" % sonra
+                ),
+                "daha_var": len(kayitlar) == limit,
+                "degisiklikler": degisiklikler,
+            }
+        )
+
+    @action(
+        detail=True,
+        methods=["get", "post"],
+        permission_classes=[IsAuthenticated],
+        filter_backends=[],
+    )
+    def basvur(self, request, slug=None):
+        """
+        GET ilanın başvuru sorularını, POST giriş yapmış vatandaş adına
+        ``{"cevaplar": {<soru_id>: <cevap>}}`` ile başvuru yapar.
+
+        Mükerrer başvuruda 409, doğrulama hatalarında 400 döner.
+        """
+        ilan = get_object_or_404(
+            IsBilgileri.objects.filter(durum=IlanDurumChoices.YAYINDA), slug=slug
+        )
+        if request.method == "GET":
+            return Response(
+                {
+                    "sorular": [
+                        {
+                            "id": soru.id,
+                            "metin": soru.metin,
+                            "tip": soru.tip,
+                            "zorunlu": soru.zorunlu,
+                            "secenekler": soru.secenekler,
+                        }
+                        for soru in soru_semasi(ilan.pk).sorular
+                    ]
+                }
+            )
+
+        vatandas = Vatandas.objects.filter(kullanici=request.user).first()
+        if vatandas is None:
+            raise PermissionDenied(_("Başvuru için vatandaş profili gereklidir."))
+        cevaplar = request.data.get("cevaplar") or {}
+        if not isinstance(cevaplar, dict):
+            raise serializers.ValidationError(
+                {"cevaplar": _("Cevaplar soru kimliğinden cevaba eşleme olmalıdır.")}
+            )
+        try:
+            basvuru = basvuru_yap(ilan, vatandas, cevaplar)
+        except ValidationError as hata:
+            if getattr(hata, "code", None) == "mukerrer":
+                return Response(
+                    {"detail": hata.message}, status=status.HTTP_409_CONFLICT
+                )
+            raise serializers.ValidationError(
+                hata.message_dict if hasattr(hata, "error_dict") else hata.messages
+            )
+        return Response({"uuid": basvuru.uuid}, status=status.HTTP_201_CREATED)
+
+
+class FirmaViewSet(KosulluGetMixin, SeciliPrefetchMixin, viewsets.ReadOnlyModelViewSet):
+    """Aktif firmalar."""
+
+    queryset = Firma.objects.filter(aktif=True).select_related("il", "ilce")
+    serializer_class = FirmaSerializer
+    lookup_field = "slug"
+    surum_adlari = ("firma",)
+    prefetch_alanlari = {"sektorler": "sektorler"}
+    filterset_fields = ("il", "ilce", "sektorler")
+
+
+class UstaViewSet(KosulluGetMixin, SeciliPrefetchMixin, viewsets.ReadOnlyModelViewSet):
+    """Usta olarak hizmet veren vatandaşlar."""
+
+    queryset = Vatandas.objects.filter(is_usta=True).select_related(
+        "kullanici", "il", "ilce"
+    )
+    serializer_class = UstaSerializer
+    lookup_field = "uuid"
+    surum_adlari = ("usta",)
+    prefetch_alanlari = {
+        "ustalik_alanlari": Prefetch(
+            "ustalik_alanlari",
+            queryset=UstalikAlani.objects.select_related("meslek"),
+        ),
+    }
+    filterset_fields = ("il", "ilce", "ustalik_alanlari__meslek")
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        # Ustalık alanları üzerinden birleştirme aynı ustayı tekrarlayabilir
+        if "ustalik_alanlari__meslek" in self.request.query_params:
+            queryset = queryset.distinct()
+        # ?beceri=excel:iyi&beceri=sql: tüm becerilere sahip ustalar
+        degerler = self.request.query_params.getlist("beceri")
+        if degerler:
+            try:
+                kosullar = beceri_kosullari(degerler)
+            except ValidationError as hata:
+                raise serializers.ValidationError({"beceri": hata.messages})
+            queryset = becerilere_sahip(queryset, kosullar)
+        return queryset
+
+
+class AnahtarKelimeOnerileriView(APIView):
+    """
+    ``?q=<önek>`` ile başlayan, yayındaki ilanlarda en çok geçen anahtar
+    kelimeler; önek verilmezse en çok geçenler.
+    """
+
+    def get(self, request):
+        return Response({"sonuclar": oneriler(request.query_params.get("q", "")[:50])})
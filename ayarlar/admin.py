@@ -1,6 +1,8 @@
 from django.contrib import admin
+from django.db.models import Count
+from django.utils.translation import gettext_lazy as _
 
-from .models import Il, Ilce, Mahalle, Meslek, Sektor
+from .models import Beceri, BeceriAdi, Il, Ilce, Mahalle, Meslek, Sektor
 
 
 @admin.register(Il)
@@ -22,13 +24,30 @@ class IlceAdmin(admin.ModelAdmin):
     prepopulated_fields = {"slug": ("ad",)}
     autocomplete_fields = ["il"]
 
+    def get_queryset(self, request):
+        # __str__ il adını da içerdiğinden otomatik tamamlama dahil her
+        # listede il birlikte çekilir
+        return super().get_queryset(request).select_related("il")
+
+
+class IlceFiltresi(admin.RelatedFieldListFilter):
+    """İlçe seçeneklerini illeriyle birlikte tek sorguda listeleyen filtre."""
+
+    def field_choices(self, field, request, model_admin):
+        ilceler = Ilce.objects.select_related("il")
+        ordering = self.field_admin_ordering(field, request, model_admin)
+        if ordering:
+            ilceler = ilceler.order_by(*ordering)
+        return [(ilce.pk, str(ilce)) for ilce in ilceler]
+
 
 @admin.register(Mahalle)
 class MahalleAdmin(admin.ModelAdmin):
     """Mahalle modelinin admin panelinde gösterimi."""
 
     list_display = ("ad", "ilce", "slug")
-    list_filter = ("ilce__il", "ilce")
+    list_select_related = ("ilce__il",)
+    list_filter = ("ilce__il", ("ilce", IlceFiltresi))
     search_fields = ("ad", "ilce__ad", "ilce__il__ad")
     prepopulated_fields = {"slug": ("ad",)}
     autocomplete_fields = ["ilce"]
@@ -50,3 +69,52 @@ class MeslekAdmin(admin.ModelAdmin):
     list_display = ("ad", "slug", "aciklama")
     search_fields = ("ad",)
     prepopulated_fields = {"slug": ("ad",)}
+
+
+class BeceriAdiInline(admin.TabularInline):
+    """Becerinin adı ve eş anlamlıları için inline form"""
+
+    model = BeceriAdi
+    extra = 1
+    fields = ("ad", "normal")
+    readonly_fields = ("normal",)
+    verbose_name = _("Ad veya Eş Anlamlı")
+    verbose_name_plural = _("Adlar ve Eş Anlamlılar")
+
+
+@admin.register(Beceri)
+class BeceriAdmin(admin.ModelAdmin):
+    """Yetenek kataloğunun admin panelinde gösterimi."""
+
+    list_display = ("ad", "yetenek_sayisi")
+    search_fields = ("ad", "adlar__normal")
+    inlines = [BeceriAdiInline]
+    actions = ["birlestir"]
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(yetenek_sayisi=Count("yetenekler", distinct=True))
+        )
+
+    @admin.display(description=_("Yetenek Sayısı"), ordering="yetenek_sayisi")
+    def yetenek_sayisi(self, obj):
+        return obj.yetenek_sayisi
+
+    @admin.action(description=_("Seçili becerileri birleştir"))
+    def birlestir(self, request, queryset):
+        # En çok kullanılan beceri korunur, diğerleri onun eş anlamlısı olur
+        beceriler = list(queryset.order_by("-yetenek_sayisi", "pk"))
+        if len(beceriler) < 2:
+            self.message_user(
+                request, _("Birleştirmek için en az iki beceri seçin."), "warning"
+            )
+            return
+        hedef, kaynaklar = beceriler[0], beceriler[1:]
+        hedef.birlestir(kaynaklar)
+        self.message_user(
+            request,
+            _('%(sayi)d beceri "%(hedef)s" becerisiyle birleştirildi.')
+            % {"sayi": len(kaynaklar), "hedef": hedef},
+        )
@@ -0,0 +1,76 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ayarlar", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Beceri",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("ad", models.CharField(max_length=100, verbose_name="Beceri Adı")),
+                (
+                    "aciklama",
+                    models.TextField(blank=True, null=True, verbose_name="Açıklama"),
+                ),
+            ],
+            options={
+                "verbose_name": "Beceri",
+                "verbose_name_plural": "Beceriler",
+                "ordering": ["ad"],
+            },
+        ),
+        migrations.CreateModel(
+            name="BeceriAdi",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("ad", models.CharField(max_length=100, verbose_name="Ad")),
+                (
+                    "normal",
+                    models.CharField(
+                        editable=False,
+                        help_text="Türkçe kurallarıyla küçük harfe çevrilmiş biçim",
+                        max_length=100,
+                        unique=True,
+                        verbose_name="Normal Biçim",
+                    ),
+                ),
+                (
+                    "beceri",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="adlar",
+                        to="ayarlar.beceri",
+                        verbose_name="Beceri",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Beceri Adı",
+                "verbose_name_plural": "Beceri Adları ve Eş Anlamlıları",
+            },
+        ),
+    ]
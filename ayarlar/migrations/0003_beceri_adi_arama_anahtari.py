@@ -0,0 +1,122 @@
+# Generated by Django 5.2.18 on 2026-10-19 21:10
+
+from django.db import migrations, models
+
+
+def beceri_adlarini_katla(apps, schema_editor):
+    """
+    Beceri adlarının normal biçimlerinde noktasız ı'yı i'ye katla.
+
+    Yalnızca ı/i farkıyla ayrılan adlardan ilk girilen korunur. Bu adlar
+    farklı becerilere aitse beceriler en eski beceride birleştirilir; bir
+    vatandaşın birden fazla birleşen becerisi varsa en yüksek seviyeli
+    yeteneği korunur.
+    """
+    Beceri = apps.get_model("ayarlar", "Beceri")
+    BeceriAdi = apps.get_model("ayarlar", "BeceriAdi")
+    Yetenek = apps.get_model("hesap", "Yetenek")
+    db = schema_editor.connection.alias
+
+    gruplar = {}
+    for ad_id, normal in (
+        BeceriAdi.objects.using(db)
+        .filter(normal__contains="ı")
+        .values_list("pk", "normal")
+    ):
+        gruplar.setdefault(normal.replace("ı", "i"), []).append(ad_id)
+    if not gruplar:
+        return
+    # Zaten katlanmış biçimde olan adlar da gruba katılır
+    for ad_id, normal in (
+        BeceriAdi.objects.using(db)
+        .filter(normal__in=gruplar)
+        .values_list("pk", "normal")
+    ):
+        gruplar[normal].append(ad_id)
+
+    beceri_idleri = dict(
+        BeceriAdi.objects.using(db)
+        .filter(pk__in=[ad_id for idler in gruplar.values() for ad_id in idler])
+        .values_list("pk", "beceri_id")
+    )
+
+    # Aynı ada çözülen beceriler, aralarındaki en eski beceride birleşir
+    kokler = {}
+
+    def kok(beceri_id):
+        while kokler.get(beceri_id, beceri_id) != beceri_id:
+            beceri_id = kokler[beceri_id]
+        return beceri_id
+
+    for ad_idleri in gruplar.values():
+        bagli = sorted({kok(beceri_idleri[ad_id]) for ad_id in ad_idleri})
+        for beceri_id in bagli[1:]:
+            kokler[beceri_id] = bagli[0]
+    hedefler = {beceri_id: kok(beceri_id) for beceri_id in kokler}
+
+    if hedefler:
+        korunanlar = set()
+        silinecekler = []
+        guncellenecekler = []
+        yetenekler = (
+            Yetenek.objects.using(db)
+            .filter(beceri_id__in={*hedefler, *hedefler.values()})
+            .order_by("-seviye", "pk")
+            .only("pk", "vatandas_id", "beceri_id")
+        )
+        for yetenek in yetenekler.iterator(chunk_size=2000):
+            hedef = hedefler.get(yetenek.beceri_id, yetenek.beceri_id)
+            if (yetenek.vatandas_id, hedef) in korunanlar:
+                silinecekler.append(yetenek.pk)
+                continue
+            korunanlar.add((yetenek.vatandas_id, hedef))
+            if yetenek.beceri_id != hedef:
+                yetenek.beceri_id = hedef
+                guncellenecekler.append(yetenek)
+        Yetenek.objects.using(db).filter(pk__in=silinecekler).delete()
+        Yetenek.objects.using(db).bulk_update(
+            guncellenecekler, ["beceri"], batch_size=2000
+        )
+        for kaynak, hedef in hedefler.items():
+            BeceriAdi.objects.using(db).filter(beceri_id=kaynak).update(beceri_id=hedef)
+
+    BeceriAdi.objects.using(db).filter(
+        pk__in=[
+            ad_id
+            for ad_idleri in gruplar.values()
+            for ad_id in ad_idleri
+            if ad_id != min(ad_idleri)
+        ]
+    ).delete()
+    Beceri.objects.using(db).filter(pk__in=hedefler).delete()
+    BeceriAdi.objects.using(db).bulk_update(
+        [
+            BeceriAdi(pk=min(ad_idleri), normal=normal)
+            for normal, ad_idleri in gruplar.items()
+        ],
+        ["normal"],
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ayarlar", "0002_beceri_beceriadi"),
+        ("hesap", "0010_alter_firma_logo_alter_sertifika_sertifika_dosya_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="beceriadi",
+            name="normal",
+            field=models.CharField(
+                editable=False,
+                help_text="Türkçe kurallarıyla küçük harfe çevrilmiş, ı/i ayrımı kaldırılmış biçim",
+                max_length=100,
+                unique=True,
+                verbose_name="Normal Biçim",
+            ),
+        ),
+        migrations.RunPython(beceri_adlarini_katla, migrations.RunPython.noop),
+    ]
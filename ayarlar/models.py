@@ -1,7 +1,10 @@
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, models, transaction
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
+from ortak.metin import arama_anahtari
+
 
 class Il(models.Model):
     """İl modeli, Türkiye'deki illeri temsil eder."""
@@ -132,3 +135,132 @@ class Meslek(models.Model):
         if self.ad and not self.slug:
             self.slug = slugify(self.ad)
         super().save(*args, **kwargs)
+
+
+class Beceri(models.Model):
+    """
+    Yetenek kataloğu.
+
+    Vatandaşların serbest metin olarak girdiği yetenekler, adı veya eş
+    anlamlılarından biri normalleştirilmiş biçimiyle eşleşen beceriye
+    bağlanır; katalogda olmayan yetenekler yeni beceri olarak eklenir.
+    """
+
+    ad = models.CharField(_("Beceri Adı"), max_length=100)
+    aciklama = models.TextField(_("Açıklama"), blank=True, null=True)
+
+    class Meta:
+        verbose_name = _("Beceri")
+        verbose_name_plural = _("Beceriler")
+        ordering = ["ad"]
+
+    def __str__(self):
+        return self.ad
+
+    def clean(self):
+        if not self.ad:
+            return
+        baska = BeceriAdi.objects.filter(normal=arama_anahtari(self.ad)).exclude(
+            beceri_id=self.pk
+        )
+        if baska.exists():
+            raise ValidationError(
+                {"ad": _("Bu ad başka bir becerinin adı veya eş anlamlısı.")}
+            )
+
+    def save(self, *args, **kwargs):
+        self.ad = " ".join(self.ad.split())
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+            # Becerinin kendi adı da eş anlamlılarıyla aynı tabloda aranır
+            adlar = BeceriAdi.objects.using(self._state.db)
+            if not adlar.filter(beceri=self, normal=arama_anahtari(self.ad)).exists():
+                adlar.create(beceri=self, ad=self.ad)
+
+    @classmethod
+    def kimlik_bul_veya_olustur(cls, metin):
+        """Metnin eşleştiği becerinin kimliği; eşleşme yoksa beceri oluşturulur."""
+        ad = " ".join(metin.split())
+        normal = arama_anahtari(ad)
+        beceri_id = (
+            BeceriAdi.objects.filter(normal=normal)
+            .values_list("beceri_id", flat=True)
+            .first()
+        )
+        if beceri_id is not None:
+            return beceri_id
+        try:
+            with transaction.atomic():
+                return cls.objects.create(ad=ad).pk
+        except IntegrityError:
+            # Aynı beceri eşzamanlı bir istekte oluşturuldu
+            return BeceriAdi.objects.get(normal=normal).beceri_id
+
+    def birlestir(self, kaynaklar):
+        """
+        Kaynak becerileri bu beceriye kat.
+
+        Kaynakların adları bu becerinin eş anlamlıları olur ve yetenekleri
+        bu beceriye bağlanır. Bir vatandaşın birden fazla birleşen becerisi
+        varsa en yüksek seviyeli yeteneği korunur.
+        """
+        Yetenek = self._meta.get_field("yetenekler").related_model
+        kaynak_idleri = [beceri.pk for beceri in kaynaklar if beceri.pk != self.pk]
+        if not kaynak_idleri:
+            return
+        with transaction.atomic():
+            BeceriAdi.objects.filter(beceri_id__in=kaynak_idleri).update(beceri=self)
+            yetenekler = Yetenek.objects.filter(beceri_id__in=[self.pk, *kaynak_idleri])
+            korunanlar, silinecekler = set(), []
+            for yetenek_id, vatandas_id in yetenekler.order_by(
+                "-seviye", "pk"
+            ).values_list("pk", "vatandas_id"):
+                if vatandas_id in korunanlar:
+                    silinecekler.append(yetenek_id)
+                else:
+                    korunanlar.add(vatandas_id)
+            Yetenek.objects.filter(pk__in=silinecekler).delete()
+            yetenekler.filter(beceri_id__in=kaynak_idleri).update(beceri=self)
+            Beceri.objects.filter(pk__in=kaynak_idleri).delete()
+
+
+class BeceriAdi(models.Model):
+    """Becerinin adı veya eş anlamlısı; normalleştirilmiş biçimi tekildir."""
+
+    beceri = models.ForeignKey(
+        Beceri,
+        on_delete=models.CASCADE,
+        related_name="adlar",
+        verbose_name=_("Beceri"),
+    )
+    ad = models.CharField(_("Ad"), max_length=100)
+    normal = models.CharField(
+        _("Normal Biçim"),
+        max_length=100,
+        unique=True,
+        editable=False,
+        help_text=_(
+            "Türkçe kurallarıyla küçük harfe çevrilmiş, ı/i ayrımı kaldırılmış biçim"
+        ),
+    )
+
+    class Meta:
+        verbose_name = _("Beceri Adı")
+        verbose_name_plural = _("Beceri Adları ve Eş Anlamlıları")
+
+    def __str__(self):
+        return self.ad
+
+    def clean(self):
+        if not self.ad:
+            return
+        baska = BeceriAdi.objects.filter(normal=arama_anahtari(self.ad)).exclude(
+            pk=self.pk
+        )
+        if baska.exists():
+            raise ValidationError({"ad": _("Bu ad katalogda zaten var.")})
+
+    def save(self, *args, **kwargs):
+        self.ad = " ".join(self.ad.split())
+        self.normal = arama_anahtari(self.ad)
+        super().save(*args, **kwargs)
@@ -0,0 +1,15 @@
+from django.contrib import admin
+
+from .models import DosyaBlob
+
+
+@admin.register(DosyaBlob)
+class DosyaBlobAdmin(admin.ModelAdmin):
+    """Tekilleştirilmiş dosya içeriklerinin admin panelinde gösterimi."""
+
+    list_display = ("ad", "boyut", "referans_sayisi", "olusturma_tarihi")
+    search_fields = ("ozet", "ad")
+    readonly_fields = ("ozet", "ad", "boyut", "referans_sayisi", "olusturma_tarihi")
+
+    def has_add_permission(self, request):
+        return False
@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class DosyalarConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "dosyalar"
+    verbose_name = _("Dosyalar")
+
+    def ready(self):
+        from . import signals
+
+        signals.baglan()
@@ -0,0 +1,168 @@
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import transaction
+from PIL import Image, ImageOps, features
+
+logger = logging.getLogger(__name__)
+
+# Türev üretilecek görsel alanları ("uygulama.Model.alan")
+TUREV_ALANLARI = (
+    "hesap.Firma.logo",
+    "hesap.Vatandas.profil_fotografi",
+)
+
+# Varyant adı ve en uzun kenar (piksel)
+VARYANTLAR = {
+    "kucuk": 160,
+    "kart": 480,
+    "detay": 1200,
+}
+
+# Tercih sırasına göre çıktı biçimleri ve kalite değerleri
+BICIMLER = {
+    "avif": 55,
+    "webp": 80,
+}
+
+# Türev bilgisinin önbellek süreleri (sn). Türevleri henüz hazır olmayan
+# görseller kısa süre sonra yeniden denetlenir.
+TUREV_BILGISI_SURESI = 24 * 60 * 60
+HAZIR_DEGIL_SURESI = 60
+# Eksik türevleri yeniden kuyruğa eklemeden önce beklenen süre (sn)
+YENIDEN_DENEME_SURESI = 5 * 60
+
+_havuz = ThreadPoolExecutor(
+    max_workers=getattr(settings, "GORSEL_ISCI_SAYISI", 2),
+    thread_name_prefix="gorsel-turev",
+)
+
+
+def desteklenen_bicimler():
+    """Pillow'un yazabildiği çıktı biçimlerini tercih sırasıyla döndür."""
+    return [bicim for bicim in BICIMLER if features.check(bicim)]
+
+
+def turev_adi(ad, varyant, bicim):
+    """Orijinal dosyanın yanında saklanacak türev dosyanın adı."""
+    kok = os.path.splitext(ad)[0]
+    return f"{kok}.{varyant}.{bicim}"
+
+
+def bilgi_adi(ad):
+    """Türevlerin biçim ve genişliklerinin yazıldığı dosyanın adı."""
+    kok = os.path.splitext(ad)[0]
+    return f"{kok}.turevler.json"
+
+
+def _onbellek_anahtari(ad, tur="bilgi"):
+    ozet = hashlib.md5(ad.encode(), usedforsecurity=False).hexdigest()
+    return f"gorsel_turev:{tur}:{ozet}"
+
+
+def turev_bilgisi(storage, ad):
+    """
+    Üretilmiş türevlerin biçimlerini ve varyant genişliklerini döndür.
+
+    Bilgi dosyası türevlerden sonra yazıldığı için varlığı türevlerin hazır
+    olduğunu gösterir. Sonuç önbellekte tutulur; türevler hazır değilse None
+    döner ve bu durum da kısa süreliğine önbelleğe alınır.
+    """
+    anahtar = _onbellek_anahtari(ad)
+    bilgi = cache.get(anahtar)
+    if bilgi is None:
+        try:
+            with storage.open(bilgi_adi(ad), "rb") as dosya:
+                bilgi = json.load(dosya)
+        except (OSError, ValueError):
+            bilgi = False
+        cache.set(anahtar, bilgi, TUREV_BILGISI_SURESI if bilgi else HAZIR_DEGIL_SURESI)
+    return bilgi or None
+
+
+def turevler_hazir_mi(storage, ad):
+    return turev_bilgisi(storage, ad) is not None
+
+
+def turevleri_uret(storage, ad):
+    """
+    Görselin tüm varyantlarını desteklenen biçimlerde üret.
+
+    EXIF yönlendirmesi piksellere uygulanır ve meta veriler türevlere
+    aktarılmaz. Görsel hiçbir zaman orijinal boyutunun üzerine büyütülmez.
+    Varyantların gerçek genişlikleri, ``srcset`` için türevlerden sonra
+    bilgi dosyasına yazılır.
+    """
+    with storage.open(ad, "rb") as kaynak:
+        gorsel = ImageOps.exif_transpose(Image.open(kaynak))
+        gorsel.load()
+
+    if gorsel.mode not in ("RGB", "RGBA"):
+        gorsel = gorsel.convert("RGBA" if "transparency" in gorsel.info else "RGB")
+
+    bicimler = desteklenen_bicimler()
+    genislikler = {}
+    for varyant, boyut in VARYANTLAR.items():
+        kopya = gorsel.copy()
+        kopya.thumbnail((boyut, boyut), Image.Resampling.LANCZOS)
+        genislikler[varyant] = kopya.width
+        for bicim in bicimler:
+            tampon = BytesIO()
+            kopya.save(tampon, format=bicim.upper(), quality=BICIMLER[bicim])
+            _yaz(storage, turev_adi(ad, varyant, bicim), tampon.getvalue())
+
+    bilgi = {"bicimler": bicimler, "genislikler": genislikler}
+    _yaz(storage, bilgi_adi(ad), json.dumps(bilgi).encode())
+    cache.set(_onbellek_anahtari(ad), bilgi, TUREV_BILGISI_SURESI)
+    return bilgi
+
+
+def _yaz(storage, ad, icerik):
+    if storage.exists(ad):
+        storage.delete(ad)
+    storage.save(ad, ContentFile(icerik))
+
+
+def turevleri_sil(storage, ad):
+    """Görselin bilgi dosyasını ve tüm türevlerini sil."""
+    storage.delete(bilgi_adi(ad))
+    cache.delete(_onbellek_anahtari(ad))
+    for varyant in VARYANTLAR:
+        for bicim in BICIMLER:
+            storage.delete(turev_adi(ad, varyant, bicim))
+
+
+def _guvenli_uret(storage, ad):
+    try:
+        turevleri_uret(storage, ad)
+    except Exception:
+        logger.exception("Görsel türevleri üretilemedi: %s", ad)
+
+
+def turev_kuyruga_ekle(storage, ad):
+    """Türev üretimini işlem onaylandıktan sonra arka plan iş parçacığına bırak."""
+    transaction.on_commit(lambda: _havuz.submit(_guvenli_uret, storage, ad))
+
+
+def eksik_turevleri_kuyruga_ekle(storage, ad):
+    """
+    Türevleri olmayan görseli en fazla ``YENIDEN_DENEME_SURESI`` içinde bir
+    kez kuyruğa ekle.
+
+    Süreç yeniden başlatıldığında bellekteki kuyrukta kalan işler kaybolur;
+    görsel gösterildikçe eksik türevler bu yolla yeniden üretilir.
+    """
+    if cache.add(_onbellek_anahtari(ad, "kuyruk"), True, YENIDEN_DENEME_SURESI):
+        turev_kuyruga_ekle(storage, ad)
+
+
+def kuyruk_uzunlugu():
+    """Arka planda bekleyen türev üretim işlerinin sayısı."""
+    return _havuz._work_queue.qsize()
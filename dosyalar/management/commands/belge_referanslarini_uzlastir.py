@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from dosyalar.referanslar import belge_referanslarini_uzlastir
+
+
+class Command(BaseCommand):
+    help = (
+        "Belge blob'larının referans sayılarını kayıtlardaki gerçek kullanımla "
+        "eşitler; hiçbir kayıtta kullanılmayan blob'ları ve geri alınan "
+        "işlemlerden kalan geçici dosyaları siler."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--bekleme",
+            type=int,
+            default=60,
+            help="Bu kadar dakikadan yeni blob ve geçici dosyalar silinmez",
+        )
+
+    def handle(self, *args, **options):
+        duzeltilen, silinen = belge_referanslarini_uzlastir(
+            timedelta(minutes=options["bekleme"])
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{duzeltilen} blob'un referans sayısı düzeltildi, {silinen} blob silindi."
+            )
+        )
@@ -0,0 +1,43 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from dosyalar.gorseller import TUREV_ALANLARI, turevleri_uret, turevler_hazir_mi
+
+
+class Command(BaseCommand):
+    help = (
+        "Profil fotoğrafları ve firma logoları için eksik görsel türevlerini "
+        "üretir. Süreç yeniden başlatıldığında arka plan kuyruğunda kalan "
+        "işler kaybolduğundan dağıtımdan sonra çalıştırılmalıdır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--yeniden",
+            action="store_true",
+            help="Mevcut türevleri de yeniden üret",
+        )
+
+    def handle(self, *args, **options):
+        toplam = 0
+        for yol in TUREV_ALANLARI:
+            model_yolu, alan_adi = yol.rsplit(".", 1)
+            model = apps.get_model(model_yolu)
+            storage = model._meta.get_field(alan_adi).storage
+            adlar = (
+                model._base_manager.exclude(**{alan_adi: ""})
+                .exclude(**{f"{alan_adi}__isnull": True})
+                .values_list(alan_adi, flat=True)
+                .iterator()
+            )
+            for ad in adlar:
+                if not options["yeniden"] and turevler_hazir_mi(storage, ad):
+                    continue
+                try:
+                    turevleri_uret(storage, ad)
+                except Exception as hata:
+                    self.stderr.write(f"{ad}: {hata}")
+                    continue
+                toplam += 1
+
+        self.stdout.write(self.style.SUCCESS(f"{toplam} görselin türevleri üretildi."))
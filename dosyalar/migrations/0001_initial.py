@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DosyaBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ozet', models.CharField(help_text='Dosya içeriğinin SHA-256 özeti', max_length=64, unique=True, verbose_name='SHA-256 Özeti')),
+                ('ad', models.CharField(help_text="Blob'un depolama içindeki yolu", max_length=255, unique=True, verbose_name='Dosya Yolu')),
+                ('boyut', models.PositiveBigIntegerField(default=0, help_text='Dosya boyutu (bayt)', verbose_name='Boyut')),
+                ('referans_sayisi', models.PositiveIntegerField(default=0, help_text='Bu içeriği kullanan dosya alanı sayısı', verbose_name='Referans Sayısı')),
+                ('olusturma_tarihi', models.DateTimeField(auto_now_add=True, verbose_name='Oluşturulma Tarihi')),
+            ],
+            options={
+                'verbose_name': 'Dosya İçeriği',
+                'verbose_name_plural': 'Dosya İçerikleri',
+                'ordering': ['-olusturma_tarihi'],
+            },
+        ),
+    ]
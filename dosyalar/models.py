@@ -0,0 +1,41 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class DosyaBlob(models.Model):
+    """
+    İçerik adresli depolamada tutulan tekil dosya içeriği.
+
+    Aynı içeriğe sahip tüm yüklemeler tek bir blob'u paylaşır; blob'a kaç
+    kaydın bağlı olduğu referans sayısında tutulur.
+    """
+
+    ozet = models.CharField(
+        _("SHA-256 Özeti"),
+        max_length=64,
+        unique=True,
+        help_text=_("Dosya içeriğinin SHA-256 özeti"),
+    )
+    ad = models.CharField(
+        _("Dosya Yolu"),
+        max_length=255,
+        unique=True,
+        help_text=_("Blob'un depolama içindeki yolu"),
+    )
+    boyut = models.PositiveBigIntegerField(
+        _("Boyut"), default=0, help_text=_("Dosya boyutu (bayt)")
+    )
+    referans_sayisi = models.PositiveIntegerField(
+        _("Referans Sayısı"),
+        default=0,
+        help_text=_("Bu içeriği kullanan dosya alanı sayısı"),
+    )
+    olusturma_tarihi = models.DateTimeField(_("Oluşturulma Tarihi"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("Dosya İçeriği")
+        verbose_name_plural = _("Dosya İçerikleri")
+        ordering = ["-olusturma_tarihi"]
+
+    def __str__(self):
+        return f"{self.ad} ({self.referans_sayisi})"
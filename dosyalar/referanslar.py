@@ -0,0 +1,107 @@
+"""
+İçerik adresli belgelerin referans sayıları.
+
+Blob'ların referans sayıları kayıt sinyallerinde artımlı olarak tutulur
+(``dosyalar.signals``). Sinyal göndermeyen toplu işlemler ``save()``
+dışında eklenen kayıtlar için ``referanslari_ekle`` çağırmalıdır; kalan
+sapmalar ve kullanılmayan blob'lar ``belge_referanslarini_uzlastir`` ile
+giderilir.
+"""
+
+from collections import Counter
+from datetime import timedelta
+from functools import cache
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Count, FileField
+from django.utils import timezone
+
+from .models import DosyaBlob
+from .storage import IcerikAdresliStorage, belge_storage
+
+
+@cache
+def belge_alanlari(model):
+    """Modelin içerik adresli depolama kullanan dosya alanları."""
+    return [
+        alan
+        for alan in model._meta.concrete_fields
+        if isinstance(alan, FileField)
+        and isinstance(alan.storage, IcerikAdresliStorage)
+    ]
+
+
+def belge_modelleri():
+    return [model for model in apps.get_models() if belge_alanlari(model)]
+
+
+def referanslari_ekle(instance):
+    """
+    ``save()`` kullanılmadan eklenen kaydın dosya referanslarını artır.
+
+    Kaydın eklendiği işlemde çağrılmalıdır.
+    """
+    for alan in belge_alanlari(type(instance)):
+        dosya = getattr(instance, alan.attname)
+        if dosya:
+            alan.storage.referans_ekle(dosya.name)
+
+
+def kullanim_sayisi(ad):
+    """Blob adını kullanan dosya alanı sayısını kayıtlardan say."""
+    return sum(
+        model._base_manager.filter(**{alan.attname: ad}).count()
+        for model in belge_modelleri()
+        for alan in belge_alanlari(model)
+    )
+
+
+def belge_referanslarini_uzlastir(bekleme=timedelta(hours=1)):
+    """
+    Referans sayılarını kayıtlardaki gerçek kullanımla eşitle.
+
+    ``bekleme`` süresinden eski olup hiçbir kayıtta kullanılmayan blob'lar
+    ve geri alınan işlemlerden kalan geçici dosyalar silinir; daha yeni
+    blob'lar henüz onaylanmamış bir işleme ait olabilir. Düzeltilen ve
+    silinen blob sayılarını döndürür.
+    """
+    storage = belge_storage()
+    esik = timezone.now() - bekleme
+
+    referanslar = Counter()
+    for model in belge_modelleri():
+        for alan in belge_alanlari(model):
+            referanslar.update(
+                dict(
+                    model._base_manager.exclude(**{f"{alan.attname}__isnull": True})
+                    .exclude(**{alan.attname: ""})
+                    .order_by()
+                    .values(alan.attname)
+                    .annotate(adet=Count("pk"))
+                    .values_list(alan.attname, "adet")
+                )
+            )
+
+    duzeltilen = silinen = 0
+    bloblar = DosyaBlob.objects.values_list(
+        "pk", "ad", "referans_sayisi", "olusturma_tarihi"
+    )
+    for pk, ad, sayi, tarih in bloblar.iterator():
+        if referanslar[ad] == sayi and (sayi or tarih > esik):
+            continue
+        # Sayım sırasında değişmiş olabileceğinden kilit altında yeniden say
+        with transaction.atomic():
+            blob = DosyaBlob.objects.select_for_update().filter(pk=pk).first()
+            if blob is None:
+                continue
+            gercek = kullanim_sayisi(blob.ad)
+            if not gercek and blob.olusturma_tarihi <= esik:
+                storage.blob_sil(blob)
+                silinen += 1
+            elif gercek != blob.referans_sayisi:
+                DosyaBlob.objects.filter(pk=pk).update(referans_sayisi=gercek)
+                duzeltilen += 1
+
+    storage.gecicileri_temizle(esik)
+    return duzeltilen, silinen
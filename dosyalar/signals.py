@@ -0,0 +1,140 @@
+from functools import partial
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from .gorseller import (
+    TUREV_ALANLARI,
+    turev_kuyruga_ekle,
+    turevler_hazir_mi,
+    turevleri_sil,
+)
+from .referanslar import belge_alanlari, belge_modelleri
+
+# Türev üretilecek görsel alanları
+_gorsel_alanlari = {}
+
+
+def _referansi_birak(storage, ad):
+    transaction.on_commit(partial(storage.referansi_birak, ad))
+
+
+def _kaydedilen_alanlar(model, update_fields):
+    alanlar = belge_alanlari(model)
+    if update_fields is not None:
+        alanlar = [alan for alan in alanlar if alan.name in update_fields]
+    return alanlar
+
+
+def eski_belgeleri_isaretle(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Kayıttan önce dosya alanlarının veritabanındaki adlarını sakla."""
+    instance._eski_belgeler = {}
+    if raw or instance._state.adding or instance.pk is None:
+        return
+
+    alanlar = _kaydedilen_alanlar(sender, update_fields)
+    if not alanlar:
+        return
+    eski = (
+        sender._base_manager.filter(pk=instance.pk)
+        .values(*[alan.attname for alan in alanlar])
+        .first()
+    )
+    instance._eski_belgeler = eski or {}
+
+
+def belge_referanslarini_guncelle(
+    sender, instance, raw=False, update_fields=None, **kwargs
+):
+    """
+    Kayda yazılan blob'ların referansını artır, yerine başkası konanları bırak.
+
+    Blob adı kayda ilk kez yazıldığında (yeni yükleme veya başka bir kaydın
+    dosyasının atanması) referans aynı işlemde artırılır; eski dosyanın
+    referansı işlem onaylandıktan sonra bırakılır.
+    """
+    if raw:
+        return
+    eski = getattr(instance, "_eski_belgeler", {})
+    for alan in _kaydedilen_alanlar(sender, update_fields):
+        onceki = eski.get(alan.attname) or ""
+        simdiki = getattr(instance, alan.attname).name or ""
+        if onceki == simdiki:
+            continue
+        if simdiki:
+            alan.storage.referans_ekle(simdiki)
+        if onceki:
+            _referansi_birak(alan.storage, onceki)
+    instance._eski_belgeler = {}
+
+
+def silinen_belgeleri_birak(sender, instance, **kwargs):
+    """Silinen kaydın dosya referanslarını bırak."""
+    for alan in belge_alanlari(sender):
+        dosya = getattr(instance, alan.attname)
+        if dosya:
+            _referansi_birak(alan.storage, dosya.name)
+
+
+def eski_gorselleri_isaretle(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Kayıttan önce görsel alanlarının veritabanındaki adlarını sakla."""
+    instance._eski_gorseller = {}
+    if raw or instance._state.adding or instance.pk is None:
+        return
+
+    alanlar = [
+        alan_adi
+        for alan_adi in _gorsel_alanlari[sender]
+        if update_fields is None or alan_adi in update_fields
+    ]
+    if alanlar:
+        eski = sender._base_manager.filter(pk=instance.pk).values(*alanlar).first()
+        instance._eski_gorseller = eski or {}
+
+
+def gorsel_turevlerini_planla(sender, instance, raw=False, **kwargs):
+    """
+    Türevleri henüz üretilmemiş görseller için arka plan işi planla ve
+    yerine başkası konan görsellerin türevlerini sil.
+    """
+    if raw:
+        return
+    eski = getattr(instance, "_eski_gorseller", {})
+    for alan_adi in _gorsel_alanlari[sender]:
+        dosya = getattr(instance, alan_adi)
+        onceki = eski.get(alan_adi)
+        if onceki and onceki != dosya.name:
+            _turevleri_sil(dosya.storage, onceki)
+        if dosya and not turevler_hazir_mi(dosya.storage, dosya.name):
+            turev_kuyruga_ekle(dosya.storage, dosya.name)
+    instance._eski_gorseller = {}
+
+
+def silinen_gorsellerin_turevlerini_sil(sender, instance, **kwargs):
+    """Silinen kaydın görsel türevlerini sil."""
+    for alan_adi in _gorsel_alanlari[sender]:
+        dosya = getattr(instance, alan_adi)
+        if dosya:
+            _turevleri_sil(dosya.storage, dosya.name)
+
+
+def _turevleri_sil(storage, ad):
+    transaction.on_commit(partial(turevleri_sil, storage, ad))
+
+
+def baglan():
+    """İçerik adresli dosya alanı olan modellere sinyalleri bağla."""
+    for model in belge_modelleri():
+        pre_save.connect(eski_belgeleri_isaretle, sender=model)
+        post_save.connect(belge_referanslarini_guncelle, sender=model)
+        post_delete.connect(silinen_belgeleri_birak, sender=model)
+
+    for yol in TUREV_ALANLARI:
+        model_yolu, alan_adi = yol.rsplit(".", 1)
+        model = apps.get_model(model_yolu)
+        _gorsel_alanlari.setdefault(model, []).append(alan_adi)
+    for model in _gorsel_alanlari:
+        pre_save.connect(eski_gorselleri_isaretle, sender=model)
+        post_save.connect(gorsel_turevlerini_planla, sender=model)
+        post_delete.connect(silinen_gorsellerin_turevlerini_sil, sender=model)
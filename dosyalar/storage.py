@@ -0,0 +1,198 @@
+import hashlib
+import logging
+import os
+import tempfile
+from functools import partial
+
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage, storages
+from django.db import transaction
+from django.db.models import F
+
+from .models import DosyaBlob
+
+logger = logging.getLogger(__name__)
+
+
+class IcerikAdresliStorage(FileSystemStorage):
+    """
+    Dosyaları içeriklerinin SHA-256 özetine göre saklayan depolama.
+
+    Yüklenen dosya diske akıtılırken özeti hesaplanır. Aynı içerik daha önce
+    kaydedilmişse yeni dosya yazılmaz; kayıt mevcut blob'a bağlanır. Yeni
+    içerik önce geçici dizine yazılır ve işlem onaylandığında blob yoluna
+    taşınır; geri alınan işlemler blob dizininde dosya bırakmaz.
+
+    Referans sayıları dosya alanı olan kayıtların sinyallerinde tutulur:
+    blob adı bir kayda yazıldığında sayı aynı işlemde ``referans_ekle`` ile
+    artırılır, kayıt silindiğinde veya dosyası değiştirildiğinde işlem
+    onaylandıktan sonra ``referansi_birak`` ile azaltılır. Blob son
+    referansı bırakılana kadar diskte kalır. ``delete`` blob'ları silmez;
+    böylece ``FieldFile.delete()`` başka kayıtların kullandığı içeriğe
+    dokunamaz.
+    """
+
+    blob_dizini = "icerik"
+    gecici_dizin = "gecici"
+
+    def get_available_name(self, name, max_length=None):
+        # Dosya adı içerikten üretildiği için çakışma kontrolüne gerek yok
+        return name
+
+    def blob_adi(self, ozet, name):
+        """Özet ve orijinal uzantıdan blob yolunu üret."""
+        uzanti = os.path.splitext(name)[1].lower()
+        return f"{self.blob_dizini}/{ozet[:2]}/{ozet[2:4]}/{ozet}{uzanti}"
+
+    def blob_mu(self, name):
+        return bool(name) and name.startswith(f"{self.blob_dizini}/")
+
+    def _save(self, name, content):
+        ozet, gecici_yol = self._ozet_hesapla(content)
+        try:
+            with transaction.atomic():
+                (
+                    blob,
+                    _olusturuldu,
+                ) = DosyaBlob.objects.select_for_update().get_or_create(
+                    ozet=ozet,
+                    defaults={"ad": self.blob_adi(ozet, name), "boyut": content.size},
+                )
+                # Blob satırı kilitliyken dosyanın diskte olup olmadığına bak;
+                # yoksa içerik işlem onaylanınca yerine taşınır.
+                if not os.path.exists(self.path(blob.ad)):
+                    gecici_yol = self._beklet(content, gecici_yol)
+                    transaction.on_commit(partial(self._yerlestir, blob.ad, gecici_yol))
+                    gecici_yol = None
+        finally:
+            if gecici_yol:
+                os.remove(gecici_yol)
+        return blob.ad
+
+    def delete(self, name):
+        # Blob'lar yalnızca son referansları bırakıldığında silinir
+        if not self.blob_mu(name):
+            super().delete(name)
+
+    def referans_ekle(self, name):
+        """
+        Blob'un referans sayısını artır.
+
+        Kaydın yazıldığı işlemde çağrılır; işlem geri alınırsa artış da geri
+        alınır.
+        """
+        if not self.blob_mu(name):
+            return
+        guncellenen = DosyaBlob.objects.filter(ad=name).update(
+            referans_sayisi=F("referans_sayisi") + 1
+        )
+        if not guncellenen:
+            logger.warning("Referans eklenecek blob bulunamadı: %s", name)
+
+    def referansi_birak(self, name):
+        """Blob'un referans sayısını azalt; son referanssa blob'u sil."""
+        if not self.blob_mu(name):
+            return super().delete(name)
+
+        with transaction.atomic():
+            blob = DosyaBlob.objects.select_for_update().filter(ad=name).first()
+            if blob is None:
+                return
+            if blob.referans_sayisi > 1:
+                blob.referans_sayisi = F("referans_sayisi") - 1
+                blob.save(update_fields=["referans_sayisi"])
+                return
+            self.blob_sil(blob)
+
+    def blob_sil(self, blob):
+        """Blob satırını ve dosyasını sil; satır kilitli olmalıdır."""
+        blob.delete()
+        super().delete(blob.ad)
+
+    def gecicileri_temizle(self, esik):
+        """Geri alınan işlemlerden kalan, ``esik`` zamanından eski geçici dosyaları sil."""
+        dizin = self.path(f"{self.blob_dizini}/{self.gecici_dizin}")
+        if not os.path.isdir(dizin):
+            return 0
+        silinen = 0
+        for girdi in os.scandir(dizin):
+            if girdi.is_file() and girdi.stat().st_mtime < esik.timestamp():
+                os.remove(girdi.path)
+                silinen += 1
+        return silinen
+
+    def _gecici_dosya(self):
+        dizin = self.path(f"{self.blob_dizini}/{self.gecici_dizin}")
+        os.makedirs(dizin, exist_ok=True)
+        return tempfile.mkstemp(dir=dizin)
+
+    def _ozet_hesapla(self, content):
+        """
+        İçeriğin SHA-256 özetini hesapla.
+
+        Diskte geçici dosyası olmayan içerik, özet hesaplanırken blob
+        dizinindeki geçici bir dosyaya yazılır; böylece içerik yeni ise
+        yalnızca yeniden adlandırılarak yerine taşınır. Dönen değer
+        ``(ozet, gecici_yol)`` ikilisidir.
+        """
+        ozet = getattr(content, "sha256", None)
+        if ozet:
+            return ozet, None
+
+        hash_nesnesi = hashlib.sha256()
+        if hasattr(content, "temporary_file_path"):
+            for parca in content.chunks():
+                hash_nesnesi.update(parca)
+            return hash_nesnesi.hexdigest(), None
+
+        fd, gecici_yol = self._gecici_dosya()
+        try:
+            with os.fdopen(fd, "wb") as hedef:
+                for parca in content.chunks():
+                    if isinstance(parca, str):
+                        parca = parca.encode()
+                    hash_nesnesi.update(parca)
+                    hedef.write(parca)
+        except BaseException:
+            os.remove(gecici_yol)
+            raise
+        return hash_nesnesi.hexdigest(), gecici_yol
+
+    def _beklet(self, content, gecici_yol):
+        """İçeriği kopyalamadan blob dizinindeki geçici dosyaya al."""
+        if gecici_yol:
+            return gecici_yol
+        fd, gecici_yol = self._gecici_dosya()
+        try:
+            if hasattr(content, "temporary_file_path"):
+                os.close(fd)
+                file_move_safe(
+                    content.temporary_file_path(), gecici_yol, allow_overwrite=True
+                )
+            else:
+                with os.fdopen(fd, "wb") as hedef:
+                    for parca in content.chunks():
+                        if isinstance(parca, str):
+                            parca = parca.encode()
+                        hedef.write(parca)
+        except BaseException:
+            os.remove(gecici_yol)
+            raise
+        return gecici_yol
+
+    def _yerlestir(self, ad, gecici_yol):
+        """Onaylanan işlemin geçici dosyasını blob yoluna taşı."""
+        tam_yol = self.path(ad)
+        if os.path.exists(tam_yol):
+            # Aynı içerik başka bir işlemde yerine taşındı
+            os.remove(gecici_yol)
+            return
+        os.makedirs(os.path.dirname(tam_yol), exist_ok=True)
+        os.replace(gecici_yol, tam_yol)
+        if self.file_permissions_mode is not None:
+            os.chmod(tam_yol, self.file_permissions_mode)
+
+
+def belge_storage():
+    """Özgeçmiş ve sertifika gibi belgeler için kullanılan depolama."""
+    return storages["belgeler"]
@@ -0,0 +1,63 @@
+from django import template
+from django.utils.html import format_html, format_html_join
+
+from dosyalar.gorseller import eksik_turevleri_kuyruga_ekle, turev_adi, turev_bilgisi
+
+register = template.Library()
+
+
+@register.simple_tag
+def duyarli_gorsel(dosya, varyant="kart", alt="", css_sinifi="", sizes=None):
+    """
+    Görsel alanını ``srcset`` içeren bir ``<picture>`` etiketi olarak çiz.
+
+    Tarayıcı, ``sizes`` değerine göre varyantlardan uygun olanı seçer;
+    ``srcset`` genişlikleri türevlerin gerçek genişlikleridir. Türevler henüz
+    üretilmemişse orijinal görsel gösterilir ve türevler kuyruğa eklenir.
+
+    Kullanım::
+
+        {% load gorseller %}
+        {% duyarli_gorsel firma.logo "kart" alt=firma.ad css_sinifi="max-h-full" %}
+    """
+    if not dosya:
+        return ""
+
+    storage, ad = dosya.storage, dosya.name
+    bilgi = turev_bilgisi(storage, ad)
+    if bilgi is None:
+        eksik_turevleri_kuyruga_ekle(storage, ad)
+        return format_html(
+            '<img src="{}" alt="{}" class="{}" loading="lazy">',
+            dosya.url,
+            alt,
+            css_sinifi,
+        )
+
+    bicimler, genislikler = bilgi["bicimler"], bilgi["genislikler"]
+    # Küçük görsellerde birden fazla varyant aynı genişlikte olabilir
+    varyantlar = {}
+    for ad_varyant, genislik in genislikler.items():
+        varyantlar.setdefault(genislik, ad_varyant)
+    kaynaklar = format_html_join(
+        "",
+        '<source type="image/{}" srcset="{}" sizes="{}">',
+        (
+            (
+                bicim,
+                ", ".join(
+                    f"{storage.url(turev_adi(ad, ad_varyant, bicim))} {genislik}w"
+                    for genislik, ad_varyant in varyantlar.items()
+                ),
+                sizes or f"{genislikler[varyant]}px",
+            )
+            for bicim in bicimler
+        ),
+    )
+    return format_html(
+        '<picture>{}<img src="{}" alt="{}" class="{}" loading="lazy" decoding="async"></picture>',
+        kaynaklar,
+        storage.url(turev_adi(ad, varyant, bicimler[-1])),
+        alt,
+        css_sinifi,
+    )
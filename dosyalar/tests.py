@@ -0,0 +1,156 @@
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+
+from django.core.exceptions import RequestDataTooBig, ValidationError
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from ayarlar.models import Il, Ilce, Sektor
+from hesap.models import Firma, Kullanici, Sertifika, Vatandas
+from ilanlar.basvuru import basvuru_yap
+from ilanlar.models import IlanBasvuru, IsBilgileri
+
+from .models import DosyaBlob
+from .referanslar import belge_referanslarini_uzlastir
+from .storage import belge_storage
+from .yukleme import (
+    SERTIFIKA_SINIRI,
+    VARSAYILAN_SINIR,
+    SinirliYuklemeIsleyicisi,
+    akis_siniri,
+)
+
+
+class IcerikAdresliStorageTests(TestCase):
+    def setUp(self):
+        medya = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, medya, ignore_errors=True)
+        ayar = override_settings(MEDIA_ROOT=medya)
+        ayar.enable()
+        self.addCleanup(ayar.disable)
+
+        il = Il.objects.create(ad="Sivas")
+        ilce = Ilce.objects.create(il=il, ad="Merkez")
+        self.ilan = IsBilgileri.objects.create(
+            baslik="İlan",
+            firma=Firma.objects.create(ad="Firma", il=il, ilce=ilce),
+            pozisyon="Geliştirici",
+            aciklama="x",
+            gerekli_nitelikler="y",
+            basvuru_baslangic=timezone.localdate(),
+            durum="yayinda",
+            sektor=Sektor.objects.create(ad="Bilişim"),
+            il=il,
+            ilce=ilce,
+        )
+        self.vatandas = Vatandas.objects.create(
+            kullanici=Kullanici.objects.create_user("aday")
+        )
+
+    def ozgecmis_yukle(self, vatandas, icerik=b"%PDF-1.4 ozgecmis"):
+        with self.captureOnCommitCallbacks(execute=True):
+            vatandas.ozgecmis_dosya.save("ozgecmis.pdf", ContentFile(icerik))
+        return vatandas.ozgecmis_dosya.name
+
+    def referans_sayisi(self, ad):
+        return DosyaBlob.objects.get(ad=ad).referans_sayisi
+
+    def test_ayni_icerik_tek_blobda_tutulur(self):
+        ad = self.ozgecmis_yukle(self.vatandas)
+        diger = Vatandas.objects.create(kullanici=Kullanici.objects.create_user("b"))
+
+        self.assertEqual(self.ozgecmis_yukle(diger), ad)
+        self.assertEqual(DosyaBlob.objects.count(), 1)
+        self.assertEqual(self.referans_sayisi(ad), 2)
+
+    def test_atanan_dosya_silinince_blob_korunur(self):
+        ad = self.ozgecmis_yukle(self.vatandas)
+        basvuru = IlanBasvuru.objects.create(
+            ilan=self.ilan,
+            vatandas=self.vatandas,
+            ozgecmis=self.vatandas.ozgecmis_dosya,
+        )
+        self.assertEqual(self.referans_sayisi(ad), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            basvuru.delete()
+        self.assertEqual(self.referans_sayisi(ad), 1)
+        self.assertTrue(belge_storage().exists(ad))
+
+    def test_basvuru_yap_ozgecmis_referansi_ekler(self):
+        ad = self.ozgecmis_yukle(self.vatandas)
+        with self.captureOnCommitCallbacks(execute=True):
+            basvuru = basvuru_yap(
+                self.ilan, self.vatandas, ozgecmis=self.vatandas.ozgecmis_dosya
+            )
+        self.assertEqual(self.referans_sayisi(ad), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            basvuru.delete()
+        self.assertTrue(belge_storage().exists(ad))
+
+    def test_son_referans_birakilinca_blob_silinir(self):
+        ad = self.ozgecmis_yukle(self.vatandas)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.vatandas.ozgecmis_dosya = None
+            self.vatandas.save()
+
+        self.assertFalse(DosyaBlob.objects.filter(ad=ad).exists())
+        self.assertFalse(belge_storage().exists(ad))
+
+    def test_geri_alinan_islem_blob_birakmaz(self):
+        with self.captureOnCommitCallbacks(execute=True) as geri_cagrilar:
+            with self.assertRaises(ValueError), transaction.atomic():
+                self.vatandas.ozgecmis_dosya.save("ozgecmis.pdf", ContentFile(b"%PDF"))
+                raise ValueError
+
+        self.assertEqual(geri_cagrilar, [])
+        self.assertFalse(DosyaBlob.objects.exists())
+        self.assertFalse(
+            os.path.exists(belge_storage().path(self.vatandas.ozgecmis_dosya.name))
+        )
+
+    def test_uzlastirma_sayilari_duzeltir_ve_kullanilmayanlari_siler(self):
+        ad = self.ozgecmis_yukle(self.vatandas)
+        DosyaBlob.objects.filter(ad=ad).update(referans_sayisi=5)
+        with self.captureOnCommitCallbacks(execute=True):
+            belge_storage().save("yetim.pdf", ContentFile(b"%PDF yetim"))
+        DosyaBlob.objects.exclude(ad=ad).update(
+            olusturma_tarihi=timezone.now() - timedelta(days=1)
+        )
+
+        self.assertEqual(belge_referanslarini_uzlastir(), (1, 1))
+        self.assertEqual(self.referans_sayisi(ad), 1)
+        self.assertEqual(DosyaBlob.objects.count(), 1)
+
+
+@override_settings(YUKLEME_ISTEK_UST_SINIRI=1000)
+class YuklemeSiniriTests(SimpleTestCase):
+    def buyuk_dosya(self):
+        return SimpleUploadedFile("ozgecmis.pdf", b"%PDF" + b"x" * 2000)
+
+    def test_ust_siniri_asan_istek_413_doner(self):
+        yanit = self.client.post("/", {"ozgecmis_dosya": self.buyuk_dosya()})
+        self.assertEqual(yanit.status_code, 413)
+
+    def test_isleyici_ust_siniri_asan_istegi_istemci_hatasiyla_keser(self):
+        request = RequestFactory().post("/", {"ozgecmis_dosya": self.buyuk_dosya()})
+        request.upload_handlers = [SinirliYuklemeIsleyicisi(request)]
+        with self.assertRaises(RequestDataTooBig):
+            request.POST
+
+    def test_sinir_model_alanina_gore_secilir(self):
+        gorsel = SimpleUploadedFile("belge.png", b"\x89PNG")
+        Sertifika._meta.get_field("sertifika_dosya").run_validators(gorsel)
+        with self.assertRaises(ValidationError):
+            Vatandas._meta.get_field("ozgecmis_dosya").run_validators(gorsel)
+
+        self.assertEqual(
+            akis_siniri("sertifikalar-0-sertifika_dosya"), SERTIFIKA_SINIRI
+        )
+        self.assertEqual(akis_siniri("bilinmeyen"), VARSAYILAN_SINIR)
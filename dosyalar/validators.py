@@ -0,0 +1,40 @@
+from django.core.exceptions import ValidationError
+from django.utils.deconstruct import deconstructible
+
+from .yukleme import SINIRLAR, sinir_hatasi
+
+
+@deconstructible
+class YuklemeSiniriValidator:
+    """
+    Yeni yüklenen dosyayı model alanının seçtiği sınıra göre denetler.
+
+    ``sinir_adi`` ``dosyalar.yukleme.SINIRLAR`` anahtarlarından biridir.
+    Yükleme işleyicisinin reddettiği dosyalar için işleyicinin verdiği hata
+    mesajı gösterilir. Daha önce kaydedilmiş dosyalar yeniden denetlenmez.
+    """
+
+    def __init__(self, sinir_adi):
+        self.sinir_adi = sinir_adi
+
+    @property
+    def sinir(self):
+        return SINIRLAR[self.sinir_adi]
+
+    def __call__(self, dosya):
+        if getattr(dosya, "_committed", False):
+            return
+
+        red_nedeni = (
+            getattr(dosya, "red_nedeni", None)
+            or getattr(getattr(dosya, "file", None), "red_nedeni", None)
+            or sinir_hatasi(self.sinir, dosya.name, dosya.size)
+        )
+        if red_nedeni:
+            raise ValidationError(red_nedeni, code="yukleme_siniri")
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, YuklemeSiniriValidator)
+            and self.sinir_adi == other.sinir_adi
+        )
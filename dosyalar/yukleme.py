@@ -0,0 +1,260 @@
+import hashlib
+import os
+import tempfile
+from functools import cache
+from io import BytesIO
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import RequestDataTooBig, ValidationError
+from django.core.files.uploadedfile import TemporaryUploadedFile, UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+from django.db.models import FileField
+from django.http import HttpResponse
+from django.template.defaultfilters import filesizeformat
+from django.utils.translation import gettext_lazy as _
+
+from ortak.metrikler import yukleme_tamamlandi
+
+MB = 1024 * 1024
+
+BELGE_SINIRI = {"boyut": 5 * MB, "uzantilar": (".pdf", ".doc", ".docx")}
+SERTIFIKA_SINIRI = {"boyut": 5 * MB, "uzantilar": (".pdf", ".jpg", ".jpeg", ".png")}
+GORSEL_SINIRI = {"boyut": 8 * MB, "uzantilar": (".jpg", ".jpeg", ".png", ".webp")}
+VARSAYILAN_SINIR = {"boyut": 10 * MB, "uzantilar": None}
+
+# Model dosya alanlarının ``YuklemeSiniriValidator`` ile seçtiği sınırlar
+SINIRLAR = {
+    "belge": BELGE_SINIRI,
+    "sertifika": SERTIFIKA_SINIRI,
+    "gorsel": GORSEL_SINIRI,
+}
+
+# Uzantıya göre beklenen dosya imzaları (ilk baytlar)
+DOSYA_IMZALARI = {
+    ".pdf": (b"%PDF",),
+    ".doc": (b"\xd0\xcf\x11\xe0",),
+    ".docx": (b"PK\x03\x04",),
+    ".jpg": (b"\xff\xd8\xff",),
+    ".jpeg": (b"\xff\xd8\xff",),
+    ".png": (b"\x89PNG",),
+    ".webp": (b"RIFF",),
+}
+
+
+def _birlestir(sinirlar):
+    uzantilar = [sinir["uzantilar"] for sinir in sinirlar]
+    return {
+        "boyut": max(sinir["boyut"] for sinir in sinirlar),
+        "uzantilar": (
+            None
+            if None in uzantilar
+            else tuple(dict.fromkeys(uzanti for grup in uzantilar for uzanti in grup))
+        ),
+    }
+
+
+@cache
+def _akis_sinirlari():
+    """Model dosya alanı adından, o adı taşıyan alanların en geniş sınırına eşleme."""
+    from .validators import YuklemeSiniriValidator
+
+    sinirlar = {}
+    for model in apps.get_models():
+        for alan in model._meta.concrete_fields:
+            if not isinstance(alan, FileField):
+                continue
+            for dogrulayici in alan.validators:
+                if isinstance(dogrulayici, YuklemeSiniriValidator):
+                    sinirlar.setdefault(alan.name, []).append(dogrulayici.sinir)
+    return {ad: _birlestir(liste) for ad, liste in sinirlar.items()}
+
+
+def akis_siniri(alan_adi):
+    """
+    Form alanı adına göre akış sırasında uygulanacak sınırı döndür.
+
+    Yükleme işleyicisi dosyanın hangi model alanına kaydedileceğini bilemez;
+    aynı adı taşıyan model alanlarının sınırlarından en genişini uygular.
+    Kesin sınır, model alanındaki ``YuklemeSiniriValidator`` ile denetlenir.
+    Inline formset alanları (ör. ``sertifikalar-0-sertifika_dosya``) son
+    bölümlerine göre eşleştirilir.
+    """
+    return _akis_sinirlari().get(alan_adi.rsplit("-", 1)[-1], VARSAYILAN_SINIR)
+
+
+def sinir_hatasi(sinir, dosya_adi, boyut):
+    """Dosya adı ve boyutu sınırı aşıyorsa hata mesajını, aşmıyorsa None döndür."""
+    uzanti = os.path.splitext(dosya_adi or "")[1].lower()
+    if sinir["uzantilar"] and uzanti not in sinir["uzantilar"]:
+        return _("Bu alana yalnızca %(uzantilar)s dosyaları yüklenebilir.") % {
+            "uzantilar": ", ".join(sinir["uzantilar"])
+        }
+    if boyut is not None and boyut > sinir["boyut"]:
+        return _("Dosya boyutu en fazla %(boyut)s olabilir.") % {
+            "boyut": filesizeformat(sinir["boyut"])
+        }
+    return None
+
+
+def istek_cok_buyuk_mu(request):
+    ust_sinir = getattr(settings, "YUKLEME_ISTEK_UST_SINIRI", None)
+    try:
+        uzunluk = int(request.META.get("CONTENT_LENGTH") or 0)
+    except ValueError:
+        return False
+    return bool(ust_sinir) and uzunluk > ust_sinir
+
+
+class YuklemeSiniriMiddleware:
+    """
+    ``Content-Length`` değeri ``YUKLEME_ISTEK_UST_SINIRI`` sınırını aşan
+    istekleri gövde okunmadan 413 ile reddeder.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if istek_cok_buyuk_mu(request):
+            return self._reddet()
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        if istek_cok_buyuk_mu(request):
+            return self._reddet()
+        return await self.get_response(request)
+
+    def _reddet(self):
+        return HttpResponse(
+            _("İstek gövdesi izin verilen boyutu aşıyor."),
+            status=413,
+            content_type="text/plain; charset=utf-8",
+        )
+
+
+class ReddedilenYukleme(UploadedFile):
+    """
+    Sınırlara takıldığı için içeriği saklanmayan yükleme.
+
+    Form doğrulamasında hata mesajının gösterilebilmesi için yerine konur;
+    içeriği okunmak istendiğinde ``ValidationError`` fırlatır, böylece
+    doğrulanmadan kaydedilmeye çalışılsa bile boş dosya yazılmaz.
+    """
+
+    def __init__(self, name, content_type, size, red_nedeni):
+        super().__init__(BytesIO(), name, content_type, size)
+        self.red_nedeni = red_nedeni
+
+    def read(self, *args, **kwargs):
+        raise ValidationError(self.red_nedeni)
+
+    def chunks(self, chunk_size=None):
+        raise ValidationError(self.red_nedeni)
+
+
+class DiskeAkanYukleme(TemporaryUploadedFile):
+    """Geçici dosyası ``YUKLEME_GECICI_DIZINI`` altında oluşturulan yükleme."""
+
+    def __init__(self, name, content_type, size, charset, content_type_extra=None):
+        dizin = settings.YUKLEME_GECICI_DIZINI
+        os.makedirs(dizin, exist_ok=True)
+        uzanti = os.path.splitext(name)[1]
+        dosya = tempfile.NamedTemporaryFile(suffix=".upload" + uzanti, dir=dizin)
+        UploadedFile.__init__(
+            self, dosya, name, content_type, size, charset, content_type_extra
+        )
+
+
+class SinirliYuklemeIsleyicisi(FileUploadHandler):
+    """
+    Dosyaları sınırlarını denetleyerek doğrudan diske akıtan yükleme işleyicisi.
+
+    Geçici dosyalar ``YUKLEME_GECICI_DIZINI`` altında, medya dizini ile aynı
+    dosya sisteminde oluşturulur; depolama dosyayı yerine yalnızca yeniden
+    adlandırarak taşır. İçerik diske yazılırken SHA-256 özeti hesaplanır ve
+    dosyanın ``sha256`` özniteliğine eklenir. Uzantısı, imzası veya boyutu
+    uygun olmayan dosyaların yazımı hemen kesilir.
+    """
+
+    def handle_raw_input(
+        self, input_data, META, content_length, boundary, encoding=None
+    ):
+        # Ara katman dışında kalan istekler için (ör. testlerde): Django bu
+        # hatayı gövdeyi okumadan istemci hatasına çevirir.
+        ust_sinir = getattr(settings, "YUKLEME_ISTEK_UST_SINIRI", None)
+        if ust_sinir and content_length and content_length > ust_sinir:
+            raise RequestDataTooBig(
+                "Yükleme isteği YUKLEME_ISTEK_UST_SINIRI sınırını aşıyor."
+            )
+
+    def new_file(self, field_name, file_name, *args, **kwargs):
+        super().new_file(field_name, file_name, *args, **kwargs)
+        self.sinir = akis_siniri(field_name)
+        self.hash_nesnesi = hashlib.sha256()
+        self.boyut = 0
+        self.file = None
+        self.red_nedeni = sinir_hatasi(self.sinir, file_name, self.content_length)
+        if self.red_nedeni is None:
+            self.file = DiskeAkanYukleme(
+                self.file_name,
+                self.content_type,
+                0,
+                self.charset,
+                self.content_type_extra,
+            )
+
+    def receive_data_chunk(self, raw_data, start):
+        self.boyut += len(raw_data)
+        if self.red_nedeni is None:
+            if start == 0 and not self._imza_uygun(raw_data):
+                self.red_nedeni = _("Dosya içeriği uzantısıyla uyuşmuyor.")
+            elif self.boyut > self.sinir["boyut"]:
+                self.red_nedeni = sinir_hatasi(self.sinir, self.file_name, self.boyut)
+            if self.red_nedeni is not None:
+                self._gecici_dosyayi_sil()
+                return None
+
+            self.hash_nesnesi.update(raw_data)
+            self.file.write(raw_data)
+        return None
+
+    def file_complete(self, file_size):
+        yukleme_tamamlandi(self.field_name, file_size, self.red_nedeni is None)
+        if self.red_nedeni is not None:
+            return ReddedilenYukleme(
+                self.file_name, self.content_type, file_size, self.red_nedeni
+            )
+
+        self.file.seek(0)
+        self.file.size = file_size
+        self.file.sha256 = self.hash_nesnesi.hexdigest()
+        return self.file
+
+    def upload_interrupted(self):
+        self._gecici_dosyayi_sil()
+
+    def _imza_uygun(self, ilk_parca):
+        uzanti = os.path.splitext(self.file_name or "")[1].lower()
+        imzalar = DOSYA_IMZALARI.get(uzanti)
+        return not imzalar or ilk_parca.startswith(imzalar)
+
+    def _gecici_dosyayi_sil(self):
+        if self.file is None:
+            return
+        gecici_yol = self.file.temporary_file_path()
+        try:
+            self.file.close()
+            os.remove(gecici_yol)
+        except FileNotFoundError:
+            pass
+        self.file = None
@@ -3,6 +3,8 @@ from django.contrib.auth.admin import UserAdmin
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from ayarlar.admin import IlceFiltresi
+
 from .forms import KullaniciDegistirmeForm, KullaniciOlusturmaForm
 from .models import (
     CalismaSaatleri,
@@ -149,6 +151,7 @@ class IsTecrubesiInline(admin.TabularInline):
 class YetenekInline(admin.TabularInline):
     model = Yetenek
     extra = 1
+    readonly_fields = ("beceri",)
     classes = ["collapse"]
     verbose_name = _("Yetenek")
     verbose_name_plural = _("Yetenekler")
@@ -194,11 +197,12 @@ class VatandasAdmin(admin.ModelAdmin):
         "is_usta",
         "is_is_arayan",
     )
+    list_select_related = ("kullanici", "il", "ilce__il")
     list_filter = (
         "is_usta",
         "is_is_arayan",
         "il",
-        "ilce",
+        ("ilce", IlceFiltresi),
         "cinsiyet",
         YasAraligiFilter,  # Özel yaş aralığı filtresi
         EgitimDurumuDerecesiListFilter,
@@ -410,7 +414,8 @@ class FirmaAdmin(admin.ModelAdmin):
         "aktif",
         "olusturma_tarihi",
     )
-    list_filter = ("aktif", "il", "sektorler")
+    list_select_related = ("kullanici", "il", "ilce__il")
+    list_filter = ("aktif", "il", ("ilce", IlceFiltresi), "sektorler")
     search_fields = ("ad", "kullanici__username", "email", "telefon", "vergi_no")
     prepopulated_fields = {"slug": ("ad",)}
     date_hierarchy = "olusturma_tarihi"
@@ -0,0 +1,84 @@
+"""
+Becerilere göre vatandaş arama.
+
+``Yetenek`` tablosundaki (beceri, seviye, vatandaş) dizini beceriden
+vatandaşlara ters dizin işlevi görür: bir beceri ve asgari seviye için
+vatandaş kimlikleri tabloya gitmeden yalnızca dizin taranarak okunur. Birden
+fazla beceri istendiğinde her beceri ayrı taranır ve kimlik listeleri
+``INTERSECT`` ile kesiştirilir.
+"""
+
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext as _
+
+from ayarlar.models import BeceriAdi
+from ortak.metin import arama_anahtari
+
+from .choices import YetenekSeviyeChoices
+from .models import Yetenek
+
+# Seviyelerin sorgu parametrelerinde kullanılan adları: "iyi", "cokiyi" vb.
+SEVIYE_ADLARI = {
+    seviye.name.lower().replace("_", ""): seviye.value
+    for seviye in YetenekSeviyeChoices
+}
+
+
+def _seviye(deger):
+    if deger.isdigit() and int(deger) in YetenekSeviyeChoices.values:
+        return int(deger)
+    try:
+        return SEVIYE_ADLARI[deger.lower().replace("_", "")]
+    except KeyError:
+        raise ValidationError(
+            _("Geçersiz yetenek seviyesi: %(deger)s"), params={"deger": deger}
+        )
+
+
+def beceri_kosullari(degerler):
+    """
+    ``"excel"`` veya ``"excel:iyi"`` biçimindeki değerleri çöz.
+
+    Seviye adla (``cokiyi``) veya sayıyla (``4``) verilebilir; verilmezse
+    her seviye kabul edilir. Beceri adları eş anlamlılarıyla birlikte tek
+    sorguda katalogdan çözülür. Beceri kimliğinden asgari seviyeye eşleme
+    döndürür; katalogda olmayan beceri için kimlik ``None`` olur.
+    """
+    istenen = {}
+    for deger in degerler:
+        ad, _ayrac, seviye = deger.partition(":")
+        normal = arama_anahtari(ad)
+        if normal:
+            seviye = _seviye(seviye) if seviye else YetenekSeviyeChoices.BASLANGIC
+            istenen[normal] = max(seviye, istenen.get(normal, seviye))
+
+    kimlikler = dict(
+        BeceriAdi.objects.filter(normal__in=istenen).values_list("normal", "beceri_id")
+    )
+    kosullar = {}
+    for normal, seviye in istenen.items():
+        beceri_id = kimlikler.get(normal)
+        kosullar[beceri_id] = max(seviye, kosullar.get(beceri_id, seviye))
+    return kosullar
+
+
+def becerilere_sahip(queryset, kosullar):
+    """
+    Vatandaşları tüm becerilere en az istenen seviyede sahip olanlarla sınırla.
+
+    ``kosullar`` beceri kimliğinden asgari seviyeye eşlemedir.
+    """
+    if not kosullar:
+        return queryset
+    if None in kosullar:
+        return queryset.none()
+    taramalar = [
+        Yetenek.objects.filter(beceri_id=beceri_id, seviye__gte=seviye)
+        .order_by()
+        .values("vatandas_id")
+        for beceri_id, seviye in kosullar.items()
+    ]
+    vatandaslar = taramalar[0]
+    if len(taramalar) > 1:
+        vatandaslar = vatandaslar.intersection(*taramalar[1:])
+    return queryset.filter(pk__in=vatandaslar)
@@ -23,12 +23,13 @@ class EgitimDereceChoices(models.TextChoices):
     DOKTORA = "doktora", _("Doktora")
 
 
-class YetenekSeviyeChoices(models.TextChoices):
-    BASLANGIC = "baslangic", _("Başlangıç")
-    ORTA = "orta", _("Orta")
-    IYI = "iyi", _("İyi")
-    COK_IYI = "cokiyi", _("Çok İyi")
-    UZMAN = "uzman", _("Uzman")
+class YetenekSeviyeChoices(models.IntegerChoices):
+    # Sıralı seviyeler; "en az iyi" gibi karşılaştırmalar sayıyla yapılır
+    BASLANGIC = 1, _("Başlangıç")
+    ORTA = 2, _("Orta")
+    IYI = 3, _("İyi")
+    COK_IYI = 4, _("Çok İyi")
+    UZMAN = 5, _("Uzman")
 
 
 class CalismaGunleriChoices(models.TextChoices):
@@ -1,8 +1,14 @@
 import uuid
 
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from ayarlar.models import Beceri
+from dosyalar.storage import belge_storage
+from dosyalar.validators import YuklemeSiniriValidator
+from ortak.metin import arama_anahtari
+
 from .choices import (
     CalismaGunleriChoices,
     CinsiyetChoices,
@@ -51,6 +57,7 @@ class Vatandas(models.Model):
         blank=True,
         null=True,
         help_text=_("Vatandaşın profil fotoğrafı"),
+        validators=[YuklemeSiniriValidator("gorsel")],
     )
 
     # İletişim bilgileri
@@ -95,9 +102,11 @@ class Vatandas(models.Model):
     ozgecmis_dosya = models.FileField(
         _("Özgeçmiş Dosyası"),
         upload_to="ozgecmis/",
+        storage=belge_storage,
         blank=True,
         null=True,
         help_text=_("Vatandaşın özgeçmiş dosyası (PDF, Word vb.)"),
+        validators=[YuklemeSiniriValidator("belge")],
     )
 
     # Özel durumlar - ana Kullanici modeline dokunmadan bu bilgileri saklıyoruz
@@ -274,6 +283,10 @@ class IsTecrubesi(models.Model):
 class Yetenek(models.Model):
     """
     Vatandaşın yeteneklerini içerir.
+
+    Girilen yetenek kaydedilirken katalogdaki ``Beceri`` kaydına bağlanır.
+    (beceri, seviye, vatandaş) dizini beceriden vatandaşlara ters dizin
+    işlevi görür.
     """
 
     vatandas = models.ForeignKey(
@@ -286,7 +299,14 @@ class Yetenek(models.Model):
     yetenek = models.CharField(
         _("Yetenek"), max_length=100, help_text=_("Yetenek, beceri veya uzmanlık alanı")
     )
-    seviye = models.CharField(
+    beceri = models.ForeignKey(
+        "ayarlar.Beceri",
+        on_delete=models.PROTECT,
+        related_name="yetenekler",
+        editable=False,
+        verbose_name=_("Beceri"),
+    )
+    seviye = models.PositiveSmallIntegerField(
         _("Seviye"),
         choices=YetenekSeviyeChoices.choices,
         default=YetenekSeviyeChoices.IYI,
@@ -296,10 +316,36 @@ class Yetenek(models.Model):
     class Meta:
         verbose_name = _("Yetenek")
         verbose_name_plural = _("Yetenekler")
+        unique_together = [["vatandas", "beceri"]]
+        indexes = [
+            models.Index(
+                fields=["beceri", "seviye", "vatandas"],
+                name="yetenek_beceri_seviye_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.yetenek} - {self.get_seviye_display()}"
 
+    def clean(self):
+        if not self.vatandas_id or not self.yetenek:
+            return
+        tekrar = (
+            Yetenek.objects.filter(
+                vatandas_id=self.vatandas_id,
+                beceri__adlar__normal=arama_anahtari(self.yetenek),
+            )
+            .exclude(pk=self.pk)
+            .exists()
+        )
+        if tekrar:
+            raise ValidationError({"yetenek": _("Bu yetenek zaten ekli.")})
+
+    def save(self, *args, **kwargs):
+        self.yetenek = " ".join(self.yetenek.split())
+        self.beceri_id = Beceri.kimlik_bul_veya_olustur(self.yetenek)
+        super().save(*args, **kwargs)
+
 
 class Sertifika(models.Model):
     """
@@ -335,9 +381,11 @@ class Sertifika(models.Model):
     sertifika_dosya = models.FileField(
         _("Sertifika Dosyası"),
         upload_to="sertifikalar/",
+        storage=belge_storage,
         blank=True,
         null=True,
         help_text=_("Sertifikanın dijital kopyası"),
+        validators=[YuklemeSiniriValidator("sertifika")],
     )
 
     class Meta:
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:27
+
+import dosyalar.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hesap', '0004_alter_istecrubesi_aciklama_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='sertifika',
+            name='sertifika_dosya',
+            field=models.FileField(blank=True, help_text='Sertifikanın dijital kopyası', null=True, storage=dosyalar.storage.belge_storage, upload_to='sertifikalar/', verbose_name='Sertifika Dosyası'),
+        ),
+        migrations.AlterField(
+            model_name='vatandas',
+            name='ozgecmis_dosya',
+            field=models.FileField(blank=True, help_text='Vatandaşın özgeçmiş dosyası (PDF, Word vb.)', null=True, storage=dosyalar.storage.belge_storage, upload_to='ozgecmis/', verbose_name='Özgeçmiş Dosyası'),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:30
+
+import dosyalar.storage
+import dosyalar.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hesap", "0005_alter_sertifika_sertifika_dosya_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="firma",
+            name="logo",
+            field=models.ImageField(
+                blank=True,
+                null=True,
+                upload_to="firma/logo/",
+                validators=[dosyalar.validators.YuklemeSiniriValidator("logo")],
+                verbose_name="Logo",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="sertifika",
+            name="sertifika_dosya",
+            field=models.FileField(
+                blank=True,
+                help_text="Sertifikanın dijital kopyası",
+                null=True,
+                storage=dosyalar.storage.belge_storage,
+                upload_to="sertifikalar/",
+                validators=[
+                    dosyalar.validators.YuklemeSiniriValidator("sertifika_dosya")
+                ],
+                verbose_name="Sertifika Dosyası",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="vatandas",
+            name="ozgecmis_dosya",
+            field=models.FileField(
+                blank=True,
+                help_text="Vatandaşın özgeçmiş dosyası (PDF, Word vb.)",
+                null=True,
+                storage=dosyalar.storage.belge_storage,
+                upload_to="ozgecmis/",
+                validators=[
+                    dosyalar.validators.YuklemeSiniriValidator("ozgecmis_dosya")
+                ],
+                verbose_name="Özgeçmiş Dosyası",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="vatandas",
+            name="profil_fotografi",
+            field=models.ImageField(
+                blank=True,
+                help_text="Vatandaşın profil fotoğrafı",
+                null=True,
+                upload_to="profil/fotograf/",
+                validators=[
+                    dosyalar.validators.YuklemeSiniriValidator("profil_fotografi")
+                ],
+                verbose_name="Profil Fotoğrafı",
+            ),
+        ),
+    ]
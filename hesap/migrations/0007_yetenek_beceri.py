@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ayarlar", "0002_beceri_beceriadi"),
+        ("hesap", "0006_alter_firma_logo_alter_sertifika_sertifika_dosya_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="yetenek",
+            name="beceri",
+            field=models.ForeignKey(
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="yetenekler",
+                to="ayarlar.beceri",
+                verbose_name="Beceri",
+            ),
+        ),
+        migrations.AddField(
+            model_name="yetenek",
+            name="seviye_sira",
+            field=models.PositiveSmallIntegerField(null=True),
+        ),
+    ]
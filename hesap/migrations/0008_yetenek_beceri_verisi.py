@@ -0,0 +1,68 @@
+from django.db import migrations
+
+# Göç, modeldeki normalleştirmenin o anki kopyasını kullanır
+TURKCE_BUYUK_I = str.maketrans({"I": "ı", "İ": "i"})
+
+ESKI_SEVIYELER = {"baslangic": 1, "orta": 2, "iyi": 3, "cokiyi": 4, "uzman": 5}
+
+
+def _normallestir(metin):
+    metin = " ".join(metin.translate(TURKCE_BUYUK_I).casefold().split())
+    return metin.replace("ı", "i")
+
+
+def yetenekleri_katalogla(apps, schema_editor):
+    """
+    Mevcut yetenekleri beceri kataloğuna bağla ve seviyeleri sayıya çevir.
+
+    Aynı vatandaşta aynı beceriye çözülen yeteneklerden en yüksek seviyeli
+    olan korunur.
+    """
+    Beceri = apps.get_model("ayarlar", "Beceri")
+    BeceriAdi = apps.get_model("ayarlar", "BeceriAdi")
+    Yetenek = apps.get_model("hesap", "Yetenek")
+    db = schema_editor.connection.alias
+
+    beceriler = dict(BeceriAdi.objects.using(db).values_list("normal", "beceri_id"))
+    korunanlar = {}
+    silinecekler = []
+    yetenekler = Yetenek.objects.using(db).only(
+        "pk", "vatandas_id", "yetenek", "seviye"
+    )
+    for yetenek in yetenekler.order_by("pk").iterator(chunk_size=2000):
+        ad = " ".join(yetenek.yetenek.split())
+        normal = _normallestir(ad)
+        if normal not in beceriler:
+            beceri = Beceri.objects.using(db).create(ad=ad)
+            BeceriAdi.objects.using(db).create(beceri=beceri, ad=ad, normal=normal)
+            beceriler[normal] = beceri.pk
+        yetenek.yetenek = ad
+        yetenek.beceri_id = beceriler[normal]
+        yetenek.seviye_sira = ESKI_SEVIYELER.get(yetenek.seviye, 3)
+
+        anahtar = (yetenek.vatandas_id, yetenek.beceri_id)
+        onceki = korunanlar.get(anahtar)
+        if onceki is None or onceki.seviye_sira < yetenek.seviye_sira:
+            if onceki is not None:
+                silinecekler.append(onceki.pk)
+            korunanlar[anahtar] = yetenek
+        else:
+            silinecekler.append(yetenek.pk)
+
+    Yetenek.objects.using(db).filter(pk__in=silinecekler).delete()
+    Yetenek.objects.using(db).bulk_update(
+        list(korunanlar.values()),
+        ["yetenek", "beceri", "seviye_sira"],
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hesap", "0007_yetenek_beceri"),
+    ]
+
+    operations = [
+        migrations.RunPython(yetenekleri_katalogla, migrations.RunPython.noop),
+    ]
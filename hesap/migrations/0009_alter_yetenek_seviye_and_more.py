@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ayarlar", "0002_beceri_beceriadi"),
+        ("hesap", "0008_yetenek_beceri_verisi"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="yetenek",
+            name="seviye",
+        ),
+        migrations.RenameField(
+            model_name="yetenek",
+            old_name="seviye_sira",
+            new_name="seviye",
+        ),
+        migrations.AlterField(
+            model_name="yetenek",
+            name="seviye",
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (1, "Başlangıç"),
+                    (2, "Orta"),
+                    (3, "İyi"),
+                    (4, "Çok İyi"),
+                    (5, "Uzman"),
+                ],
+                default=3,
+                help_text="Bu yetenekteki uzmanlık seviyeniz",
+                verbose_name="Seviye",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="yetenek",
+            name="beceri",
+            field=models.ForeignKey(
+                editable=False,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="yetenekler",
+                to="ayarlar.beceri",
+                verbose_name="Beceri",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="yetenek",
+            unique_together={("vatandas", "beceri")},
+        ),
+        migrations.AddIndex(
+            model_name="yetenek",
+            index=models.Index(
+                fields=["beceri", "seviye", "vatandas"],
+                name="yetenek_beceri_seviye_idx",
+            ),
+        ),
+    ]
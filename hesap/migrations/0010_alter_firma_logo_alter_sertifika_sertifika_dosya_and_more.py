@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:43
+
+import dosyalar.storage
+import dosyalar.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hesap", "0009_alter_yetenek_seviye_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="firma",
+            name="logo",
+            field=models.ImageField(
+                blank=True,
+                null=True,
+                upload_to="firma/logo/",
+                validators=[dosyalar.validators.YuklemeSiniriValidator("gorsel")],
+                verbose_name="Logo",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="sertifika",
+            name="sertifika_dosya",
+            field=models.FileField(
+                blank=True,
+                help_text="Sertifikanın dijital kopyası",
+                null=True,
+                storage=dosyalar.storage.belge_storage,
+                upload_to="sertifikalar/",
+                validators=[dosyalar.validators.YuklemeSiniriValidator("sertifika")],
+                verbose_name="Sertifika Dosyası",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="vatandas",
+            name="ozgecmis_dosya",
+            field=models.FileField(
+                blank=True,
+                help_text="Vatandaşın özgeçmiş dosyası (PDF, Word vb.)",
+                null=True,
+                storage=dosyalar.storage.belge_storage,
+                upload_to="ozgecmis/",
+                validators=[dosyalar.validators.YuklemeSiniriValidator("belge")],
+                verbose_name="Özgeçmiş Dosyası",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="vatandas",
+            name="profil_fotografi",
+            field=models.ImageField(
+                blank=True,
+                help_text="Vatandaşın profil fotoğrafı",
+                null=True,
+                upload_to="profil/fotograf/",
+                validators=[dosyalar.validators.YuklemeSiniriValidator("gorsel")],
+                verbose_name="Profil Fotoğrafı",
+            ),
+        ),
+    ]
@@ -3,6 +3,7 @@ from django.db import models
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
+from dosyalar.validators import YuklemeSiniriValidator
 from hesap.choices import KullaniciTipChoices
 
 # Vatandas modeli ve ilgili modelleri import et
@@ -67,7 +68,13 @@ class Firma(models.Model):
     slug = models.SlugField(
         _("Slug"), max_length=255, blank=True, null=True, unique=True
     )
-    logo = models.ImageField(_("Logo"), upload_to="firma/logo/", blank=True, null=True)
+    logo = models.ImageField(
+        _("Logo"),
+        upload_to="firma/logo/",
+        blank=True,
+        null=True,
+        validators=[YuklemeSiniriValidator("gorsel")],
+    )
     aciklama = models.TextField(_("Firma Açıklaması"), blank=True, null=True)
 
     # İletişim Bilgileri
@@ -1,3 +1,57 @@
 from django.test import TestCase
 
-# Create your tests here.
+from ayarlar.models import Beceri, BeceriAdi
+
+from .beceri import becerilere_sahip, beceri_kosullari
+from .choices import YetenekSeviyeChoices
+from .models import Kullanici, Vatandas, Yetenek
+
+
+class BeceriKatalogTests(TestCase):
+    def test_noktali_ve_noktasiz_i_ayni_beceriye_cozulur(self):
+        for adlar in (["LINUX", "Linux", "lınux"], ["İngilizce", "INGILIZCE"]):
+            with self.subTest(adlar=adlar):
+                kimlikler = {Beceri.kimlik_bul_veya_olustur(ad) for ad in adlar}
+                self.assertEqual(len(kimlikler), 1)
+        self.assertEqual(BeceriAdi.objects.count(), 2)
+
+    def test_es_anlamli_buyuk_harfle_de_bulunur(self):
+        beceri = Beceri.objects.create(ad="Microsoft Excel")
+        BeceriAdi.objects.create(beceri=beceri, ad="Excel")
+        self.assertEqual(Beceri.kimlik_bul_veya_olustur("EXCEL"), beceri.pk)
+
+
+class BecerilereSahipTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.vatandaslar = [
+            Vatandas.objects.create(kullanici=Kullanici.objects.create_user(f"v{sira}"))
+            for sira in range(3)
+        ]
+        yetenekler = [
+            ("Excel", YetenekSeviyeChoices.COK_IYI, "Linux"),
+            ("excel", YetenekSeviyeChoices.ORTA, "LINUX"),
+            ("EXCEL", YetenekSeviyeChoices.UZMAN, None),
+        ]
+        for vatandas, (excel, seviye, linux) in zip(cls.vatandaslar, yetenekler):
+            Yetenek.objects.create(vatandas=vatandas, yetenek=excel, seviye=seviye)
+            if linux:
+                Yetenek.objects.create(vatandas=vatandas, yetenek=linux)
+
+    def _ara(self, *degerler):
+        kosullar = beceri_kosullari(degerler)
+        return set(becerilere_sahip(Vatandas.objects.all(), kosullar))
+
+    def test_seviye_adi_asgari_seviyeyi_belirler(self):
+        v0, v1, v2 = self.vatandaslar
+        self.assertEqual(self._ara("excel:iyi"), {v0, v2})
+        self.assertEqual(self._ara("excel:uzman"), {v2})
+        self.assertEqual(self._ara("excel"), {v0, v1, v2})
+
+    def test_birden_fazla_beceri_kesisir(self):
+        v0, v1, _v2 = self.vatandaslar
+        self.assertEqual(self._ara("excel:iyi", "linux"), {v0})
+        self.assertEqual(self._ara("EXCEL", "lınux"), {v0, v1})
+
+    def test_katalogda_olmayan_beceri_sonuc_dondurmez(self):
+        self.assertEqual(self._ara("excel", "cobol"), set())
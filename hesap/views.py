@@ -1,3 +1,99 @@
-from django.shortcuts import render
+from django import forms
+from django.db.models import Count, Exists, OuterRef, Prefetch, Q
+from django.utils.translation import gettext
 
-# Create your views here.
+from ayarlar.models import Meslek
+from ortak.liste import (
+    FasetliListeFormu,
+    FasetliListeView,
+    cografya_form_secenekleri,
+    cografya_secenekleri,
+)
+
+from .models import UstalikAlani, Vatandas
+
+# Deneyim aralıkları (yıl); üst sınırı olmayan aralık için None
+DENEYIM_ARALIKLARI = {"0-2": (0, 2), "3-5": (3, 5), "6-10": (6, 10), "10+": (11, None)}
+
+
+class UstaFiltreFormu(FasetliListeFormu):
+    meslek = forms.ChoiceField(required=False)
+    il = forms.ChoiceField(required=False)
+    ilce = forms.ChoiceField(required=False)
+    deneyim = forms.MultipleChoiceField(
+        required=False,
+        choices=[(ad, ad) for ad in DENEYIM_ARALIKLARI],
+        widget=forms.CheckboxSelectMultiple,
+    )
+
+
+class UstaListesiView(FasetliListeView):
+    """Usta olarak hizmet veren vatandaşlar; meslek, konum ve deneyime göre."""
+
+    template_name = "ustalar/list.html"
+    sonuc_sablonu = "ustalar/components/master-listings.html"
+    form_class = UstaFiltreFormu
+    onek = "usta"
+    surum_adlari = ("usta",)
+    fasetler = {
+        "meslek": "ustalik_alanlari__meslek__slug",
+        "il": "il__slug",
+        "ilce": "ilce__slug",
+    }
+    siralamalar = {
+        "tarih-yeni": ("-olusturma_tarihi", "-id"),
+        "tarih-eski": ("olusturma_tarihi", "id"),
+    }
+    # Meslek fasetinde ustalık alanlarına katılım satırları çoğaltır
+    sayim = Count("pk", distinct=True)
+
+    def temel_sorgu(self):
+        return (
+            Vatandas.objects.filter(is_usta=True)
+            .select_related("kullanici", "il", "ilce")
+            .prefetch_related(
+                Prefetch(
+                    "ustalik_alanlari",
+                    queryset=UstalikAlani.objects.select_related("meslek"),
+                )
+            )
+        )
+
+    def filtrele(self, queryset, filtreler):
+        for ad in ("il", "ilce"):
+            if ad in filtreler:
+                queryset = queryset.filter(**{f"{ad}__slug": filtreler[ad]})
+        # Meslek ve deneyim aynı ustalık alanında sağlanmalıdır
+        alanlar = Q()
+        if "meslek" in filtreler:
+            alanlar &= Q(meslek__slug=filtreler["meslek"])
+        if "deneyim" in filtreler:
+            araliklar = Q()
+            for ad in filtreler["deneyim"]:
+                alt, ust = DENEYIM_ARALIKLARI[ad]
+                aralik = Q(deneyim_yili__gte=alt)
+                if ust is not None:
+                    aralik &= Q(deneyim_yili__lte=ust)
+                araliklar |= aralik
+            alanlar &= araliklar
+        if alanlar:
+            queryset = queryset.filter(
+                Exists(UstalikAlani.objects.filter(alanlar, vatandas=OuterRef("pk")))
+            )
+        return queryset
+
+    def secenekleri_hesapla(self):
+        return {
+            "meslek": [
+                ("", gettext("Tüm Meslekler")),
+                *Meslek.objects.values_list("slug", "ad"),
+            ],
+            **cografya_secenekleri(),
+        }
+
+    def form_secenekleri(self, secenekler, veri):
+        return cografya_form_secenekleri(secenekler, veri)
+
+    def etkin_fasetler(self, filtreler):
+        # İlçe sayıları yalnızca il seçiliyken gösterilir
+        return [ad for ad in self.fasetler if ad != "ilce" or "il" in filtreler]
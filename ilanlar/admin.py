@@ -2,7 +2,10 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
+from ayarlar.admin import IlceFiltresi
+
 from .models import (
+    AnahtarKelime,
     BasvuruCevap,
     IlanAnahtar,
     IlanBasvuru,
@@ -11,6 +14,7 @@ from .models import (
     IlanSoru,
     IsBilgileri,
 )
+from .sonuc import SONUC_ALANLARI, sonuclari_hesapla
 
 
 # Inline Models
@@ -91,12 +95,14 @@ class IsBilgileriAdmin(admin.ModelAdmin):
         "basvuru_sayisi",
         "olusturma_tarihi",
     )
+    list_select_related = ("firma", "il")
     list_filter = (
         "durum",
         "calisma_modeli",
         "calisma_yeri",
         "sektor",
         "il",
+        ("ilce", IlceFiltresi),
         "egitim_duzey",
         "deneyim_duzey",
         "one_cikartilmis",
@@ -418,7 +424,12 @@ class IlanSonucAdmin(admin.ModelAdmin):
     )
     list_filter = ("tamamlandi",)
     search_fields = ("ilan__baslik", "aciklama", "ic_degerlendirme")
-    readonly_fields = ("tamamlanma_tarihi", "toplam_basvuru")
+    readonly_fields = (
+        "tamamlanma_tarihi",
+        "toplam_basvuru",
+        "mulakat_yapilan",
+        "ise_alinan",
+    )
     filter_horizontal = ("ise_alinanlar",)
 
     # Otomatik tamamlama için alanlar
@@ -451,7 +462,7 @@ class IlanSonucAdmin(admin.ModelAdmin):
             {
                 "fields": ("ise_alinanlar",),
                 "description": _(
-                    "Bu ilanda işe alınan adayları seçin. Seçilen aday sayısı, işe alınan sayısıyla eşleşmelidir."
+                    "Bu ilanda işe alınan adayları seçin. İşe alınan sayısı seçilen adaylardan hesaplanır."
                 ),
             },
         ),
@@ -468,20 +479,24 @@ class IlanSonucAdmin(admin.ModelAdmin):
         ),
     )
 
-    # İlan sonuçları kaydedildiğinde toplam başvuru sayısını güncelle
-    def save_model(self, request, obj, form, change):
-        # İşe alınanlar ile işe alınan sayısı tutarlılığını kontrol et
-        if obj.ise_alinanlar.count() != obj.ise_alinan:
-            from django.contrib import messages
+    # İşe alınanlar ilişkisi kaydedildikten sonra istatistikleri yeniden hesapla
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        sonuclari_hesapla([form.instance.ilan_id])
+        form.instance.refresh_from_db(fields=SONUC_ALANLARI)
 
-            messages.warning(
-                request, _("İşe alınan adaylar ile işe alınan sayısı eşleşmiyor!")
-            )
 
-        # Toplam başvuru sayısını güncelle
-        obj.toplam_basvuru = obj.ilan.basvurular.count()
+@admin.register(AnahtarKelime)
+class AnahtarKelimeAdmin(admin.ModelAdmin):
+    """Anahtar kelime sözlüğü; kelimeler ilanlara girildikçe oluşur"""
 
-        super().save_model(request, obj, form, change)
+    list_display = ("ad", "normal", "ilan_sayisi")
+    search_fields = ("ad", "normal")
+    ordering = ("-ilan_sayisi", "normal")
+    readonly_fields = ("normal", "ilan_sayisi")
+
+    def has_add_permission(self, request):
+        return False
 
 
 # İlan cevapları için ayrı admin kaydı yapmıyoruz, sadece inline olarak gösteriliyor
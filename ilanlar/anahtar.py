@@ -0,0 +1,126 @@
+"""
+Anahtar kelime sayaçları ve otomatik tamamlama.
+
+Her sözlük kelimesinin yayındaki ilan sayısı, ilan durumu ve ilan anahtar
+kelimesi sinyallerinde tek bir hedefli UPDATE ile artımlı olarak güncellenir;
+toplu işlemlerden kaynaklanan sapmalar ``anahtar_sayilarini_uzlastir`` ile
+giderilir. Otomatik tamamlama, yayındaki ilanlarda geçen kelimelerden süreç
+içinde kurulan bir önek ağacıyla (trie) yapılır: her düğüm o önekle başlayan
+en çok kullanılan kelimeleri hazır tuttuğu için arama yalnızca önek
+uzunluğu kadar adım sürer. Ağaç ``anahtar`` sürümü değiştiğinde yeniden
+kurulur.
+"""
+
+import threading
+from functools import partial
+
+from django.db import transaction
+from django.db.models import Count, Exists, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from ortak.onbellek import surum_artir, surumler
+
+from .models import AnahtarKelime, IlanAnahtar, IlanDurumChoices
+
+ANAHTAR_SURUMU = "anahtar"
+
+# Her önek için hazır tutulan öneri sayısı
+ONERI_SAYISI = 10
+
+
+def ilan_sayilarini_degistir(kelime_idleri, fark):
+    """Kelimelerin yayındaki ilan sayılarını ``fark`` kadar değiştir."""
+    kelime_idleri = list(kelime_idleri)
+    if not kelime_idleri or not fark:
+        return
+    AnahtarKelime.objects.filter(pk__in=kelime_idleri).update(
+        ilan_sayisi=Greatest(F("ilan_sayisi") + fark, Value(0))
+    )
+    transaction.on_commit(partial(surum_artir, ANAHTAR_SURUMU))
+
+
+def anahtar_sayilarini_uzlastir():
+    """
+    İlan sayılarını gerçek sayımlarla eşitle ve kullanılmayan kelimeleri sil.
+
+    Sayılar tek bir UPDATE ile yayındaki ilanların anahtar kelimelerinden
+    yeniden hesaplanır. Güncellenen kelime sayısını döndürür.
+    """
+    anahtarlar = IlanAnahtar.objects.filter(kelime_id=OuterRef("pk"))
+    with transaction.atomic():
+        AnahtarKelime.objects.filter(~Exists(anahtarlar)).delete()
+        guncellenen = AnahtarKelime.objects.update(
+            ilan_sayisi=Coalesce(
+                Subquery(
+                    anahtarlar.filter(ilan__durum=IlanDurumChoices.YAYINDA)
+                    .order_by()
+                    .values("kelime_id")
+                    .annotate(adet=Count("pk"))
+                    .values("adet"),
+                    output_field=IntegerField(),
+                ),
+                Value(0),
+            )
+        )
+        transaction.on_commit(partial(surum_artir, ANAHTAR_SURUMU))
+    return guncellenen
+
+
+class OnekAgaci:
+    """
+    Kelimelerin normal biçimlerinden kurulan önek ağacı.
+
+    Her düğüm ``(çocuklar, öneriler)`` çiftidir; öneriler o önekle başlayan
+    en çok kullanılan ``oneri_sayisi`` kelimedir. Kelimeler sayıya göre
+    azalan sırada eklendiği için öneri listeleri sıralama gerektirmez.
+    Kelimeler ve önek ``AnahtarKelime.normallestir`` biçiminde olmalıdır;
+    bu biçimde noktalı ve noktasız i ayrımı yapılmaz.
+    """
+
+    def __init__(self, kelimeler, oneri_sayisi=ONERI_SAYISI):
+        self.kok = ({}, [])
+        for kelime in sorted(kelimeler, key=lambda k: (-k["ilan_sayisi"], k["normal"])):
+            dugum = self.kok
+            if len(dugum[1]) < oneri_sayisi:
+                dugum[1].append(kelime)
+            for harf in kelime["normal"]:
+                dugum = dugum[0].setdefault(harf, ({}, []))
+                if len(dugum[1]) < oneri_sayisi:
+                    dugum[1].append(kelime)
+
+    def ara(self, onek):
+        dugum = self.kok
+        for harf in onek:
+            dugum = dugum[0].get(harf)
+            if dugum is None:
+                return []
+        return dugum[1]
+
+
+_kilit = threading.Lock()
+_agac = {"surum": None, "agac": None}
+
+
+def _agaci_kur():
+    return OnekAgaci(
+        AnahtarKelime.objects.filter(ilan_sayisi__gt=0).values(
+            "ad", "normal", "ilan_sayisi"
+        )
+    )
+
+
+def oneriler(onek=""):
+    """
+    Önekle başlayan en çok kullanılan kelimeleri döndür.
+
+    Önek boşsa en çok kullanılan kelimeler döner. Önek de kelimeler gibi
+    Türkçe kurallarıyla küçük harfe çevrilir.
+    """
+    surum = surumler(ANAHTAR_SURUMU)[ANAHTAR_SURUMU]
+    with _kilit:
+        agac = _agac["agac"] if _agac["surum"] == surum else None
+    if agac is None:
+        agac = _agaci_kur()
+        with _kilit:
+            _agac.update(surum=surum, agac=agac)
+    return agac.ara(AnahtarKelime.normallestir(onek))
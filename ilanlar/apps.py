@@ -6,3 +6,6 @@ class IlanlarConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "ilanlar"
     verbose_name = _("İlanlar")
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,84 @@
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F
+from django.db.models.constants import OnConflict
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from dosyalar.referanslar import referanslari_ekle
+
+from .models import BasvuruCevap, IlanBasvuru, IlanDurumChoices, IsBilgileri
+from .soru_semasi import soru_semasi
+
+
+def _basvuru_ekle(basvuru):
+    """
+    Başvuruyu ``ON CONFLICT DO NOTHING`` ile ekle.
+
+    Aynı vatandaşın aynı ilana önceki başvurusu ``(ilan, vatandas)``
+    benzersiz anahtarına takılır; bu durumda False döner ve ayrıca bir
+    kontrol sorgusu yapılmaz. Kayıt ``save()`` ile yapılmadığı için model
+    sinyalleri gönderilmez; özgeçmiş referansı çağıran tarafından eklenir.
+    """
+    meta = IlanBasvuru._meta
+    alanlar = [
+        alan
+        for alan in meta.local_concrete_fields
+        if not alan.generated and alan is not meta.pk
+    ]
+    # bulk_create(ignore_conflicts=True) eklenen satırın kimliğini
+    # döndürmez; cevaplar başvuruya bağlandığı için kimlik RETURNING ile
+    # aynı ifadede alınır.
+    satirlar = IlanBasvuru._base_manager._insert(
+        [basvuru],
+        fields=alanlar,
+        returning_fields=[meta.pk],
+        on_conflict=OnConflict.IGNORE,
+    )
+    if not satirlar or satirlar[0] is None:
+        return False
+
+    basvuru.pk = satirlar[0][0]
+    basvuru._state.adding = False
+    basvuru._state.db = IlanBasvuru._base_manager.db
+    return True
+
+
+def basvuru_yap(ilan, vatandas, cevaplar=None, ozgecmis=None, on_yazi=None):
+    """
+    Vatandaşın ilana başvurusunu cevaplarıyla birlikte tek işlemde kaydet.
+
+    Cevaplar önbellekteki derlenmiş soru şemasına göre doğrulanır;
+    ``cevaplar`` soru kimliklerini veya ``soru_<id>`` alan adlarını cevaba
+    eşler. Başvuru, cevaplar ve ilanın başvuru sayacı aynı işlemde yazılır;
+    soru sayısından bağımsız olarak sabit sayıda SQL ifadesi çalıştırılır.
+    Mükerrer başvurularda ``mukerrer`` kodlu ``ValidationError`` fırlatılır.
+    """
+    bugun = timezone.localdate()
+    if ilan.durum != IlanDurumChoices.YAYINDA or (
+        ilan.basvuru_bitis and ilan.basvuru_bitis < bugun
+    ):
+        raise ValidationError(_("Bu ilan başvuruya kapalıdır."), code="kapali")
+    if ilan.basvuru_baslangic and ilan.basvuru_baslangic > bugun:
+        raise ValidationError(_("Bu ilana henüz başvuru yapılamaz."), code="baslamadi")
+
+    temiz_cevaplar = soru_semasi(ilan.pk).dogrula(cevaplar or {})
+    basvuru = IlanBasvuru(
+        ilan=ilan, vatandas=vatandas, ozgecmis=ozgecmis, on_yazi=on_yazi
+    )
+
+    with transaction.atomic():
+        if not _basvuru_ekle(basvuru):
+            raise ValidationError(_("Bu ilana daha önce başvurdunuz."), code="mukerrer")
+        referanslari_ekle(basvuru)
+
+        BasvuruCevap.objects.bulk_create(
+            [
+                BasvuruCevap(basvuru=basvuru, soru_id=soru_id, cevap=cevap)
+                for soru_id, cevap in temiz_cevaplar
+            ]
+        )
+        IsBilgileri.objects.filter(pk=ilan.pk).update(
+            basvuru_sayisi=F("basvuru_sayisi") + 1
+        )
+    return basvuru
@@ -0,0 +1,102 @@
+"""
+İlan listesi faset sayıları.
+
+Her faset, kendi seçimi dışındaki etkin filtrelerle sayılır; örneğin bir
+sektör seçiliyken diğer sektörlerin sayıları da görünmeye devam eder.
+PostgreSQL'de tüm fasetler tek sorguda ``GROUPING SETS`` ile gruplanır ve
+her faset sayısı yalnızca diğer fasetlerin seçimlerini içeren bir ``FILTER``
+ile hesaplanır. Diğer veritabanlarında aynı sayılar, faset alanlarının
+kombinasyonlarına göre gruplanmış tek bir sorgudan Python'da toplanır.
+"""
+
+from collections import defaultdict
+
+from django.db import connections
+from django.db.models import Count, F, Q
+
+
+def _takma_ad(sira):
+    return f"faset_{sira}"
+
+
+def _postgresql(taban, adlar, secimler, baglanti):
+    qn = baglanti.ops.quote_name
+    kolonlar = [qn(_takma_ad(sira)) for sira in range(len(adlar))]
+    taban_sql, parametreler = taban.query.sql_with_params()
+    parametreler = list(parametreler)
+
+    sayimlar = []
+    for ad in adlar:
+        kosullar = []
+        for sira, diger in enumerate(adlar):
+            if diger != ad and diger in secimler:
+                kosullar.append(f"{kolonlar[sira]} = ANY(%s)")
+                parametreler.append(list(secimler[diger]))
+        sayimlar.append(
+            f"COUNT(*) FILTER (WHERE {' AND '.join(kosullar)})"
+            if kosullar
+            else "COUNT(*)"
+        )
+
+    sql = (
+        f"WITH taban AS ({taban_sql}) "
+        f"SELECT {', '.join(kolonlar)}, GROUPING({', '.join(kolonlar)}), "
+        f"{', '.join(sayimlar)} "
+        f"FROM taban GROUP BY GROUPING SETS "
+        f"({', '.join(f'({kolon})' for kolon in kolonlar)})"
+    )
+
+    # GROUPING() sonucunda gruplanmayan her kolonun biti 1'dir; ilk kolon en
+    # anlamlı bittir.
+    tum_bitler = (1 << len(adlar)) - 1
+    kumeler = {
+        tum_bitler ^ (1 << (len(adlar) - 1 - sira)): sira for sira in range(len(adlar))
+    }
+    sonuc = {ad: {} for ad in adlar}
+    with baglanti.cursor() as cursor:
+        cursor.execute(sql, parametreler)
+        for satir in cursor.fetchall():
+            sira = kumeler[satir[len(adlar)]]
+            sayi = satir[len(adlar) + 1 + sira]
+            if sayi:
+                sonuc[adlar[sira]][satir[sira]] = sayi
+    return sonuc
+
+
+def _genel(taban, adlar, secimler, alanlar):
+    sayimlar = {}
+    for sira, ad in enumerate(adlar):
+        kosul = Q()
+        for diger in adlar:
+            if diger != ad and diger in secimler:
+                kosul &= Q(**{f"{alanlar[diger]}__in": secimler[diger]})
+        sayimlar[f"sayi_{sira}"] = Count("pk", filter=kosul) if kosul else Count("pk")
+
+    sonuc = {ad: defaultdict(int) for ad in adlar}
+    for satir in taban.annotate(**sayimlar):
+        for sira, ad in enumerate(adlar):
+            if satir[f"sayi_{sira}"]:
+                sonuc[ad][satir[_takma_ad(sira)]] += satir[f"sayi_{sira}"]
+    return {ad: dict(sayilar) for ad, sayilar in sonuc.items()}
+
+
+def faset_sayilari(queryset, alanlar, secimler):
+    """
+    Fasetlerin değer başına kayıt sayılarını tek sorguda hesapla.
+
+    ``queryset`` faset dışı filtreleri (durum, tarih vb.) içermelidir.
+    ``alanlar`` faset adından sorgu yoluna (``"sektor__slug"`` gibi),
+    ``secimler`` faset adından seçili değerlerin listesine eşlemedir.
+    ``{faset: {değer: sayı}}`` döndürür; sayısı sıfır olan değerler yer
+    almaz.
+    """
+    adlar = list(alanlar)
+    if not adlar:
+        return {}
+    taban = queryset.order_by().values(
+        **{_takma_ad(sira): F(alanlar[ad]) for sira, ad in enumerate(adlar)}
+    )
+    baglanti = connections[queryset.db]
+    if baglanti.vendor == "postgresql":
+        return _postgresql(taban, adlar, secimler, baglanti)
+    return _genel(taban, adlar, secimler, alanlar)
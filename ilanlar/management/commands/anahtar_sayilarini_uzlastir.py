@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from ilanlar.anahtar import anahtar_sayilarini_uzlastir
+
+
+class Command(BaseCommand):
+    help = (
+        "Anahtar kelimelerin yayındaki ilan sayılarını gerçek sayımlarla "
+        "eşitler ve hiçbir ilanda geçmeyen kelimeleri sözlükten siler. Sinyal "
+        "göndermeyen toplu güncellemelerden kaynaklanan sapmaları gidermek "
+        "için düzenli olarak çalıştırılmalıdır."
+    )
+
+    def handle(self, *args, **options):
+        guncellenen = anahtar_sayilarini_uzlastir()
+        self.stdout.write(
+            self.style.SUCCESS(f"{guncellenen} anahtar kelime uzlaştırıldı.")
+        )
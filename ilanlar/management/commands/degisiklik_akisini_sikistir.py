@@ -0,0 +1,39 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from ilanlar.models import IlanDegisiklik
+
+
+class Command(BaseCommand):
+    help = (
+        "İlan değişiklik akışında aynı ilan için daha yeni bir kaydı olan eski "
+        "kayıtları siler. Her ilanın son kaydı korunduğu için eski imleçle "
+        "okuyan istemciler yine güncel duruma ulaşır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--gun",
+            type=int,
+            default=30,
+            help="Bu kadar günden eski kayıtları sıkıştır (varsayılan: 30)",
+        )
+
+    def handle(self, *args, **options):
+        sinir = timezone.now() - timedelta(days=options["gun"])
+        # Akış (islem_kimligi, id) sırasıyla okunduğu için "daha yeni" de
+        # aynı sıraya göre belirlenir.
+        daha_yeni = IlanDegisiklik.objects.filter(
+            Q(islem_kimligi__gt=OuterRef("islem_kimligi"))
+            | Q(islem_kimligi=OuterRef("islem_kimligi"), pk__gt=OuterRef("pk")),
+            ilan_id=OuterRef("ilan_id"),
+        )
+        silinen, _ = (
+            IlanDegisiklik.objects.filter(olusturma_tarihi__lt=sinir)
+            .filter(Exists(daha_yeni))
+            .delete()
+        )
+        self.stdout.write(self.style.SUCCESS(f"{silinen} eski kayıt silindi."))
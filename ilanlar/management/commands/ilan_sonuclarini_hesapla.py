@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+
+from ilanlar.models import IlanDurumChoices, IsBilgileri
+from ilanlar.sonuc import PARTI_BOYUTU, sonuclari_hesapla
+
+
+class Command(BaseCommand):
+    help = (
+        "İlan sonuçlarının toplam başvuru, mülakat ve işe alınan sayılarını "
+        "başvuru durumlarından ve işe alınanlar listesinden toplu olarak "
+        "yeniden hesaplar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "ilanlar",
+            nargs="*",
+            type=int,
+            help="Yalnızca bu ilanları hesapla (varsayılan: sonucu olan tüm ilanlar)",
+        )
+        parser.add_argument(
+            "--sonlananlar",
+            action="store_true",
+            help="Sonlandırılmış tüm ilanları hesapla; sonucu olmayanlar için kayıt oluştur",
+        )
+        parser.add_argument(
+            "--parti",
+            type=int,
+            default=PARTI_BOYUTU,
+            help=f"Tek sorguda hesaplanacak ilan sayısı (varsayılan: {PARTI_BOYUTU})",
+        )
+
+    def handle(self, *args, **options):
+        ilan_idleri = options["ilanlar"] or None
+        olustur = bool(options["ilanlar"])
+        if options["sonlananlar"]:
+            ilan_idleri = IsBilgileri.objects.filter(
+                durum=IlanDurumChoices.SONLANDI
+            ).values_list("pk", flat=True)
+            olustur = True
+
+        guncellenen = sonuclari_hesapla(
+            ilan_idleri, olustur=olustur, parti_boyutu=options["parti"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"{guncellenen} ilan sonucu güncellendi."))
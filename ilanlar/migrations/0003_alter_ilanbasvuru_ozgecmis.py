@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:27
+
+import dosyalar.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ilanlar', '0002_ilanbasvuru_ilansonuc_basvurucevap'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='ilanbasvuru',
+            name='ozgecmis',
+            field=models.FileField(blank=True, help_text='Başvuru için yüklenen özgeçmiş dosyası', null=True, storage=dosyalar.storage.belge_storage, upload_to='basvurular/ozgecmis/', verbose_name='Özgeçmiş'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:30
+
+import dosyalar.storage
+import dosyalar.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ilanlar", "0003_alter_ilanbasvuru_ozgecmis"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="ilanbasvuru",
+            name="ozgecmis",
+            field=models.FileField(
+                blank=True,
+                help_text="Başvuru için yüklenen özgeçmiş dosyası",
+                null=True,
+                storage=dosyalar.storage.belge_storage,
+                upload_to="basvurular/ozgecmis/",
+                validators=[dosyalar.validators.YuklemeSiniriValidator("ozgecmis")],
+                verbose_name="Özgeçmiş",
+            ),
+        ),
+    ]
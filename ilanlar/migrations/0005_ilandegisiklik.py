@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:33
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ilanlar", "0004_alter_ilanbasvuru_ozgecmis"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IlanDegisiklik",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "ilan_id",
+                    models.BigIntegerField(db_index=True, verbose_name="İlan Kimliği"),
+                ),
+                ("ilan_uuid", models.UUIDField(verbose_name="İlan UUID")),
+                (
+                    "islem",
+                    models.CharField(
+                        choices=[
+                            ("guncellendi", "Güncellendi"),
+                            ("yayindan_kaldirildi", "Yayından Kaldırıldı"),
+                            ("silindi", "Silindi"),
+                        ],
+                        default="guncellendi",
+                        max_length=20,
+                        verbose_name="İşlem",
+                    ),
+                ),
+                (
+                    "olusturma_tarihi",
+                    models.DateTimeField(
+                        db_default=django.db.models.functions.datetime.Now(),
+                        help_text="Kaydın veritabanı saatine göre oluşturulma zamanı",
+                        verbose_name="Oluşturulma Tarihi",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "İlan Değişikliği",
+                "verbose_name_plural": "İlan Değişiklikleri",
+                "ordering": ["id"],
+            },
+        ),
+    ]
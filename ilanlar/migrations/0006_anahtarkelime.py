@@ -0,0 +1,76 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ilanlar", "0005_ilandegisiklik"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AnahtarKelime",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "ad",
+                    models.CharField(
+                        help_text="Kelimenin ilk girildiği yazılışı",
+                        max_length=50,
+                        verbose_name="Ad",
+                    ),
+                ),
+                (
+                    "normal",
+                    models.CharField(
+                        help_text="Türkçe kurallarıyla küçük harfe çevrilmiş biçim",
+                        max_length=50,
+                        unique=True,
+                        verbose_name="Normal Biçim",
+                    ),
+                ),
+                (
+                    "ilan_sayisi",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Kelimenin geçtiği yayındaki ilan sayısı",
+                        verbose_name="İlan Sayısı",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Anahtar Kelime",
+                "verbose_name_plural": "Anahtar Kelimeler",
+                "indexes": [
+                    models.Index(fields=["-ilan_sayisi"], name="anahtarkelime_sayi_idx")
+                ],
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name="ilananahtar",
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name="ilananahtar",
+            name="kelime",
+            field=models.ForeignKey(
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="ilan_anahtarlari",
+                to="ilanlar.anahtarkelime",
+                verbose_name="Sözlük Kelimesi",
+            ),
+        ),
+    ]
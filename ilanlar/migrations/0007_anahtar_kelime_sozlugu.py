@@ -0,0 +1,75 @@
+from django.db import migrations
+from django.db.models import Count
+
+# Göç, modeldeki normalleştirmenin o anki kopyasını kullanır
+TURKCE_BUYUK_I = str.maketrans({"I": "ı", "İ": "i"})
+
+
+def _normallestir(metin):
+    return " ".join(metin.translate(TURKCE_BUYUK_I).casefold().split())
+
+
+def sozlugu_doldur(apps, schema_editor):
+    """
+    Mevcut anahtar kelimeleri sözlüğe bağla ve yayındaki ilan sayılarını hesapla.
+
+    Aynı ilanda yalnızca yazılışı farklı olan kelimelerden ilk girilen
+    korunur.
+    """
+    AnahtarKelime = apps.get_model("ilanlar", "AnahtarKelime")
+    IlanAnahtar = apps.get_model("ilanlar", "IlanAnahtar")
+    db = schema_editor.connection.alias
+
+    kelimeler = {}
+    gorulenler = set()
+    silinecekler = []
+    guncellenecekler = []
+    anahtarlar = (
+        IlanAnahtar.objects.using(db)
+        .order_by("pk")
+        .only("pk", "ilan_id", "anahtar_kelime")
+    )
+    for anahtar in anahtarlar.iterator(chunk_size=2000):
+        ad = " ".join(anahtar.anahtar_kelime.split())
+        normal = _normallestir(ad)
+        if (anahtar.ilan_id, normal) in gorulenler:
+            silinecekler.append(anahtar.pk)
+            continue
+        gorulenler.add((anahtar.ilan_id, normal))
+        if normal not in kelimeler:
+            kelimeler[normal] = AnahtarKelime.objects.using(db).create(
+                ad=ad, normal=normal
+            )
+        anahtar.anahtar_kelime = ad
+        anahtar.kelime_id = kelimeler[normal].pk
+        guncellenecekler.append(anahtar)
+
+    IlanAnahtar.objects.using(db).filter(pk__in=silinecekler).delete()
+    IlanAnahtar.objects.using(db).bulk_update(
+        guncellenecekler, ["anahtar_kelime", "kelime"], batch_size=2000
+    )
+
+    sayilar = (
+        IlanAnahtar.objects.using(db)
+        .filter(ilan__durum="yayinda")
+        .values("kelime_id")
+        .annotate(adet=Count("pk"))
+        .values_list("kelime_id", "adet")
+    )
+    guncel = []
+    for kelime_id, adet in sayilar:
+        guncel.append(AnahtarKelime(pk=kelime_id, ilan_sayisi=adet))
+    AnahtarKelime.objects.using(db).bulk_update(
+        guncel, ["ilan_sayisi"], batch_size=2000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ilanlar", "0006_anahtarkelime"),
+    ]
+
+    operations = [
+        migrations.RunPython(sozlugu_doldur, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ilanlar", "0007_anahtar_kelime_sozlugu"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="ilananahtar",
+            name="kelime",
+            field=models.ForeignKey(
+                editable=False,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="ilan_anahtarlari",
+                to="ilanlar.anahtarkelime",
+                verbose_name="Sözlük Kelimesi",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="ilananahtar",
+            unique_together={("ilan", "kelime")},
+        ),
+    ]
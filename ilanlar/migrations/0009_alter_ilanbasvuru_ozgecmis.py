@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:43
+
+import dosyalar.storage
+import dosyalar.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ilanlar", "0008_alter_ilananahtar_kelime_unique_together"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="ilanbasvuru",
+            name="ozgecmis",
+            field=models.FileField(
+                blank=True,
+                help_text="Başvuru için yüklenen özgeçmiş dosyası",
+                null=True,
+                storage=dosyalar.storage.belge_storage,
+                upload_to="basvurular/ozgecmis/",
+                validators=[dosyalar.validators.YuklemeSiniriValidator("belge")],
+                verbose_name="Özgeçmiş",
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:46
+
+import ortak.ifadeler
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ilanlar", "0009_alter_ilanbasvuru_ozgecmis"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="ilandegisiklik",
+            options={
+                "ordering": ["islem_kimligi", "id"],
+                "verbose_name": "İlan Değişikliği",
+                "verbose_name_plural": "İlan Değişiklikleri",
+            },
+        ),
+        migrations.AddField(
+            model_name="ilandegisiklik",
+            name="islem_kimligi",
+            field=models.BigIntegerField(
+                db_default=ortak.ifadeler.IslemKimligi(),
+                editable=False,
+                help_text="Kaydı ekleyen veritabanı işleminin kimliği",
+                verbose_name="İşlem Kimliği",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ilandegisiklik",
+            index=models.Index(
+                fields=["islem_kimligi", "id"], name="ilandegisiklik_sira_idx"
+            ),
+        ),
+    ]
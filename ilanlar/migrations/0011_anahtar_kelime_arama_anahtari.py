@@ -0,0 +1,107 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:55
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def kelimeleri_katla(apps, schema_editor):
+    """
+    Sözlükteki normal biçimlerde noktasız ı'yı i'ye katla.
+
+    Yalnızca ı/i farkıyla ayrılan kelimeler ilk girilen kelimede birleştirilir;
+    aynı ilanda bu yüzden tekrarlanan anahtar kelimelerden ilki korunur.
+    Birleşen kelimelerin yayındaki ilan sayıları yeniden hesaplanır.
+    """
+    AnahtarKelime = apps.get_model("ilanlar", "AnahtarKelime")
+    IlanAnahtar = apps.get_model("ilanlar", "IlanAnahtar")
+    db = schema_editor.connection.alias
+
+    gruplar = {}
+    for kelime_id, normal in (
+        AnahtarKelime.objects.using(db)
+        .filter(normal__contains="ı")
+        .values_list("pk", "normal")
+    ):
+        gruplar.setdefault(normal.replace("ı", "i"), []).append(kelime_id)
+    if not gruplar:
+        return
+    # Zaten katlanmış biçimde olan kelimeler de gruba katılır
+    for kelime_id, normal in (
+        AnahtarKelime.objects.using(db)
+        .filter(normal__in=gruplar)
+        .values_list("pk", "normal")
+    ):
+        gruplar[normal].append(kelime_id)
+
+    hedefler = {}
+    for normal, kelime_idleri in gruplar.items():
+        hedef = min(kelime_idleri)
+        for kelime_id in kelime_idleri:
+            hedefler[kelime_id] = hedef
+
+    gorulenler = set()
+    silinecekler = []
+    guncellenecekler = []
+    anahtarlar = (
+        IlanAnahtar.objects.using(db)
+        .filter(kelime_id__in=hedefler)
+        .order_by("pk")
+        .only("pk", "ilan_id", "kelime_id")
+    )
+    for anahtar in anahtarlar.iterator(chunk_size=2000):
+        hedef = hedefler[anahtar.kelime_id]
+        if (anahtar.ilan_id, hedef) in gorulenler:
+            silinecekler.append(anahtar.pk)
+            continue
+        gorulenler.add((anahtar.ilan_id, hedef))
+        if anahtar.kelime_id != hedef:
+            anahtar.kelime_id = hedef
+            guncellenecekler.append(anahtar)
+
+    IlanAnahtar.objects.using(db).filter(pk__in=silinecekler).delete()
+    IlanAnahtar.objects.using(db).bulk_update(
+        guncellenecekler, ["kelime"], batch_size=2000
+    )
+    AnahtarKelime.objects.using(db).filter(
+        pk__in=[
+            kelime_id for kelime_id, hedef in hedefler.items() if kelime_id != hedef
+        ]
+    ).delete()
+
+    sayilar = dict(
+        IlanAnahtar.objects.using(db)
+        .filter(kelime_id__in=set(hedefler.values()), ilan__durum="yayinda")
+        .values("kelime_id")
+        .annotate(adet=Count("pk"))
+        .values_list("kelime_id", "adet")
+    )
+    kelimeler = []
+    for normal, kelime_idleri in gruplar.items():
+        hedef = min(kelime_idleri)
+        kelimeler.append(
+            AnahtarKelime(pk=hedef, normal=normal, ilan_sayisi=sayilar.get(hedef, 0))
+        )
+    AnahtarKelime.objects.using(db).bulk_update(
+        kelimeler, ["normal", "ilan_sayisi"], batch_size=2000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ilanlar", "0010_ilandegisiklik_islem_kimligi"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="anahtarkelime",
+            name="normal",
+            field=models.CharField(
+                help_text="Türkçe kurallarıyla küçük harfe çevrilmiş, ı/i ayrımı kaldırılmış biçim",
+                max_length=50,
+                unique=True,
+                verbose_name="Normal Biçim",
+            ),
+        ),
+        migrations.RunPython(kelimeleri_katla, migrations.RunPython.noop),
+    ]
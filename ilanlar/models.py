@@ -1,10 +1,17 @@
 import uuid
 
+from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Now
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
+from dosyalar.storage import belge_storage
+from dosyalar.validators import YuklemeSiniriValidator
+from ortak.ifadeler import IslemKimligi
+from ortak.metin import arama_anahtari
+
 
 class CalismaModeliChoices(models.TextChoices):
     """İş ilanı çalışma modeli seçenekleri"""
@@ -269,10 +276,94 @@ class IsBilgileri(models.Model):
             self.slug = slugify(self.baslik)
         super().save(*args, **kwargs)
 
+    @classmethod
+    def durum_degistir(cls, ilan_id, yeni_durum):
+        """
+        İlanın yalnızca durum sütununu hedefli bir UPDATE ile değiştir.
+
+        Diğer alanlar ve ``guncelleme_tarihi`` yeniden yazılmaz. ``save()``
+        çağrılmadığı için model sinyalleri yerine ``ilan_durumu_degisti``
+        sinyali gönderilir. Durum gerçekten değiştiyse True döndürür.
+        """
+        from .signals import ilan_durumu_degisti
+
+        with transaction.atomic():
+            onceki = (
+                cls.objects.select_for_update()
+                .filter(pk=ilan_id)
+                .values_list("durum", "uuid")
+                .first()
+            )
+            if onceki is None or onceki[0] == yeni_durum:
+                return False
+
+            cls.objects.filter(pk=ilan_id).update(durum=yeni_durum)
+            ilan_durumu_degisti.send(
+                sender=cls,
+                ilan_id=ilan_id,
+                ilan_uuid=onceki[1],
+                onceki_durum=onceki[0],
+                yeni_durum=yeni_durum,
+            )
+        return True
+
+
+class AnahtarKelime(models.Model):
+    """
+    İlan anahtar kelimelerinin tekilleştirilmiş sözlüğü.
+
+    "Python", "python" ve "PYTHON " aynı kayda bağlanır; noktalı ve noktasız
+    i ayrımı yapılmadığından "ISO 9001" ile "iso 9001" de aynı kelimedir.
+    Sözlük, ilan filtresi ve otomatik tamamlama aynı ``normal`` biçimi
+    kullanır. ``ilan_sayisi`` kelimenin geçtiği yayındaki ilan sayısıdır ve
+    sinyallerle artımlı olarak güncellenir.
+    """
+
+    ad = models.CharField(
+        _("Ad"), max_length=50, help_text=_("Kelimenin ilk girildiği yazılışı")
+    )
+    normal = models.CharField(
+        _("Normal Biçim"),
+        max_length=50,
+        unique=True,
+        help_text=_(
+            "Türkçe kurallarıyla küçük harfe çevrilmiş, ı/i ayrımı kaldırılmış biçim"
+        ),
+    )
+    ilan_sayisi = models.PositiveIntegerField(
+        _("İlan Sayısı"),
+        default=0,
+        help_text=_("Kelimenin geçtiği yayındaki ilan sayısı"),
+    )
+
+    class Meta:
+        verbose_name = _("Anahtar Kelime")
+        verbose_name_plural = _("Anahtar Kelimeler")
+        indexes = [
+            models.Index(fields=["-ilan_sayisi"], name="anahtarkelime_sayi_idx"),
+        ]
+
+    def __str__(self):
+        return self.ad
+
+    normallestir = staticmethod(arama_anahtari)
+
+    @classmethod
+    def bul_veya_olustur(cls, metin):
+        ad = " ".join(metin.split())
+        kelime, _olusturuldu = cls.objects.get_or_create(
+            normal=cls.normallestir(ad), defaults={"ad": ad}
+        )
+        return kelime
+
 
 class IlanAnahtar(models.Model):
     """
     İş ilanları için anahtar kelimeler.
+
+    Girilen kelime kaydedilirken sözlükteki ``AnahtarKelime`` kaydına
+    bağlanır; aynı ilanda yalnızca yazılışı farklı olan kelimeler tekrar
+    edilemez.
     """
 
     ilan = models.ForeignKey(
@@ -285,15 +376,46 @@ class IlanAnahtar(models.Model):
     anahtar_kelime = models.CharField(
         _("Anahtar Kelime"), max_length=50, help_text=_("İlanla ilgili anahtar kelime")
     )
+    kelime = models.ForeignKey(
+        AnahtarKelime,
+        on_delete=models.PROTECT,
+        related_name="ilan_anahtarlari",
+        editable=False,
+        verbose_name=_("Sözlük Kelimesi"),
+    )
 
     class Meta:
         verbose_name = _("İlan Anahtar Kelime")
         verbose_name_plural = _("İlan Anahtar Kelimeler")
-        unique_together = [["ilan", "anahtar_kelime"]]
+        unique_together = [["ilan", "kelime"]]
 
     def __str__(self):
         return self.anahtar_kelime
 
+    def clean(self):
+        if not self.ilan_id:
+            return
+        tekrar = (
+            IlanAnahtar.objects.filter(
+                ilan_id=self.ilan_id,
+                kelime__normal=AnahtarKelime.normallestir(self.anahtar_kelime),
+            )
+            .exclude(pk=self.pk)
+            .exists()
+        )
+        if tekrar:
+            raise ValidationError(
+                {"anahtar_kelime": _("Bu anahtar kelime ilanda zaten var.")}
+            )
+
+    def save(self, *args, **kwargs):
+        self.anahtar_kelime = " ".join(self.anahtar_kelime.split())
+        if self.kelime_id is None or self.kelime.normal != AnahtarKelime.normallestir(
+            self.anahtar_kelime
+        ):
+            self.kelime = AnahtarKelime.bul_veya_olustur(self.anahtar_kelime)
+        super().save(*args, **kwargs)
+
 
 class IlanDil(models.Model):
     """
@@ -398,6 +520,11 @@ class BasvuruDurumChoices(models.TextChoices):
     IPTAL = "iptal", _("İptal Edildi")
 
 
+# Mülakat aşamasına ulaşmış başvuru durumları; kabul edilen adaylar da
+# mülakattan geçmiş sayılır. Rapor görünümleri de bu tanımı kullanır.
+MULAKAT_DURUMLARI = (BasvuruDurumChoices.MUSAKAT, BasvuruDurumChoices.KABUL)
+
+
 class IlanBasvuru(models.Model):
     """
     İş ilanlarına yapılan başvuruları içeren model
@@ -426,9 +553,11 @@ class IlanBasvuru(models.Model):
     ozgecmis = models.FileField(
         _("Özgeçmiş"),
         upload_to="basvurular/ozgecmis/",
+        storage=belge_storage,
         blank=True,
         null=True,
         help_text=_("Başvuru için yüklenen özgeçmiş dosyası"),
+        validators=[YuklemeSiniriValidator("belge")],
     )
     on_yazi = models.TextField(
         _("Ön Yazı"),
@@ -618,6 +747,16 @@ class IlanSonuc(models.Model):
     def __str__(self):
         return f"{self.ilan.baslik} - {'Tamamlandı' if self.tamamlandi else 'Devam Ediyor'}"
 
+    # Veritabanındaki tamamlanma durumu; yeni kayıtlar tamamlanmamış sayılır
+    _onceki_tamamlandi = False
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if "tamamlandi" in instance.__dict__:
+            instance._onceki_tamamlandi = instance.tamamlandi
+        return instance
+
     def save(self, *args, **kwargs):
         # İlan tamamlandıysa ve tarih yoksa, tarihi otomatik ayarla
         if self.tamamlandi and not self.tamamlanma_tarihi:
@@ -625,9 +764,75 @@ class IlanSonuc(models.Model):
 
             self.tamamlanma_tarihi = timezone.now()
 
-        # İlan tamamlandıysa, ilgili ilanın durumunu "sonlandi" olarak ayarla
-        if self.tamamlandi and hasattr(self, "ilan"):
-            self.ilan.durum = "sonlandi"
-            self.ilan.save()
+        # İlan yalnızca tamamlanmadı -> tamamlandı geçişinde sonlandırılır;
+        # tamamlanmış sonucun sonraki kayıtları ilana dokunmaz.
+        tamamlaniyor = self.tamamlandi and not self._onceki_tamamlandi
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+            if tamamlaniyor:
+                IsBilgileri.durum_degistir(self.ilan_id, IlanDurumChoices.SONLANDI)
+        self._onceki_tamamlandi = self.tamamlandi
 
-        super().save(*args, **kwargs)
+        if tamamlaniyor and IlanSonuc.ilan.is_cached(self):
+            self.ilan.durum = IlanDurumChoices.SONLANDI
+
+
+class IlanDegisiklikIslemChoices(models.TextChoices):
+    """Değişiklik akışındaki işlem türleri"""
+
+    GUNCELLENDI = "guncellendi", _("Güncellendi")
+    YAYINDAN_KALDIRILDI = "yayindan_kaldirildi", _("Yayından Kaldırıldı")
+    SILINDI = "silindi", _("Silindi")
+
+
+class IlanDegisiklik(models.Model):
+    """
+    Yayındaki ilanlarda olan değişikliklerin sıralı kaydı.
+
+    İlanları yansıtan dış sistemler son okudukları konumdan sonraki kayıtları
+    çekerek yalnızca değişen ilanları alır. Silinen veya yayından kaldırılan
+    ilanlar için iz kaydı (tombstone) tutulur; bu yüzden ilana yabancı anahtar
+    yerine kimliği saklanır.
+
+    Birincil anahtar işlemlerin onaylanma sırasını yansıtmaz: uzun süren bir
+    işlem, okuyucular ilerledikten sonra daha küçük bir kimlikle
+    onaylanabilir. Bu yüzden kayıtlar ``(islem_kimligi, id)`` sırasıyla
+    okunur ve yalnızca tüm işlemleri sonuçlanmış kimliklere kadar verilir.
+
+    Kayıtlar ``IsBilgileri``, ``IlanAnahtar`` ve ``IlanDil`` sinyallerinde
+    eklenir; sinyal göndermeyen toplu işlemlerden sonra
+    ``ilanlar.signals.ilanlari_akisa_ekle`` çağrılmalıdır.
+    """
+
+    ilan_id = models.BigIntegerField(_("İlan Kimliği"), db_index=True)
+    ilan_uuid = models.UUIDField(_("İlan UUID"))
+    islem = models.CharField(
+        _("İşlem"),
+        max_length=20,
+        choices=IlanDegisiklikIslemChoices.choices,
+        default=IlanDegisiklikIslemChoices.GUNCELLENDI,
+    )
+    islem_kimligi = models.BigIntegerField(
+        _("İşlem Kimliği"),
+        db_default=IslemKimligi(),
+        editable=False,
+        help_text=_("Kaydı ekleyen veritabanı işleminin kimliği"),
+    )
+    olusturma_tarihi = models.DateTimeField(
+        _("Oluşturulma Tarihi"),
+        db_default=Now(),
+        help_text=_("Kaydın veritabanı saatine göre oluşturulma zamanı"),
+    )
+
+    class Meta:
+        verbose_name = _("İlan Değişikliği")
+        verbose_name_plural = _("İlan Değişiklikleri")
+        ordering = ["islem_kimligi", "id"]
+        indexes = [
+            models.Index(
+                fields=["islem_kimligi", "id"], name="ilandegisiklik_sira_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.pk} - {self.ilan_uuid} ({self.get_islem_display()})"
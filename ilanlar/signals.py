@@ -0,0 +1,200 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import Signal, receiver
+
+from ortak.signals import guncelleme_bildir
+
+from .anahtar import ilan_sayilarini_degistir
+from .models import (
+    IlanAnahtar,
+    IlanDegisiklik,
+    IlanDegisiklikIslemChoices,
+    IlanDil,
+    IlanDurumChoices,
+    IlanSoru,
+    IsBilgileri,
+)
+from .sonuc import sonuclari_hesapla
+from .soru_semasi import semayi_gecersiz_kil
+
+# IsBilgileri.durum_degistir() ile yapılan hedefli durum güncellemelerinde
+# gönderilir: ilan_id, ilan_uuid, onceki_durum, yeni_durum
+ilan_durumu_degisti = Signal()
+
+
+def degisiklik_kaydet(ilan_id, ilan_uuid, islem=IlanDegisiklikIslemChoices.GUNCELLENDI):
+    """İlan değişiklik akışına yeni bir kayıt ekle."""
+    IlanDegisiklik.objects.create(ilan_id=ilan_id, ilan_uuid=ilan_uuid, islem=islem)
+
+
+def ilanlari_akisa_ekle(ilanlar):
+    """
+    Sinyal göndermeden değişen yayındaki ilanları akışa ekle.
+
+    ``QuerySet.update()``, ``bulk_create()`` gibi toplu işlemler
+    ``post_save`` göndermediği için bu yollarla değişen ilanlar akışa
+    kendiliğinden yansımaz; bu fonksiyon işlemden sonra aynı işlem içinde
+    çağrılmalıdır. Eklenen kayıt sayısını döndürür.
+    """
+    kayitlar = [
+        IlanDegisiklik(ilan_id=ilan_id, ilan_uuid=ilan_uuid)
+        for ilan_id, ilan_uuid in ilanlar.filter(
+            durum=IlanDurumChoices.YAYINDA
+        ).values_list("pk", "uuid")
+    ]
+    IlanDegisiklik.objects.using(ilanlar.db).bulk_create(kayitlar, batch_size=1000)
+    return len(kayitlar)
+
+
+@receiver(pre_save, sender=IsBilgileri)
+def onceki_durumu_sakla(sender, instance, raw=False, **kwargs):
+    """Kaydedilmeden önce ilanın veritabanındaki durumunu sakla."""
+    instance._onceki_durum = None
+    if not raw and instance.pk and not instance._state.adding:
+        instance._onceki_durum = (
+            IsBilgileri.objects.filter(pk=instance.pk)
+            .values_list("durum", flat=True)
+            .first()
+        )
+
+
+def _durum_gecisini_isle(ilan_id, ilan_uuid, onceki_durum, yeni_durum):
+    if yeni_durum == IlanDurumChoices.YAYINDA:
+        degisiklik_kaydet(ilan_id, ilan_uuid)
+    elif onceki_durum == IlanDurumChoices.YAYINDA:
+        degisiklik_kaydet(
+            ilan_id, ilan_uuid, IlanDegisiklikIslemChoices.YAYINDAN_KALDIRILDI
+        )
+
+    # Yayına giren veya yayından çıkan ilanın kelimelerinin ilan sayıları
+    onceden_yayinda = onceki_durum == IlanDurumChoices.YAYINDA
+    simdi_yayinda = yeni_durum == IlanDurumChoices.YAYINDA
+    if onceden_yayinda != simdi_yayinda:
+        ilan_sayilarini_degistir(
+            IlanAnahtar.objects.filter(ilan_id=ilan_id).values_list(
+                "kelime_id", flat=True
+            ),
+            1 if simdi_yayinda else -1,
+        )
+
+    # Sonlandırılan ilanın sonuç istatistiklerini işlem sonunda hesapla
+    if (
+        yeni_durum == IlanDurumChoices.SONLANDI
+        and onceki_durum != IlanDurumChoices.SONLANDI
+    ):
+        transaction.on_commit(partial(sonuclari_hesapla, [ilan_id], olustur=True))
+
+
+@receiver(post_save, sender=IsBilgileri)
+def ilan_kaydedildi(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    _durum_gecisini_isle(
+        instance.pk,
+        instance.uuid,
+        getattr(instance, "_onceki_durum", None),
+        instance.durum,
+    )
+
+
+@receiver(ilan_durumu_degisti, sender=IsBilgileri)
+def ilan_durumu_guncellendi(
+    sender, ilan_id, ilan_uuid, onceki_durum, yeni_durum, **kwargs
+):
+    """Hedefli durum güncellemesini akışa, sonuçlara ve önbelleğe yansıt."""
+    _durum_gecisini_isle(ilan_id, ilan_uuid, onceki_durum, yeni_durum)
+    guncelleme_bildir(sender, {"durum": onceki_durum}, {"durum": yeni_durum})
+
+
+@receiver(post_delete, sender=IsBilgileri)
+def ilan_silindi(sender, instance, **kwargs):
+    if instance.durum == IlanDurumChoices.YAYINDA:
+        degisiklik_kaydet(
+            instance.pk, instance.uuid, IlanDegisiklikIslemChoices.SILINDI
+        )
+
+
+@receiver(post_save, sender=IlanAnahtar)
+@receiver(post_delete, sender=IlanAnahtar)
+@receiver(post_save, sender=IlanDil)
+@receiver(post_delete, sender=IlanDil)
+def ilan_detayi_degisti(sender, instance, raw=False, **kwargs):
+    """Anahtar kelime veya dil şartı değişen yayındaki ilanı akışa ekle."""
+    if raw:
+        return
+    ilan_uuid = (
+        IsBilgileri.objects.filter(pk=instance.ilan_id, durum=IlanDurumChoices.YAYINDA)
+        .values_list("uuid", flat=True)
+        .first()
+    )
+    if ilan_uuid:
+        degisiklik_kaydet(instance.ilan_id, ilan_uuid)
+
+
+def _yayinda_mi(ilan_id):
+    return IsBilgileri.objects.filter(
+        pk=ilan_id, durum=IlanDurumChoices.YAYINDA
+    ).exists()
+
+
+@receiver(pre_save, sender=IlanAnahtar)
+def onceki_kelimeyi_sakla(sender, instance, raw=False, **kwargs):
+    """Kaydedilmeden önce anahtar kelimenin ilanını ve sözlük kelimesini sakla."""
+    instance._onceki_kelime = None
+    if not raw and instance.pk and not instance._state.adding:
+        instance._onceki_kelime = (
+            IlanAnahtar.objects.filter(pk=instance.pk)
+            .values_list("ilan_id", "kelime_id")
+            .first()
+        )
+
+
+@receiver(post_save, sender=IlanAnahtar)
+def anahtar_kelime_kaydedildi(sender, instance, raw=False, **kwargs):
+    """Yayındaki ilana eklenen veya değişen kelimenin ilan sayısını güncelle."""
+    if raw:
+        return
+    onceki = getattr(instance, "_onceki_kelime", None)
+    if onceki == (instance.ilan_id, instance.kelime_id):
+        return
+    if onceki and _yayinda_mi(onceki[0]):
+        ilan_sayilarini_degistir([onceki[1]], -1)
+    if _yayinda_mi(instance.ilan_id):
+        ilan_sayilarini_degistir([instance.kelime_id], 1)
+
+
+@receiver(post_delete, sender=IlanAnahtar)
+def anahtar_kelime_silindi(sender, instance, **kwargs):
+    """
+    Yayındaki ilandan çıkarılan kelimenin ilan sayısını azalt.
+
+    İlan silinirken anahtar kelimeleri ilandan önce silindiği için ilan bu
+    noktada hâlâ veritabanındadır.
+    """
+    if _yayinda_mi(instance.ilan_id):
+        ilan_sayilarini_degistir([instance.kelime_id], -1)
+
+
+@receiver(pre_save, sender=IlanSoru)
+def onceki_ilani_sakla(sender, instance, raw=False, **kwargs):
+    """Sorunun başka bir ilana taşınması durumunda eski ilanı sakla."""
+    instance._onceki_ilan_id = None
+    if not raw and instance.pk and not instance._state.adding:
+        instance._onceki_ilan_id = (
+            IlanSoru.objects.filter(pk=instance.pk)
+            .values_list("ilan_id", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=IlanSoru)
+@receiver(post_delete, sender=IlanSoru)
+def ilan_sorusu_degisti(sender, instance, raw=False, **kwargs):
+    """Sorusu değişen ilanların soru şemasını işlem sonunda geçersiz kıl."""
+    if raw:
+        return
+    ilan_idleri = {instance.ilan_id, getattr(instance, "_onceki_ilan_id", None)}
+    for ilan_id in ilan_idleri - {None}:
+        transaction.on_commit(partial(semayi_gecersiz_kil, ilan_id))
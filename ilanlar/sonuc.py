@@ -0,0 +1,82 @@
+from django.db import transaction
+from django.db.models import Count, Q
+
+from ortak.istatistik import istatistik_degistir
+from ortak.models import IstatistikChoices
+
+from .models import MULAKAT_DURUMLARI, IlanBasvuru, IlanSonuc
+
+PARTI_BOYUTU = 500
+
+SONUC_ALANLARI = ("toplam_basvuru", "mulakat_yapilan", "ise_alinan")
+
+
+@transaction.atomic
+def _parti_hesapla(ilan_idleri):
+    basvuru_sayilari = {
+        satir["ilan_id"]: satir
+        for satir in IlanBasvuru.objects.filter(ilan_id__in=ilan_idleri)
+        .order_by()
+        .values("ilan_id")
+        .annotate(
+            toplam_basvuru=Count("pk"),
+            mulakat_yapilan=Count("pk", filter=Q(durum__in=MULAKAT_DURUMLARI)),
+        )
+    }
+    sonuclar = IlanSonuc.objects.filter(ilan_id__in=ilan_idleri).annotate(
+        yeni_ise_alinan=Count("ise_alinanlar")
+    )
+
+    degisenler = []
+    ise_alinan_farki = 0
+    for sonuc in sonuclar.only("pk", "ilan_id", *SONUC_ALANLARI):
+        sayilar = basvuru_sayilari.get(sonuc.ilan_id, {})
+        yeniler = {
+            "toplam_basvuru": sayilar.get("toplam_basvuru", 0),
+            "mulakat_yapilan": sayilar.get("mulakat_yapilan", 0),
+            "ise_alinan": sonuc.yeni_ise_alinan,
+        }
+        ise_alinan_farki += yeniler["ise_alinan"] - sonuc.ise_alinan
+        degisti = False
+        for alan, yeni in yeniler.items():
+            if getattr(sonuc, alan) != yeni:
+                setattr(sonuc, alan, yeni)
+                degisti = True
+        if degisti:
+            degisenler.append(sonuc)
+
+    # Toplu güncelleme sinyal göndermediği için istatistik farkı ayrıca işlenir
+    IlanSonuc.objects.bulk_update(degisenler, SONUC_ALANLARI)
+    istatistik_degistir({IstatistikChoices.ISE_ALINAN: ise_alinan_farki})
+    return len(degisenler)
+
+
+def sonuclari_hesapla(ilan_idleri=None, olustur=False, parti_boyutu=PARTI_BOYUTU):
+    """
+    İlan sonuçlarının başvuru, mülakat ve işe alım sayılarını yeniden hesapla.
+
+    Her partide başvuru ve mülakat sayıları ``IlanBasvuru`` üzerinde tek bir
+    gruplanmış sorguyla, işe alınan sayıları sonuçlarla birlikte okunur;
+    yalnızca değişen kayıtlar toplu olarak güncellenir. ``ilan_idleri``
+    verilmezse tüm ilan sonuçları hesaplanır. ``olustur`` verilirse sonucu
+    olmayan ilanlar için önce boş sonuç kaydı oluşturulur.
+
+    Güncellenen sonuç sayısını döndürür.
+    """
+    if ilan_idleri is None:
+        ilan_idleri = IlanSonuc.objects.order_by("ilan_id").values_list(
+            "ilan_id", flat=True
+        )
+    ilan_idleri = list(ilan_idleri)
+
+    if olustur:
+        IlanSonuc.objects.bulk_create(
+            [IlanSonuc(ilan_id=ilan_id) for ilan_id in ilan_idleri],
+            batch_size=parti_boyutu,
+            ignore_conflicts=True,
+        )
+
+    guncellenen = 0
+    for baslangic in range(0, len(ilan_idleri), parti_boyutu):
+        guncellenen += _parti_hesapla(ilan_idleri[baslangic : baslangic + parti_boyutu])
+    return guncellenen
@@ -0,0 +1,190 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+from django import forms
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
+
+from ortak.onbellek import surum_artir, surumler
+
+from .models import IlanSoru
+
+SEMA_SURESI = 24 * 60 * 60
+
+SoruTipi = IlanSoru.SoruTipiChoices
+
+EVET_HAYIR_SECENEKLERI = (("evet", _("Evet")), ("hayir", _("Hayır")))
+EVET_HAYIR_CEVAPLARI = {"evet": "evet", "hayir": "hayir", "hayır": "hayir"}
+
+
+def secenekleri_ayir(metin):
+    """Satır satır yazılmış seçenekleri boşlukları temizlenmiş demete çevir."""
+    return tuple(
+        secenek.strip() for secenek in (metin or "").splitlines() if secenek.strip()
+    )
+
+
+@dataclass(frozen=True)
+class Soru:
+    """Başvuru formunda gösterilen, seçenekleri önceden ayrıştırılmış soru."""
+
+    id: int
+    metin: str
+    tip: str
+    zorunlu: bool
+    secenekler: tuple = ()
+
+    @property
+    def alan_adi(self):
+        return f"soru_{self.id}"
+
+    def temizle(self, deger):
+        """Cevabı soru tipine göre doğrula; saklanacak metni döndür."""
+        if deger is None:
+            deger = ""
+        elif isinstance(deger, bool):
+            deger = "evet" if deger else "hayir"
+        deger = str(deger).strip()
+
+        if not deger:
+            if self.zorunlu:
+                raise ValidationError(_("Bu soru zorunludur."), code="zorunlu")
+            return None
+
+        if self.tip == SoruTipi.EVET_HAYIR:
+            if deger.lower() not in EVET_HAYIR_CEVAPLARI:
+                raise ValidationError(_("Evet veya Hayır seçiniz."), code="gecersiz")
+            return EVET_HAYIR_CEVAPLARI[deger.lower()]
+
+        if self.tip == SoruTipi.COKTAN_SECMELI and deger not in self.secenekler:
+            raise ValidationError(_("Geçerli bir seçenek seçiniz."), code="gecersiz")
+        return deger
+
+    def form_alani(self):
+        """Soruya karşılık gelen form alanı."""
+        ortak = {"label": self.metin, "required": self.zorunlu}
+        if self.tip == SoruTipi.EVET_HAYIR:
+            return forms.ChoiceField(
+                choices=EVET_HAYIR_SECENEKLERI, widget=forms.RadioSelect, **ortak
+            )
+        if self.tip == SoruTipi.COKTAN_SECMELI:
+            return forms.ChoiceField(
+                choices=[(secenek, secenek) for secenek in self.secenekler],
+                widget=forms.RadioSelect,
+                **ortak,
+            )
+        return forms.CharField(widget=forms.Textarea(attrs={"rows": 3}), **ortak)
+
+
+@dataclass(frozen=True)
+class SoruSemasi:
+    """Bir ilanın sıralı ve derlenmiş başvuru soruları."""
+
+    ilan_id: int
+    sorular: tuple
+
+    def dogrula(self, cevaplar):
+        """
+        Cevapları şemaya göre doğrula.
+
+        ``cevaplar`` soru kimliğini (veya ``soru_<id>`` alan adını) cevaba
+        eşler. Geçerli cevapları ``(soru_id, cevap)`` listesi olarak döndürür;
+        hatalar ``soru_<id>`` anahtarlarıyla tek bir ``ValidationError``
+        içinde toplanır.
+        """
+        cevaplar = {
+            str(anahtar).removeprefix("soru_"): deger
+            for anahtar, deger in cevaplar.items()
+        }
+        temiz, hatalar = [], {}
+        for soru in self.sorular:
+            try:
+                cevap = soru.temizle(cevaplar.pop(str(soru.id), None))
+            except ValidationError as hata:
+                hatalar[soru.alan_adi] = hata.error_list
+            else:
+                if cevap is not None:
+                    temiz.append((soru.id, cevap))
+
+        if cevaplar:
+            hatalar["__all__"] = [
+                ValidationError(
+                    _("İlana ait olmayan soru cevaplandı."), code="gecersiz"
+                )
+            ]
+        if hatalar:
+            raise ValidationError(hatalar)
+        return temiz
+
+    def form_sinifi(self):
+        """Şemadan üretilen başvuru formu sınıfı (süreç içinde saklanır)."""
+        return _form_sinifi(self)
+
+
+class BasvuruSorulariForm(forms.Form):
+    """Soru şemasından üretilen formların temel sınıfı."""
+
+    sema = None
+
+    def cevaplar(self):
+        """Geçerli formun cevaplarını ``basvuru_yap`` için döndür."""
+        return {
+            alan_adi: deger
+            for alan_adi, deger in self.cleaned_data.items()
+            if alan_adi.startswith("soru_")
+        }
+
+
+@lru_cache(maxsize=512)
+def _form_sinifi(sema):
+    alanlar = {soru.alan_adi: soru.form_alani() for soru in sema.sorular}
+    return type(
+        f"Ilan{sema.ilan_id}SorulariForm",
+        (BasvuruSorulariForm,),
+        {"sema": sema, **alanlar},
+    )
+
+
+def _surum_adi(ilan_id):
+    return f"ilan_sorulari:{ilan_id}"
+
+
+def _derle(ilan_id):
+    return SoruSemasi(
+        ilan_id=ilan_id,
+        sorular=tuple(
+            Soru(
+                id=satir["id"],
+                metin=satir["soru"],
+                tip=satir["soru_tipi"],
+                zorunlu=satir["zorunlu"],
+                secenekler=secenekleri_ayir(satir["secenekler"]),
+            )
+            for satir in IlanSoru.objects.filter(ilan_id=ilan_id)
+            .order_by("sira", "pk")
+            .values("id", "soru", "soru_tipi", "secenekler", "zorunlu")
+        ),
+    )
+
+
+def soru_semasi(ilan_id):
+    """
+    İlanın derlenmiş soru şemasını döndür.
+
+    Şema, ilanın soru sürümüyle anahtarlanarak önbellekte tutulur; sıcak
+    önbellekte form oluşturmak ve cevapları doğrulamak sorgu gerektirmez.
+    Sorulardan biri değiştiğinde sürüm artırılır ve eski şema kullanılmaz.
+    """
+    surum = surumler(_surum_adi(ilan_id))[_surum_adi(ilan_id)]
+    anahtar = f"ilan:{ilan_id}:sorular:{surum}"
+    sema = cache.get(anahtar)
+    if sema is None:
+        sema = _derle(ilan_id)
+        cache.set(anahtar, sema, SEMA_SURESI)
+    return sema
+
+
+def semayi_gecersiz_kil(ilan_id):
+    """İlanın soru şeması sürümünü artırarak önbellekteki şemayı geçersiz kıl."""
+    surum_artir(_surum_adi(ilan_id))
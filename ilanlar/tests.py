@@ -1,3 +1,364 @@
+import datetime
+import itertools
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import Count
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from ayarlar.models import Il, Ilce, Sektor
+from hesap.models import Firma, Kullanici, Vatandas
+
+from .basvuru import basvuru_yap
+from .fasetler import faset_sayilari
+from .models import (
+    AnahtarKelime,
+    BasvuruCevap,
+    BasvuruDurumChoices,
+    CalismaModeliChoices,
+    IlanBasvuru,
+    IlanDurumChoices,
+    IlanSonuc,
+    IlanSoru,
+    IsBilgileri,
+)
+from .signals import ilan_durumu_degisti
+from .sonuc import sonuclari_hesapla
+from .soru_semasi import soru_semasi
+
+
+class AnahtarKelimeTests(TestCase):
+    def test_noktali_ve_noktasiz_i_ayni_kelimeye_baglanir(self):
+        kelime = AnahtarKelime.bul_veya_olustur("ISO 9001")
+        self.assertEqual(kelime.normal, "iso 9001")
+        self.assertEqual(AnahtarKelime.bul_veya_olustur("iso  9001"), kelime)
+        self.assertEqual(AnahtarKelime.bul_veya_olustur("İSO 9001"), kelime)
+
+
+def _ilanlar(*basliklar):
+    il = Il.objects.create(ad="Sivas")
+    ilce = Ilce.objects.create(il=il, ad="Merkez")
+    firma = Firma.objects.create(ad="Firma A", il=il, ilce=ilce)
+    sektor = Sektor.objects.create(ad="Bilişim")
+    return [
+        IsBilgileri.objects.create(
+            baslik=baslik,
+            firma=firma,
+            pozisyon="Geliştirici",
+            aciklama="Açıklama",
+            gerekli_nitelikler="Nitelikler",
+            basvuru_baslangic=datetime.date.today(),
+            durum=IlanDurumChoices.YAYINDA,
+            sektor=sektor,
+            il=il,
+            ilce=ilce,
+        )
+        for baslik in basliklar
+    ]
+
+
+def _vatandaslar(adet):
+    return [
+        Vatandas.objects.create(kullanici=Kullanici.objects.create_user(f"v{sira}"))
+        for sira in range(adet)
+    ]
+
+
+class BasvuruYapTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.ilanlar = _ilanlar("1 Sorulu İlan", "5 Sorulu İlan")
+        for ilan, soru_sayisi in zip(cls.ilanlar, (1, 5)):
+            IlanSoru.objects.bulk_create(
+                IlanSoru(ilan=ilan, soru=f"Soru {sira}", sira=sira)
+                for sira in range(soru_sayisi)
+            )
+        cls.vatandaslar = _vatandaslar(2)
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _cevaplar(self, ilan):
+        return {soru.id: "Cevap" for soru in soru_semasi(ilan.pk).sorular}
+
+    def test_cevaplar_ve_sayac_tek_seferde_yazilir(self):
+        ilan = self.ilanlar[1]
+        basvuru = basvuru_yap(ilan, self.vatandaslar[0], self._cevaplar(ilan))
+        self.assertEqual(BasvuruCevap.objects.filter(basvuru=basvuru).count(), 5)
+        ilan.refresh_from_db()
+        self.assertEqual(ilan.basvuru_sayisi, 1)
+
+    def test_mukerrer_basvuru(self):
+        ilan = self.ilanlar[0]
+        basvuru_yap(ilan, self.vatandaslar[0], self._cevaplar(ilan))
+        with self.assertRaises(ValidationError) as hata:
+            basvuru_yap(ilan, self.vatandaslar[0], self._cevaplar(ilan))
+        self.assertEqual(hata.exception.code, "mukerrer")
+        self.assertEqual(IlanBasvuru.objects.filter(ilan=ilan).count(), 1)
+        self.assertEqual(BasvuruCevap.objects.count(), 1)
+        ilan.refresh_from_db()
+        self.assertEqual(ilan.basvuru_sayisi, 1)
+
+    def test_ifade_sayisi_soru_sayisindan_bagimsiz(self):
+        sayilar = []
+        for ilan, vatandas in zip(self.ilanlar, self.vatandaslar):
+            cevaplar = self._cevaplar(ilan)
+            with CaptureQueriesContext(connection) as sorgular:
+                basvuru_yap(ilan, vatandas, cevaplar)
+            sayilar.append(len(sorgular))
+        self.assertEqual(sayilar[0], sayilar[1])
+        # Kayıt noktası, başvuru, cevaplar, sayaç ve kayıt noktasının bırakılması
+        ilan = self.ilanlar[1]
+        cevaplar = self._cevaplar(ilan)
+        with self.assertNumQueries(5):
+            basvuru_yap(ilan, self.vatandaslar[0], cevaplar)
+
+
+class SonuclariHesaplaTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.ilan, cls.bos_ilan, cls.sonucsuz_ilan = _ilanlar("A", "B", "C")
+        durumlar = [
+            BasvuruDurumChoices.BEKLEMEDE,
+            BasvuruDurumChoices.MUSAKAT,
+            BasvuruDurumChoices.MUSAKAT,
+            BasvuruDurumChoices.KABUL,
+            BasvuruDurumChoices.RED,
+        ]
+        basvurular = [
+            IlanBasvuru.objects.create(ilan=cls.ilan, vatandas=vatandas, durum=durum)
+            for vatandas, durum in zip(_vatandaslar(len(durumlar)), durumlar)
+        ]
+        IlanBasvuru.objects.create(
+            ilan=cls.sonucsuz_ilan, vatandas=basvurular[0].vatandas
+        )
+        sonuc = IlanSonuc.objects.create(ilan=cls.ilan, toplam_basvuru=99)
+        sonuc.ise_alinanlar.add(basvurular[3])
+        IlanSonuc.objects.create(ilan=cls.bos_ilan, mulakat_yapilan=7, ise_alinan=1)
+
+    def _sayilar(self):
+        return {
+            sonuc.ilan_id: (
+                sonuc.toplam_basvuru,
+                sonuc.mulakat_yapilan,
+                sonuc.ise_alinan,
+            )
+            for sonuc in IlanSonuc.objects.all()
+        }
+
+    def test_elle_sayilan_degerlerle_eslesir(self):
+        ilan_idleri = [self.ilan.pk, self.bos_ilan.pk, self.sonucsuz_ilan.pk]
+        self.assertEqual(
+            sonuclari_hesapla(ilan_idleri, olustur=True, parti_boyutu=2), 3
+        )
+        # Kabul edilen aday da mülakat yapılmış sayılır
+        self.assertEqual(
+            self._sayilar(),
+            {
+                self.ilan.pk: (5, 3, 1),
+                self.bos_ilan.pk: (0, 0, 0),
+                self.sonucsuz_ilan.pk: (1, 0, 0),
+            },
+        )
+        self.assertEqual(sonuclari_hesapla(ilan_idleri), 0)
+
+
+class IlanSonucTamamlanmaTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        (cls.ilan,) = _ilanlar("Tamamlanacak İlan")
+
+    def setUp(self):
+        self.sinyaller = []
+
+        def alici(sender, **kwargs):
+            self.sinyaller.append((kwargs["onceki_durum"], kwargs["yeni_durum"]))
+
+        ilan_durumu_degisti.connect(alici, sender=IsBilgileri)
+        self.addCleanup(ilan_durumu_degisti.disconnect, alici, sender=IsBilgileri)
+
+    def _ilan_alanlari(self):
+        return IsBilgileri.objects.filter(pk=self.ilan.pk).values().get()
+
+    def test_yalnizca_tamamlanma_gecisi_ilani_sonlandirir(self):
+        sonuc = IlanSonuc.objects.create(ilan=self.ilan)
+        sonuc.aciklama = "Devam ediyor"
+        sonuc.save()
+        self.assertEqual(self._ilan_alanlari()["durum"], IlanDurumChoices.YAYINDA)
+        self.assertEqual(self.sinyaller, [])
+
+        sonuc.tamamlandi = True
+        sonuc.save()
+        self.assertEqual(self._ilan_alanlari()["durum"], IlanDurumChoices.SONLANDI)
+        self.assertEqual(
+            self.sinyaller, [(IlanDurumChoices.YAYINDA, IlanDurumChoices.SONLANDI)]
+        )
+
+        # Tamamlanmış sonucun sonraki kayıtları yeniden yayınlanan ilana dokunmaz
+        IsBilgileri.objects.filter(pk=self.ilan.pk).update(
+            durum=IlanDurumChoices.YAYINDA
+        )
+        sonuc = IlanSonuc.objects.get(pk=sonuc.pk)
+        sonuc.aciklama = "Tamamlandı"
+        sonuc.save()
+        self.assertEqual(self._ilan_alanlari()["durum"], IlanDurumChoices.YAYINDA)
+        self.assertEqual(len(self.sinyaller), 1)
+
+    def test_hedefli_guncelleme_diger_sutunlara_dokunmaz(self):
+        onceki = self._ilan_alanlari()
+        with CaptureQueriesContext(connection) as sorgular:
+            degisti = IsBilgileri.durum_degistir(
+                self.ilan.pk, IlanDurumChoices.SONLANDI
+            )
+        self.assertTrue(degisti)
+        sonraki = self._ilan_alanlari()
+        self.assertEqual(sonraki.pop("durum"), IlanDurumChoices.SONLANDI)
+        onceki.pop("durum")
+        self.assertEqual(sonraki, onceki)
+        guncellemeler = [
+            sorgu["sql"]
+            for sorgu in sorgular.captured_queries
+            if sorgu["sql"].startswith('UPDATE "ilanlar_isbilgileri"')
+        ]
+        self.assertEqual(len(guncellemeler), 1)
+        self.assertIn('SET "durum" = ', guncellemeler[0])
+        self.assertNotIn("guncelleme_tarihi", guncellemeler[0])
+
+        self.assertFalse(
+            IsBilgileri.durum_degistir(self.ilan.pk, IlanDurumChoices.SONLANDI)
+        )
+        self.assertEqual(len(self.sinyaller), 1)
+
+
+class IlanListesiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        iller = [Il.objects.create(ad=ad) for ad in ("Sivas", "Tokat")]
+        ilceler = [Ilce.objects.create(il=il, ad="Merkez") for il in iller]
+        sektorler = [Sektor.objects.create(ad=ad) for ad in ("Bilişim", "Sağlık")]
+        firma = Firma.objects.create(ad="Firma A", il=iller[0], ilce=ilceler[0])
+        modeller = [CalismaModeliChoices.TAM_ZAMANLI, CalismaModeliChoices.STAJYER]
+        for sira, (il, sektor, model) in enumerate(
+            itertools.product(range(2), sektorler, modeller + modeller[:1])
+        ):
+            IsBilgileri.objects.create(
+                baslik=f"İlan {sira}",
+                firma=firma,
+                pozisyon="Geliştirici",
+                aciklama="Açıklama",
+                gerekli_nitelikler="Nitelikler",
+                basvuru_baslangic=datetime.date.today(),
+                durum=(
+                    IlanDurumChoices.TASLAK if sira == 0 else IlanDurumChoices.YAYINDA
+                ),
+                sektor=sektor,
+                calisma_modeli=model,
+                il=iller[il],
+                ilce=ilceler[il],
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_htmx_istegi_yalnizca_parcayi_alir(self):
+        tam = self.client.get("/ilanlar/")
+        self.assertTemplateUsed(tam, "ilanlar/list.html")
+        parca = self.client.get("/ilanlar/", headers={"HX-Request": "true"})
+        self.assertTemplateUsed(parca, "components/liste-parcasi.html")
+        self.assertTemplateNotUsed(parca, "ilanlar/list.html")
+        geri_yukleme = self.client.get(
+            "/ilanlar/",
+            headers={"HX-Request": "true", "HX-History-Restore-Request": "true"},
+        )
+        self.assertTemplateUsed(geri_yukleme, "ilanlar/list.html")
+        for yanit in (tam, parca, geri_yukleme):
+            self.assertEqual(yanit.status_code, 200)
+            self.assertIn("HX-Request", yanit["Vary"])
+
+    def test_faset_sayilari_ayri_sayimlarla_eslesir(self):
+        alanlar = {
+            "calisma_modeli": "calisma_modeli",
+            "sektor": "sektor__slug",
+            "il": "il__slug",
+        }
+        taban = IsBilgileri.objects.filter(durum=IlanDurumChoices.YAYINDA)
+        for secimler in (
+            {},
+            {"sektor": ["bilisim"]},
+            {"sektor": ["bilisim"], "calisma_modeli": ["stajyer"]},
+            {"il": ["sivas", "tokat"], "calisma_modeli": ["tam_zamanli"]},
+        ):
+            beklenen = {}
+            for ad, yol in alanlar.items():
+                queryset = taban
+                for diger, degerler in secimler.items():
+                    if diger != ad:
+                        queryset = queryset.filter(
+                            **{f"{alanlar[diger]}__in": degerler}
+                        )
+                beklenen[ad] = dict(
+                    queryset.order_by()
+                    .values(yol)
+                    .annotate(sayi=Count("pk"))
+                    .values_list(yol, "sayi")
+                )
+            with self.subTest(secimler=secimler):
+                self.assertEqual(faset_sayilari(taban, alanlar, secimler), beklenen)
+        self.assertEqual(
+            faset_sayilari(taban, alanlar, {})["calisma_modeli"],
+            {"tam_zamanli": 7, "stajyer": 4},
+        )
+
+
+class SoruSemasiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.ilan, cls.diger_ilan = _ilanlar("Sorulu İlan", "Diğer İlan")
+        cls.soru = IlanSoru.objects.create(ilan=cls.ilan, soru="Ehliyetiniz var mı?")
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _sema_ve_form(self, ilan):
+        sema = soru_semasi(ilan.pk)
+        return sema, sema.form_sinifi()
+
+    def test_sicak_onbellek_sorgu_yapmaz(self):
+        sema, form_sinifi = self._sema_ve_form(self.ilan)
+        with self.assertNumQueries(0):
+            self.assertEqual(self._sema_ve_form(self.ilan), (sema, form_sinifi))
+
+    def test_soru_degisince_sema_ve_form_yenilenir(self):
+        sema, form_sinifi = self._sema_ve_form(self.ilan)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.soru.soru = "Sürücü belgeniz var mı?"
+            self.soru.save()
+        yeni_sema, yeni_form_sinifi = self._sema_ve_form(self.ilan)
+        self.assertNotEqual(yeni_sema, sema)
+        self.assertIsNot(yeni_form_sinifi, form_sinifi)
+        self.assertEqual(
+            yeni_form_sinifi.base_fields[f"soru_{self.soru.pk}"].label,
+            "Sürücü belgeniz var mı?",
+        )
+
+    def test_soru_silinince_ve_tasininca_semalar_yenilenir(self):
+        self._sema_ve_form(self.ilan)
+        self._sema_ve_form(self.diger_ilan)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.soru.ilan = self.diger_ilan
+            self.soru.save()
+        self.assertEqual(soru_semasi(self.ilan.pk).sorular, ())
+        self.assertEqual(len(soru_semasi(self.diger_ilan.pk).sorular), 1)
 
-# Create your tests here.
+        with self.captureOnCommitCallbacks(execute=True):
+            self.soru.delete()
+        sema, form_sinifi = self._sema_ve_form(self.diger_ilan)
+        self.assertEqual(sema.sorular, ())
+        self.assertFalse(
+            [alan for alan in form_sinifi.base_fields if alan.startswith("soru_")]
+        )
@@ -1,3 +1,162 @@
+from datetime import timedelta
+
+from django import forms
 from django.shortcuts import render
+from django.utils import timezone
+from django.utils.translation import gettext
+from django.views.decorators.http import require_safe
+
+from ayarlar.models import Sektor
+from ortak.liste import (
+    FasetliListeFormu,
+    FasetliListeView,
+    cografya_form_secenekleri,
+    cografya_secenekleri,
+)
+from ortak.sorgu_profili import sorgu_butcesi
+
+from .anahtar import oneriler
+from .fasetler import faset_sayilari
+from .models import (
+    AnahtarKelime,
+    CalismaModeliChoices,
+    CalismaYeriChoices,
+    DeneyimDuzeyiChoices,
+    EgitimDuzeyiChoices,
+    IlanDurumChoices,
+    IsBilgileri,
+)
+
+YAYIN_TARIHI_GUNLERI = {"bugun": 0, "son_3_gun": 3, "son_7_gun": 7, "son_30_gun": 30}
+
+# Filtre bölümünde gösterilen popüler anahtar kelime sayısı
+POPULER_ANAHTAR_SAYISI = 8
+
+
+class IlanFiltreFormu(FasetliListeFormu):
+    anahtar = forms.CharField(required=False, max_length=50)
+    calisma_modeli = forms.MultipleChoiceField(
+        required=False,
+        choices=CalismaModeliChoices.choices,
+        widget=forms.CheckboxSelectMultiple,
+    )
+    calisma_yeri = forms.MultipleChoiceField(
+        required=False,
+        choices=CalismaYeriChoices.choices,
+        widget=forms.CheckboxSelectMultiple,
+    )
+    sektor = forms.ChoiceField(required=False)
+    il = forms.ChoiceField(required=False)
+    ilce = forms.ChoiceField(required=False)
+    deneyim_duzey = forms.MultipleChoiceField(
+        required=False,
+        choices=DeneyimDuzeyiChoices.choices,
+        widget=forms.CheckboxSelectMultiple,
+    )
+    egitim_duzey = forms.MultipleChoiceField(
+        required=False,
+        choices=EgitimDuzeyiChoices.choices,
+        widget=forms.CheckboxSelectMultiple,
+    )
+    yayin_tarihi = forms.ChoiceField(
+        required=False, choices=[(ad, ad) for ad in YAYIN_TARIHI_GUNLERI]
+    )
+
+    def clean_anahtar(self):
+        # Önbellek anahtarı yazılıştan bağımsız olsun
+        return AnahtarKelime.normallestir(self.cleaned_data["anahtar"])
+
+
+class IlanListesiView(FasetliListeView):
+    """
+    Yayındaki iş ilanları; anahtar kelime, çalışma modeli, sektör, konum ve
+    düzeylere göre.
+    """
+
+    template_name = "ilanlar/list.html"
+    sonuc_sablonu = "ilanlar/components/job-listings.html"
+    form_class = IlanFiltreFormu
+    onek = "ilan"
+    surum_adlari = ("ilan",)
+    fasetler = {
+        "calisma_modeli": "calisma_modeli",
+        "calisma_yeri": "calisma_yeri",
+        "sektor": "sektor__slug",
+        "il": "il__slug",
+        "ilce": "ilce__slug",
+        "deneyim_duzey": "deneyim_duzey",
+        "egitim_duzey": "egitim_duzey",
+    }
+    siralamalar = {
+        "tarih-yeni": ("-yayinlanma_tarihi", "-id"),
+        "tarih-eski": ("yayinlanma_tarihi", "id"),
+        "basvuru-cok": ("-basvuru_sayisi", "-id"),
+    }
+
+    def temel_sorgu(self):
+        return IsBilgileri.objects.filter(
+            durum=IlanDurumChoices.YAYINDA
+        ).select_related("firma", "sektor", "il", "ilce")
+
+    def filtrele(self, queryset, filtreler):
+        for ad in ("calisma_modeli", "calisma_yeri", "deneyim_duzey", "egitim_duzey"):
+            if ad in filtreler:
+                queryset = queryset.filter(**{f"{ad}__in": filtreler[ad]})
+        for ad in ("sektor", "il", "ilce"):
+            if ad in filtreler:
+                queryset = queryset.filter(**{f"{ad}__slug": filtreler[ad]})
+        if "anahtar" in filtreler:
+            queryset = queryset.filter(
+                anahtar_kelimeler__kelime__normal=filtreler["anahtar"]
+            )
+        if "yayin_tarihi" in filtreler:
+            gun = YAYIN_TARIHI_GUNLERI[filtreler["yayin_tarihi"]]
+            baslangic = timezone.localtime().replace(
+                hour=0, minute=0, second=0, microsecond=0
+            ) - timedelta(days=gun)
+            queryset = queryset.filter(yayinlanma_tarihi__gte=baslangic)
+        return queryset
+
+    def secenekleri_hesapla(self):
+        return {
+            "sektor": [
+                ("", gettext("Tüm Sektörler")),
+                *Sektor.objects.values_list("slug", "ad"),
+            ],
+            **cografya_secenekleri(),
+        }
+
+    def form_secenekleri(self, secenekler, veri):
+        return cografya_form_secenekleri(secenekler, veri)
+
+    def etkin_fasetler(self, filtreler):
+        # İlçe sayıları yalnızca il seçiliyken gösterilir
+        return [ad for ad in self.fasetler if ad != "ilce" or "il" in filtreler]
+
+    def fasetleri_hesapla(self, filtreler):
+        alanlar = {ad: self.fasetler[ad] for ad in self.etkin_fasetler(filtreler)}
+        secimler = {
+            ad: deger if isinstance(deger, list) else [deger]
+            for ad, deger in filtreler.items()
+            if ad in alanlar
+        }
+        digerleri = {ad: deger for ad, deger in filtreler.items() if ad not in alanlar}
+        return faset_sayilari(
+            self.filtrele(self.temel_sorgu(), digerleri), alanlar, secimler
+        )
+
+    def get_context_data(self, **kwargs):
+        return super().get_context_data(
+            populer_anahtarlar=oneriler()[:POPULER_ANAHTAR_SAYISI], **kwargs
+        )
+
 
-# Create your views here.
+@require_safe
+@sorgu_butcesi(1)
+def anahtar_onerileri(request):
+    """``?anahtar=<önek>`` için otomatik tamamlama seçenekleri (HTMX parçası)."""
+    return render(
+        request,
+        "ilanlar/components/anahtar-onerileri.html",
+        {"oneriler": oneriler(request.GET.get("anahtar", "")[:50])},
+    )
@@ -13,4 +13,15 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'istihdam.settings')
 
+# Çalıştırma: uvicorn istihdam.asgi:application --workers <n>
+# Senkron görünümler istek başına ayrı iş parçacığında çalıştığından ASGI
+# altında kalıcı bağlantılar yerine bağlantı havuzu (DB_POOL=1) kullanılmalıdır;
+# kalıcı bağlantılar açıksa uygulama başlatılmaz.
+
 application = get_asgi_application()
+
+from ortak.metrikler import metrikleri_baslat  # noqa: E402
+from ortak.veritabani import kalici_baglantilari_reddet  # noqa: E402
+
+kalici_baglantilari_reddet()
+metrikleri_baslat()
@@ -1,4 +1,6 @@
+import copy
 import os
+import sys
 from pathlib import Path
 
 import environ
@@ -34,9 +36,16 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "rest_framework",
+    "django_filters",
+    "django_htmx",
     "hesap.apps.HesapConfig",
     "ayarlar.apps.AyarlarConfig",
     "ilanlar.apps.IlanlarConfig",
+    "dosyalar.apps.DosyalarConfig",
+    "api.apps.ApiConfig",
+    "ortak.apps.OrtakConfig",
+    "raporlar.apps.RaporlarConfig",
 ]
 
 
@@ -45,11 +54,16 @@ SILENCED_SYSTEM_CHECKS = ["security.W019"]
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "ortak.yonlendirici.OkumaKopyasiMiddleware",
+    "ortak.metrikler.MetrikMiddleware",
+    "dosyalar.yukleme.YuklemeSiniriMiddleware",
+    "ortak.sorgu_profili.SorguProfiliMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
+    "django_htmx.middleware.HtmxMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
@@ -66,6 +80,7 @@ TEMPLATES = [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
+                "ortak.context_processors.onbellek_surumleri",
             ],
         },
     },
@@ -85,9 +100,48 @@ DATABASES = {
         "PASSWORD": env("DB_PASSWORD"),
         "HOST": env("DB_HOST"),
         "PORT": env("DB_PORT"),
+        # Kalıcı bağlantılar: bağlantı istekler arasında bu kadar saniye korunur.
+        # Yalnızca WSGI altında açılmalıdır; ASGI altında DB_POOL kullanılır.
+        "CONN_MAX_AGE": env.int("DB_CONN_MAX_AGE", default=0),
+        "CONN_HEALTH_CHECKS": env.bool("DB_CONN_HEALTH_CHECKS", default=True),
+        "OPTIONS": {},
     }
 }
 
+# psycopg bağlantı havuzu; etkinleştirildiğinde kalıcı bağlantılar kapatılır.
+# ASGI (uvicorn) altında kalıcı bağlantılar iş parçacıklarında biriktiği için
+# havuz kullanılmalıdır.
+if env.bool("DB_POOL", default=False):
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": env.int("DB_POOL_MIN_SIZE", default=2),
+        "max_size": env.int("DB_POOL_MAX_SIZE", default=10),
+        "timeout": env.int("DB_POOL_TIMEOUT", default=10),
+    }
+
+# Okuma kopyaları: DB_REPLICA_HOSTS=host1:5432,host2 biçiminde verilir. Her
+# kopya birincilin ayarlarını devralır ve ``replica_<n>`` adıyla tanımlanır.
+for sira, kopya in enumerate(env.list("DB_REPLICA_HOSTS", default=[]), start=1):
+    host, _, port = kopya.partition(":")
+    DATABASES[f"replica_{sira}"] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "PORT": port or DATABASES["default"]["PORT"],
+        "OPTIONS": copy.deepcopy(DATABASES["default"]["OPTIONS"]),
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["ortak.yonlendirici.OkumaKopyasiYonlendirici"]
+
+# Yazma isteğinden sonra kullanıcının okumaları bu kadar saniye birincilden yapılır
+OKUMA_KOPYASI_SABITLEME_SURESI = env.int("OKUMA_KOPYASI_SABITLEME_SURESI", default=10)
+
+
+# Önbellek: CACHE_URL ile seçilir, ör. filecache:///var/tmp/istihdam,
+# rediscache:///run/redis/redis.sock (yerel soket) veya redis://localhost:6379/1.
+# Varsayılan süreç içi locmem önbelleği süreçler arasında paylaşılmaz.
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -131,6 +185,28 @@ STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 MEDIA_URL = env("MEDIA_URL")
 MEDIA_ROOT = os.path.join(BASE_DIR, env("MEDIA_ROOT"))
 
+# Dosya yükleme
+# Yüklemeler sınırları denetlenerek medya dizini altındaki geçici dizine
+# akıtılır; böylece kalıcı konuma kopyalanmadan taşınırlar. Gövdesi
+# YUKLEME_ISTEK_UST_SINIRI sınırını aşan istekler okunmadan 413 ile reddedilir.
+FILE_UPLOAD_HANDLERS = ["dosyalar.yukleme.SinirliYuklemeIsleyicisi"]
+YUKLEME_GECICI_DIZINI = os.path.join(MEDIA_ROOT, ".yukleme")
+YUKLEME_ISTEK_UST_SINIRI = env.int("YUKLEME_ISTEK_UST_SINIRI", default=50 * 1024 * 1024)
+
+# Depolama alanları
+# Özgeçmiş ve sertifika gibi belgeler içerik adresli depolamada tekilleştirilir
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+    "belgeler": {
+        "BACKEND": "dosyalar.storage.IcerikAdresliStorage",
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -138,3 +214,51 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # Configure custom user model
 AUTH_USER_MODEL = "hesap.Kullanici"
+
+# REST API (salt okunur, herkese açık)
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": ["rest_framework.renderers.JSONRenderer"],
+    "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.AllowAny"],
+    "DEFAULT_FILTER_BACKENDS": ["django_filters.rest_framework.DjangoFilterBackend"],
+    "DEFAULT_PAGINATION_CLASS": "api.pagination.KimlikCursorPagination",
+    "PAGE_SIZE": 20,
+}
+
+# Anonim ziyaretçiler için sayfa ve şablon parçası önbellek süresi (sn)
+SAYFA_ONBELLEK_SURESI = env.int("SAYFA_ONBELLEK_SURESI", default=15 * 60)
+
+# Platform istatistiklerinin süreç içi önbellek süresi (sn)
+ISTATISTIK_ONBELLEK_SURESI = env.int("ISTATISTIK_ONBELLEK_SURESI", default=60)
+
+# Sorgu profili: isteklerin bu oranı (0-1) ölçülüp günlüğe yazılır. Sorgu
+# bütçesi tanımlı görünümler her istekte ölçülür; katı modda bütçeyi aşan
+# görünüm hata verir (testlerde varsayılan olarak açıktır).
+SORGU_PROFILI_ORNEKLEME = env.float(
+    "SORGU_PROFILI_ORNEKLEME", default=1.0 if DEBUG else 0.01
+)
+SORGU_TEKRAR_ESIGI = env.int("SORGU_TEKRAR_ESIGI", default=5)
+SORGU_BUTCESI_KATI = env.bool(
+    "SORGU_BUTCESI_KATI",
+    default=sys.argv[1:2] == ["test"] or "pytest" in sys.modules,
+)
+
+# /metrics uç noktası için Bearer anahtarı (boşsa erişim ters vekil ile sınırlanmalı)
+METRIK_ANAHTARI = env("METRIK_ANAHTARI", default="")
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "json": {"()": "ortak.gunluk.JsonBicimlendirici"},
+    },
+    "handlers": {
+        "json_konsol": {"class": "logging.StreamHandler", "formatter": "json"},
+    },
+    "loggers": {
+        "istihdam": {
+            "handlers": ["json_konsol"],
+            "level": env("GUNLUK_SEVIYESI", default="INFO"),
+            "propagate": False,
+        },
+    },
+}
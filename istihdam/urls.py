@@ -8,14 +8,36 @@ from django.contrib import admin
 from django.urls import include, path
 from django.views.generic import TemplateView
 
+from hesap.views import UstaListesiView
+from ilanlar.views import IlanListesiView, anahtar_onerileri
+from ortak.metrikler import metrikler
+from ortak.onbellek import surumlu_sayfa_onbellegi
+from ortak.sorgu_profili import sorgu_butcesi
+
 urlpatterns = [
     path("admin/", admin.site.urls),
+    # REST API
+    path("api/v1/", include("api.urls", namespace="v1")),
+    # Sistem durumu (yalnızca yetkililer)
+    path("sistem/", include("ortak.urls")),
+    # Prometheus ölçümleri
+    path("metrics", metrikler, name="metrikler"),
     # Ana sayfa
-    path("", TemplateView.as_view(template_name="pages/home.html"), name="home"),
+    path(
+        "",
+        sorgu_butcesi(15)(
+            surumlu_sayfa_onbellegi("ilan", "firma", "usta", "istatistik")(
+                TemplateView.as_view(template_name="pages/home.html")
+            )
+        ),
+        name="home",
+    ),
     # Diğer URL yapısı için yertutucu
     path(
         "hakkimizda/",
-        TemplateView.as_view(template_name="pages/about.html"),
+        surumlu_sayfa_onbellegi()(
+            TemplateView.as_view(template_name="pages/about.html")
+        ),
         name="about",
     ),
     path(
@@ -25,18 +47,18 @@ urlpatterns = [
     ),
     path(
         "firmalar/",
-        TemplateView.as_view(template_name="firmalar/list.html"),
+        surumlu_sayfa_onbellegi("firma")(
+            TemplateView.as_view(template_name="firmalar/list.html")
+        ),
         name="firmalar",
     ),
+    # Liste sayfaları parçalarını filtre kombinasyonu başına önbelleğe alır
+    path("ustalar/", UstaListesiView.as_view(), name="ustalar"),
+    path("ilanlar/", IlanListesiView.as_view(), name="ilanlar"),
     path(
-        "ustalar/",
-        TemplateView.as_view(template_name="ustalar/list.html"),
-        name="ustalar",
-    ),
-    path(
-        "ilanlar/",
-        TemplateView.as_view(template_name="ilanlar/list.html"),
-        name="ilanlar",
+        "ilanlar/anahtar-kelimeler/",
+        anahtar_onerileri,
+        name="anahtar-onerileri",
     ),
 ]
 
@@ -14,3 +14,7 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'istihdam.settings')
 
 application = get_wsgi_application()
+
+from ortak.metrikler import metrikleri_baslat  # noqa: E402
+
+metrikleri_baslat()
@@ -0,0 +1,14 @@
+from django.contrib import admin
+
+from .models import PlatformIstatistik
+
+
+@admin.register(PlatformIstatistik)
+class PlatformIstatistikAdmin(admin.ModelAdmin):
+    """Platform özet istatistiklerinin admin panelinde gösterimi."""
+
+    list_display = ("anahtar", "deger", "guncelleme_tarihi")
+    readonly_fields = ("anahtar", "deger", "guncelleme_tarihi")
+
+    def has_add_permission(self, request):
+        return False
@@ -0,0 +1,19 @@
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class OrtakConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "ortak"
+    verbose_name = _("Ortak")
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from . import signals
+        from .metrikler import sorgu_olcumunu_bagla
+        from .sorgu_profili import sorgu_kaydini_bagla
+
+        signals.baglan()
+        connection_created.connect(sorgu_olcumunu_bagla)
+        connection_created.connect(sorgu_kaydini_bagla)
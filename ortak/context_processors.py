@@ -0,0 +1,17 @@
+from django.conf import settings
+
+from .onbellek import SurumSozlugu
+
+
+def onbellek_surumleri(request):
+    """
+    Parça önbelleği anahtarlarında kullanılacak model sürümleri ve süre.
+
+    Sürümler yalnızca şablonda kullanıldıklarında önbellekten okunur::
+
+        {% cache onbellek_suresi "anasayfa-son-ilanlar" surumler.ilan %}
+    """
+    return {
+        "surumler": SurumSozlugu(),
+        "onbellek_suresi": settings.SAYFA_ONBELLEK_SURESI,
+    }
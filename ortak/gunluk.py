@@ -0,0 +1,22 @@
+import json
+import logging
+
+
+class JsonBicimlendirici(logging.Formatter):
+    """
+    Günlük kayıtlarını tek satırlık JSON olarak biçimlendirir.
+
+    ``extra={"veri": {...}}`` ile verilen alanlar kayda eklenir.
+    """
+
+    def format(self, record):
+        kayit = {
+            "zaman": self.formatTime(record, "%Y-%m-%dT%H:%M:%S%z"),
+            "seviye": record.levelname,
+            "gunluk": record.name,
+            "olay": record.getMessage(),
+            **getattr(record, "veri", {}),
+        }
+        if record.exc_info:
+            kayit["hata"] = self.formatException(record.exc_info)
+        return json.dumps(kayit, ensure_ascii=False, default=str)
@@ -0,0 +1,38 @@
+"""
+Veritabanına özgü sorgu ifadeleri.
+
+PostgreSQL'de işlem kimlikleri ve anlık görüntü (snapshot) sınırı kullanılır.
+İşlemleri sırayla yürüten diğer veritabanlarında (SQLite) kayıtlar ekleme
+sırasıyla onaylandığı için bu ifadeler sabit değer üretir.
+"""
+
+from django.db.models import BigIntegerField, Func
+
+
+class IslemKimligi(Func):
+    """
+    Kaydı ekleyen işlemin kimliği (``pg_current_xact_id()``).
+
+    Savepoint içinde de üst işlemin kimliği döner.
+    """
+
+    template = "0"
+    output_field = BigIntegerField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return "pg_current_xact_id()::text::bigint", []
+
+
+class AcikIslemSiniri(Func):
+    """
+    Hâlâ açık olabilecek en eski işlemin kimliği.
+
+    Kimliği bu değerden küçük olan tüm işlemler sonuçlanmıştır; bu işlemlerin
+    eklediği kayıtlar sonradan ortaya çıkmaz.
+    """
+
+    template = "9223372036854775807"
+    output_field = BigIntegerField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return "pg_snapshot_xmin(pg_current_snapshot())::text::bigint", []
@@ -0,0 +1,171 @@
+import threading
+import time
+from dataclasses import dataclass
+
+from asgiref.sync import sync_to_async
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Sum
+
+from .models import IstatistikChoices, PlatformIstatistik
+from .onbellek import (
+    ahesapla_veya_getir,
+    asurumler,
+    hesapla_veya_getir,
+    surum_artir,
+    surumler,
+)
+
+
+@dataclass(frozen=True)
+class Sayac:
+    """
+    Bir modelin tek alanından türetilen platform istatistiği.
+
+    ``deger`` verildiğinde alanı bu değere eşit olan kayıtlar sayılır;
+    verilmezse alanın kendisi toplanır.
+    """
+
+    model: str
+    alan: str
+    deger: object = None
+
+    def katki(self, alan_degeri):
+        """Alan değerine sahip tek bir kaydın istatistiğe katkısı."""
+        if self.deger is None:
+            return alan_degeri or 0
+        return int(alan_degeri == self.deger)
+
+    def hesapla(self):
+        """İstatistiğin gerçek değerini veritabanından hesapla."""
+        queryset = apps.get_model(self.model)._base_manager.all()
+        if self.deger is None:
+            return queryset.aggregate(toplam=Sum(self.alan))["toplam"] or 0
+        return queryset.filter(**{self.alan: self.deger}).count()
+
+
+SAYACLAR = {
+    IstatistikChoices.AKTIF_ILAN: Sayac("ilanlar.IsBilgileri", "durum", "yayinda"),
+    IstatistikChoices.FIRMA: Sayac("hesap.Firma", "aktif", True),
+    IstatistikChoices.USTA: Sayac("hesap.Vatandas", "is_usta", True),
+    IstatistikChoices.IS_ARAYAN: Sayac("hesap.Vatandas", "is_is_arayan", True),
+    IstatistikChoices.ISE_ALINAN: Sayac("ilanlar.IlanSonuc", "ise_alinan"),
+}
+
+_kilit = threading.Lock()
+_onbellek = {"degerler": None, "zaman": 0.0}
+
+
+def istatistikler():
+    """
+    Platform istatistiklerini anahtar-değer sözlüğü olarak döndür.
+
+    Değerler süreç içinde ``ISTATISTIK_ONBELLEK_SURESI`` saniye saklanır;
+    süre dolduğunda paylaşılan önbellekten, orada da yoksa özet tablodan
+    tek sorguyla yeniden okunur. Tablo hiç doldurulmamışsa önce uzlaştırma
+    yapılır.
+    """
+    degerler = _surecteki_degerler()
+    if degerler is not None:
+        return degerler
+
+    surum = surumler("istatistik")["istatistik"]
+    degerler = hesapla_veya_getir(
+        f"istatistikler:{surum}", _ozet_tablodan_oku, settings.SAYFA_ONBELLEK_SURESI
+    )
+    _surece_yaz(degerler)
+    return degerler
+
+
+async def aistatistikler():
+    """``istatistikler`` fonksiyonunun async görünümler için karşılığı."""
+    degerler = _surecteki_degerler()
+    if degerler is not None:
+        return degerler
+
+    surum = (await asurumler("istatistik"))["istatistik"]
+    degerler = await ahesapla_veya_getir(
+        f"istatistikler:{surum}", _aozet_tablodan_oku, settings.SAYFA_ONBELLEK_SURESI
+    )
+    _surece_yaz(degerler)
+    return degerler
+
+
+def _surecteki_degerler():
+    with _kilit:
+        if (
+            _onbellek["degerler"] is not None
+            and time.monotonic() - _onbellek["zaman"]
+            < settings.ISTATISTIK_ONBELLEK_SURESI
+        ):
+            return _onbellek["degerler"]
+    return None
+
+
+def _surece_yaz(degerler):
+    with _kilit:
+        _onbellek.update(degerler=degerler, zaman=time.monotonic())
+
+
+def _ozet_tablodan_oku():
+    degerler = dict(PlatformIstatistik.objects.values_list("anahtar", "deger"))
+    if len(degerler) < len(SAYACLAR):
+        degerler = istatistikleri_uzlastir()
+    return degerler
+
+
+async def _aozet_tablodan_oku():
+    degerler = {
+        anahtar: deger
+        async for anahtar, deger in PlatformIstatistik.objects.values_list(
+            "anahtar", "deger"
+        )
+    }
+    if len(degerler) < len(SAYACLAR):
+        degerler = await sync_to_async(istatistikleri_uzlastir)()
+    return degerler
+
+
+def onbellegi_temizle():
+    """Bu süreçteki istatistik önbelleğini boşalt."""
+    with _kilit:
+        _onbellek.update(degerler=None, zaman=0.0)
+
+
+def istatistik_degistir(farklar):
+    """
+    İstatistikleri verilen farklar kadar artır veya azalt.
+
+    Güncelleme çağıran işlemle birlikte kaydedilir; işlem geri alınırsa
+    sayaçlar da eski değerinde kalır. Sinyal göndermeyen toplu
+    güncellemeler de farkları bu fonksiyonla bildirmelidir.
+    """
+    for anahtar, fark in farklar.items():
+        if fark:
+            PlatformIstatistik.objects.filter(anahtar=anahtar).update(
+                deger=F("deger") + fark
+            )
+    if any(farklar.values()):
+        transaction.on_commit(_degisiklik_yayinla)
+
+
+def _degisiklik_yayinla():
+    onbellegi_temizle()
+    surum_artir("istatistik")
+
+
+def istatistikleri_uzlastir():
+    """Tüm istatistikleri gerçek sayımlarla eşitle ve yeni değerleri döndür."""
+    degerler = {anahtar: sayac.hesapla() for anahtar, sayac in SAYACLAR.items()}
+    PlatformIstatistik.objects.bulk_create(
+        [
+            PlatformIstatistik(anahtar=anahtar, deger=deger)
+            for anahtar, deger in degerler.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["anahtar"],
+        update_fields=["deger", "guncelleme_tarihi"],
+    )
+    onbellegi_temizle()
+    return {str(anahtar): deger for anahtar, deger in degerler.items()}
@@ -0,0 +1,343 @@
+"""
+Sık kullanılan yollar için kıyaslama (benchmark) takımı.
+
+Kıyaslamalar ``ornek_veri_uret`` ile üretilmiş veri üzerinde çalışır. Her
+kıyaslama bir ``Baglam`` alan ve tek bir işlemi yapan fonksiyondur;
+``kiyaslama`` dekoratörüyle ``KIYASLAMALAR`` sözlüğüne kaydedilir. Ölçümler
+(p50/p95 gecikme ve işlem başına sorgu sayısı) ``kiyasla`` komutu
+tarafından aynı veritabanı ve veri ölçeğindeki referans çalışmayla
+karşılaştırılır; yalnızca gerilemeyen çalışmalar geçmişe eklenir.
+"""
+
+import random
+import statistics
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import connections, transaction
+from django.db.models import Q
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from ayarlar.models import Il, Meslek
+from hesap.models import Firma, Vatandas
+from ilanlar.basvuru import basvuru_yap
+from ilanlar.models import IlanBasvuru, IlanDurumChoices, IsBilgileri
+from ilanlar.soru_semasi import soru_semasi
+
+from .ornek_veri import KULLANICI_ONEKI
+from .sorgu_profili import SorguKaydedici
+
+KIYASLAMALAR = {}
+
+# Veri ölçeği bu modellerin kayıt sayılarıyla belirlenir
+OLCEK_MODELLERI = {"ilan": IsBilgileri, "vatandas": Vatandas, "basvuru": IlanBasvuru}
+
+# Kayıt sayıları bu orandan az farklıysa iki çalışma aynı ölçekte sayılır
+OLCEK_TOLERANSI = 0.1
+
+
+def kiyaslama(ad):
+    """Fonksiyonu verilen adla kıyaslama olarak kaydet."""
+
+    def dekorator(fonksiyon):
+        KIYASLAMALAR[ad] = fonksiyon
+        return fonksiyon
+
+    return dekorator
+
+
+@dataclass
+class Baglam:
+    """Kıyaslamaların paylaştığı istemciler ve örnek kayıt kimlikleri."""
+
+    tohum: int = 1
+    rng: random.Random = None
+    anonim: Client = None
+    yonetici: Client = None
+    ornekler: dict = field(default_factory=dict)
+
+    @classmethod
+    def hazirla(cls, tohum=1):
+        Kullanici = get_user_model()
+        yonetici = Kullanici.objects.filter(is_superuser=True, is_active=True).first()
+        if yonetici is None:
+            yonetici = Kullanici.objects.create_superuser(
+                f"{KULLANICI_ONEKI}kiyas_yonetici", password=None
+            )
+        baglam = cls(tohum=tohum, rng=random.Random(tohum))
+        baglam.anonim = Client()
+        baglam.yonetici = Client()
+        baglam.yonetici.force_login(yonetici)
+
+        bugun = timezone.localdate()
+        yayinda = IsBilgileri.objects.filter(durum=IlanDurumChoices.YAYINDA)
+        baglam.ornekler = {
+            "ilan_sluglari": list(yayinda.values_list("slug", flat=True)[:200]),
+            "soru_ilanlari": list(
+                yayinda.filter(
+                    Q(basvuru_bitis__isnull=True) | Q(basvuru_bitis__gte=bugun),
+                    sorular__isnull=False,
+                    basvuru_baslangic__lte=bugun,
+                )
+                .distinct()
+                .values_list("pk", flat=True)[:200]
+            ),
+            "iller": list(Il.objects.values_list("pk", flat=True)),
+            "firmalar": list(Firma.objects.values_list("pk", flat=True)[:200]),
+            "meslekler": list(Meslek.objects.values_list("pk", flat=True)),
+            "vatandas_araligi": (
+                Vatandas.objects.order_by("pk").values_list("pk", flat=True).first(),
+                Vatandas.objects.order_by("-pk").values_list("pk", flat=True).first(),
+            ),
+        }
+        if (
+            not baglam.ornekler["ilan_sluglari"]
+            or None in baglam.ornekler["vatandas_araligi"]
+        ):
+            raise ValueError("Kıyaslama için örnek veri bulunamadı.")
+        return baglam
+
+    def sec(self, anahtar):
+        return self.rng.choice(self.ornekler[anahtar])
+
+
+def _getir(istemci, yol, **parametreler):
+    yanit = istemci.get(yol, parametreler)
+    if yanit.status_code != 200:
+        raise AssertionError(f"{yol}: HTTP {yanit.status_code}")
+    return yanit
+
+
+# Herkese açık ilan listesi, arama ve detay
+
+
+@kiyaslama("ilan_listesi")
+def ilan_listesi(baglam):
+    _getir(baglam.anonim, "/api/v1/ilanlar/")
+
+
+@kiyaslama("ilan_arama")
+def ilan_arama(baglam):
+    _getir(
+        baglam.anonim,
+        "/api/v1/ilanlar/",
+        il=baglam.sec("iller"),
+        calisma_modeli="tam_zamanli",
+    )
+
+
+@kiyaslama("ilan_detay")
+def ilan_detay(baglam):
+    _getir(baglam.anonim, f"/api/v1/ilanlar/{baglam.sec('ilan_sluglari')}/")
+
+
+@kiyaslama("disa_aktarim_degisiklikler")
+def disa_aktarim_degisiklikler(baglam):
+    _getir(baglam.anonim, "/api/v1/ilanlar/degisiklikler/", limit=500)
+
+
+@kiyaslama("disa_aktarim_firmalar")
+def disa_aktarim_firmalar(baglam):
+    _getir(baglam.anonim, "/api/v1/firmalar/")
+
+
+# Coğrafya
+
+
+@kiyaslama("cografya_ilce_otomatik_tamamlama")
+def cografya_ilce_otomatik_tamamlama(baglam):
+    _getir(
+        baglam.yonetici,
+        reverse("admin:autocomplete"),
+        app_label="hesap",
+        model_name="vatandas",
+        field_name="ilce",
+        term="mer",
+    )
+
+
+@kiyaslama("cografya_ustalar_il")
+def cografya_ustalar_il(baglam):
+    _getir(baglam.anonim, "/api/v1/ustalar/", il=baglam.sec("iller"))
+
+
+# Yönetim paneli listeleri
+
+
+@kiyaslama("admin_basvuru_listesi")
+def admin_basvuru_listesi(baglam):
+    _getir(baglam.yonetici, reverse("admin:ilanlar_ilanbasvuru_changelist"))
+
+
+@kiyaslama("admin_basvuru_durum_filtresi")
+def admin_basvuru_durum_filtresi(baglam):
+    _getir(
+        baglam.yonetici,
+        reverse("admin:ilanlar_ilanbasvuru_changelist"),
+        durum__exact="beklemede",
+    )
+
+
+@kiyaslama("admin_basvuru_firma_filtresi")
+def admin_basvuru_firma_filtresi(baglam):
+    _getir(
+        baglam.yonetici,
+        reverse("admin:ilanlar_ilanbasvuru_changelist"),
+        ilan__firma__id__exact=baglam.sec("firmalar"),
+    )
+
+
+def _vatandas_listesi(baglam, **filtre):
+    _getir(baglam.yonetici, reverse("admin:hesap_vatandas_changelist"), **filtre)
+
+
+@kiyaslama("admin_vatandas_listesi")
+def admin_vatandas_listesi(baglam):
+    _vatandas_listesi(baglam)
+
+
+@kiyaslama("admin_vatandas_yas_araligi")
+def admin_vatandas_yas_araligi(baglam):
+    _vatandas_listesi(baglam, yas_araligi="26-35")
+
+
+@kiyaslama("admin_vatandas_egitim_derecesi")
+def admin_vatandas_egitim_derecesi(baglam):
+    _vatandas_listesi(baglam, egitim_derecesi="lisans")
+
+
+@kiyaslama("admin_vatandas_sertifika_var")
+def admin_vatandas_sertifika_var(baglam):
+    _vatandas_listesi(baglam, sertifika_var_mi="var")
+
+
+@kiyaslama("admin_vatandas_sertifika_yok")
+def admin_vatandas_sertifika_yok(baglam):
+    _vatandas_listesi(baglam, sertifika_var_mi="yok")
+
+
+@kiyaslama("admin_vatandas_ustalik_meslegi")
+def admin_vatandas_ustalik_meslegi(baglam):
+    _vatandas_listesi(baglam, ustalik_meslek=baglam.sec("meslekler"))
+
+
+# Başvuru
+
+
+@kiyaslama("basvuru_yap")
+def basvuru_kiyasi(baglam):
+    """Sorulu bir ilana başvuru; işlem geri alınır, veri değişmez."""
+    ilan = IsBilgileri.objects.get(pk=baglam.sec("soru_ilanlari"))
+    ilk, son = baglam.ornekler["vatandas_araligi"]
+    vatandas = (
+        Vatandas.objects.filter(pk__gte=baglam.rng.randint(ilk, son))
+        .order_by("pk")
+        .first()
+    )
+    cevaplar = {
+        soru.id: (soru.secenekler[0] if soru.secenekler else "evet")
+        for soru in soru_semasi(ilan.pk).sorular
+    }
+    with transaction.atomic():
+        try:
+            basvuru_yap(ilan, vatandas, cevaplar)
+        except ValidationError as hata:
+            if hata.code != "mukerrer":
+                raise
+        transaction.set_rollback(True)
+
+
+@dataclass
+class Olcum:
+    sureler: list
+    sorgular: list
+
+    def ozet(self):
+        sureler = sorted(self.sureler)
+        return {
+            "p50_ms": round(statistics.median(sureler) * 1000, 3),
+            "p95_ms": round(
+                sureler[min(len(sureler) - 1, int(len(sureler) * 0.95))] * 1000, 3
+            ),
+            "sorgu": max(self.sorgular),
+            "tekrar": len(sureler),
+        }
+
+
+def olc(fonksiyon, baglam, tekrar=30, isinma=3):
+    """Kıyaslamayı ısınma turlarından sonra ``tekrar`` kez çalıştırıp ölç."""
+    for _ in range(isinma):
+        fonksiyon(baglam)
+
+    olcum = Olcum([], [])
+    for _ in range(tekrar):
+        kaydedici = SorguKaydedici()
+        with ExitStack() as yigin:
+            for baglanti in connections.all():
+                yigin.enter_context(baglanti.execute_wrapper(kaydedici))
+            baslangic = time.perf_counter()
+            fonksiyon(baglam)
+            olcum.sureler.append(time.perf_counter() - baslangic)
+        olcum.sorgular.append(len(kaydedici.sorgular))
+    return olcum.ozet()
+
+
+def gerilemeler(onceki, simdiki, esik):
+    """
+    Önceki çalışmaya göre gerileyen kıyaslamaları döndür.
+
+    Gecikme ``esik`` oranından (ör. 0.2 = %20) fazla artmışsa veya sorgu
+    sayısı artmışsa kıyaslama gerilemiş sayılır.
+    """
+    sonuc = []
+    for ad, olcum in simdiki.items():
+        eski = onceki.get(ad)
+        if eski is None:
+            continue
+        if olcum["sorgu"] > eski["sorgu"]:
+            sonuc.append(f"{ad}: sorgu {eski['sorgu']} -> {olcum['sorgu']}")
+        for anahtar in ("p50_ms", "p95_ms"):
+            if olcum[anahtar] > eski[anahtar] * (1 + esik):
+                sonuc.append(
+                    f"{ad}: {anahtar} {eski[anahtar]:.2f} -> {olcum[anahtar]:.2f}"
+                )
+    return sonuc
+
+
+def veri_olcegi():
+    """Kıyaslamanın çalıştığı verinin ölçeği (model başına kayıt sayısı)."""
+    return {ad: model.objects.count() for ad, model in OLCEK_MODELLERI.items()}
+
+
+def ayni_olcek(birinci, ikinci, tolerans=OLCEK_TOLERANSI):
+    """İki veri ölçeği her modelde ``tolerans`` oranından az farklı mı?"""
+    if not birinci or birinci.keys() != ikinci.keys():
+        return False
+    return all(
+        abs(birinci[ad] - ikinci[ad]) <= tolerans * max(birinci[ad], ikinci[ad])
+        for ad in birinci
+    )
+
+
+def referans_sonuclar(gecmis, veritabani, olcek):
+    """
+    Her kıyaslama için karşılaştırılacak referans ölçümü döndür.
+
+    Referans, aynı veritabanı türünde ve aynı veri ölçeğinde o kıyaslamayı
+    içeren en son kayıtlı çalışmadır. Geçmişe yalnızca gerilemeyen
+    çalışmalar eklendiği için gerileyen bir çalışma referans olamaz.
+    """
+    sonuc = {}
+    for kayit in reversed(gecmis):
+        if kayit["veritabani"] != veritabani or not ayni_olcek(
+            kayit.get("olcek"), olcek
+        ):
+            continue
+        for ad, olcum in kayit["sonuclar"].items():
+            sonuc.setdefault(ad, olcum)
+    return sonuc
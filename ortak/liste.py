@@ -0,0 +1,248 @@
+"""
+Filtre formlu, fasetli ve sayfalı herkese açık liste sayfaları.
+
+Filtre formundaki her değişiklik HTMX ile aynı adrese gönderilir. HTMX
+isteklerinde (``HX-Request``) sayfanın tamamı yerine yalnızca sonuç parçası
+ve güncel faset sayıları (``hx-swap-oob``) döner; tam sayfa isteğinde aynı
+parçalar düzen şablonuna yerleştirilir. Sonuç parçası filtre, sıralama ve
+sayfa kombinasyonu başına, faset sayıları ise yalnızca filtre kombinasyonu
+başına model sürümlerine bağlı önbellekte tutulur.
+"""
+
+import hashlib
+import json
+from urllib.parse import urlencode
+
+from django import forms
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db.models import Count
+from django.template.loader import render_to_string
+from django.utils.cache import patch_vary_headers
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language, gettext
+from django.views.generic import TemplateView
+
+from ayarlar.models import Il, Ilce
+
+from .onbellek import hesapla_veya_getir, surumler
+
+LISTE_ONEKI = "liste"
+
+
+def parca_istegi(request):
+    """
+    İstek yalnızca sayfa parçası bekleyen bir HTMX isteği mi?
+
+    Geçmişten geri yükleme istekleri (``HX-History-Restore-Request``) tam
+    sayfa bekler.
+    """
+    return bool(request.htmx) and not request.htmx.history_restore_request
+
+
+def cografya_secenekleri():
+    """İl seçenekleri ve il slug'ına göre ilçe seçenekleri."""
+    ilceler = {}
+    for il_slug, slug, ad in Ilce.objects.values_list("il__slug", "slug", "ad"):
+        ilceler.setdefault(il_slug, []).append((slug, ad))
+    return {
+        "il": [("", gettext("Tüm İller")), *Il.objects.values_list("slug", "ad")],
+        "ilce": ilceler,
+    }
+
+
+def cografya_form_secenekleri(secenekler, veri):
+    """İlçe seçeneklerini seçili ilin ilçeleriyle sınırla."""
+    return {
+        **secenekler,
+        "ilce": [
+            ("", gettext("Tüm İlçeler")),
+            *secenekler["ilce"].get(veri.get("il"), []),
+        ],
+    }
+
+
+class FasetliListeFormu(forms.Form):
+    """
+    Fasetli liste filtreleri.
+
+    Veritabanındaki seçenekler (il, sektör vb.) formu oluşturan görünüm
+    tarafından önbellekten verilir; doğrulama sorgu yapmaz. Geçersiz alanlar
+    hata yerine yok sayılır, ``filtreler`` yalnızca geçerli ve dolu alanları
+    döndürür.
+    """
+
+    siralama = forms.ChoiceField(required=False)
+    sayfa = forms.IntegerField(required=False, min_value=1)
+
+    def __init__(self, *args, secenekler=None, siralamalar=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["siralama"].choices = [(ad, ad) for ad in siralamalar]
+        for ad, liste in (secenekler or {}).items():
+            if ad in self.fields:
+                self.fields[ad].choices = liste
+
+    def filtreler(self):
+        self.is_valid()
+        sonuc = {}
+        for ad, deger in self.cleaned_data.items():
+            if ad in ("siralama", "sayfa") or deger in (None, "", []):
+                continue
+            sonuc[ad] = sorted(deger) if isinstance(deger, list) else deger
+        return sonuc
+
+
+def _ozet(veri):
+    return hashlib.md5(
+        json.dumps(veri, sort_keys=True).encode(), usedforsecurity=False
+    ).hexdigest()
+
+
+class FasetliListeView(TemplateView):
+    """
+    Fasetli liste sayfası.
+
+    Alt sınıflar ``temel_sorgu`` ve ``filtrele`` metotlarını tanımlar.
+    ``fasetler`` form alanı adından gruplanacak sorgu yoluna eşlemedir; her
+    faset, kendi alanı dışındaki filtreler uygulanmış sorgu üzerinde sayılır.
+    ``siralamalar`` sıralama değerinden ``order_by`` alanlarına eşlemedir,
+    ilki varsayılandır.
+    """
+
+    form_class = FasetliListeFormu
+    onek = None
+    surum_adlari = ()
+    fasetler = {}
+    siralamalar = {}
+    sayfa_boyutu = 20
+    sonuc_sablonu = None
+    parca_sablonu = "components/liste-parcasi.html"
+    sayim = Count("pk")
+
+    def temel_sorgu(self):
+        raise NotImplementedError
+
+    def filtrele(self, queryset, filtreler):
+        raise NotImplementedError
+
+    def secenekleri_hesapla(self):
+        """Form alanı adından ``(değer, etiket)`` listesine eşleme."""
+        return {}
+
+    def form_secenekleri(self, secenekler, veri):
+        """Hesaplanan seçeneklerden bu isteğin form seçeneklerini üret."""
+        return secenekler
+
+    def etkin_fasetler(self, filtreler):
+        return list(self.fasetler)
+
+    def _onbellek(self, tur, hesapla, *parcalar):
+        surum = ".".join(str(deger) for deger in self._surumler.values())
+        anahtar = ":".join(
+            (LISTE_ONEKI, self.onek, tur, get_language(), surum, *parcalar)
+        )
+        return hesapla_veya_getir(anahtar, hesapla, settings.SAYFA_ONBELLEK_SURESI)
+
+    def fasetleri_hesapla(self, filtreler):
+        sonuc = {}
+        for ad in self.etkin_fasetler(filtreler):
+            yol = self.fasetler[ad]
+            digerleri = {alan: deger for alan, deger in filtreler.items() if alan != ad}
+            sonuc[ad] = dict(
+                self.filtrele(self.temel_sorgu(), digerleri)
+                .order_by()
+                .values(yol)
+                .annotate(sayi=self.sayim)
+                .values_list(yol, "sayi")
+            )
+        return sonuc
+
+    def sonuclari_olustur(self, filtreler, siralama, sayfa_no):
+        queryset = self.filtrele(self.temel_sorgu(), filtreler).order_by(
+            *self.siralamalar[siralama]
+        )
+        sayfalayici = Paginator(queryset, self.sayfa_boyutu)
+        sayfa = sayfalayici.get_page(sayfa_no)
+        return render_to_string(
+            self.sonuc_sablonu,
+            {
+                "sayfa": sayfa,
+                "sayfa_araligi": list(
+                    sayfalayici.get_elided_page_range(
+                        sayfa.number, on_each_side=1, on_ends=1
+                    )
+                ),
+                "siralama": siralama,
+                "siralamalar": list(self.siralamalar),
+                "sorgu": urlencode({**filtreler, "siralama": siralama}, doseq=True),
+            },
+        )
+
+    def faset_gruplari(self, form, filtreler, sayilar):
+        """Şablonlar için faset başına seçenek, sayı ve seçim durumu."""
+        gruplar = {}
+        for ad in self.fasetler:
+            alan = form.fields[ad]
+            secili = filtreler.get(ad, [])
+            if not isinstance(secili, list):
+                secili = [secili]
+            gruplar[ad] = {
+                "ad": ad,
+                "tur": (
+                    "kutu"
+                    if isinstance(alan.widget, forms.CheckboxSelectMultiple)
+                    else "secim"
+                ),
+                "secenekler": [
+                    {
+                        "deger": deger,
+                        "etiket": etiket,
+                        "sayi": sayilar.get(ad, {}).get(deger, 0),
+                        "secili": deger in secili,
+                    }
+                    for deger, etiket in alan.choices
+                ],
+            }
+        return gruplar
+
+    def get(self, request, *args, **kwargs):
+        self._surumler = surumler(*self.surum_adlari)
+        secenekler = self._onbellek("secenekler", self.secenekleri_hesapla)
+        form = self.form_class(
+            request.GET,
+            secenekler=self.form_secenekleri(secenekler, request.GET),
+            siralamalar=self.siralamalar,
+        )
+        filtreler = form.filtreler()
+        siralama = form.cleaned_data.get("siralama") or next(iter(self.siralamalar))
+        sayfa_no = form.cleaned_data.get("sayfa") or 1
+
+        filtre_ozeti = _ozet(filtreler)
+        sayilar = self._onbellek(
+            "faset", lambda: self.fasetleri_hesapla(filtreler), filtre_ozeti
+        )
+        sonuclar = self._onbellek(
+            "sonuc",
+            lambda: self.sonuclari_olustur(filtreler, siralama, sayfa_no),
+            filtre_ozeti,
+            siralama,
+            str(sayfa_no),
+        )
+        baglam = {
+            "form": form,
+            "filtreler": filtreler,
+            "siralama": siralama,
+            "sonuclar": mark_safe(sonuclar),
+            "fasetler": self.faset_gruplari(form, filtreler, sayilar),
+        }
+        if parca_istegi(request):
+            yanit = self.response_class(
+                request=request,
+                template=[self.parca_sablonu],
+                context=baglam,
+                using=self.template_engine,
+            )
+        else:
+            yanit = self.render_to_response(self.get_context_data(**baglam))
+        patch_vary_headers(yanit, ["HX-Request"])
+        return yanit
@@ -0,0 +1,146 @@
+import copy
+import statistics
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from ortak.veritabani import baglanti_durumu
+
+MODLAR = ("istek_basina", "kalici", "havuz")
+
+
+class Command(BaseCommand):
+    help = (
+        "Bağlantı yönetimi seçeneklerini eşzamanlı yük altında karşılaştırır. "
+        "Her iş parçacığı istek yaşam döngüsünü taklit eder: sorgu çalıştırır "
+        "ve istek sonunda Django'nun yaptığı gibi bağlantıyı bırakır. "
+        "İstek başına bağlantı (CONN_MAX_AGE=0), kalıcı bağlantı ve psycopg "
+        "havuzu için gecikme ve açılan bağlantı sayısı raporlanır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+        parser.add_argument(
+            "--is-parcacigi", type=int, default=16, help="Eşzamanlı istemci sayısı"
+        )
+        parser.add_argument(
+            "--istek", type=int, default=200, help="İstemci başına istek sayısı"
+        )
+        parser.add_argument(
+            "--sorgu",
+            default="SELECT 1",
+            help="Her istekte çalıştırılacak SQL (varsayılan: SELECT 1)",
+        )
+        parser.add_argument(
+            "--mod",
+            action="append",
+            choices=MODLAR,
+            help="Yalnızca bu modları çalıştır (tekrarlanabilir)",
+        )
+
+    def handle(self, *args, **options):
+        kaynak = options["database"]
+        if kaynak not in connections:
+            raise CommandError(f"Tanımsız veritabanı: {kaynak}")
+
+        for mod in options["mod"] or MODLAR:
+            if mod == "havuz" and connections[kaynak].vendor != "postgresql":
+                self.stdout.write(
+                    self.style.WARNING("havuz: yalnızca PostgreSQL'de desteklenir")
+                )
+                continue
+            self._raporla(mod, self._kos(kaynak, mod, options))
+
+    def _alias_olustur(self, kaynak, mod):
+        ayarlar = copy.deepcopy(connections.settings[kaynak])
+        ayarlar["OPTIONS"].pop("pool", None)
+        ayarlar["CONN_MAX_AGE"] = 0
+        if mod == "kalici":
+            ayarlar["CONN_MAX_AGE"] = 600
+            ayarlar["CONN_HEALTH_CHECKS"] = True
+        elif mod == "havuz":
+            ayarlar["OPTIONS"]["pool"] = connections.settings[kaynak]["OPTIONS"].get(
+                "pool"
+            ) or {"min_size": 2, "max_size": 10}
+
+        alias = f"_kiyas_{mod}"
+        connections.settings[alias] = ayarlar
+        return alias
+
+    def _kos(self, kaynak, mod, options):
+        alias = self._alias_olustur(kaynak, mod)
+        sureler, hatalar = [], []
+        acilan = {"sayi": 0}
+        kilit = threading.Lock()
+
+        def baglanti_acildi(sender, connection, **kwargs):
+            if connection.alias == alias:
+                with kilit:
+                    acilan["sayi"] += 1
+
+        def istemci():
+            baglanti = connections[alias]
+            yerel = []
+            try:
+                for _ in range(options["istek"]):
+                    baslangic = time.perf_counter()
+                    with baglanti.cursor() as cursor:
+                        cursor.execute(options["sorgu"])
+                        cursor.fetchall()
+                    # İstek sonu: request_finished sinyalindeki davranış
+                    baglanti.close_if_unusable_or_obsolete()
+                    yerel.append(time.perf_counter() - baslangic)
+            except Exception as hata:  # noqa: BLE001 - rapora eklenir
+                hatalar.append(hata)
+            finally:
+                baglanti.close()
+                with kilit:
+                    sureler.extend(yerel)
+
+        connection_created.connect(baglanti_acildi)
+        try:
+            is_parcaciklari = [
+                threading.Thread(target=istemci) for _ in range(options["is_parcacigi"])
+            ]
+            baslangic = time.perf_counter()
+            for is_parcacigi in is_parcaciklari:
+                is_parcacigi.start()
+            for is_parcacigi in is_parcaciklari:
+                is_parcacigi.join()
+            toplam = time.perf_counter() - baslangic
+            durum = baglanti_durumu(alias)
+        finally:
+            connection_created.disconnect(baglanti_acildi)
+            if mod == "havuz":
+                connections[alias].close_pool()
+            connections[alias].close()
+            del connections[alias]
+            del connections.settings[alias]
+
+        return {
+            "mod": mod,
+            "sure": toplam,
+            "sureler": sureler,
+            "acilan": acilan["sayi"],
+            "hatalar": hatalar,
+            "havuz": durum.get("havuz"),
+        }
+
+    def _raporla(self, mod, sonuc):
+        sureler = sorted(sonuc["sureler"])
+        if not sureler:
+            self.stdout.write(self.style.ERROR(f"{mod}: {sonuc['hatalar'][:1]}"))
+            return
+
+        p95 = sureler[min(len(sureler) - 1, int(len(sureler) * 0.95))]
+        self.stdout.write(
+            f"{mod:<13} istek/sn={len(sureler) / sonuc['sure']:8.1f}  "
+            f"p50={statistics.median(sureler) * 1000:7.2f} ms  "
+            f"p95={p95 * 1000:7.2f} ms  "
+            f"acilan_baglanti={sonuc['acilan']}  hata={len(sonuc['hatalar'])}"
+        )
+        if sonuc["havuz"]:
+            self.stdout.write(f"{'':<13} havuz={sonuc['havuz']}")
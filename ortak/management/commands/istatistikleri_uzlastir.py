@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from ortak.istatistik import istatistikleri_uzlastir
+
+
+class Command(BaseCommand):
+    help = (
+        "Platform özet istatistiklerini gerçek sayımlarla eşitler. Sinyal "
+        "göndermeyen toplu güncellemelerden kaynaklanan sapmaları gidermek "
+        "için düzenli olarak (ör. saatlik) çalıştırılmalıdır."
+    )
+
+    def handle(self, *args, **options):
+        for anahtar, deger in istatistikleri_uzlastir().items():
+            self.stdout.write(f"{anahtar}: {deger}")
+        self.stdout.write(self.style.SUCCESS("İstatistikler uzlaştırıldı."))
@@ -0,0 +1,131 @@
+import json
+import subprocess
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from ortak.kiyaslama import (
+    KIYASLAMALAR,
+    Baglam,
+    gerilemeler,
+    olc,
+    referans_sonuclar,
+    veri_olcegi,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "İlan listesi, arama, yönetim paneli listeleri ve filtreleri, başvuru, "
+        "dışa aktarım ve coğrafya sorguları için kıyaslamaları çalıştırır. "
+        "p50/p95 gecikme ve sorgu sayıları aynı veritabanı türü ve veri "
+        "ölçeğindeki son kayıtlı çalışmayla karşılaştırılır; eşikten fazla "
+        "gerileyen kıyaslama olursa komut hata ile sonlanır ve çalışma geçmişe "
+        "eklenmez. Önce ornek_veri_uret ile veri üretilmelidir."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "adlar", nargs="*", help="Yalnızca adı bu ifadeleri içeren kıyaslamalar"
+        )
+        parser.add_argument("--tekrar", type=int, default=30)
+        parser.add_argument("--isinma", type=int, default=3)
+        parser.add_argument("--tohum", type=int, default=1)
+        parser.add_argument(
+            "--esik",
+            type=float,
+            default=0.2,
+            help="Gerileme sayılacak gecikme artışı oranı (varsayılan 0.2 = %%20)",
+        )
+        parser.add_argument(
+            "--gecmis",
+            default=str(Path(settings.BASE_DIR) / "kiyaslama_gecmisi.json"),
+            help="Sonuçların eklendiği JSON dosyası",
+        )
+        parser.add_argument(
+            "--kaydetme",
+            action="store_true",
+            help="Sonuçları geçmişe ekleme, yalnızca karşılaştır",
+        )
+        parser.add_argument(
+            "--gerilemeyi-kabul-et",
+            action="store_true",
+            help="Gerileme olsa da sonuçları yeni referans olarak geçmişe ekle",
+        )
+        parser.add_argument(
+            "--listele", action="store_true", help="Kıyaslama adlarını listele"
+        )
+
+    def handle(self, *args, **options):
+        if options["listele"]:
+            for ad in KIYASLAMALAR:
+                self.stdout.write(ad)
+            return
+
+        secilenler = {
+            ad: fonksiyon
+            for ad, fonksiyon in KIYASLAMALAR.items()
+            if not options["adlar"] or any(parca in ad for parca in options["adlar"])
+        }
+        if not secilenler:
+            raise CommandError("Eşleşen kıyaslama yok.")
+
+        # Test istemcisinin ``testserver`` adıyla istek atabilmesi için
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            try:
+                baglam = Baglam.hazirla(options["tohum"])
+            except ValueError as hata:
+                raise CommandError(f"{hata} Önce ornek_veri_uret çalıştırın.")
+
+            sonuclar = {}
+            for ad, fonksiyon in secilenler.items():
+                sonuclar[ad] = olc(
+                    fonksiyon, baglam, options["tekrar"], options["isinma"]
+                )
+                self.stdout.write(
+                    f"{ad:<36} p50={sonuclar[ad]['p50_ms']:8.2f} ms  "
+                    f"p95={sonuclar[ad]['p95_ms']:8.2f} ms  "
+                    f"sorgu={sonuclar[ad]['sorgu']}"
+                )
+
+        gecmis_yolu = Path(options["gecmis"])
+        gecmis = json.loads(gecmis_yolu.read_text()) if gecmis_yolu.exists() else []
+        olcek = veri_olcegi()
+        bulunan = gerilemeler(
+            referans_sonuclar(gecmis, connection.vendor, olcek),
+            sonuclar,
+            options["esik"],
+        )
+
+        # Gerileyen çalışma bir sonraki çalışmanın referansı olmasın
+        if not options["kaydetme"] and (not bulunan or options["gerilemeyi_kabul_et"]):
+            gecmis.append(
+                {
+                    "zaman": timezone.now().isoformat(),
+                    "surum": self._git_surumu(),
+                    "veritabani": connection.vendor,
+                    "olcek": olcek,
+                    "sonuclar": sonuclar,
+                }
+            )
+            gecmis_yolu.write_text(json.dumps(gecmis, indent=2, ensure_ascii=False))
+
+        if bulunan:
+            raise CommandError("Performans gerilemesi:\n  " + "\n  ".join(bulunan))
+        self.stdout.write(self.style.SUCCESS("Gerileme yok."))
+
+    def _git_surumu(self):
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=settings.BASE_DIR,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
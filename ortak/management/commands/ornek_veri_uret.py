@@ -0,0 +1,73 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from ortak.ornek_veri import Olcek, OrnekVeriUretici
+
+
+class Command(BaseCommand):
+    help = (
+        "Yük testleri için gerçekçi örnek veri üretir: 81 il ve ilçeleri, "
+        "firmalar, özgeçmiş ayrıntılarıyla vatandaşlar, anahtar kelime, dil ve "
+        "sorularıyla ilanlar, cevaplarıyla başvurular. Aynı tohum aynı veriyi "
+        "üretir. Veriler paralel partiler halinde PostgreSQL'de COPY ile "
+        "yazılır; model sinyalleri çalışmaz, özetler sonunda yeniden hesaplanır."
+    )
+
+    def add_arguments(self, parser):
+        varsayilan = Olcek()
+        parser.add_argument("--tohum", type=int, default=1)
+        parser.add_argument(
+            "--olcek",
+            type=float,
+            default=1.0,
+            help="Tüm varsayılan sayıları bu oranla çarp (ör. 0.01 hızlı deneme için)",
+        )
+        for ad, deger in vars(varsayilan).items():
+            parser.add_argument(
+                f"--{ad}",
+                type=int,
+                help=f"Üretilecek {ad} sayısı (varsayılan {deger} x ölçek)",
+            )
+        parser.add_argument("--parti", type=int, default=5000, help="Parti boyutu")
+        parser.add_argument(
+            "--is-parcacigi",
+            type=int,
+            default=4,
+            help="Paralel yazan iş parçacığı sayısı (SQLite'ta 1)",
+        )
+        parser.add_argument(
+            "--parola",
+            default="ornek-parola",
+            help="Örnek kullanıcıların parolası (yük testinde oturum açmak için)",
+        )
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, **options):
+        if options["database"] not in connections:
+            raise CommandError(f"Tanımsız veritabanı: {options['database']}")
+
+        olcek = Olcek().carp(options["olcek"])
+        for ad in vars(olcek):
+            if options[ad] is not None:
+                setattr(olcek, ad, options[ad])
+        if olcek.basvuru > olcek.ilan * olcek.vatandas:
+            raise CommandError("Başvuru sayısı ilan x vatandaş sayısını aşamaz.")
+
+        self.stdout.write(
+            "Üretiliyor: "
+            + ", ".join(f"{ad}={deger}" for ad, deger in vars(olcek).items())
+        )
+        OrnekVeriUretici(
+            olcek,
+            tohum=options["tohum"],
+            parti_boyutu=options["parti"],
+            is_parcacigi=options["is_parcacigi"],
+            parola=options["parola"],
+            using=options["database"],
+            raporla=self._raporla,
+        ).uret()
+        self.stdout.write(self.style.SUCCESS("Örnek veri üretildi."))
+
+    def _raporla(self, asama, sayi, sure):
+        hiz = f"  ({sayi / sure:,.0f} kayıt/sn)" if sayi and sure else ""
+        self.stdout.write(f"{asama:<10} {sayi:>10,} kayıt  {sure:7.1f} sn{hiz}")
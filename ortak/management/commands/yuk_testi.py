@@ -0,0 +1,166 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ortak.yuk_testi import (
+    SENARYOLAR,
+    AsgiIstemci,
+    HttpIstemci,
+    Ornekler,
+    WsgiIstemci,
+    calistir,
+    olay_dongusu_baslat,
+)
+
+MODLAR = ("wsgi", "asgi")
+
+
+def _karisim(deger):
+    karisim = {}
+    for parca in deger.split(","):
+        ad, _, agirlik = parca.partition("=")
+        if ad not in SENARYOLAR:
+            raise ValueError(ad)
+        karisim[ad] = float(agirlik or 1)
+    return karisim
+
+
+class Command(BaseCommand):
+    help = (
+        "Aday (ilan listesi → il filtresi → ilan → başvuru), işveren "
+        "(yönetim panelinde başvuru ayıklama) ve ziyaretçi (async ilan, "
+        "coğrafya ve istatistik uç noktaları) senaryolarını eşzamanlı sanal "
+        "kullanıcılarla oynatır; adım başına istek/sn, p50/p95/p99 gecikme ve "
+        "hata oranını raporlar. --adres verilmezse istekler süreç içinde "
+        "--mod ile seçilen WSGI veya ASGI uygulamasına iletilir; bu durumda "
+        "sonuç tek bir işçi sürecinin kapasitesidir. --mod tekrarlanırsa "
+        "modlar aynı senaryolarla sırayla ölçülüp karşılaştırılır. Aday "
+        "senaryosu hedef veritabanına gerçek başvuru yazdığından yalnızca "
+        "ornek_veri_uret verisiyle kullanılmalıdır; --salt-okunur ile başvuru "
+        "adımı atlanır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--adres",
+            help="Çalışan sunucunun taban adresi (ör. http://127.0.0.1:8000); "
+            "sunucu aynı veritabanını kullanmalıdır",
+        )
+        parser.add_argument(
+            "--mod",
+            action="append",
+            choices=MODLAR,
+            help="Süreç içi sunucu modu (varsayılan wsgi; tekrarlanabilir)",
+        )
+        parser.add_argument(
+            "--eszamanlilik", type=int, default=8, help="Sanal kullanıcı sayısı"
+        )
+        parser.add_argument("--sure", type=float, default=30, help="Ölçüm süresi (sn)")
+        parser.add_argument(
+            "--isinma",
+            type=float,
+            default=3,
+            help="Ölçüme dahil edilmeyen başlangıç süresi (sn)",
+        )
+        parser.add_argument(
+            "--karisim",
+            type=_karisim,
+            default={"aday": 4, "isveren": 1},
+            help="Senaryo ağırlıkları, ör. aday=4,isveren=1 veya ziyaretci",
+        )
+        parser.add_argument("--tohum", type=int, default=1)
+        parser.add_argument(
+            "--salt-okunur",
+            action="store_true",
+            help="Aday senaryosunda başvuru gönderme (veritabanına yazma)",
+        )
+        parser.add_argument("--json", help="Raporun yazılacağı JSON dosyası")
+
+    def handle(self, *args, **options):
+        try:
+            ornekler = Ornekler.topla()
+        except ValueError as hata:
+            raise CommandError(f"{hata} Önce ornek_veri_uret çalıştırın.")
+
+        if "aday" in options["karisim"] and not options["salt_okunur"]:
+            self.stdout.write(
+                self.style.WARNING(
+                    "Aday senaryosu hedef veritabanına gerçek başvurular yazar "
+                    "(--salt-okunur ile kapatılır)."
+                )
+            )
+
+        if options["adres"]:
+            if options["mod"]:
+                raise CommandError("--mod yalnızca süreç içi ölçümde kullanılır.")
+            adres = options["adres"]
+            raporlar = {adres: self._olc(lambda: HttpIstemci(adres), ornekler, options)}
+        else:
+            raporlar = {
+                mod: self._olc_surec_ici(mod, ornekler, options)
+                for mod in dict.fromkeys(options["mod"] or ["wsgi"])
+            }
+
+        for ad, rapor in raporlar.items():
+            if len(raporlar) > 1:
+                self.stdout.write(self.style.MIGRATE_HEADING(ad))
+            for adim, satir in sorted(rapor["adimlar"].items()):
+                self._yaz(adim, satir)
+            self._yaz("TOPLAM", rapor["toplam"])
+            for adim, satir in sorted(rapor["adimlar"].items()):
+                for hata, sayi in satir["hatalar"].items():
+                    self.stdout.write(self.style.WARNING(f"{adim}: {hata} x{sayi}"))
+
+        if len(raporlar) > 1:
+            self.stdout.write(self.style.MIGRATE_HEADING("Karşılaştırma"))
+            for ad, rapor in raporlar.items():
+                toplam, zirve = rapor["toplam"], rapor["zirve"]
+                self.stdout.write(
+                    f"{ad:<6} istek/sn={toplam['istek_sn']:8.1f}  "
+                    f"p95={toplam['p95_ms']:7.1f} ms  "
+                    f"hata={toplam['hata_orani']:.2%}  "
+                    f"bellek={zirve['bellek_mb']} MB  "
+                    f"is_parcacigi={zirve['is_parcacigi']}"
+                )
+
+        if options["json"]:
+            Path(options["json"]).write_text(
+                json.dumps(raporlar, indent=2, ensure_ascii=False)
+            )
+
+    def _olc_surec_ici(self, mod, ornekler, options):
+        if mod == "wsgi":
+            uygulama = WsgiIstemci().uygulama
+            return self._olc(lambda: WsgiIstemci(uygulama), ornekler, options)
+
+        # Tüm sanal kullanıcılar tek olay döngüsünü paylaşır (tek ASGI işçisi)
+        dongu = olay_dongusu_baslat()
+        try:
+            uygulama = AsgiIstemci(dongu).uygulama
+            return self._olc(lambda: AsgiIstemci(dongu, uygulama), ornekler, options)
+        finally:
+            dongu.call_soon_threadsafe(dongu.stop)
+
+    def _olc(self, istemci_uret, ornekler, options):
+        rapor = calistir(
+            istemci_uret,
+            ornekler,
+            eszamanlilik=options["eszamanlilik"],
+            sure=options["sure"],
+            isinma=options["isinma"],
+            karisim=options["karisim"],
+            tohum=options["tohum"],
+            salt_okunur=options["salt_okunur"],
+        )
+        if rapor["toplam"] is None:
+            raise CommandError("Ölçüm süresinde hiç istek tamamlanmadı.")
+        return rapor
+
+    def _yaz(self, ad, satir):
+        self.stdout.write(
+            f"{ad:<26} istek={satir['istek']:6d}  "
+            f"istek/sn={satir['istek_sn']:8.1f}  "
+            f"p50={satir['p50_ms']:7.1f} ms  p95={satir['p95_ms']:7.1f} ms  "
+            f"p99={satir['p99_ms']:7.1f} ms  hata={satir['hata_orani']:.2%}"
+        )
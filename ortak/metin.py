@@ -0,0 +1,19 @@
+"""Metin normalleştirme yardımcıları."""
+
+# Türkçede noktalı ve noktasız büyük I harflerinin küçük karşılıkları
+TURKCE_BUYUK_I = str.maketrans({"I": "ı", "İ": "i"})
+
+
+def normallestir(metin):
+    """Metni Türkçe kurallarıyla küçük harfe çevir, boşlukları sadeleştir."""
+    return " ".join(metin.translate(TURKCE_BUYUK_I).casefold().split())
+
+
+def arama_anahtari(metin):
+    """
+    Metnin eşleştirmede kullanılan, noktalı ve noktasız i ayrımı yapmayan biçimi.
+
+    Kullanıcılar "ISO" gibi kısaltmaları noktalı i ile de yazdığından
+    "ISO 9001", "İSO 9001" ve "iso 9001" aynı anahtara düşer.
+    """
+    return normallestir(metin).replace("ı", "i")
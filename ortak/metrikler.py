@@ -0,0 +1,208 @@
+import atexit
+import os
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Çok süreçli çalışmada (gunicorn vb.) PROMETHEUS_MULTIPROC_DIR ortam
+# değişkeni sunucu başlamadan tanımlanmalıdır; her süreç ölçümlerini bu
+# dizine yazar ve /metrics tüm süreçlerin toplamını döndürür.
+COK_SURECLI = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+SORGU_ISLEMLERI = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+
+# İstek süresince çalışan sorgu sayacı. Async görünümlerde sorgular başka bir
+# iş parçacığında çalışır; bağlam değişkeni oraya kopyalandığından sayaç
+# yine aynı isteğe yazılır.
+_istek_sayaci = ContextVar("istek_sayaci", default=None)
+
+ISTEK_SURESI = Histogram(
+    "istihdam_istek_suresi_saniye",
+    "Görünüme göre istek işleme süresi",
+    ["gorunum", "yontem", "durum"],
+)
+ISTEK_SORGU_SAYISI = Histogram(
+    "istihdam_istek_sorgu_sayisi",
+    "Görünüme göre istek başına SQL sorgusu sayısı",
+    ["gorunum"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, float("inf")),
+)
+SORGU_SURESI = Histogram(
+    "istihdam_sorgu_suresi_saniye",
+    "Veritabanı ve sorgu türüne göre SQL çalışma süresi",
+    ["veritabani", "islem"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1, 2.5),
+)
+ONBELLEK_ISTEKLERI = Counter(
+    "istihdam_onbellek_istekleri",
+    "Önbellek okumaları (isabet oranı: isabet / toplam)",
+    ["onbellek", "sonuc"],
+)
+YUKLEME_BOYUTU = Histogram(
+    "istihdam_yukleme_boyutu_bayt",
+    "Form alanına göre yüklenen dosya boyutu",
+    ["alan", "sonuc"],
+    buckets=tuple(kb * 1024 for kb in (16, 64, 256, 1024, 2048, 5120, 10240, 51200)),
+)
+KUYRUK_DERINLIGI = Gauge(
+    "istihdam_kuyruk_derinligi",
+    "Arka planda bekleyen iş sayısı",
+    ["kuyruk"],
+    multiprocess_mode="livesum",
+)
+HAVUZ_BAGLANTILARI = Gauge(
+    "istihdam_veritabani_havuzu",
+    "psycopg bağlantı havuzu durumu",
+    ["veritabani", "durum"],
+    multiprocess_mode="livesum",
+)
+
+
+def onbellek_okundu(onbellek, isabet):
+    """Önbellek okumasını isabet veya ıska olarak say."""
+    ONBELLEK_ISTEKLERI.labels(onbellek, "isabet" if isabet else "iska").inc()
+
+
+def yukleme_tamamlandi(alan_adi, boyut, kabul):
+    """Tamamlanan dosya yüklemesini boyutuyla kaydet."""
+    YUKLEME_BOYUTU.labels(
+        alan_adi.rsplit("-", 1)[-1], "kabul" if kabul else "red"
+    ).observe(boyut)
+
+
+def _sorgu_olc(execute, sql, params, many, context):
+    baslangic = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        islem = sql.lstrip()[:6].upper()
+        SORGU_SURESI.labels(
+            context["connection"].alias,
+            islem if islem in SORGU_ISLEMLERI else "DIGER",
+        ).observe(time.perf_counter() - baslangic)
+        sayac = _istek_sayaci.get()
+        if sayac is not None:
+            sayac["sorgu"] += 1
+
+
+def sorgu_olcumunu_bagla(sender, connection, **kwargs):
+    """``connection_created`` sinyaliyle her bağlantıya sorgu ölçümünü ekle."""
+    if _sorgu_olc not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_sorgu_olc)
+
+
+def _durum_olcerlerini_guncelle():
+    # Süreç yerel kuyruk ve havuz durumları; livesum ile süreçler toplanır
+    from dosyalar.gorseller import kuyruk_uzunlugu
+
+    KUYRUK_DERINLIGI.labels("gorsel_turevleri").set(kuyruk_uzunlugu())
+    for baglanti in connections.all(initialized_only=True):
+        havuz = getattr(baglanti, "pool", None)
+        if havuz is None:
+            continue
+        for durum, deger in havuz.get_stats().items():
+            if durum.startswith("pool_"):
+                HAVUZ_BAGLANTILARI.labels(baglanti.alias, durum).set(deger)
+
+
+class MetrikMiddleware:
+    """
+    İstek süresini, istek başına sorgu sayısını ve sorgu sürelerini ölçer.
+
+    Görünüm etiketi URL adıdır; eşleşmeyen istekler ``eslesmeyen`` olarak
+    toplanır, böylece etiket sayısı sınırlı kalır.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        sayac = {"sorgu": 0}
+        belirtec = _istek_sayaci.set(sayac)
+        baslangic = time.perf_counter()
+        try:
+            yanit = self.get_response(request)
+        finally:
+            _istek_sayaci.reset(belirtec)
+        self._kaydet(request, yanit, sayac, time.perf_counter() - baslangic)
+        return yanit
+
+    async def __acall__(self, request):
+        sayac = {"sorgu": 0}
+        belirtec = _istek_sayaci.set(sayac)
+        baslangic = time.perf_counter()
+        try:
+            yanit = await self.get_response(request)
+        finally:
+            _istek_sayaci.reset(belirtec)
+        self._kaydet(request, yanit, sayac, time.perf_counter() - baslangic)
+        return yanit
+
+    def _kaydet(self, request, yanit, sayac, sure):
+        eslesme = getattr(request, "resolver_match", None)
+        gorunum = (eslesme and eslesme.view_name) or "eslesmeyen"
+        ISTEK_SURESI.labels(gorunum, request.method, yanit.status_code).observe(sure)
+        ISTEK_SORGU_SAYISI.labels(gorunum).observe(sayac["sorgu"])
+        _durum_olcerlerini_guncelle()
+
+
+def _kayit_defteri():
+    if not COK_SURECLI:
+        return REGISTRY
+    kayit_defteri = CollectorRegistry()
+    multiprocess.MultiProcessCollector(kayit_defteri)
+    return kayit_defteri
+
+
+def metrikler(request):
+    """
+    Ölçümleri Prometheus metin biçiminde döndür.
+
+    ``METRIK_ANAHTARI`` tanımlıysa ``Authorization: Bearer <anahtar>``
+    başlığı gerekir.
+    """
+    anahtar = settings.METRIK_ANAHTARI
+    if anahtar and not constant_time_compare(
+        request.headers.get("Authorization", ""), f"Bearer {anahtar}"
+    ):
+        return HttpResponseForbidden()
+    _durum_olcerlerini_guncelle()
+    return HttpResponse(
+        generate_latest(_kayit_defteri()), content_type=CONTENT_TYPE_LATEST
+    )
+
+
+def metrikleri_baslat():
+    """
+    WSGI/ASGI giriş noktasında çağrılır.
+
+    Çok süreçli modda süreç kapanırken ``livesum`` ölçerlerindeki payı
+    silinir; aksi halde ölen süreçlerin kuyruk ve havuz değerleri toplamda
+    kalır.
+    """
+    if COK_SURECLI:
+        # Uygulama fork öncesi yüklenebileceği için pid kapanışta okunur
+        atexit.register(lambda: multiprocess.mark_process_dead(os.getpid()))
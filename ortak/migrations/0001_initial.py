@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="PlatformIstatistik",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "anahtar",
+                    models.CharField(
+                        choices=[
+                            ("aktif_ilan", "Aktif İlan"),
+                            ("firma", "Kayıtlı Firma"),
+                            ("usta", "Kayıtlı Usta"),
+                            ("is_arayan", "İş Arayan"),
+                            ("ise_alinan", "İstihdam Sayısı"),
+                        ],
+                        max_length=30,
+                        unique=True,
+                        verbose_name="İstatistik",
+                    ),
+                ),
+                ("deger", models.BigIntegerField(default=0, verbose_name="Değer")),
+                (
+                    "guncelleme_tarihi",
+                    models.DateTimeField(
+                        auto_now=True, verbose_name="Güncellenme Tarihi"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Platform İstatistiği",
+                "verbose_name_plural": "Platform İstatistikleri",
+                "ordering": ["anahtar"],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class IstatistikChoices(models.TextChoices):
+    """Platform özet istatistiklerinin anahtarları"""
+
+    AKTIF_ILAN = "aktif_ilan", _("Aktif İlan")
+    FIRMA = "firma", _("Kayıtlı Firma")
+    USTA = "usta", _("Kayıtlı Usta")
+    IS_ARAYAN = "is_arayan", _("İş Arayan")
+    ISE_ALINAN = "ise_alinan", _("İstihdam Sayısı")
+
+
+class PlatformIstatistik(models.Model):
+    """
+    Ana sayfada gösterilen platform toplamlarının özet tablosu.
+
+    Değerler kayıt işlemlerinde artımlı olarak güncellenir ve
+    ``istatistikleri_uzlastir`` komutuyla düzenli olarak gerçek sayımlarla
+    eşitlenir. Her istatistik ayrı bir satırda tutulduğu için farklı
+    sayaçları güncelleyen işlemler birbirini beklemez.
+    """
+
+    anahtar = models.CharField(
+        _("İstatistik"),
+        max_length=30,
+        unique=True,
+        choices=IstatistikChoices.choices,
+    )
+    deger = models.BigIntegerField(_("Değer"), default=0)
+    guncelleme_tarihi = models.DateTimeField(_("Güncellenme Tarihi"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("Platform İstatistiği")
+        verbose_name_plural = _("Platform İstatistikleri")
+        ordering = ["anahtar"]
+
+    def __str__(self):
+        return f"{self.get_anahtar_display()}: {self.deger}"
@@ -0,0 +1,271 @@
+import asyncio
+import hashlib
+import math
+import random
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.translation import get_language
+
+from .metrikler import onbellek_okundu
+
+SURUM_ONEKI = "surum"
+SAYFA_ONEKI = "sayfa"
+KILIT_ONEKI = "kilit"
+
+# Hesaplamayı başka bir süreç yaparken sonucun beklenmesi için yoklama aralığı
+BEKLEME_ARALIGI = 0.05
+
+# Kaydedildiğinde veya silindiğinde artırılacak sürümler (model etiketine göre).
+# İlan kartlarında firma adı ve logosu da gösterildiği için firma değişikliği
+# ilan sürümünü de artırır. İl ve ilçe adları ilan, firma ve usta
+# gösterimlerinde de yer alır. Platform istatistiklerini etkileyen modeller
+# istatistik sürümünü artırır. Usta adları kullanıcı kaydından gelir.
+SURUMLU_MODELLER = {
+    "ilanlar.IsBilgileri": ("ilan", "istatistik"),
+    "ilanlar.IlanAnahtar": ("ilan",),
+    "ilanlar.AnahtarKelime": ("anahtar",),
+    "ilanlar.IlanDil": ("ilan",),
+    "ilanlar.IlanSonuc": ("istatistik",),
+    "hesap.Firma": ("firma", "ilan", "istatistik"),
+    "hesap.Kullanici": ("usta",),
+    "hesap.Vatandas": ("usta", "istatistik"),
+    "hesap.UstalikAlani": ("usta",),
+    "ayarlar.Sektor": ("firma", "ilan"),
+    "ayarlar.Meslek": ("usta",),
+    "ayarlar.Il": ("cografya", "ilan", "firma", "usta"),
+    "ayarlar.Ilce": ("cografya", "ilan", "firma", "usta"),
+}
+
+# Yalnızca bu alanlar kaydedildiğinde sürüm artırılmaz (ör. her girişte
+# güncellenen son giriş tarihi)
+SURUM_DISI_ALANLAR = frozenset({"last_login"})
+
+
+def _surum_anahtari(ad):
+    return f"{SURUM_ONEKI}:{ad}"
+
+
+def _baslangic_surumu():
+    # Önbellek boşaltıldığında eski sürüm numaralarına geri dönülmemesi için
+    # sürümler zamandan başlatılır.
+    return time.time_ns() // 1000
+
+
+def surumler(*adlar):
+    """Verilen adların güncel sürümlerini sözlük olarak döndür."""
+    anahtarlar = {_surum_anahtari(ad): ad for ad in adlar}
+    mevcut = cache.get_many(anahtarlar)
+    sonuc = {}
+    for anahtar, ad in anahtarlar.items():
+        if anahtar not in mevcut:
+            cache.add(anahtar, _baslangic_surumu(), timeout=None)
+            mevcut[anahtar] = cache.get(anahtar)
+        sonuc[ad] = mevcut[anahtar]
+    return sonuc
+
+
+async def asurumler(*adlar):
+    """``surumler`` fonksiyonunun async görünümler için karşılığı."""
+    anahtarlar = {_surum_anahtari(ad): ad for ad in adlar}
+    mevcut = await cache.aget_many(anahtarlar)
+    sonuc = {}
+    for anahtar, ad in anahtarlar.items():
+        if anahtar not in mevcut:
+            await cache.aadd(anahtar, _baslangic_surumu(), timeout=None)
+            mevcut[anahtar] = await cache.aget(anahtar)
+        sonuc[ad] = mevcut[anahtar]
+    return sonuc
+
+
+def surum_artir(ad):
+    """Sürümü artırarak bu sürüme bağlı sayfa ve parçaları geçersiz kıl."""
+    try:
+        cache.incr(_surum_anahtari(ad))
+    except ValueError:
+        cache.add(_surum_anahtari(ad), _baslangic_surumu(), timeout=None)
+
+
+class SurumSozlugu:
+    """Şablonlarda ``surumler.ilan`` biçiminde okunan tembel sürüm sözlüğü."""
+
+    def __init__(self):
+        self._degerler = {}
+
+    def __getitem__(self, ad):
+        if ad not in self._degerler:
+            self._degerler.update(surumler(ad))
+        return self._degerler[ad]
+
+
+def _erken_yenilenmeli(kayit, beta):
+    """
+    Olasılıksal erken yenileme (XFetch).
+
+    Kaydın süresi dolmaya yaklaştıkça, hesaplama süresiyle orantılı olarak
+    artan bir olasılıkla True döner. Böylece kayıt tüm süreçler için aynı
+    anda dolmaz; genellikle tek bir istek süre dolmadan yeniler.
+    """
+    _, hesaplama_suresi, son_gecerlilik = kayit
+    return (
+        time.time() - hesaplama_suresi * beta * math.log(1.0 - random.random())
+        >= son_gecerlilik
+    )
+
+
+def hesapla_veya_getir(anahtar, hesapla, timeout, beta=1.0, kilit_suresi=10):
+    """
+    Önbellekteki değeri döndür; yoksa ``hesapla()`` ile üret ve sakla.
+
+    Aynı anahtar için eşzamanlı hesaplamalar tek seferde birleştirilir:
+    hesaplamayı ``cache.add`` ile kilidi alan istek yapar. Eski değer
+    varken diğer istekler onu döndürür, hiç değer yoksa kilit bırakılana
+    kadar (en fazla ``kilit_suresi`` saniye) sonucu bekler. Süre dolmadan
+    önce olasılıksal erken yenileme yapılır. ``hesapla()`` None döndürürse
+    veya hata fırlatırsa sonuç saklanmaz; bekleyen istekler kilit
+    bırakılınca kendileri hesaplar. Saklanması istenen olumsuz sonuçlar
+    (ör. bulunamadı) None dışında bir değerle temsil edilmelidir.
+    """
+    kayit = cache.get(anahtar)
+    onbellek_okundu(anahtar.split(":", 1)[0], kayit is not None)
+    if kayit is not None and not _erken_yenilenmeli(kayit, beta):
+        return kayit[0]
+
+    kilit = f"{KILIT_ONEKI}:{anahtar}"
+    if not cache.add(kilit, 1, kilit_suresi):
+        if kayit is not None:
+            return kayit[0]
+        bitis = time.monotonic() + kilit_suresi
+        while time.monotonic() < bitis:
+            time.sleep(BEKLEME_ARALIGI)
+            kayitlar = cache.get_many([anahtar, kilit])
+            if anahtar in kayitlar:
+                return kayitlar[anahtar][0]
+            if kilit not in kayitlar:
+                break
+        # Kilit sahibi sonuç saklamadan bitirdi; bu istek kendisi hesaplar
+
+    try:
+        baslangic = time.time()
+        deger = hesapla()
+        if deger is not None:
+            bitis = time.time()
+            # Kayıt süreden biraz uzun saklanır; erken yenileme yapılırken ve
+            # kilit tutulurken diğer istekler eski değeri kullanabilir.
+            cache.set(
+                anahtar,
+                (deger, bitis - baslangic, bitis + timeout),
+                timeout + kilit_suresi,
+            )
+        return deger
+    finally:
+        cache.delete(kilit)
+
+
+async def ahesapla_veya_getir(anahtar, hesapla, timeout, beta=1.0, kilit_suresi=10):
+    """
+    ``hesapla_veya_getir`` fonksiyonunun async karşılığı; ``hesapla`` bir
+    coroutine fonksiyonudur. Sonuç beklenirken olay döngüsü bloklanmaz.
+    """
+    kayit = await cache.aget(anahtar)
+    onbellek_okundu(anahtar.split(":", 1)[0], kayit is not None)
+    if kayit is not None and not _erken_yenilenmeli(kayit, beta):
+        return kayit[0]
+
+    kilit = f"{KILIT_ONEKI}:{anahtar}"
+    if not await cache.aadd(kilit, 1, kilit_suresi):
+        if kayit is not None:
+            return kayit[0]
+        bitis = time.monotonic() + kilit_suresi
+        while time.monotonic() < bitis:
+            await asyncio.sleep(BEKLEME_ARALIGI)
+            kayitlar = await cache.aget_many([anahtar, kilit])
+            if anahtar in kayitlar:
+                return kayitlar[anahtar][0]
+            if kilit not in kayitlar:
+                break
+
+    try:
+        baslangic = time.time()
+        deger = await hesapla()
+        if deger is not None:
+            bitis = time.time()
+            await cache.aset(
+                anahtar,
+                (deger, bitis - baslangic, bitis + timeout),
+                timeout + kilit_suresi,
+            )
+        return deger
+    finally:
+        await cache.adelete(kilit)
+
+
+def _onbelleklenebilir_istek(request):
+    return request.method in ("GET", "HEAD") and not request.user.is_authenticated
+
+
+def _onbelleklenebilir_yanit(request, yanit):
+    # CSRF belirteci kullanan sayfalar ziyaretçiye özeldir
+    return (
+        yanit.status_code == 200
+        and not yanit.streaming
+        and not yanit.cookies
+        and not request.META.get("CSRF_COOKIE_NEEDS_UPDATE")
+    )
+
+
+def _sayfa_anahtari(request, surum_adlari):
+    yol = hashlib.md5(
+        request.get_full_path().encode(), usedforsecurity=False
+    ).hexdigest()
+    surum = ".".join(str(deger) for deger in surumler(*surum_adlari).values())
+    return f"{SAYFA_ONEKI}:{get_language()}:{yol}:{surum}"
+
+
+def surumlu_sayfa_onbellegi(*surum_adlari, timeout=None):
+    """
+    Anonim GET isteklerinin yanıtını verilen model sürümlerine bağlı önbelleğe al.
+
+    Sürümlerden biri artırıldığında anahtar değiştiği için sayfa bir sonraki
+    istekte yeniden oluşturulur. Oturum açmış kullanıcılar, başarısız yanıtlar
+    ve CSRF belirteci içeren sayfalar önbelleğe alınmaz. Eşzamanlı isteklerde
+    sayfa ``hesapla_veya_getir`` ile yalnızca bir kez oluşturulur.
+
+    Kullanım::
+
+        surumlu_sayfa_onbellegi("ilan", "firma")(TemplateView.as_view(...))
+    """
+
+    def dekorator(view):
+        @wraps(view)
+        def sarmalayici(request, *args, **kwargs):
+            if not _onbelleklenebilir_istek(request):
+                return view(request, *args, **kwargs)
+
+            olusturulan = {}
+
+            def olustur():
+                yanit = view(request, *args, **kwargs)
+                if hasattr(yanit, "render") and callable(yanit.render):
+                    yanit = yanit.render()
+                olusturulan["yanit"] = yanit
+                if _onbelleklenebilir_yanit(request, yanit):
+                    return (yanit.content, yanit["Content-Type"])
+                return None
+
+            kayit = hesapla_veya_getir(
+                _sayfa_anahtari(request, surum_adlari),
+                olustur,
+                timeout if timeout is not None else settings.SAYFA_ONBELLEK_SURESI,
+            )
+            if "yanit" in olusturulan:
+                return olusturulan["yanit"]
+            icerik, content_type = kayit
+            return HttpResponse(icerik, content_type=content_type)
+
+        return sarmalayici
+
+    return dekorator
@@ -0,0 +1,934 @@
+"""
+Yük testleri için gerçekçi, tohuma göre belirlenimci örnek veri üretimi.
+
+Her parti kendi tohumundan (``<tohum>:<tablo>:<parti>``) türetilen rastgele
+sayı üreteciyle oluşturulur; kimlikler ve başvuru dağılımı ana iş
+parçacığında planlandığı için partiler hangi sırayla ve kaç iş parçacığında
+çalışırsa çalışsın aynı tohum aynı veriyi üretir. Yazma PostgreSQL'de
+``COPY``, diğer veritabanlarında çok satırlı ``INSERT`` ile yapılır; model
+sinyalleri gönderilmez, türetilmiş özetler üretim sonunda yeniden hesaplanır.
+"""
+
+import datetime
+import random
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import accumulate
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.text import slugify
+
+from ayarlar.models import Beceri, BeceriAdi, Il, Ilce, Meslek, Sektor
+from hesap.choices import (
+    CalismaGunleriChoices,
+    CinsiyetChoices,
+    EgitimDereceChoices,
+    KullaniciTipChoices,
+    YetenekSeviyeChoices,
+)
+from hesap.models import (
+    CalismaSaatleri,
+    EgitimDurumu,
+    Firma,
+    IsTecrubesi,
+    Kullanici,
+    Sertifika,
+    UstalikAlani,
+    Vatandas,
+    Yetenek,
+)
+from ilanlar.models import (
+    AnahtarKelime,
+    BasvuruCevap,
+    BasvuruDurumChoices,
+    CalismaModeliChoices,
+    CalismaYeriChoices,
+    DeneyimDuzeyiChoices,
+    EgitimDuzeyiChoices,
+    IlanAnahtar,
+    IlanBasvuru,
+    IlanDil,
+    IlanDurumChoices,
+    IlanSonuc,
+    IlanSoru,
+    IsBilgileri,
+)
+
+from .metin import arama_anahtari
+
+KULLANICI_ONEKI = "ornek_"
+
+ILLER = (
+    "Adana", "Adıyaman", "Afyonkarahisar", "Ağrı", "Amasya", "Ankara", "Antalya",
+    "Artvin", "Aydın", "Balıkesir", "Bilecik", "Bingöl", "Bitlis", "Bolu",
+    "Burdur", "Bursa", "Çanakkale", "Çankırı", "Çorum", "Denizli", "Diyarbakır",
+    "Edirne", "Elazığ", "Erzincan", "Erzurum", "Eskişehir", "Gaziantep",
+    "Giresun", "Gümüşhane", "Hakkari", "Hatay", "Isparta", "Mersin", "İstanbul",
+    "İzmir", "Kars", "Kastamonu", "Kayseri", "Kırklareli", "Kırşehir", "Kocaeli",
+    "Konya", "Kütahya", "Malatya", "Manisa", "Kahramanmaraş", "Mardin", "Muğla",
+    "Muş", "Nevşehir", "Niğde", "Ordu", "Rize", "Sakarya", "Samsun", "Siirt",
+    "Sinop", "Sivas", "Tekirdağ", "Tokat", "Trabzon", "Tunceli", "Şanlıurfa",
+    "Uşak", "Van", "Yozgat", "Zonguldak", "Aksaray", "Bayburt", "Karaman",
+    "Kırıkkale", "Batman", "Şırnak", "Bartın", "Ardahan", "Iğdır", "Yalova",
+    "Karabük", "Kilis", "Osmaniye", "Düzce",
+)  # fmt: skip
+
+# Nüfusu yüksek iller ilan ve vatandaş dağılımında daha ağır basar
+IL_AGIRLIKLARI = {
+    "İstanbul": 20,
+    "Ankara": 8,
+    "İzmir": 6,
+    "Bursa": 4,
+    "Antalya": 3,
+    "Kocaeli": 3,
+    "Konya": 3,
+    "Adana": 3,
+    "Gaziantep": 2,
+    "Kayseri": 2,
+}
+
+ILCE_ADLARI = (
+    "Merkez", "Yenimahalle", "Yenice", "Kale", "Çamlıbel", "Karşıyaka",
+    "Bahçelievler", "Esentepe", "Gölbaşı", "Akçay", "Sarıyer", "Kocasinan",
+    "Yeşilyurt", "Bozkır", "Çayırova", "Saray", "Pınarbaşı", "Ortaköy",
+    "Hasanbeyli", "Kemalpaşa", "Altınova", "Demirci", "Köprübaşı", "Sultanhanı",
+)  # fmt: skip
+
+SEKTORLER = (
+    "Bilişim", "İnşaat", "Tekstil", "Gıda", "Otomotiv", "Lojistik", "Sağlık",
+    "Eğitim", "Turizm", "Perakende", "Enerji", "Finans", "Tarım", "Metal",
+    "Kimya", "Mobilya", "Medya", "Danışmanlık", "Güvenlik", "Temizlik",
+)  # fmt: skip
+
+MESLEKLER = (
+    "Elektrikçi", "Tesisatçı", "Boyacı", "Marangoz", "Kaynakçı", "Tornacı",
+    "Oto Tamircisi", "Kombi Servisi", "Klima Teknisyeni", "Fayansçı", "Sıvacı",
+    "Çatı Ustası", "Camcı", "Çilingir", "Bahçıvan", "Terzi", "Aşçı", "Berber",
+    "Kuaför", "Beyaz Eşya Servisi", "Mobilya Montajcısı", "Parke Ustası",
+    "Alçıpan Ustası", "Demirci", "Asansör Teknisyeni",
+)  # fmt: skip
+
+ERKEK_ADLARI = (
+    "Ahmet", "Mehmet", "Mustafa", "Ali", "Hüseyin", "Hasan", "İbrahim", "Murat",
+    "Emre", "Burak", "Yusuf", "Ömer", "Kemal", "Serkan", "Can", "Eren", "Oğuz",
+    "Cem", "Onur", "Volkan", "Tolga", "Barış", "Kaan", "Umut", "Furkan",
+)  # fmt: skip
+KADIN_ADLARI = (
+    "Ayşe", "Fatma", "Emine", "Hatice", "Zeynep", "Elif", "Meryem", "Şerife",
+    "Zehra", "Büşra", "Esra", "Merve", "Özlem", "Derya", "Selin", "Ebru",
+    "Gamze", "Deniz", "Seda", "Tuğba", "Buse", "Ece", "İrem", "Aslı", "Nur",
+)  # fmt: skip
+SOYADLARI = (
+    "Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Yıldırım", "Öztürk",
+    "Aydın", "Özdemir", "Arslan", "Doğan", "Kılıç", "Aslan", "Çetin", "Kara",
+    "Koç", "Kurt", "Özkan", "Şimşek", "Polat", "Korkmaz", "Erdoğan", "Aktaş",
+    "Güneş", "Bulut", "Turan", "Tekin", "Acar", "Uçar",
+)  # fmt: skip
+
+FIRMA_EKLERI = ("A.Ş.", "Ltd. Şti.", "San. ve Tic. A.Ş.", "Grup", "Holding")
+POZISYONLAR = (
+    "Yazılım Geliştirici", "Muhasebe Uzmanı", "Satış Temsilcisi", "Depo Sorumlusu",
+    "Forklift Operatörü", "Üretim Personeli", "Kalite Kontrol Uzmanı", "Şoför",
+    "Garson", "Aşçı Yardımcısı", "Resepsiyonist", "İnsan Kaynakları Uzmanı",
+    "Elektrik Teknisyeni", "CNC Operatörü", "Kaynak Ustası", "Hemşire",
+    "Öğretmen", "Güvenlik Görevlisi", "Temizlik Personeli", "Kasiyer",
+    "Proje Yöneticisi", "Mimar", "İnşaat Mühendisi", "Çağrı Merkezi Temsilcisi",
+)  # fmt: skip
+DEPARTMANLAR = (
+    "Üretim",
+    "Satış",
+    "Muhasebe",
+    "Bilgi İşlem",
+    "Lojistik",
+    "İnsan Kaynakları",
+)
+ANAHTAR_KELIMELER = (
+    "Python", "Django", "Excel", "SAP", "Muhasebe", "Forklift", "Ehliyet B",
+    "Ehliyet C", "SRC", "Vardiya", "İngilizce", "Satış", "Müşteri İlişkileri",
+    "AutoCAD", "CNC", "Kaynak", "Elektrik", "PLC", "Hijyen", "Kasa", "Depo",
+    "Lojistik", "İSG", "Kalite", "ISO 9001", "Photoshop", "SQL", "Java",
+    "Sunum", "Takım Çalışması", "Esnek Çalışma", "Yemek", "Servis",
+)  # fmt: skip
+DILLER = ("İngilizce", "Almanca", "Arapça", "Rusça", "Fransızca", "İspanyolca")
+OKULLAR = (
+    "Atatürk Üniversitesi", "Ege Üniversitesi", "Hacettepe Üniversitesi",
+    "İstanbul Üniversitesi", "Anadolu Üniversitesi", "Gazi Üniversitesi",
+    "Mesleki ve Teknik Anadolu Lisesi", "Anadolu Lisesi", "Ticaret Meslek Lisesi",
+)  # fmt: skip
+BOLUMLER = (
+    "Bilgisayar Mühendisliği", "İşletme", "Makine", "Elektrik-Elektronik",
+    "Muhasebe ve Vergi", "Aşçılık", "İnşaat", "Hemşirelik", "Lojistik",
+)  # fmt: skip
+SERTIFIKALAR = (
+    ("İş Güvenliği Eğitimi", "Çalışma ve Sosyal Güvenlik Bakanlığı"),
+    ("Forklift Operatörlüğü", "Halk Eğitim Merkezi"),
+    ("Hijyen Belgesi", "İl Sağlık Müdürlüğü"),
+    ("SRC Belgesi", "Ulaştırma Bakanlığı"),
+    ("Mesleki Yeterlilik Belgesi", "Mesleki Yeterlilik Kurumu"),
+    ("İlk Yardım Sertifikası", "Kızılay"),
+)
+SORULAR = (
+    ("Vardiyalı çalışmaya uygun musunuz?", IlanSoru.SoruTipiChoices.EVET_HAYIR, ""),
+    ("Askerlik durumunuz nedir?", IlanSoru.SoruTipiChoices.COKTAN_SECMELI,
+     "Yapıldı\nMuaf\nTecilli"),
+    ("Ne zaman işe başlayabilirsiniz?", IlanSoru.SoruTipiChoices.COKTAN_SECMELI,
+     "Hemen\n2 hafta içinde\n1 ay içinde"),
+    ("Ehliyetiniz var mı?", IlanSoru.SoruTipiChoices.EVET_HAYIR, ""),
+    ("Kendinizi kısaca tanıtır mısınız?", IlanSoru.SoruTipiChoices.METIN, ""),
+    ("Maaş beklentiniz nedir?", IlanSoru.SoruTipiChoices.METIN, ""),
+)  # fmt: skip
+
+ILAN_DURUMLARI = {
+    IlanDurumChoices.YAYINDA: 70,
+    IlanDurumChoices.SONLANDI: 15,
+    IlanDurumChoices.TASLAK: 5,
+    IlanDurumChoices.DURDURULDU: 5,
+    IlanDurumChoices.IPTAL: 5,
+}
+
+
+@dataclass
+class Olcek:
+    """Üretilecek kayıt sayıları."""
+
+    firma: int = 2000
+    vatandas: int = 100_000
+    ilan: int = 20_000
+    basvuru: int = 1_000_000
+
+    def carp(self, oran):
+        return Olcek(
+            **{ad: max(1, int(deger * oran)) for ad, deger in vars(self).items()}
+        )
+
+
+@dataclass
+class IlanPlani:
+    kimlik: int
+    firma: int
+    durum: str
+    baslangic: datetime.date
+    basvuru: int
+    basvuru_kimligi: int
+    sorular: list = field(default_factory=list)
+
+
+def toplu_yaz(model, nesneler, using=DEFAULT_DB_ALIAS):
+    """
+    Nesneleri model sinyalleri ve ``save()`` çalıştırılmadan toplu yaz.
+
+    Birincil anahtarı atanmış nesneler kimlikleriyle yazılır. Değeri boş
+    ``auto_now``/``auto_now_add`` alanları şimdiki zamanla doldurulur; dolu
+    olanlar olduğu gibi saklanır.
+    """
+    if not nesneler:
+        return
+    baglanti = connections[using]
+    alanlar = [
+        alan
+        for alan in model._meta.concrete_fields
+        if not (alan.primary_key and getattr(nesneler[0], alan.attname) is None)
+    ]
+    simdi = timezone.now()
+    for alan in alanlar:
+        if getattr(alan, "auto_now", False) or getattr(alan, "auto_now_add", False):
+            for nesne in nesneler:
+                if getattr(nesne, alan.attname) is None:
+                    setattr(nesne, alan.attname, simdi)
+
+    if baglanti.vendor == "postgresql":
+        qn = baglanti.ops.quote_name
+        sutunlar = ", ".join(qn(alan.column) for alan in alanlar)
+        with baglanti.cursor() as cursor:
+            with cursor.cursor.copy(
+                f"COPY {qn(model._meta.db_table)} ({sutunlar}) FROM STDIN"
+            ) as kopya:
+                for nesne in nesneler:
+                    kopya.write_row(
+                        [
+                            alan.get_db_prep_save(
+                                getattr(nesne, alan.attname), baglanti
+                            )
+                            for alan in alanlar
+                        ]
+                    )
+        return
+
+    parti = baglanti.ops.bulk_batch_size(alanlar, nesneler)
+    for baslangic in range(0, len(nesneler), parti):
+        model._base_manager.using(using)._insert(
+            nesneler[baslangic : baslangic + parti],
+            fields=alanlar,
+            raw=True,
+            using=using,
+        )
+
+
+def _ilk_kimlik(model, using):
+    return (model._base_manager.using(using).aggregate(m=Max("pk"))["m"] or 0) + 1
+
+
+def _uuid(rng):
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _tarih(rng, bugun, en_az_gun, en_cok_gun):
+    return bugun - datetime.timedelta(days=rng.randint(en_az_gun, en_cok_gun))
+
+
+def _zaman(rng, gun):
+    return timezone.make_aware(
+        datetime.datetime.combine(
+            gun, datetime.time(rng.randint(8, 22), rng.randint(0, 59))
+        )
+    )
+
+
+def _telefon(rng):
+    return f"05{rng.randint(30, 59)}{rng.randint(1_000_000, 9_999_999)}"
+
+
+def _paylastir(toplam, agirliklar, sinir):
+    """
+    ``toplam`` adedi ağırlıklarla orantılı tam sayılara böl.
+
+    Her pay ``sinir`` ile sınırlanır, sıfır ağırlıklılara pay verilmez.
+    Yuvarlamadan ve sınırdan kalan adetler en büyük ağırlıklılardan
+    başlanarak dağıtılır; böylece sınırlar izin verdiği sürece payların
+    toplamı tam olarak ``toplam`` olur.
+    """
+    toplam_agirlik = sum(agirliklar)
+    if not toplam_agirlik:
+        return [0] * len(agirliklar)
+    paylar = [
+        min(sinir, int(toplam * agirlik / toplam_agirlik)) for agirlik in agirliklar
+    ]
+    sira = sorted(
+        (i for i, agirlik in enumerate(agirliklar) if agirlik > 0),
+        key=lambda i: agirliklar[i],
+        reverse=True,
+    )
+    kalan = min(toplam, sinir * len(sira)) - sum(paylar)
+    while kalan > 0:
+        for i in sira:
+            if kalan == 0:
+                break
+            if paylar[i] < sinir:
+                paylar[i] += 1
+                kalan -= 1
+    return paylar
+
+
+class OrnekVeriUretici:
+    """
+    Ölçeğe göre referans verisi, firma, vatandaş, ilan ve başvuru üretir.
+
+    ``raporla`` her aşamanın sonunda ``(asama, kayit_sayisi, sure)`` ile
+    çağrılır.
+    """
+
+    def __init__(
+        self,
+        olcek,
+        tohum=1,
+        parti_boyutu=5000,
+        is_parcacigi=4,
+        parola="ornek-parola",
+        using=DEFAULT_DB_ALIAS,
+        bugun=None,
+        raporla=None,
+    ):
+        self.olcek = olcek
+        self.tohum = tohum
+        self.parti_boyutu = parti_boyutu
+        self.using = using
+        # SQLite aynı anda tek yazıcıya izin verir
+        self.is_parcacigi = (
+            is_parcacigi if connections[using].vendor == "postgresql" else 1
+        )
+        self.bugun = bugun or timezone.localdate()
+        # Parola özeti bir kez hesaplanır; tüm örnek kullanıcılar aynı parolayı kullanır
+        self.parola_ozeti = make_password(parola)
+        self.raporla = raporla or (lambda *args: None)
+
+    def rng(self, *etiket):
+        return random.Random(":".join(str(parca) for parca in (self.tohum, *etiket)))
+
+    def uret(self):
+        self._referanslari_hazirla()
+        self._kimlikleri_ayir()
+        self._partiler("firma", self.olcek.firma, self._firma_partisi)
+        self._partiler("vatandas", self.olcek.vatandas, self._vatandas_partisi)
+        self._ilanlari_planla()
+        self._partiler("ilan", self.olcek.ilan, self._ilan_partisi)
+        self._basvuru_partileri()
+        self._tamamla()
+
+    # Hazırlık
+
+    def _referanslari_hazirla(self):
+        for ad in ILLER:
+            il = Il.objects.using(self.using).filter(ad=ad).first()
+            if il is None:
+                il = Il(ad=ad)
+                il.save(using=self.using)
+            if not il.ilceler.exists():
+                sayi = 3 + IL_AGIRLIKLARI.get(ad, 1) * 2
+                for ilce_adi in ILCE_ADLARI[:sayi]:
+                    Ilce(il=il, ad=ilce_adi).save(using=self.using)
+        for model, adlar in ((Sektor, SEKTORLER), (Meslek, MESLEKLER)):
+            for ad in adlar:
+                if not model.objects.using(self.using).filter(ad=ad).exists():
+                    model(ad=ad).save(using=self.using)
+
+        self.iller = list(
+            Il.objects.using(self.using).order_by("pk").values_list("pk", "ad")
+        )
+        self.il_agirliklari = list(
+            accumulate(IL_AGIRLIKLARI.get(ad, 1) for _, ad in self.iller)
+        )
+        self.ilceler = {}
+        for ilce_id, il_id in (
+            Ilce.objects.using(self.using).order_by("pk").values_list("pk", "il_id")
+        ):
+            self.ilceler.setdefault(il_id, []).append(ilce_id)
+        self.sektorler = list(
+            Sektor.objects.using(self.using).order_by("pk").values_list("pk", flat=True)
+        )
+        self.meslekler = list(
+            Meslek.objects.using(self.using).order_by("pk").values_list("pk", "ad")
+        )
+        self.anahtar_kelimeler = {}
+        kelimeler = AnahtarKelime.objects.using(self.using)
+        for ad in ANAHTAR_KELIMELER:
+            kelime, _olusturuldu = kelimeler.get_or_create(
+                normal=AnahtarKelime.normallestir(ad), defaults={"ad": ad}
+            )
+            self.anahtar_kelimeler[ad] = kelime.pk
+        # Örnek yetenekler de aynı kelimelerden seçilir
+        self.beceriler = {}
+        for ad in ANAHTAR_KELIMELER:
+            beceri_adi = (
+                BeceriAdi.objects.using(self.using)
+                .filter(normal=arama_anahtari(ad))
+                .first()
+            )
+            if beceri_adi is None:
+                beceri = Beceri(ad=ad)
+                beceri.save(using=self.using)
+                self.beceriler[ad] = beceri.pk
+            else:
+                self.beceriler[ad] = beceri_adi.beceri_id
+
+    def _kimlikleri_ayir(self):
+        self.kullanici_ilk = _ilk_kimlik(Kullanici, self.using)
+        self.firma_ilk = _ilk_kimlik(Firma, self.using)
+        self.vatandas_ilk = _ilk_kimlik(Vatandas, self.using)
+        self.ilan_ilk = _ilk_kimlik(IsBilgileri, self.using)
+        self.soru_ilk = _ilk_kimlik(IlanSoru, self.using)
+        self.basvuru_ilk = _ilk_kimlik(IlanBasvuru, self.using)
+        # Firma kullanıcıları önce, vatandaş kullanıcıları sonra gelir
+        self.vatandas_kullanici_ilk = self.kullanici_ilk + self.olcek.firma
+        # Kullanıcı adları kimliğe göre verildiği için tekrar çalıştırmada çakışmaz
+        self.onek = f"{KULLANICI_ONEKI}{self.kullanici_ilk}_"
+
+    def _konum(self, rng):
+        il_id = rng.choices(self.iller, cum_weights=self.il_agirliklari)[0][0]
+        return il_id, rng.choice(self.ilceler[il_id])
+
+    # Partiler
+
+    def _partiler(self, asama, toplam, uret, araliklar=None):
+        baslangic = timezone.now()
+        if araliklar is None:
+            araliklar = [
+                (sira, bas, min(bas + self.parti_boyutu, toplam))
+                for sira, bas in enumerate(range(0, toplam, self.parti_boyutu))
+            ]
+
+        def calistir(aralik):
+            try:
+                with transaction.atomic(using=self.using):
+                    return uret(*aralik)
+            finally:
+                # Havuzdaki iş parçacığının bağlantısını bırak
+                if self.is_parcacigi > 1:
+                    connections[self.using].close()
+
+        if self.is_parcacigi > 1:
+            with ThreadPoolExecutor(self.is_parcacigi) as havuz:
+                yazilan = sum(havuz.map(calistir, araliklar))
+        else:
+            yazilan = sum(map(calistir, araliklar))
+        self.raporla(asama, yazilan, (timezone.now() - baslangic).total_seconds())
+
+    def _kullanici(self, kimlik, tip, ad, soyad, katilma):
+        return Kullanici(
+            pk=kimlik,
+            username=f"{self.onek}{kimlik}",
+            password=self.parola_ozeti,
+            first_name=ad,
+            last_name=soyad,
+            email=f"{self.onek}{kimlik}@ornek.test",
+            kullanici_tipi=tip,
+            date_joined=katilma,
+            created_at=katilma,
+            updated_at=katilma,
+        )
+
+    def _firma_partisi(self, sira, bas, son):
+        rng = self.rng("firma", sira)
+        kullanicilar, firmalar, sektorler = [], [], []
+        for sira_no in range(bas, son):
+            kimlik = self.firma_ilk + sira_no
+            ad = (
+                f"{rng.choice(SOYADLARI)} {rng.choice(SEKTORLER)} "
+                f"{rng.choice(FIRMA_EKLERI)}"
+            )
+            il_id, ilce_id = self._konum(rng)
+            katilma = _zaman(rng, _tarih(rng, self.bugun, 30, 5 * 365))
+            kullanici = self._kullanici(
+                self.kullanici_ilk + sira_no,
+                KullaniciTipChoices.firma,
+                rng.choice(ERKEK_ADLARI + KADIN_ADLARI),
+                rng.choice(SOYADLARI),
+                katilma,
+            )
+            kullanicilar.append(kullanici)
+            firmalar.append(
+                Firma(
+                    pk=kimlik,
+                    kullanici_id=kullanici.pk,
+                    ad=ad,
+                    slug=f"{slugify(ad)}-{kimlik}",
+                    aciklama=f"{ad}, {rng.randint(1970, 2022)} yılından beri hizmet veriyor.",
+                    email=f"info{kimlik}@ornek.test",
+                    telefon=_telefon(rng),
+                    il_id=il_id,
+                    ilce_id=ilce_id,
+                    kurulus_yili=rng.randint(1970, 2022),
+                    calisan_sayisi=int(rng.paretovariate(1.2) * 5),
+                    aktif=rng.random() < 0.95,
+                    olusturma_tarihi=katilma,
+                    guncelleme_tarihi=katilma,
+                )
+            )
+            for sektor_id in rng.sample(self.sektorler, rng.randint(1, 3)):
+                sektorler.append(
+                    Firma.sektorler.through(firma_id=kimlik, sektor_id=sektor_id)
+                )
+        toplu_yaz(Kullanici, kullanicilar, self.using)
+        toplu_yaz(Firma, firmalar, self.using)
+        toplu_yaz(Firma.sektorler.through, sektorler, self.using)
+        return len(firmalar)
+
+    def _vatandas_partisi(self, sira, bas, son):
+        rng = self.rng("vatandas", sira)
+        kayitlar = {
+            model: []
+            for model in (
+                Kullanici,
+                Vatandas,
+                EgitimDurumu,
+                IsTecrubesi,
+                Yetenek,
+                Sertifika,
+                UstalikAlani,
+                CalismaSaatleri,
+            )
+        }
+        for sira_no in range(bas, son):
+            kimlik = self.vatandas_ilk + sira_no
+            cinsiyet = rng.choice(CinsiyetChoices.values)
+            ad = rng.choice(ERKEK_ADLARI if cinsiyet == "E" else KADIN_ADLARI)
+            soyad = rng.choice(SOYADLARI)
+            katilma = _zaman(rng, _tarih(rng, self.bugun, 1, 3 * 365))
+            il_id, ilce_id = self._konum(rng)
+            usta = rng.random() < 0.15
+            kullanici = self._kullanici(
+                self.vatandas_kullanici_ilk + sira_no,
+                KullaniciTipChoices.vatandas,
+                ad,
+                soyad,
+                katilma,
+            )
+            kayitlar[Kullanici].append(kullanici)
+            kayitlar[Vatandas].append(
+                Vatandas(
+                    pk=kimlik,
+                    kullanici_id=kullanici.pk,
+                    uuid=_uuid(rng),
+                    dogum_tarihi=_tarih(rng, self.bugun, 18 * 365, 60 * 365),
+                    cinsiyet=cinsiyet,
+                    telefon=_telefon(rng),
+                    il_id=il_id,
+                    ilce_id=ilce_id,
+                    is_usta=usta,
+                    is_is_arayan=rng.random() < 0.6,
+                    olusturma_tarihi=katilma,
+                    guncelleme_tarihi=katilma,
+                )
+            )
+
+            for _ in range(rng.randint(1, 3)):
+                baslangic = _tarih(rng, self.bugun, 2 * 365, 20 * 365)
+                kayitlar[EgitimDurumu].append(
+                    EgitimDurumu(
+                        vatandas_id=kimlik,
+                        okul_adi=rng.choice(OKULLAR),
+                        bolum=rng.choice(BOLUMLER),
+                        derece=rng.choice(EgitimDereceChoices.values),
+                        baslangic_tarihi=baslangic,
+                        bitis_tarihi=baslangic + datetime.timedelta(days=4 * 365),
+                    )
+                )
+            for _ in range(rng.choices((0, 1, 2, 3, 4), (15, 35, 30, 15, 5))[0]):
+                baslangic = _tarih(rng, self.bugun, 90, 15 * 365)
+                calisiyor = rng.random() < 0.2
+                kayitlar[IsTecrubesi].append(
+                    IsTecrubesi(
+                        vatandas_id=kimlik,
+                        firma_adi=f"{rng.choice(SOYADLARI)} {rng.choice(FIRMA_EKLERI)}",
+                        pozisyon=rng.choice(POZISYONLAR),
+                        baslangic_tarihi=baslangic,
+                        bitis_tarihi=(
+                            None
+                            if calisiyor
+                            else min(
+                                self.bugun,
+                                baslangic
+                                + datetime.timedelta(days=rng.randint(60, 1500)),
+                            )
+                        ),
+                        calisiyor=calisiyor,
+                    )
+                )
+            for yetenek in rng.sample(ANAHTAR_KELIMELER, rng.randint(0, 6)):
+                kayitlar[Yetenek].append(
+                    Yetenek(
+                        vatandas_id=kimlik,
+                        yetenek=yetenek,
+                        beceri_id=self.beceriler[yetenek],
+                        seviye=rng.choice(YetenekSeviyeChoices.values),
+                    )
+                )
+            for sertifika, kurum in rng.sample(
+                SERTIFIKALAR, rng.choices((0, 1, 2), (60, 30, 10))[0]
+            ):
+                kayitlar[Sertifika].append(
+                    Sertifika(
+                        vatandas_id=kimlik,
+                        sertifika_adi=sertifika,
+                        veren_kurum=kurum,
+                        alis_tarihi=_tarih(rng, self.bugun, 30, 10 * 365),
+                    )
+                )
+            if usta:
+                for meslek_id, meslek in rng.sample(self.meslekler, rng.randint(1, 3)):
+                    kayitlar[UstalikAlani].append(
+                        UstalikAlani(
+                            vatandas_id=kimlik,
+                            meslek_id=meslek_id,
+                            deneyim_yili=rng.randint(1, 30),
+                            aciklama=f"{meslek} işleri yapılır.",
+                            fiyat_bilgisi=f"Saatlik {rng.randint(3, 20) * 50} TL",
+                        )
+                    )
+                for gun in rng.sample(CalismaGunleriChoices.values, rng.randint(4, 6)):
+                    kayitlar[CalismaSaatleri].append(
+                        CalismaSaatleri(
+                            vatandas_id=kimlik,
+                            gun=gun,
+                            baslangic_saati=datetime.time(rng.choice((8, 9, 10))),
+                            bitis_saati=datetime.time(rng.choice((17, 18, 19))),
+                        )
+                    )
+
+        for model, nesneler in kayitlar.items():
+            toplu_yaz(model, nesneler, self.using)
+        return len(kayitlar[Vatandas])
+
+    def _ilanlari_planla(self):
+        """
+        İlanların firma, durum, başvuru sayısı ve sorularını belirle.
+
+        Başvurular ilanlar arasında uzun kuyruklu dağılır: az sayıda ilan çok
+        başvuru alır. Sayılar ve kimlik aralıkları burada sabitlendiği için
+        başvuru partileri birbirinden bağımsız üretilebilir.
+        """
+        rng = self.rng("ilan_plani")
+        agirliklar = [rng.paretovariate(1.5) for _ in range(self.olcek.ilan)]
+        self.planlar = []
+        soru_kimligi = self.soru_ilk
+        for sira_no in range(self.olcek.ilan):
+            durum = rng.choices(list(ILAN_DURUMLARI), list(ILAN_DURUMLARI.values()))[0]
+            sorular = []
+            for sira, (metin, tip, secenekler) in enumerate(
+                rng.sample(SORULAR, rng.choices((0, 1, 2, 3), (40, 25, 20, 15))[0])
+            ):
+                sorular.append((soru_kimligi, metin, tip, secenekler, sira))
+                soru_kimligi += 1
+            self.planlar.append(
+                IlanPlani(
+                    kimlik=self.ilan_ilk + sira_no,
+                    firma=self.firma_ilk + rng.randrange(self.olcek.firma),
+                    durum=durum,
+                    baslangic=_tarih(rng, self.bugun, 0, 365),
+                    basvuru=0,
+                    basvuru_kimligi=0,
+                    sorular=sorular,
+                )
+            )
+
+        # Taslak ilanlar başvuru almaz; toplam yalnızca yayınlanmış ilanlara
+        # dağıtılır ki istenen ölçekteki başvuru sayısına ulaşılsın.
+        basvurular = _paylastir(
+            self.olcek.basvuru,
+            [
+                0 if plan.durum == IlanDurumChoices.TASLAK else agirlik
+                for plan, agirlik in zip(self.planlar, agirliklar)
+            ],
+            self.olcek.vatandas,
+        )
+        basvuru_kimligi = self.basvuru_ilk
+        for plan, basvuru in zip(self.planlar, basvurular):
+            plan.basvuru = basvuru
+            plan.basvuru_kimligi = basvuru_kimligi
+            basvuru_kimligi += basvuru
+
+    def _ilan_partisi(self, sira, bas, son):
+        rng = self.rng("ilan", sira)
+        ilanlar, anahtarlar, diller, sorular = [], [], [], []
+        for plan in self.planlar[bas:son]:
+            pozisyon = rng.choice(POZISYONLAR)
+            baslik = f"{pozisyon} ({rng.choice(('Deneyimli', 'Yeni Mezun', 'Tam Zamanlı', 'Acil'))})"
+            il_id, ilce_id = self._konum(rng)
+            yayinda_mi = plan.durum != IlanDurumChoices.TASLAK
+            olusturma = _zaman(
+                rng, plan.baslangic - datetime.timedelta(days=rng.randint(0, 7))
+            )
+            ilanlar.append(
+                IsBilgileri(
+                    pk=plan.kimlik,
+                    uuid=_uuid(rng),
+                    baslik=baslik,
+                    slug=f"{slugify(baslik)}-{plan.kimlik}",
+                    firma_id=plan.firma,
+                    pozisyon=pozisyon,
+                    aciklama=f"{pozisyon} pozisyonu için ekip arkadaşı arıyoruz.",
+                    sektor_id=rng.choice(self.sektorler),
+                    departman=rng.choice(DEPARTMANLAR),
+                    calisma_modeli=rng.choice(CalismaModeliChoices.values),
+                    calisma_yeri=rng.choice(CalismaYeriChoices.values),
+                    il_id=il_id,
+                    ilce_id=ilce_id,
+                    gerekli_nitelikler="En az lise mezunu, iletişimi güçlü.",
+                    egitim_duzey=rng.choice(EgitimDuzeyiChoices.values),
+                    deneyim_duzey=rng.choice(DeneyimDuzeyiChoices.values),
+                    maas_bilgisi=f"{rng.randint(17, 60)}.000 TL",
+                    maas_gizli=rng.random() < 0.6,
+                    basvuru_baslangic=plan.baslangic,
+                    basvuru_bitis=(
+                        plan.baslangic
+                        + datetime.timedelta(days=rng.choice((15, 30, 45, 60)))
+                        if rng.random() < 0.8
+                        else None
+                    ),
+                    alinacak_kisi=rng.choices((1, 2, 3, 5, 10), (60, 20, 10, 7, 3))[0],
+                    durum=plan.durum,
+                    one_cikartilmis=rng.random() < 0.05,
+                    basvuru_sayisi=plan.basvuru,
+                    goruntuleme_sayisi=plan.basvuru * rng.randint(5, 30),
+                    olusturma_tarihi=olusturma,
+                    guncelleme_tarihi=olusturma,
+                    yayinlanma_tarihi=(
+                        _zaman(rng, plan.baslangic) if yayinda_mi else None
+                    ),
+                )
+            )
+            for kelime in rng.sample(ANAHTAR_KELIMELER, rng.randint(2, 6)):
+                anahtarlar.append(
+                    IlanAnahtar(
+                        ilan_id=plan.kimlik,
+                        anahtar_kelime=kelime,
+                        kelime_id=self.anahtar_kelimeler[kelime],
+                    )
+                )
+            for dil in rng.sample(DILLER, rng.choices((0, 1, 2), (50, 40, 10))[0]):
+                diller.append(
+                    IlanDil(
+                        ilan_id=plan.kimlik,
+                        dil=dil,
+                        seviye=rng.choice(IlanDil.DilSeviyeChoices.values),
+                        zorunlu=rng.random() < 0.3,
+                    )
+                )
+            for kimlik, metin, tip, secenekler, sira_no in plan.sorular:
+                sorular.append(
+                    IlanSoru(
+                        pk=kimlik,
+                        ilan_id=plan.kimlik,
+                        soru=metin,
+                        soru_tipi=tip,
+                        secenekler=secenekler or None,
+                        zorunlu=tip != IlanSoru.SoruTipiChoices.METIN,
+                        sira=sira_no,
+                    )
+                )
+        toplu_yaz(IsBilgileri, ilanlar, self.using)
+        toplu_yaz(IlanAnahtar, anahtarlar, self.using)
+        toplu_yaz(IlanDil, diller, self.using)
+        toplu_yaz(IlanSoru, sorular, self.using)
+        return len(ilanlar)
+
+    def _basvuru_partileri(self):
+        # İlanlar, her parti yaklaşık ``parti_boyutu`` başvuru içerecek şekilde gruplanır
+        araliklar, bas, biriken = [], 0, 0
+        for sira_no, plan in enumerate(self.planlar):
+            biriken += plan.basvuru
+            if biriken >= self.parti_boyutu or sira_no == len(self.planlar) - 1:
+                araliklar.append((len(araliklar), bas, sira_no + 1))
+                bas, biriken = sira_no + 1, 0
+        self._partiler("basvuru", None, self._basvuru_partisi, araliklar)
+
+    def _cevap(self, rng, tip, secenekler):
+        if tip == IlanSoru.SoruTipiChoices.EVET_HAYIR:
+            return rng.choice(("evet", "hayir"))
+        if tip == IlanSoru.SoruTipiChoices.COKTAN_SECMELI:
+            return rng.choice(secenekler.splitlines())
+        return rng.choice(
+            ("Deneyimliyim.", "Hemen başlayabilirim.", "Görüşmek isterim.")
+        )
+
+    def _basvuru_partisi(self, sira, bas, son):
+        rng = self.rng("basvuru", sira)
+        basvurular, cevaplar = [], []
+        for plan in self.planlar[bas:son]:
+            sonlandi = plan.durum == IlanDurumChoices.SONLANDI
+            for sira_no, vatandas in enumerate(
+                rng.sample(range(self.olcek.vatandas), plan.basvuru)
+            ):
+                kimlik = plan.basvuru_kimligi + sira_no
+                if sonlandi:
+                    durum = rng.choices(
+                        (
+                            BasvuruDurumChoices.RED,
+                            BasvuruDurumChoices.MUSAKAT,
+                            BasvuruDurumChoices.KABUL,
+                        ),
+                        (80, 15, 5),
+                    )[0]
+                else:
+                    durum = rng.choices(
+                        (BasvuruDurumChoices.BEKLEMEDE, BasvuruDurumChoices.INCELENDI,
+                         BasvuruDurumChoices.RED, BasvuruDurumChoices.IPTAL),
+                        (55, 25, 15, 5),
+                    )[0]  # fmt: skip
+                tarih = _zaman(
+                    rng,
+                    min(
+                        self.bugun,
+                        plan.baslangic + datetime.timedelta(days=rng.randint(0, 45)),
+                    ),
+                )
+                basvurular.append(
+                    IlanBasvuru(
+                        pk=kimlik,
+                        uuid=_uuid(rng),
+                        ilan_id=plan.kimlik,
+                        vatandas_id=self.vatandas_ilk + vatandas,
+                        on_yazi=(
+                            "Merhaba, ilanınızla ilgileniyorum."
+                            if rng.random() < 0.3
+                            else None
+                        ),
+                        durum=durum,
+                        basvuru_tarihi=tarih,
+                        guncelleme_tarihi=tarih,
+                        son_islem_tarihi=(
+                            None if durum == BasvuruDurumChoices.BEKLEMEDE else tarih
+                        ),
+                        okundu=durum != BasvuruDurumChoices.BEKLEMEDE,
+                        favorilendi=rng.random() < 0.05,
+                    )
+                )
+                for soru_id, _, tip, secenekler, _ in plan.sorular:
+                    cevaplar.append(
+                        BasvuruCevap(
+                            basvuru_id=kimlik,
+                            soru_id=soru_id,
+                            cevap=self._cevap(rng, tip, secenekler),
+                        )
+                    )
+        toplu_yaz(IlanBasvuru, basvurular, self.using)
+        toplu_yaz(BasvuruCevap, cevaplar, self.using)
+        return len(basvurular)
+
+    # Tamamlama
+
+    def _tamamla(self):
+        """Dizileri ilerlet, türetilmiş özetleri hesapla ve önbellekleri geçersiz kıl."""
+        from ilanlar.anahtar import anahtar_sayilarini_uzlastir
+        from ilanlar.signals import ilanlari_akisa_ekle
+        from ilanlar.sonuc import sonuclari_hesapla
+        from raporlar.gorunumler import destekleniyor_mu, gorunumleri_yenile
+
+        from .istatistik import istatistikleri_uzlastir
+        from .onbellek import SURUMLU_MODELLER, surum_artir
+
+        baslangic = timezone.now()
+        baglanti = connections[self.using]
+        komutlar = baglanti.ops.sequence_reset_sql(
+            no_style(), [Kullanici, Firma, Vatandas, IsBilgileri, IlanSoru, IlanBasvuru]
+        )
+        if komutlar:
+            with baglanti.cursor() as cursor:
+                for komut in komutlar:
+                    cursor.execute(komut)
+
+        # Sonlanan ilanların sonuçları ve kabul edilen başvuruları
+        sonlananlar = [
+            plan.kimlik
+            for plan in self.planlar
+            if plan.durum == IlanDurumChoices.SONLANDI
+        ]
+        IlanSonuc.objects.using(self.using).bulk_create(
+            [
+                IlanSonuc(ilan_id=ilan_id, tamamlandi=True, tamamlanma_tarihi=baslangic)
+                for ilan_id in sonlananlar
+            ],
+            batch_size=self.parti_boyutu,
+            ignore_conflicts=True,
+        )
+        sonuclar = dict(
+            IlanSonuc.objects.using(self.using)
+            .filter(ilan_id__in=sonlananlar)
+            .values_list("ilan_id", "pk")
+        )
+        ise_alinanlar = IlanSonuc.ise_alinanlar.through
+        toplu_yaz(
+            ise_alinanlar,
+            [
+                ise_alinanlar(ilansonuc_id=sonuclar[ilan_id], ilanbasvuru_id=basvuru_id)
+                for basvuru_id, ilan_id in IlanBasvuru.objects.using(self.using)
+                .filter(ilan_id__in=sonlananlar, durum=BasvuruDurumChoices.KABUL)
+                .values_list("pk", "ilan_id")
+            ],
+            self.using,
+        )
+        sonuclari_hesapla(sonlananlar)
+        ilanlari_akisa_ekle(
+            IsBilgileri.objects.using(self.using).filter(pk__gte=self.ilan_ilk)
+        )
+        istatistikleri_uzlastir()
+        anahtar_sayilarini_uzlastir()
+        for ad in {ad for adlar in SURUMLU_MODELLER.values() for ad in adlar}:
+            surum_artir(ad)
+        if destekleniyor_mu():
+            gorunumleri_yenile(eszamanli=False)
+        self.raporla("ozetler", 0, (timezone.now() - baslangic).total_seconds())
@@ -0,0 +1,119 @@
+from functools import partial
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+
+from .istatistik import SAYACLAR, istatistik_degistir
+from .onbellek import SURUM_DISI_ALANLAR, SURUMLU_MODELLER, surum_artir
+
+# Modellere göre artırılacak sürüm adları
+_model_surumleri = {}
+
+# Çoktan çoğa ara tablolarına göre ilişkinin sahibi olan model
+_iliski_sahipleri = {}
+
+# Modellere göre etkiledikleri istatistik sayaçları
+_model_sayaclari = {}
+
+
+def _surumleri_artir(adlar):
+    for ad in adlar:
+        surum_artir(ad)
+
+
+def model_degisti(sender, raw=False, update_fields=None, **kwargs):
+    """
+    Değişen modelin sürümlerini işlem tamamlandıktan sonra artır.
+
+    İşlem içinde artırılsaydı, eşzamanlı bir istek henüz kaydedilmemiş eski
+    veriyi yeni sürüm anahtarıyla önbelleğe alabilirdi.
+    """
+    if raw or (update_fields and update_fields <= SURUM_DISI_ALANLAR):
+        return
+    transaction.on_commit(partial(_surumleri_artir, _model_surumleri[sender]))
+
+
+def iliski_degisti(sender, action, **kwargs):
+    """Çoktan çoğa ilişkisi değişen modelin sürümlerini artır."""
+    if action in ("post_add", "post_remove", "post_clear"):
+        model_degisti(_iliski_sahipleri[sender])
+
+
+def _farklar(sayaclar, onceki, sonraki):
+    return {
+        anahtar: sayac.katki(sonraki.get(sayac.alan))
+        - sayac.katki(onceki.get(sayac.alan))
+        for anahtar, sayac in sayaclar.items()
+    }
+
+
+def onceki_degerleri_sakla(sender, instance, raw=False, **kwargs):
+    """Kaydedilmeden önce sayaçların bağlı olduğu alanların değerini sakla."""
+    instance._onceki_sayac_degerleri = {}
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    alanlar = {sayac.alan for sayac in _model_sayaclari[sender].values()}
+    instance._onceki_sayac_degerleri = (
+        sender._base_manager.filter(pk=instance.pk).values(*alanlar).first() or {}
+    )
+
+
+def sayaclari_guncelle(sender, instance, raw=False, **kwargs):
+    """Kaydın yeni değerlerine göre istatistikleri artımlı olarak güncelle."""
+    if raw:
+        return
+    sayaclar = _model_sayaclari[sender]
+    sonraki = {sayac.alan: getattr(instance, sayac.alan) for sayac in sayaclar.values()}
+    istatistik_degistir(
+        _farklar(sayaclar, getattr(instance, "_onceki_sayac_degerleri", {}), sonraki)
+    )
+    instance._onceki_sayac_degerleri = sonraki
+
+
+def silinen_kaydi_dus(sender, instance, **kwargs):
+    """Silinen kaydın istatistiklere katkısını geri al."""
+    sayaclar = _model_sayaclari[sender]
+    onceki = {sayac.alan: getattr(instance, sayac.alan) for sayac in sayaclar.values()}
+    istatistik_degistir(_farklar(sayaclar, onceki, {}))
+
+
+def guncelleme_bildir(model, onceki, sonraki):
+    """
+    ``save()`` kullanılmadan yapılan güncellemeleri önbellek ve sayaçlara bildir.
+
+    ``onceki`` ve ``sonraki`` değişen alanların eski ve yeni değerlerini
+    içerir. Hedefli ``QuerySet.update()`` çağrıları model sinyali
+    göndermediği için sürüm ve istatistikler bu fonksiyonla güncellenir.
+    """
+    sayaclar = {
+        anahtar: sayac
+        for anahtar, sayac in _model_sayaclari.get(model, {}).items()
+        if sayac.alan in sonraki
+    }
+    if sayaclar:
+        istatistik_degistir(_farklar(sayaclar, onceki, sonraki))
+    if model in _model_surumleri:
+        model_degisti(model)
+
+
+def baglan():
+    """Önbellek sürümü ve istatistik sayacı sinyallerini modellere bağla."""
+    for etiket, adlar in SURUMLU_MODELLER.items():
+        model = apps.get_model(etiket)
+        _model_surumleri[model] = adlar
+        post_save.connect(model_degisti, sender=model)
+        post_delete.connect(model_degisti, sender=model)
+        for alan in model._meta.local_many_to_many:
+            _iliski_sahipleri[alan.remote_field.through] = model
+            m2m_changed.connect(iliski_degisti, sender=alan.remote_field.through)
+
+    # QuerySet.update() ve toplu işlemler sinyal göndermediği için bu yollarla
+    # oluşan sapmalar ``istatistikleri_uzlastir`` komutuyla giderilir.
+    for anahtar, sayac in SAYACLAR.items():
+        model = apps.get_model(sayac.model)
+        _model_sayaclari.setdefault(model, {})[anahtar] = sayac
+    for model in _model_sayaclari:
+        pre_save.connect(onceki_degerleri_sakla, sender=model)
+        post_save.connect(sayaclari_guncelle, sender=model)
+        post_delete.connect(silinen_kaydi_dus, sender=model)
@@ -0,0 +1,213 @@
+import hashlib
+import logging
+import random
+import re
+import time
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+logger = logging.getLogger("istihdam.sorgu")
+
+# IN (...) listeleri ve VALUES satırları parametre sayısından bağımsız tek
+# parmak izine indirgenir.
+_PARAMETRE_LISTESI = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+_SAYI = re.compile(r"\b\d+\b")
+_BOSLUK = re.compile(r"\s+")
+
+# Middleware'in o anki istek için açtığı profil; örneklenen isteklerde
+# ``kaydedici`` anahtarı doldurulur.
+_etkin_profil = ContextVar("etkin_profil", default=None)
+
+
+class SorguButcesiAsildi(AssertionError):
+    """Bir görünüm tanımlanan sorgu bütçesinden fazla sorgu çalıştırdı."""
+
+
+def parmak_izi(sql):
+    """Parametreleri ve sabit sayıları atılmış SQL ve kısa özeti."""
+    normal = _BOSLUK.sub(" ", sql).strip()
+    normal = _PARAMETRE_LISTESI.sub("(%s, ...)", normal)
+    normal = _SAYI.sub("N", normal)
+    return normal, hashlib.md5(normal.encode(), usedforsecurity=False).hexdigest()[:12]
+
+
+def sorgu_butcesi(azami):
+    """
+    Görünümün istek başına çalıştırabileceği en fazla sorgu sayısını bildir.
+
+    Bütçeli görünümler örneklemeden bağımsız olarak her istekte ölçülür.
+    Bütçe aşıldığında uyarı günlüğe yazılır; ``SORGU_BUTCESI_KATI`` açıksa
+    (testlerde varsayılan) ``SorguButcesiAsildi`` fırlatılır.
+    """
+
+    def dekorator(view):
+        if iscoroutinefunction(view):
+
+            @wraps(view)
+            async def sarmalayici(*args, **kwargs):
+                return await view(*args, **kwargs)
+
+        else:
+
+            @wraps(view)
+            def sarmalayici(*args, **kwargs):
+                return view(*args, **kwargs)
+
+        sarmalayici.sorgu_butcesi = azami
+        return sarmalayici
+
+    return dekorator
+
+
+class SorguKaydedici:
+    """``connection.execute_wrapper`` ile çalıştırılan sorguları kaydeder."""
+
+    def __init__(self):
+        self.sorgular = []
+
+    def __call__(self, execute, sql, params, many, context):
+        baslangic = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sorgular.append(
+                (context["connection"].alias, sql, time.perf_counter() - baslangic)
+            )
+
+    @property
+    def toplam_sure(self):
+        return sum(sure for _, _, sure in self.sorgular)
+
+    def tekrarlar(self, esik):
+        """En az ``esik`` kez çalışan sorgu kalıpları (olası N+1)."""
+        gruplar = {}
+        for _, sql, _ in self.sorgular:
+            normal, ozet = parmak_izi(sql)
+            grup = gruplar.setdefault(ozet, {"parmak_izi": ozet, "sql": normal})
+            grup["sayi"] = grup.get("sayi", 0) + 1
+        return sorted(
+            (grup for grup in gruplar.values() if grup["sayi"] >= esik),
+            key=lambda grup: grup["sayi"],
+            reverse=True,
+        )
+
+    def en_yavaslar(self, adet):
+        return [
+            {"veritabani": alias, "sql": sql, "sure_ms": round(sure * 1000, 2)}
+            for alias, sql, sure in sorted(
+                self.sorgular, key=lambda sorgu: sorgu[2], reverse=True
+            )[:adet]
+        ]
+
+
+def _profil_kaydi(execute, sql, params, many, context):
+    profil = _etkin_profil.get()
+    kaydedici = profil.get("kaydedici") if profil else None
+    if kaydedici is None:
+        return execute(sql, params, many, context)
+    return kaydedici(execute, sql, params, many, context)
+
+
+def sorgu_kaydini_bagla(sender, connection, **kwargs):
+    """``connection_created`` sinyaliyle her bağlantıya profil kaydını ekle."""
+    if _profil_kaydi not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_profil_kaydi)
+
+
+class SorguProfiliMiddleware:
+    """
+    İstek başına sorgu sayısını, toplam veritabanı süresini, tekrarlanan
+    sorgu kalıplarını ve en yavaş sorguları ölçer.
+
+    İstekler ``SORGU_PROFILI_ORNEKLEME`` oranında örneklenir; sonuç
+    ``istihdam.sorgu`` günlüğüne yapılandırılmış kayıt olarak yazılır ve
+    yanıta ``Server-Timing`` başlığı eklenir.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        profil = {}
+        belirtec = _etkin_profil.set(profil)
+        baslangic = time.perf_counter()
+        try:
+            yanit = self.get_response(request)
+        finally:
+            _etkin_profil.reset(belirtec)
+        if profil:
+            self._raporla(request, yanit, profil, time.perf_counter() - baslangic)
+        return yanit
+
+    async def __acall__(self, request):
+        profil = {}
+        belirtec = _etkin_profil.set(profil)
+        baslangic = time.perf_counter()
+        try:
+            yanit = await self.get_response(request)
+        finally:
+            _etkin_profil.reset(belirtec)
+        if profil:
+            self._raporla(request, yanit, profil, time.perf_counter() - baslangic)
+        return yanit
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # Ölçüm görünüm çalışmadan hemen önce başlar; örneklenmeyen isteklerde
+        # sorgular kaydedilmez.
+        profil = _etkin_profil.get()
+        butce = getattr(view_func, "sorgu_butcesi", None)
+        if profil is None or (
+            butce is None and random.random() >= settings.SORGU_PROFILI_ORNEKLEME
+        ):
+            return None
+
+        profil.update(
+            gorunum=getattr(request.resolver_match, "view_name", None)
+            or f"{view_func.__module__}.{view_func.__qualname__}",
+            butce=butce,
+            kaydedici=SorguKaydedici(),
+        )
+        return None
+
+    def _raporla(self, request, yanit, profil, sure):
+        kaydedici = profil["kaydedici"]
+        sorgu_sayisi = len(kaydedici.sorgular)
+        kayit = {
+            "gorunum": profil["gorunum"],
+            "yol": request.path,
+            "yontem": request.method,
+            "durum": yanit.status_code,
+            "sure_ms": round(sure * 1000, 2),
+            "sorgu_sayisi": sorgu_sayisi,
+            "veritabani_suresi_ms": round(kaydedici.toplam_sure * 1000, 2),
+            "tekrarlar": kaydedici.tekrarlar(settings.SORGU_TEKRAR_ESIGI),
+            "en_yavaslar": kaydedici.en_yavaslar(3),
+        }
+        yanit["Server-Timing"] = (
+            f'db;dur={kayit["veritabani_suresi_ms"]};desc="{sorgu_sayisi} sorgu"'
+        )
+
+        butce = profil["butce"]
+        if butce is not None and sorgu_sayisi > butce:
+            kayit["butce"] = butce
+            logger.warning("sorgu_butcesi_asildi", extra={"veri": kayit})
+            if settings.SORGU_BUTCESI_KATI:
+                raise SorguButcesiAsildi(
+                    f"{profil['gorunum']}: {sorgu_sayisi} sorgu çalıştı, "
+                    f"bütçe {butce}"
+                )
+        elif kayit["tekrarlar"]:
+            logger.warning("tekrarlanan_sorgu", extra={"veri": kayit})
+        else:
+            logger.info("istek_sorgulari", extra={"veri": kayit})
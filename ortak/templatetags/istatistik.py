@@ -0,0 +1,19 @@
+from django import template
+
+from ortak.istatistik import istatistikler
+
+register = template.Library()
+
+
+@register.simple_tag
+def platform_istatistikleri():
+    """
+    Platform özet istatistiklerini şablona aktar.
+
+    Kullanım::
+
+        {% load istatistik %}
+        {% platform_istatistikleri as istatistik %}
+        {{ istatistik.aktif_ilan }}
+    """
+    return istatistikler()
@@ -0,0 +1,310 @@
+import datetime
+import threading
+import time
+import warnings
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import URLPattern, get_resolver
+
+from ayarlar.models import Il, Ilce, Sektor
+from hesap.models import Firma, Kullanici
+from ilanlar.models import IlanAnahtar, IlanDurumChoices, IsBilgileri
+from raporlar.models import IseAlimHunisi
+
+from .kiyaslama import ayni_olcek, gerilemeler, olc, referans_sonuclar
+from .onbellek import (
+    KILIT_ONEKI,
+    hesapla_veya_getir,
+    surum_artir,
+    surumlu_sayfa_onbellegi,
+)
+from .ornek_veri import _paylastir
+from .sorgu_profili import SorguButcesiAsildi, SorguProfiliMiddleware, sorgu_butcesi
+from .yonlendirici import (
+    SABITLEME_CEREZI,
+    OkumaKopyasiMiddleware,
+    OkumaKopyasiYonlendirici,
+    birincile_sabitle,
+    kopyadan_oku,
+)
+
+
+class HesaplaVeyaGetirTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _kilit_sahibi(self, anahtar, sure):
+        """Kilidi alıp ``sure`` saniye sonra sonuç saklamadan bırakan istek."""
+        kilit = f"{KILIT_ONEKI}:{anahtar}"
+        self.assertTrue(cache.add(kilit, 1, 10))
+        zamanlayici = threading.Timer(sure, cache.delete, [kilit])
+        zamanlayici.start()
+        self.addCleanup(zamanlayici.cancel)
+
+    def test_kilit_birakilinca_bekleme_biter(self):
+        self._kilit_sahibi("test:yok", 0.1)
+        baslangic = time.monotonic()
+        deger = hesapla_veya_getir("test:yok", lambda: "hesaplandi", 60)
+        self.assertEqual(deger, "hesaplandi")
+        self.assertLess(time.monotonic() - baslangic, 1)
+
+    def test_none_sonucu_saklanmaz(self):
+        self.assertIsNone(hesapla_veya_getir("test:bos", lambda: None, 60))
+        self.assertIsNone(cache.get("test:bos"))
+        self.assertIsNone(cache.get(f"{KILIT_ONEKI}:test:bos"))
+
+    def test_hata_kilidi_birakir(self):
+        def hatali():
+            raise RuntimeError
+
+        with self.assertRaises(RuntimeError):
+            hesapla_veya_getir("test:hata", hatali, 60)
+        self.assertIsNone(cache.get(f"{KILIT_ONEKI}:test:hata"))
+
+
+class SurumluSayfaOnbellegiTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.cagrilar = 0
+
+        @surumlu_sayfa_onbellegi("ilan")
+        def gorunum(request):
+            self.cagrilar += 1
+            return HttpResponse(f"sayfa {self.cagrilar}")
+
+        self.gorunum = gorunum
+
+    def _iste(self, kullanici=None, yontem="get"):
+        request = getattr(RequestFactory(), yontem)("/sayfa/?a=1")
+        request.user = kullanici or AnonymousUser()
+        return self.gorunum(request)
+
+    def test_anonim_istek_surum_artana_kadar_onbellekten_doner(self):
+        self.assertEqual(self._iste().content, b"sayfa 1")
+        self.assertEqual(self._iste().content, b"sayfa 1")
+        self.assertEqual(self.cagrilar, 1)
+        surum_artir("ilan")
+        self.assertEqual(self._iste().content, b"sayfa 2")
+        self.assertEqual(self.cagrilar, 2)
+
+    def test_oturum_acmis_kullanici_ve_post_onbellegi_atlar(self):
+        self._iste()
+        self.assertEqual(self._iste(Kullanici(username="uye")).content, b"sayfa 2")
+        self.assertEqual(self._iste(yontem="post").content, b"sayfa 3")
+        # Ziyaretçiler önbellekteki sayfayı görmeye devam eder
+        self.assertEqual(self._iste().content, b"sayfa 1")
+
+
+def _butceli_gorunumler(desenler=None, onek=""):
+    """URL yapılandırmasındaki sorgu bütçeli görünümlerin tam adları."""
+    adlar = set()
+    for desen in desenler if desenler is not None else get_resolver().url_patterns:
+        if isinstance(desen, URLPattern):
+            if desen.name and hasattr(desen.callback, "sorgu_butcesi"):
+                adlar.add(onek + desen.name)
+        else:
+            alt_onek = onek + (f"{desen.namespace}:" if desen.namespace else "")
+            adlar |= _butceli_gorunumler(desen.url_patterns, alt_onek)
+    return adlar
+
+
+class SorguButcesiTests(TestCase):
+    """Bütçeli görünümler katı modda bütçelerini aşmadan yanıt vermeli."""
+
+    ISTEKLER = {
+        "home": "/",
+        "anahtar-onerileri": "/ilanlar/anahtar-kelimeler/?anahtar=py",
+        "v1:anahtar-kelimeler": "/api/v1/anahtar-kelimeler/?anahtar=py",
+        "v1:asenkron-ilanlar": "/api/v1/asenkron/ilanlar/?il={il}",
+        "v1:asenkron-iller": "/api/v1/asenkron/iller/",
+        "v1:asenkron-ilceler": "/api/v1/asenkron/iller/{il_slug}/ilceler/",
+        "v1:asenkron-istatistikler": "/api/v1/asenkron/istatistikler/",
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.il = Il.objects.create(ad="Sivas")
+        ilce = Ilce.objects.create(il=cls.il, ad="Merkez")
+        sektor = Sektor.objects.create(ad="Bilişim")
+        firma = Firma.objects.create(ad="Firma A", il=cls.il, ilce=ilce)
+        for sira in range(5):
+            ilan = IsBilgileri.objects.create(
+                baslik=f"İlan {sira}",
+                firma=firma,
+                pozisyon="Geliştirici",
+                aciklama="Açıklama",
+                gerekli_nitelikler="Nitelikler",
+                basvuru_baslangic=datetime.date.today(),
+                durum=IlanDurumChoices.YAYINDA,
+                sektor=sektor,
+                il=cls.il,
+                ilce=ilce,
+            )
+            IlanAnahtar.objects.create(ilan=ilan, anahtar_kelime="Python")
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_kati_mod_testlerde_acik(self):
+        self.assertTrue(settings.SORGU_BUTCESI_KATI)
+
+    def test_tum_butceli_gorunumler_kapsaniyor(self):
+        self.assertEqual(_butceli_gorunumler(), set(self.ISTEKLER))
+
+    @override_settings(SORGU_BUTCESI_KATI=True)
+    def test_butceli_gorunumler_butceyi_asmaz(self):
+        for ad, yol in self.ISTEKLER.items():
+            with self.subTest(gorunum=ad):
+                yanit = self.client.get(yol.format(il=self.il.pk, il_slug=self.il.slug))
+                self.assertEqual(yanit.status_code, 200)
+
+    @override_settings(SORGU_BUTCESI_KATI=True)
+    def test_butce_asilinca_hata_firlatilir(self):
+        @sorgu_butcesi(1)
+        def gorunum(request):
+            list(Il.objects.all())
+            list(Ilce.objects.all())
+            return HttpResponse()
+
+        def get_response(request):
+            middleware.process_view(request, gorunum, (), {})
+            return gorunum(request)
+
+        middleware = SorguProfiliMiddleware(get_response)
+        with self.assertRaises(SorguButcesiAsildi):
+            middleware(RequestFactory().get("/"))
+
+
+class OkumaKopyasiTests(SimpleTestCase):
+    """Okumaların yönlendirilmesi; ``replica_1`` birincilin takma adıdır."""
+
+    def setUp(self):
+        kopyali = {
+            **settings.DATABASES,
+            "replica_1": {
+                **settings.DATABASES["default"],
+                "TEST": {"MIRROR": "default"},
+            },
+        }
+        # Yalnızca tanımlı kopya adları okunur; bağlantı açılmaz
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            ayarlar = override_settings(DATABASES=kopyali)
+            ayarlar.enable()
+        self.addCleanup(ayarlar.disable)
+        self.yonlendirici = OkumaKopyasiYonlendirici()
+
+    def _okumalar(self):
+        return (
+            self.yonlendirici.db_for_read(IsBilgileri),
+            self.yonlendirici.db_for_read(IseAlimHunisi),
+        )
+
+    def _iste(self, request):
+        okumalar = []
+
+        def get_response(request):
+            okumalar.append(self._okumalar())
+            return HttpResponse()
+
+        yanit = OkumaKopyasiMiddleware(get_response)(request)
+        return okumalar[0], yanit
+
+    def test_istek_disindaki_okumalar_birincilden(self):
+        self.assertEqual(self._okumalar(), ("default", "default"))
+        with kopyadan_oku():
+            self.assertEqual(self._okumalar(), ("replica_1", "replica_1"))
+            with birincile_sabitle():
+                self.assertEqual(self._okumalar(), ("default", "replica_1"))
+        self.assertEqual(self.yonlendirici.db_for_write(IsBilgileri), "default")
+
+    def test_yazmadan_sonra_okumalar_birincile_sabitlenir(self):
+        fabrika = RequestFactory()
+        okumalar, _yanit = self._iste(fabrika.get("/ilanlar/"))
+        self.assertEqual(okumalar, ("replica_1", "replica_1"))
+
+        okumalar, yanit = self._iste(fabrika.post("/ilanlar/"))
+        self.assertEqual(okumalar, ("default", "replica_1"))
+        cerez = yanit.cookies[SABITLEME_CEREZI]
+
+        fabrika.cookies[SABITLEME_CEREZI] = cerez.value
+        okumalar, yanit = self._iste(fabrika.get("/ilanlar/"))
+        self.assertEqual(okumalar, ("default", "replica_1"))
+        self.assertNotIn(SABITLEME_CEREZI, yanit.cookies)
+
+        fabrika.cookies[SABITLEME_CEREZI] = str(int(time.time()) - 1)
+        okumalar, _yanit = self._iste(fabrika.get("/ilanlar/"))
+        self.assertEqual(okumalar, ("replica_1", "replica_1"))
+
+    def test_yonetim_paneli_birincilden_okur(self):
+        okumalar, _yanit = self._iste(RequestFactory().get("/admin/"))
+        self.assertEqual(okumalar, ("default", "replica_1"))
+
+
+class PaylastirTests(SimpleTestCase):
+    def test_toplam_korunur_ve_kalan_buyuklere_verilir(self):
+        paylar = _paylastir(10, [3, 1, 1, 0], 100)
+        self.assertEqual(sum(paylar), 10)
+        self.assertEqual(paylar, [6, 2, 2, 0])
+
+    def test_sinir_asilmaz(self):
+        self.assertEqual(_paylastir(10, [5, 1, 0], 4), [4, 4, 0])
+        self.assertEqual(_paylastir(7, [0, 0], 5), [0, 0])
+
+
+class KiyaslamaTests(SimpleTestCase):
+    OLCEK = {"ilan": 1000, "vatandas": 5000, "basvuru": 50000}
+
+    def _olcum(self, p50, sorgu=3):
+        return {"p50_ms": p50, "p95_ms": p50 * 2, "sorgu": sorgu, "tekrar": 30}
+
+    def _kayit(self, sonuclar, olcek=None, veritabani="postgresql"):
+        return {
+            "veritabani": veritabani,
+            "olcek": olcek or self.OLCEK,
+            "sonuclar": sonuclar,
+        }
+
+    def test_olc_isinmadan_sonra_tekrar_sayisi_kadar_olcer(self):
+        cagrilar = []
+        ozet = olc(cagrilar.append, "baglam", tekrar=5, isinma=2)
+        self.assertEqual(len(cagrilar), 7)
+        self.assertEqual(ozet["tekrar"], 5)
+        self.assertEqual(ozet["sorgu"], 0)
+        self.assertLessEqual(ozet["p50_ms"], ozet["p95_ms"])
+
+    def test_gerilemeler(self):
+        onceki = {"a": self._olcum(10), "b": self._olcum(10)}
+        simdiki = {
+            "a": self._olcum(11.9),
+            "b": self._olcum(10, sorgu=4),
+            "yeni": self._olcum(99),
+        }
+        bulunan = gerilemeler(onceki, simdiki, 0.2)
+        self.assertEqual(bulunan, ["b: sorgu 3 -> 4"])
+        simdiki["a"] = self._olcum(12.1)
+        self.assertEqual(len(gerilemeler(onceki, simdiki, 0.2)), 3)
+
+    def test_ayni_olcek(self):
+        self.assertTrue(ayni_olcek(self.OLCEK, {**self.OLCEK, "ilan": 1050}))
+        self.assertFalse(ayni_olcek(self.OLCEK, {**self.OLCEK, "ilan": 10000}))
+        self.assertFalse(ayni_olcek(None, self.OLCEK))
+
+    def test_referans_ayni_veritabani_ve_olcekten_secilir(self):
+        gecmis = [
+            self._kayit({"a": self._olcum(1), "b": self._olcum(1)}),
+            self._kayit({"a": self._olcum(2)}),
+            self._kayit({"a": self._olcum(3)}, veritabani="sqlite"),
+            self._kayit({"a": self._olcum(4)}, olcek={**self.OLCEK, "ilan": 10}),
+        ]
+        referans = referans_sonuclar(gecmis, "postgresql", self.OLCEK)
+        self.assertEqual(referans["a"]["p50_ms"], 2)
+        self.assertEqual(referans["b"]["p50_ms"], 1)
+        self.assertEqual(referans_sonuclar(gecmis, "mysql", self.OLCEK), {})
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from . import views
+
+app_name = "ortak"
+
+urlpatterns = [
+    path("veritabani/", views.veritabani_durumu, name="veritabani_durumu"),
+]
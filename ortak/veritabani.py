@@ -0,0 +1,51 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+
+
+def baglanti_modu(alias="default"):
+    """Veritabanı bağlantısının yönetim biçimini döndür."""
+    ayarlar = connections[alias].settings_dict
+    if ayarlar.get("OPTIONS", {}).get("pool"):
+        return "havuz"
+    if ayarlar.get("CONN_MAX_AGE"):
+        return "kalici"
+    return "istek_basina"
+
+
+def kalici_baglantilari_reddet():
+    """
+    Kalıcı bağlantı kullanan bir veritabanı tanımlıysa ``ImproperlyConfigured``
+    fırlat.
+
+    ASGI altında senkron görünümler farklı iş parçacıklarında çalıştığından
+    ``CONN_MAX_AGE`` ile açılan bağlantılar iş parçacığı başına birikir ve
+    veritabanının bağlantı sınırını tüketir; bunun yerine havuz kullanılmalıdır.
+    """
+    kaliciler = [alias for alias in connections if baglanti_modu(alias) == "kalici"]
+    if kaliciler:
+        raise ImproperlyConfigured(
+            "ASGI altında kalıcı bağlantılar desteklenmez (%s). "
+            "DB_CONN_MAX_AGE=0 veya DB_POOL=1 kullanın." % ", ".join(kaliciler)
+        )
+
+
+def baglanti_durumu(alias="default"):
+    """
+    Bağlantı ayarlarını ve havuz kullanılıyorsa havuz istatistiklerini döndür.
+
+    Havuz istatistikleri psycopg_pool'un ``get_stats()`` çıktısıdır
+    (``pool_size``, ``pool_available``, ``requests_waiting`` vb.).
+    """
+    baglanti = connections[alias]
+    ayarlar = baglanti.settings_dict
+    durum = {
+        "alias": alias,
+        "vendor": baglanti.vendor,
+        "mod": baglanti_modu(alias),
+        "conn_max_age": ayarlar.get("CONN_MAX_AGE"),
+        "conn_health_checks": ayarlar.get("CONN_HEALTH_CHECKS"),
+    }
+    havuz = getattr(baglanti, "pool", None) if durum["mod"] == "havuz" else None
+    if havuz is not None:
+        durum["havuz"] = havuz.get_stats()
+    return durum
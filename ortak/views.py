@@ -0,0 +1,13 @@
+from django.contrib.admin.views.decorators import staff_member_required
+from django.db import connections
+from django.http import JsonResponse
+
+from .veritabani import baglanti_durumu
+
+
+@staff_member_required
+def veritabani_durumu(request):
+    """Veritabanı bağlantı ve havuz durumunu JSON olarak döndür (yetkililere)."""
+    return JsonResponse(
+        {"veritabanlari": [baglanti_durumu(alias) for alias in connections]}
+    )
@@ -0,0 +1,173 @@
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.urls import reverse
+
+KOPYA_ONEKI = "replica_"
+SABITLEME_CEREZI = "birincil_okuma"
+
+# Bu uygulamaların modelleri, istek birincile sabitlenmiş olsa bile okuma
+# kopyasından okunur (ör. raporlama görünümleri).
+KOPYADAN_OKUNAN_UYGULAMALAR = {"raporlar"}
+
+
+@dataclass(frozen=True)
+class OkumaBaglami:
+    """İstek veya blok boyunca okumaların yapılacağı kopya ve sabitleme durumu."""
+
+    kopya: str | None = None
+    birincile_sabit: bool = False
+
+
+# Bağlam dışındaki okumalar (yönetim komutları, iş parçacıkları) birincilden
+# yapılır; kopya istek başına bir kez seçilir ki aynı istekteki sorgular
+# farklı gecikmedeki kopyalardan tutarsız veri okumasın.
+_okuma_baglami = ContextVar("okuma_baglami", default=OkumaBaglami())
+
+
+def okuma_kopyalari():
+    """Tanımlı okuma kopyası veritabanı adları."""
+    return [alias for alias in settings.DATABASES if alias.startswith(KOPYA_ONEKI)]
+
+
+def kopya_sec():
+    """Rastgele bir okuma kopyası seç; kopya tanımlı değilse None döndür."""
+    kopyalar = okuma_kopyalari()
+    return random.choice(kopyalar) if kopyalar else None
+
+
+@contextmanager
+def _baglam(baglam):
+    belirtec = _okuma_baglami.set(baglam)
+    try:
+        yield
+    finally:
+        _okuma_baglami.reset(belirtec)
+
+
+def birincile_sabitle():
+    """Blok içindeki tüm okumaları birincil veritabanına yönlendir."""
+    return _baglam(replace(_okuma_baglami.get(), birincile_sabit=True))
+
+
+def kopyadan_oku():
+    """
+    İstek dışındaki bir blokta okumaları tek bir okuma kopyasına yönlendir.
+
+    Yönetim komutları ve arka plan işleri varsayılan olarak birincilden
+    okur; kopya gecikmesini tolere edebilen uzun okumalar bu blokla
+    kopyaya alınabilir.
+    """
+    return _baglam(replace(_okuma_baglami.get(), kopya=kopya_sec()))
+
+
+class OkumaKopyasiYonlendirici:
+    """
+    Okumaları isteğin okuma kopyasına, yazmaları birincil veritabanına yönlendirir.
+
+    Okumalar şu durumlarda birincilde kalır: istek veya ``kopyadan_oku``
+    bağlamı dışında çalışılıyorsa, okuma kopyası tanımlı değilse, istek
+    ``birincile_sabitle`` ile sabitlenmişse veya birincilde açık bir işlem
+    varsa (aynı işlem içinde yazılan veri hemen okunabilsin diye).
+    """
+
+    def db_for_read(self, model, **hints):
+        baglam = _okuma_baglami.get()
+        if baglam.kopya is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        if (
+            baglam.birincile_sabit
+            and model._meta.app_label not in KOPYADAN_OKUNAN_UYGULAMALAR
+        ):
+            return DEFAULT_DB_ALIAS
+        return baglam.kopya
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Okuma kopyaları birincilin birebir kopyası olduğundan tüm ilişkilere izin ver
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class OkumaKopyasiMiddleware:
+    """
+    İstek için bir okuma kopyası seçer ve okumaları gerektiğinde birincil
+    veritabanına sabitler.
+
+    Yazma istekleri (GET/HEAD/OPTIONS dışındakiler) ve yönetim paneli
+    birincilden okur. Yazma isteğinden sonra tarayıcıya kısa ömürlü bir
+    çerez bırakılır; çerez geçerli olduğu sürece kullanıcının okumaları da
+    birincilden yapılır, böylece kopya gecikmesi nedeniyle kendi başvurusunu
+    görememe durumu yaşanmaz.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        belirtec = _okuma_baglami.set(self._baglam(request))
+        try:
+            yanit = self.get_response(request)
+        finally:
+            _okuma_baglami.reset(belirtec)
+        return self._cerez_ekle(request, yanit)
+
+    async def __acall__(self, request):
+        belirtec = _okuma_baglami.set(self._baglam(request))
+        try:
+            yanit = await self.get_response(request)
+        finally:
+            _okuma_baglami.reset(belirtec)
+        return self._cerez_ekle(request, yanit)
+
+    def _baglam(self, request):
+        kopya = kopya_sec()
+        return OkumaBaglami(
+            kopya=kopya,
+            birincile_sabit=kopya is not None and self._sabitlenmeli(request),
+        )
+
+    def _sabitlenmeli(self, request):
+        if request.method not in ("GET", "HEAD", "OPTIONS"):
+            return True
+        if request.path.startswith(reverse("admin:index")):
+            return True
+        try:
+            return float(request.COOKIES.get(SABITLEME_CEREZI, 0)) > time.time()
+        except ValueError:
+            return False
+
+    def _cerez_ekle(self, request, yanit):
+        if (
+            request.method in ("GET", "HEAD", "OPTIONS")
+            or yanit.status_code >= 400
+            or not okuma_kopyalari()
+        ):
+            return yanit
+        sure = settings.OKUMA_KOPYASI_SABITLEME_SURESI
+        yanit.set_cookie(
+            SABITLEME_CEREZI,
+            str(int(time.time() + sure)),
+            max_age=sure,
+            httponly=True,
+            samesite="Lax",
+        )
+        return yanit
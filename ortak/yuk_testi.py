@@ -0,0 +1,628 @@
+"""
+Kullanıcı senaryolarını eşzamanlı olarak yeniden oynatan yük testi.
+
+Senaryolar aday (ilanlara göz at, ile göre filtrele, ilanı aç, başvur),
+işveren (yönetim panelinde başvuru ayıklama) ve ziyaretçi (async uç
+noktalarla ilan, coğrafya ve istatistik okuma) yolculuklarıdır. İstekler
+süreç içinde doğrudan ``istihdam.wsgi.application`` veya
+``istihdam.asgi.application`` çağrılarak ya da HTTP üzerinden çalışan bir
+sunucuya gönderilir. Oturumlar veritabanındaki oturum
+deposuna doğrudan yazıldığından HTTP modunda sunucunun aynı veritabanını
+kullanması gerekir. Ölçümler ``ornek_veri_uret`` ile üretilmiş veriyle
+anlamlıdır.
+
+Aday senaryosu hedef veritabanına gerçek başvurular yazar (ilan başvuru
+sayaçları ve değişiklik akışı dahil); ``salt_okunur`` ile başvuru adımı
+atlanır. Her yolculukta yeni bir aday ve adayın henüz başvurmadığı bir ilan
+seçilir, böylece başvuru adımı mükerrer başvuru (409) yolunu değil gerçek
+kayıt yolunu ölçer.
+"""
+
+import asyncio
+import http.client
+import io
+import json
+import os
+import random
+import secrets
+import statistics
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from http.cookies import SimpleCookie
+from importlib import import_module
+from urllib.parse import urlencode, urlsplit
+
+from django.conf import settings
+from django.contrib.auth import (
+    BACKEND_SESSION_KEY,
+    HASH_SESSION_KEY,
+    SESSION_KEY,
+    get_user_model,
+)
+from django.db import connections
+from django.db.models import Q
+from django.urls import reverse
+from django.utils import timezone
+
+from ayarlar.models import Il
+from hesap.models import Firma, Vatandas
+from ilanlar.models import IlanBasvuru, IlanDurumChoices, IsBilgileri
+
+from .ornek_veri import KULLANICI_ONEKI
+
+
+@dataclass
+class Yanit:
+    durum: int
+    govde: bytes
+    basliklar: list
+
+    def json(self):
+        return json.loads(self.govde)
+
+
+class WsgiIstemci:
+    """İstekleri süreç içinde WSGI uygulamasına doğrudan iletir."""
+
+    def __init__(self, uygulama=None, sunucu="localhost"):
+        if uygulama is None:
+            from istihdam.wsgi import application as uygulama
+        self.uygulama = uygulama
+        self.sunucu = sunucu
+
+    def istek(self, yontem, yol, sorgu="", govde=b"", basliklar=None):
+        environ = {
+            "REQUEST_METHOD": yontem,
+            "PATH_INFO": yol,
+            "QUERY_STRING": sorgu,
+            "SERVER_NAME": self.sunucu,
+            "SERVER_PORT": "80",
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "REMOTE_ADDR": "127.0.0.1",
+            "HTTP_HOST": self.sunucu,
+            "CONTENT_LENGTH": str(len(govde)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": "http",
+            "wsgi.input": io.BytesIO(govde),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        for ad, deger in (basliklar or {}).items():
+            anahtar = ad.upper().replace("-", "_")
+            if anahtar != "CONTENT_TYPE":
+                anahtar = f"HTTP_{anahtar}"
+            environ[anahtar] = deger
+
+        durum_satiri = {}
+
+        def start_response(durum, yanit_basliklari, exc_info=None):
+            durum_satiri["durum"] = int(durum.split(" ", 1)[0])
+            durum_satiri["basliklar"] = yanit_basliklari
+
+        parcalar = self.uygulama(environ, start_response)
+        try:
+            icerik = b"".join(parcalar)
+        finally:
+            if hasattr(parcalar, "close"):
+                parcalar.close()
+        return Yanit(durum_satiri["durum"], icerik, durum_satiri["basliklar"])
+
+    def kapat(self):
+        pass
+
+
+class AsgiIstemci:
+    """
+    İstekleri süreç içinde ASGI uygulamasına iletir.
+
+    Tüm sanal kullanıcılar ``dongu`` olay döngüsünü paylaşır; bu tek bir
+    ASGI işçi sürecine karşılık gelir.
+    """
+
+    def __init__(self, dongu, uygulama=None, sunucu="localhost"):
+        if uygulama is None:
+            from istihdam.asgi import application as uygulama
+        self.dongu = dongu
+        self.uygulama = uygulama
+        self.sunucu = sunucu
+
+    def istek(self, yontem, yol, sorgu="", govde=b"", basliklar=None):
+        return asyncio.run_coroutine_threadsafe(
+            self._istek(yontem, yol, sorgu, govde, basliklar or {}), self.dongu
+        ).result()
+
+    async def _istek(self, yontem, yol, sorgu, govde, basliklar):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": yontem,
+            "scheme": "http",
+            "path": yol,
+            "raw_path": yol.encode(),
+            "query_string": sorgu.encode(),
+            "root_path": "",
+            "headers": [
+                (b"host", self.sunucu.encode()),
+                (b"content-length", str(len(govde)).encode()),
+            ]
+            + [
+                (ad.lower().encode("latin-1"), deger.encode("latin-1"))
+                for ad, deger in basliklar.items()
+            ],
+            "client": ("127.0.0.1", 0),
+            "server": (self.sunucu, 80),
+        }
+        bitti = asyncio.Event()
+        govde_okundu = False
+        yanit = {"parcalar": []}
+
+        async def receive():
+            nonlocal govde_okundu
+            if not govde_okundu:
+                govde_okundu = True
+                return {"type": "http.request", "body": govde, "more_body": False}
+            # İstemci yanıt bitene kadar bağlı kalır
+            await bitti.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(mesaj):
+            if mesaj["type"] == "http.response.start":
+                yanit["durum"] = mesaj["status"]
+                yanit["basliklar"] = [
+                    (ad.decode("latin-1"), deger.decode("latin-1"))
+                    for ad, deger in mesaj.get("headers", [])
+                ]
+            elif mesaj["type"] == "http.response.body":
+                yanit["parcalar"].append(mesaj.get("body", b""))
+
+        try:
+            await self.uygulama(scope, receive, send)
+        finally:
+            bitti.set()
+        return Yanit(yanit["durum"], b"".join(yanit["parcalar"]), yanit["basliklar"])
+
+    def kapat(self):
+        pass
+
+
+def olay_dongusu_baslat():
+    """Arka plan iş parçacığında çalışan bir olay döngüsü başlat."""
+    dongu = asyncio.new_event_loop()
+    threading.Thread(target=dongu.run_forever, daemon=True).start()
+    return dongu
+
+
+class HttpIstemci:
+    """İstekleri kalıcı (keep-alive) HTTP bağlantısı üzerinden gönderir."""
+
+    def __init__(self, taban_adres, zaman_asimi=30):
+        adres = urlsplit(taban_adres)
+        self.sinif = (
+            http.client.HTTPSConnection
+            if adres.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self.sunucu = adres.netloc
+        self.onek = adres.path.rstrip("/")
+        self.zaman_asimi = zaman_asimi
+        self.baglanti = None
+
+    def istek(self, yontem, yol, sorgu="", govde=b"", basliklar=None):
+        hedef = self.onek + yol + (f"?{sorgu}" if sorgu else "")
+        for deneme in range(2):
+            if self.baglanti is None:
+                self.baglanti = self.sinif(self.sunucu, timeout=self.zaman_asimi)
+            try:
+                self.baglanti.request(
+                    yontem, hedef, body=govde, headers=basliklar or {}
+                )
+                yanit = self.baglanti.getresponse()
+                return Yanit(yanit.status, yanit.read(), yanit.getheaders())
+            except (http.client.RemoteDisconnected, ConnectionResetError):
+                # Sunucu boştaki kalıcı bağlantıyı kapattıysa bir kez yeniden dene
+                self.kapat()
+                if deneme:
+                    raise
+
+    def kapat(self):
+        if self.baglanti is not None:
+            self.baglanti.close()
+            self.baglanti = None
+
+
+class Tarayici:
+    """Çerezleri ve CSRF belirtecini tutan, tek kullanıcılık istemci."""
+
+    def __init__(self, istemci, oturum_anahtari=None):
+        self.istemci = istemci
+        # CSRF çerezindeki gizli değer başlıkta maskesiz olarak da kabul edilir
+        csrf = secrets.token_hex(16)
+        self.csrf = csrf
+        self.cerezler = {settings.CSRF_COOKIE_NAME: csrf}
+        if oturum_anahtari:
+            self.cerezler[settings.SESSION_COOKIE_NAME] = oturum_anahtari
+
+    def istek(self, yontem, yol, parametreler=None, veri=None):
+        basliklar = {
+            "Cookie": "; ".join(f"{ad}={deger}" for ad, deger in self.cerezler.items())
+        }
+        govde = b""
+        if veri is not None:
+            govde = json.dumps(veri).encode()
+            basliklar["Content-Type"] = "application/json"
+        if yontem not in ("GET", "HEAD", "OPTIONS"):
+            basliklar["X-CSRFToken"] = self.csrf
+        yanit = self.istemci.istek(
+            yontem, yol, urlencode(parametreler or {}), govde, basliklar
+        )
+        for ad, deger in yanit.basliklar:
+            if ad.lower() == "set-cookie":
+                for cerez in SimpleCookie(deger).values():
+                    if cerez["max-age"] == "0":
+                        self.cerezler.pop(cerez.key, None)
+                    else:
+                        self.cerezler[cerez.key] = cerez.value
+        return yanit
+
+
+def oturum_ac(kullanici):
+    """Kullanıcı için oturum kaydı oluştur ve oturum anahtarını döndür."""
+    oturum = import_module(settings.SESSION_ENGINE).SessionStore()
+    oturum[SESSION_KEY] = kullanici._meta.pk.value_to_string(kullanici)
+    oturum[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+    oturum[HASH_SESSION_KEY] = kullanici.get_session_auth_hash()
+    oturum.create()
+    return oturum.session_key
+
+
+@dataclass
+class Ornekler:
+    """Senaryoların seçim yaptığı kayıt kimlikleri."""
+
+    acik_ilanlar: list
+    il_sluglari: list
+    basvurular: list
+    firmalar: list
+    adaylar: list
+    yonetici: object
+    # Adayların başvurduğu ``(kullanıcı kimliği, ilan slug'ı)`` çiftleri
+    basvurulanlar: set = field(default_factory=set)
+
+    @classmethod
+    def topla(cls, adet=500):
+        bugun = timezone.localdate()
+        Kullanici = get_user_model()
+        yonetici = Kullanici.objects.filter(
+            is_superuser=True, is_active=True, is_staff=True
+        ).first()
+        if yonetici is None:
+            yonetici = Kullanici.objects.create_superuser(
+                f"{KULLANICI_ONEKI}yuk_yonetici", password=None
+            )
+        ornekler = cls(
+            acik_ilanlar=list(
+                IsBilgileri.objects.filter(
+                    Q(basvuru_bitis__isnull=True) | Q(basvuru_bitis__gte=bugun),
+                    Q(basvuru_baslangic__isnull=True) | Q(basvuru_baslangic__lte=bugun),
+                    durum=IlanDurumChoices.YAYINDA,
+                ).values_list("slug", "il_id")[:adet]
+            ),
+            il_sluglari=list(
+                Il.objects.filter(slug__isnull=False).values_list("slug", flat=True)
+            ),
+            basvurular=list(
+                IlanBasvuru.objects.filter(durum="beklemede").values_list(
+                    "pk", flat=True
+                )[:adet]
+            ),
+            firmalar=list(Firma.objects.values_list("pk", flat=True)[:adet]),
+            adaylar=list(
+                Kullanici.objects.filter(
+                    username__startswith=KULLANICI_ONEKI,
+                    pk__in=Vatandas.objects.values("kullanici"),
+                    is_active=True,
+                )[:adet]
+            ),
+            yonetici=yonetici,
+        )
+        if not ornekler.acik_ilanlar or not ornekler.adaylar:
+            raise ValueError("Yük testi için örnek veri bulunamadı.")
+        ornekler.basvurulanlar = set(
+            IlanBasvuru.objects.filter(
+                vatandas__kullanici__in=ornekler.adaylar,
+                ilan__slug__in=[slug for slug, _ in ornekler.acik_ilanlar],
+            ).values_list("vatandas__kullanici_id", "ilan__slug")
+        )
+        return ornekler
+
+
+class SanalKullanici:
+    """Senaryoları sırayla çalıştıran, aday ve işveren oturumlu kullanıcı."""
+
+    # Başvurulmamış ilan bulmak için yapılan en fazla rastgele deneme
+    ILAN_DENEMESI = 20
+
+    def __init__(self, istemci, ornekler, olcumler, tohum, salt_okunur=False):
+        self.rng = random.Random(tohum)
+        self.ornekler = ornekler
+        self.olcumler = olcumler
+        self.istemci = istemci
+        self.salt_okunur = salt_okunur
+        self.adaylar = {}
+        self.isveren = Tarayici(istemci, oturum_ac(ornekler.yonetici))
+        self.ziyaretci = Tarayici(istemci)
+
+    def aday_sec(self):
+        """Yolculuk için rastgele bir aday seç; oturumu ilk seçimde açılır."""
+        aday = self.rng.choice(self.ornekler.adaylar)
+        if aday.pk not in self.adaylar:
+            self.adaylar[aday.pk] = Tarayici(self.istemci, oturum_ac(aday))
+        return aday.pk, self.adaylar[aday.pk]
+
+    def ilan_sec(self, aday_kimligi):
+        """Adayın başvurmadığı bir açık ilan seç; bulunamazsa herhangi birini."""
+        for _ in range(self.ILAN_DENEMESI):
+            slug, il = self.rng.choice(self.ornekler.acik_ilanlar)
+            if (aday_kimligi, slug) not in self.ornekler.basvurulanlar:
+                break
+        return slug, il
+
+    def adim(
+        self, ad, tarayici, yontem, yol, parametreler=None, veri=None, beklenen=(200,)
+    ):
+        baslangic = time.perf_counter()
+        try:
+            yanit = tarayici.istek(yontem, yol, parametreler, veri)
+        except Exception as hata:  # noqa: BLE001 - hata olarak raporlanır
+            self.olcumler.kaydet(ad, time.perf_counter() - baslangic, repr(hata))
+            return None
+        hata = None if yanit.durum in beklenen else f"HTTP {yanit.durum}"
+        self.olcumler.kaydet(ad, time.perf_counter() - baslangic, hata)
+        return yanit if hata is None else None
+
+
+def aday_senaryosu(kullanici):
+    """İlanlara göz at, ile göre filtrele, ilanı aç ve başvur."""
+    aday_kimligi, aday = kullanici.aday_sec()
+    slug, il = kullanici.ilan_sec(aday_kimligi)
+    kullanici.adim("ilan_sayfasi", aday, "GET", reverse("ilanlar"))
+    kullanici.adim("ilan_listesi", aday, "GET", "/api/v1/ilanlar/")
+    kullanici.adim("ilan_il_filtresi", aday, "GET", "/api/v1/ilanlar/", {"il": il})
+    kullanici.adim("ilan_detay", aday, "GET", f"/api/v1/ilanlar/{slug}/")
+    sorular = kullanici.adim(
+        "basvuru_formu", aday, "GET", f"/api/v1/ilanlar/{slug}/basvur/"
+    )
+    if sorular is None or kullanici.salt_okunur:
+        return
+    cevaplar = {
+        soru["id"]: (soru["secenekler"] or ["evet"])[0]
+        for soru in sorular.json()["sorular"]
+    }
+    # Tüm ilanlara başvurmuş adayın tekrar başvurusu (409) beklenen bir sonuçtur
+    yanit = kullanici.adim(
+        "basvuru_gonder",
+        aday,
+        "POST",
+        f"/api/v1/ilanlar/{slug}/basvur/",
+        veri={"cevaplar": cevaplar},
+        beklenen=(201, 409),
+    )
+    if yanit is not None:
+        kullanici.ornekler.basvurulanlar.add((aday_kimligi, slug))
+
+
+def isveren_senaryosu(kullanici):
+    """Yönetim panelinde bekleyen başvuruları firmaya göre ayıkla ve incele."""
+    isveren = kullanici.isveren
+    ornekler = kullanici.ornekler
+    liste = reverse("admin:ilanlar_ilanbasvuru_changelist")
+    kullanici.adim(
+        "admin_bekleyen_basvurular",
+        isveren,
+        "GET",
+        liste,
+        {"durum__exact": "beklemede"},
+    )
+    if ornekler.firmalar:
+        kullanici.adim(
+            "admin_firma_basvurulari",
+            isveren,
+            "GET",
+            liste,
+            {"ilan__firma__id__exact": kullanici.rng.choice(ornekler.firmalar)},
+        )
+    if ornekler.basvurular:
+        kullanici.adim(
+            "admin_basvuru_detay",
+            isveren,
+            "GET",
+            reverse(
+                "admin:ilanlar_ilanbasvuru_change",
+                args=[kullanici.rng.choice(ornekler.basvurular)],
+            ),
+        )
+    kullanici.adim(
+        "admin_aday_tarama",
+        isveren,
+        "GET",
+        reverse("admin:hesap_vatandas_changelist"),
+        {"egitim_derecesi": "lisans"},
+    )
+
+
+def ziyaretci_senaryosu(kullanici):
+    """Async uç noktalarla ilanlara göz at, ile göre filtrele, ilçe ve
+    istatistikleri oku."""
+    ziyaretci = kullanici.ziyaretci
+    _, il = kullanici.rng.choice(kullanici.ornekler.acik_ilanlar)
+    kullanici.adim(
+        "asenkron_ilan_listesi", ziyaretci, "GET", reverse("v1:asenkron-ilanlar")
+    )
+    kullanici.adim(
+        "asenkron_ilan_il_filtresi",
+        ziyaretci,
+        "GET",
+        reverse("v1:asenkron-ilanlar"),
+        {"il": il},
+    )
+    kullanici.adim("asenkron_iller", ziyaretci, "GET", reverse("v1:asenkron-iller"))
+    kullanici.adim(
+        "asenkron_ilceler",
+        ziyaretci,
+        "GET",
+        reverse(
+            "v1:asenkron-ilceler",
+            args=[kullanici.rng.choice(kullanici.ornekler.il_sluglari)],
+        ),
+    )
+    kullanici.adim(
+        "asenkron_istatistikler",
+        ziyaretci,
+        "GET",
+        reverse("v1:asenkron-istatistikler"),
+    )
+
+
+SENARYOLAR = {
+    "aday": aday_senaryosu,
+    "isveren": isveren_senaryosu,
+    "ziyaretci": ziyaretci_senaryosu,
+}
+
+
+@dataclass
+class Olcumler:
+    """Adım adına göre süreler ve hatalar; ısınma süresindekiler atılır."""
+
+    olcum_baslangici: float = 0.0
+    sureler: dict = field(default_factory=dict)
+    hatalar: dict = field(default_factory=dict)
+    kilit: threading.Lock = field(default_factory=threading.Lock)
+
+    def kaydet(self, ad, sure, hata=None):
+        if time.perf_counter() < self.olcum_baslangici:
+            return
+        with self.kilit:
+            self.sureler.setdefault(ad, []).append(sure)
+            if hata is not None:
+                self.hatalar.setdefault(ad, {}).setdefault(hata, 0)
+                self.hatalar[ad][hata] += 1
+
+
+def _yuzdelik(sirali, oran):
+    return sirali[min(len(sirali) - 1, int(len(sirali) * oran))]
+
+
+def ozetle(olcumler, sure):
+    """Adım başına ve toplam istek/sn, p50/p95/p99 ve hata oranı."""
+
+    def satir(sureler, hatalar):
+        sirali = sorted(sureler)
+        hata_sayisi = sum(hatalar.values())
+        return {
+            "istek": len(sirali),
+            "istek_sn": round(len(sirali) / sure, 2),
+            "p50_ms": round(statistics.median(sirali) * 1000, 2),
+            "p95_ms": round(_yuzdelik(sirali, 0.95) * 1000, 2),
+            "p99_ms": round(_yuzdelik(sirali, 0.99) * 1000, 2),
+            "hata": hata_sayisi,
+            "hata_orani": round(hata_sayisi / len(sirali), 4),
+            "hatalar": hatalar,
+        }
+
+    adimlar = {
+        ad: satir(sureler, olcumler.hatalar.get(ad, {}))
+        for ad, sureler in olcumler.sureler.items()
+    }
+    tum_hatalar = {}
+    for hatalar in olcumler.hatalar.values():
+        for hata, sayi in hatalar.items():
+            tum_hatalar[hata] = tum_hatalar.get(hata, 0) + sayi
+    toplam = (
+        satir(
+            [sure for sureler in olcumler.sureler.values() for sure in sureler],
+            tum_hatalar,
+        )
+        if adimlar
+        else None
+    )
+    return {"sure_sn": round(sure, 2), "adimlar": adimlar, "toplam": toplam}
+
+
+def _bellek_mb():
+    """Sürecin o anki yerleşik bellek kullanımı; /proc olmayan sistemlerde None."""
+    try:
+        with open("/proc/self/statm") as dosya:
+            sayfa = int(dosya.read().split()[1])
+    except OSError:
+        return None
+    return round(sayfa * os.sysconf("SC_PAGE_SIZE") / 2**20, 1)
+
+
+def calistir(
+    istemci_uret,
+    ornekler,
+    eszamanlilik=8,
+    sure=30,
+    isinma=3,
+    karisim=None,
+    tohum=1,
+    salt_okunur=False,
+):
+    """
+    ``eszamanlilik`` sanal kullanıcıyı ``isinma + sure`` saniye boyunca
+    çalıştır ve ölçümlerin özetini döndür.
+
+    ``istemci_uret`` her sanal kullanıcı için yeni bir istemci döndürür;
+    ``karisim`` senaryo adlarını seçilme ağırlıklarına eşler;
+    ``salt_okunur`` açıksa aday senaryosu başvuru göndermez. Özete
+    süreç içi çalışmalarda kıyaslama için en yüksek bellek kullanımı ve
+    iş parçacığı sayısı da eklenir.
+    """
+    karisim = karisim or {"aday": 4, "isveren": 1}
+    adlar = list(karisim)
+    agirliklar = [karisim[ad] for ad in adlar]
+    olcumler = Olcumler()
+    kullanicilar = [
+        SanalKullanici(
+            istemci_uret(), ornekler, olcumler, f"{tohum}:{sira}", salt_okunur
+        )
+        for sira in range(eszamanlilik)
+    ]
+
+    baslangic = time.perf_counter()
+    olcumler.olcum_baslangici = baslangic + isinma
+    bitis = olcumler.olcum_baslangici + sure
+
+    def dongu(kullanici):
+        try:
+            while time.perf_counter() < bitis:
+                senaryo = kullanici.rng.choices(adlar, agirliklar)[0]
+                SENARYOLAR[senaryo](kullanici)
+        finally:
+            kullanici.istemci.kapat()
+            connections.close_all()
+
+    is_parcaciklari = [
+        threading.Thread(target=dongu, args=(kullanici,)) for kullanici in kullanicilar
+    ]
+    for is_parcacigi in is_parcaciklari:
+        is_parcacigi.start()
+    zirve = {"bellek_mb": _bellek_mb(), "is_parcacigi": threading.active_count()}
+    while any(is_parcacigi.is_alive() for is_parcacigi in is_parcaciklari):
+        time.sleep(0.5)
+        bellek = _bellek_mb()
+        if bellek is not None:
+            zirve["bellek_mb"] = max(zirve["bellek_mb"], bellek)
+        zirve["is_parcacigi"] = max(zirve["is_parcacigi"], threading.active_count())
+    for is_parcacigi in is_parcaciklari:
+        is_parcacigi.join()
+
+    rapor = ozetle(olcumler, time.perf_counter() - olcumler.olcum_baslangici)
+    rapor["zirve"] = zirve
+    return rapor
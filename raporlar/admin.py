@@ -0,0 +1,126 @@
+from django.contrib import admin
+from django.db.models import F, Sum
+from django.utils.translation import gettext_lazy as _
+
+from .gorunumler import destekleniyor_mu, son_yenileme
+from .models import IseAlimHunisi
+
+TOPLAM_ALANLARI = (
+    "yayinlanan_ilan",
+    "basvuru",
+    "mulakat",
+    "ise_alinan",
+    "tamamlanan_ilan",
+    "ise_alim_gun_toplami",
+)
+
+# Özet tablosunda seçilebilecek kırılımlar
+KIRILIMLAR = {
+    "ay": ("ay", _("Ay")),
+    "sektor": ("sektor__ad", _("Sektör")),
+    "il": ("il__ad", _("İl")),
+    "firma": ("firma__ad", _("Firma")),
+}
+
+
+def _oran(pay, payda):
+    return round(100 * pay / payda, 1) if payda else None
+
+
+def _huni_satiri(satir):
+    satir.update(
+        mulakat_orani=_oran(satir["mulakat"], satir["basvuru"]),
+        ise_alim_orani=_oran(satir["ise_alinan"], satir["basvuru"]),
+        ortalama_ise_alim_suresi=(
+            round(satir["ise_alim_gun_toplami"] / satir["tamamlanan_ilan"], 1)
+            if satir["tamamlanan_ilan"]
+            else None
+        ),
+    )
+    return satir
+
+
+@admin.register(IseAlimHunisi)
+class IseAlimHunisiAdmin(admin.ModelAdmin):
+    """
+    İşe alım hunisi panosu.
+
+    Filtrelenen satırların toplamları ve seçilen kırılıma göre özet tablo,
+    materialized view üzerinden hesaplanır.
+    """
+
+    change_list_template = "admin/raporlar/isealimhunisi/change_list.html"
+    date_hierarchy = "ay"
+    list_display = (
+        "ay",
+        "sektor",
+        "il",
+        "firma",
+        "yayinlanan_ilan",
+        "basvuru",
+        "mulakat",
+        "ise_alinan",
+        "ortalama_ise_alim_suresi",
+    )
+    list_filter = ("ay", "sektor", "il")
+    list_select_related = ("sektor", "il", "firma")
+    search_fields = ("firma__ad",)
+    show_full_result_count = False
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    @admin.display(description=_("Ort. İşe Alım Süresi (gün)"))
+    def ortalama_ise_alim_suresi(self, obj):
+        return obj.ortalama_ise_alim_suresi
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        return queryset if destekleniyor_mu() else queryset.none()
+
+    def changelist_view(self, request, extra_context=None):
+        if not destekleniyor_mu():
+            self.message_user(
+                request,
+                _("Rapor görünümleri yalnızca PostgreSQL'de desteklenir."),
+                level="warning",
+            )
+            return super().changelist_view(request, extra_context)
+
+        # Kırılım parametresi changelist filtrelerine karışmasın
+        istek = request.GET.copy()
+        kirilim = istek.pop("kirilim", ["ay"])[-1]
+        if kirilim not in KIRILIMLAR:
+            kirilim = "ay"
+        request.GET = istek
+
+        yanit = super().changelist_view(request, extra_context)
+        try:
+            queryset = yanit.context_data["cl"].queryset
+        except (AttributeError, KeyError):
+            return yanit
+
+        alan, baslik = KIRILIMLAR[kirilim]
+        toplamlar = {ad: Sum(ad, default=0) for ad in TOPLAM_ALANLARI}
+        ozet = (
+            queryset.order_by()
+            .values(etiket=F(alan))
+            .annotate(**toplamlar)
+            .order_by("etiket")[:100]
+        )
+        yanit.context_data.update(
+            genel_toplam=_huni_satiri(queryset.aggregate(**toplamlar)),
+            kirilim=kirilim,
+            filtre_sorgusu=istek.urlencode(),
+            kirilimlar={ad: etiket for ad, (_alan, etiket) in KIRILIMLAR.items()},
+            ozet_basligi=baslik,
+            ozet_satirlari=[_huni_satiri(satir) for satir in ozet],
+            son_yenileme=son_yenileme(),
+        )
+        return yanit
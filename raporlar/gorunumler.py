@@ -0,0 +1,42 @@
+import time
+
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+
+# Yenilenecek materialized view'lar (bağımlılık sırasına göre)
+GORUNUMLER = ["raporlar_isealimhunisi"]
+
+SON_YENILEME_ANAHTARI = "raporlar:son_yenileme"
+
+
+def destekleniyor_mu():
+    """Materialized view'lar yalnızca PostgreSQL'de oluşturulur."""
+    return connection.vendor == "postgresql"
+
+
+def gorunumleri_yenile(eszamanli=True):
+    """
+    Rapor görünümlerini yenile ve her biri için geçen süreyi döndür.
+
+    Eşzamanlı yenileme, görünüm yeniden hesaplanırken okumaları engellemez;
+    bunun için her görünümde benzersiz bir indeks bulunur.
+    """
+    sureler = {}
+    with connection.cursor() as cursor:
+        for gorunum in GORUNUMLER:
+            baslangic = time.monotonic()
+            cursor.execute(
+                "REFRESH MATERIALIZED VIEW {}{}".format(
+                    "CONCURRENTLY " if eszamanli else "",
+                    connection.ops.quote_name(gorunum),
+                )
+            )
+            sureler[gorunum] = time.monotonic() - baslangic
+    cache.set(SON_YENILEME_ANAHTARI, timezone.now(), None)
+    return sureler
+
+
+def son_yenileme():
+    """Görünümlerin en son yenilendiği zaman; bilinmiyorsa None."""
+    return cache.get(SON_YENILEME_ANAHTARI)
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from raporlar.gorunumler import destekleniyor_mu, gorunumleri_yenile
+
+
+class Command(BaseCommand):
+    help = (
+        "Raporlama materialized view'larını yeniler. Zamanlanmış görev olarak "
+        "(ör. 15 dakikada bir) çalıştırılmalıdır; yenileme eşzamanlı yapıldığı "
+        "için yönetim paneli okumaları beklemez."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--kilitli",
+            action="store_true",
+            help="Eşzamanlı olmayan (okumaları kilitleyen) ancak daha hızlı yenileme",
+        )
+
+    def handle(self, *args, **options):
+        if not destekleniyor_mu():
+            raise CommandError("Rapor görünümleri yalnızca PostgreSQL'de desteklenir.")
+
+        for gorunum, sure in gorunumleri_yenile(
+            eszamanli=not options["kilitli"]
+        ).items():
+            self.stdout.write(f"{gorunum}: {sure:.2f} sn")
+        self.stdout.write(self.style.SUCCESS("Rapor görünümleri yenilendi."))
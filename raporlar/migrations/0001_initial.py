@@ -0,0 +1,154 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+HUNI_OLUSTUR = """
+CREATE MATERIALIZED VIEW raporlar_isealimhunisi AS
+WITH basvurular AS (
+    SELECT
+        ilan_id,
+        COUNT(*) AS basvuru,
+        COUNT(*) FILTER (WHERE durum = 'musakat') AS mulakat
+    FROM ilanlar_ilanbasvuru
+    GROUP BY ilan_id
+),
+ilanlar AS (
+    SELECT
+        i.id,
+        i.sektor_id,
+        i.il_id,
+        i.firma_id,
+        COALESCE(i.yayinlanma_tarihi, i.olusturma_tarihi) AS yayin_tarihi
+    FROM ilanlar_isbilgileri i
+    WHERE i.durum <> 'taslak'
+)
+SELECT
+    concat_ws(
+        ':',
+        to_char(date_trunc('month', i.yayin_tarihi), 'YYYY-MM'),
+        COALESCE(i.sektor_id::text, '-'),
+        COALESCE(i.il_id::text, '-'),
+        i.firma_id::text
+    ) AS anahtar,
+    date_trunc('month', i.yayin_tarihi)::date AS ay,
+    i.sektor_id,
+    i.il_id,
+    i.firma_id,
+    COUNT(*) AS yayinlanan_ilan,
+    COALESCE(SUM(b.basvuru), 0) AS basvuru,
+    COALESCE(SUM(b.mulakat), 0) AS mulakat,
+    COALESCE(SUM(s.ise_alinan), 0) AS ise_alinan,
+    COUNT(*) FILTER (
+        WHERE s.tamamlandi AND s.tamamlanma_tarihi IS NOT NULL
+    ) AS tamamlanan_ilan,
+    COALESCE(
+        SUM(
+            EXTRACT(EPOCH FROM s.tamamlanma_tarihi - i.yayin_tarihi) / 86400.0
+        ) FILTER (WHERE s.tamamlandi AND s.tamamlanma_tarihi IS NOT NULL),
+        0
+    )::double precision AS ise_alim_gun_toplami
+FROM ilanlar i
+LEFT JOIN basvurular b ON b.ilan_id = i.id
+LEFT JOIN ilanlar_ilansonuc s ON s.ilan_id = i.id
+GROUP BY 1, 2, 3, 4, 5;
+
+CREATE UNIQUE INDEX raporlar_isealimhunisi_anahtar ON raporlar_isealimhunisi (anahtar);
+CREATE INDEX raporlar_isealimhunisi_ay ON raporlar_isealimhunisi (ay);
+"""
+
+HUNI_KALDIR = "DROP MATERIALIZED VIEW IF EXISTS raporlar_isealimhunisi;"
+
+
+def _postgresql_ise(sql):
+    # Materialized view yalnızca PostgreSQL'de oluşturulur; diğer
+    # veritabanlarında rapor paneli kullanılamaz.
+    def calistir(apps, schema_editor):
+        if schema_editor.connection.vendor == "postgresql":
+            schema_editor.execute(sql)
+
+    return calistir
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("ayarlar", "0001_initial"),
+        ("hesap", "0006_alter_firma_logo_alter_sertifika_sertifika_dosya_and_more"),
+        ("ilanlar", "0005_ilandegisiklik"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IseAlimHunisi",
+            fields=[
+                ("anahtar", models.TextField(primary_key=True, serialize=False)),
+                ("ay", models.DateField(verbose_name="Ay")),
+                (
+                    "sektor",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="ayarlar.sektor",
+                        verbose_name="Sektör",
+                    ),
+                ),
+                (
+                    "il",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="ayarlar.il",
+                        verbose_name="İl",
+                    ),
+                ),
+                (
+                    "firma",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="hesap.firma",
+                        verbose_name="Firma",
+                    ),
+                ),
+                (
+                    "yayinlanan_ilan",
+                    models.PositiveIntegerField(verbose_name="Yayınlanan İlan"),
+                ),
+                ("basvuru", models.PositiveIntegerField(verbose_name="Başvuru")),
+                (
+                    "mulakat",
+                    models.PositiveIntegerField(verbose_name="Mülakata Çağrılan"),
+                ),
+                ("ise_alinan", models.PositiveIntegerField(verbose_name="İşe Alınan")),
+                (
+                    "tamamlanan_ilan",
+                    models.PositiveIntegerField(verbose_name="Tamamlanan İlan"),
+                ),
+                (
+                    "ise_alim_gun_toplami",
+                    models.FloatField(
+                        help_text="Tamamlanan ilanların yayından tamamlanmaya kadar geçen gün toplamı",
+                        verbose_name="İşe Alım Süresi Toplamı (gün)",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "İşe Alım Hunisi",
+                "verbose_name_plural": "İşe Alım Hunisi",
+                "db_table": "raporlar_isealimhunisi",
+                "ordering": ["-ay", "firma"],
+                "managed": False,
+            },
+        ),
+        migrations.RunPython(
+            _postgresql_ise(HUNI_OLUSTUR), _postgresql_ise(HUNI_KALDIR)
+        ),
+    ]
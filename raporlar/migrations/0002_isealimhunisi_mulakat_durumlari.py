@@ -0,0 +1,93 @@
+# Generated by Django 5.2.18 on 2026-10-19 21:30
+
+from django.db import migrations
+
+from ilanlar.models import MULAKAT_DURUMLARI
+
+# Mülakat sayısı, ilan sonuçlarıyla aynı durum tanımından hesaplanır.
+# Tanım değişirse görünüm yeni bir göçle yeniden oluşturulmalıdır.
+HUNI_OLUSTUR = """
+CREATE MATERIALIZED VIEW raporlar_isealimhunisi AS
+WITH basvurular AS (
+    SELECT
+        ilan_id,
+        COUNT(*) AS basvuru,
+        COUNT(*) FILTER (WHERE durum IN (%s)) AS mulakat
+    FROM ilanlar_ilanbasvuru
+    GROUP BY ilan_id
+),
+ilanlar AS (
+    SELECT
+        i.id,
+        i.sektor_id,
+        i.il_id,
+        i.firma_id,
+        COALESCE(i.yayinlanma_tarihi, i.olusturma_tarihi) AS yayin_tarihi
+    FROM ilanlar_isbilgileri i
+    WHERE i.durum <> 'taslak'
+)
+SELECT
+    concat_ws(
+        ':',
+        to_char(date_trunc('month', i.yayin_tarihi), 'YYYY-MM'),
+        COALESCE(i.sektor_id::text, '-'),
+        COALESCE(i.il_id::text, '-'),
+        i.firma_id::text
+    ) AS anahtar,
+    date_trunc('month', i.yayin_tarihi)::date AS ay,
+    i.sektor_id,
+    i.il_id,
+    i.firma_id,
+    COUNT(*) AS yayinlanan_ilan,
+    COALESCE(SUM(b.basvuru), 0) AS basvuru,
+    COALESCE(SUM(b.mulakat), 0) AS mulakat,
+    COALESCE(SUM(s.ise_alinan), 0) AS ise_alinan,
+    COUNT(*) FILTER (
+        WHERE s.tamamlandi AND s.tamamlanma_tarihi IS NOT NULL
+    ) AS tamamlanan_ilan,
+    COALESCE(
+        SUM(
+            EXTRACT(EPOCH FROM s.tamamlanma_tarihi - i.yayin_tarihi) / 86400.0
+        ) FILTER (WHERE s.tamamlandi AND s.tamamlanma_tarihi IS NOT NULL),
+        0
+    )::double precision AS ise_alim_gun_toplami
+FROM ilanlar i
+LEFT JOIN basvurular b ON b.ilan_id = i.id
+LEFT JOIN ilanlar_ilansonuc s ON s.ilan_id = i.id
+GROUP BY 1, 2, 3, 4, 5;
+
+CREATE UNIQUE INDEX raporlar_isealimhunisi_anahtar ON raporlar_isealimhunisi (anahtar);
+CREATE INDEX raporlar_isealimhunisi_ay ON raporlar_isealimhunisi (ay);
+"""
+
+
+HUNI_KALDIR = "DROP MATERIALIZED VIEW IF EXISTS raporlar_isealimhunisi;"
+
+
+def _durumlar(durumlar):
+    return ", ".join(f"'{durum}'" for durum in durumlar)
+
+
+def _huniyi_yeniden_olustur(durumlar):
+    # Materialized view yalnızca PostgreSQL'de oluşturulur
+    def calistir(apps, schema_editor):
+        if schema_editor.connection.vendor == "postgresql":
+            schema_editor.execute(HUNI_KALDIR)
+            schema_editor.execute(HUNI_OLUSTUR % _durumlar(durumlar))
+
+    return calistir
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("raporlar", "0001_initial"),
+        ("ilanlar", "0011_anahtar_kelime_arama_anahtari"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _huniyi_yeniden_olustur(MULAKAT_DURUMLARI),
+            _huniyi_yeniden_olustur(["musakat"]),
+        ),
+    ]
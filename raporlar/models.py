@@ -0,0 +1,71 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from ayarlar.models import Il, Sektor
+from hesap.models import Firma
+
+
+class IseAlimHunisi(models.Model):
+    """
+    Sektör, il, firma ve ay bazında işe alım hunisi özeti.
+
+    ``raporlar_isealimhunisi`` materialized view'ını okuyan, veritabanında
+    yönetilmeyen model. Görünüm ``raporlari_yenile`` komutuyla eşzamanlı
+    (okumaları engellemeden) yenilenir; raporlar canlı başvuru tablosunu
+    hiç taramaz. İlanlar yayınlandıkları aya göre gruplanır, başvuru ve
+    işe alım sayıları ilanın yayın ayına yazılır.
+    """
+
+    anahtar = models.TextField(primary_key=True)
+    ay = models.DateField(_("Ay"))
+    sektor = models.ForeignKey(
+        Sektor,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+        null=True,
+        verbose_name=_("Sektör"),
+    )
+    il = models.ForeignKey(
+        Il,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+        null=True,
+        verbose_name=_("İl"),
+    )
+    firma = models.ForeignKey(
+        Firma,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+        verbose_name=_("Firma"),
+    )
+    yayinlanan_ilan = models.PositiveIntegerField(_("Yayınlanan İlan"))
+    basvuru = models.PositiveIntegerField(_("Başvuru"))
+    mulakat = models.PositiveIntegerField(_("Mülakata Çağrılan"))
+    ise_alinan = models.PositiveIntegerField(_("İşe Alınan"))
+    tamamlanan_ilan = models.PositiveIntegerField(_("Tamamlanan İlan"))
+    ise_alim_gun_toplami = models.FloatField(
+        _("İşe Alım Süresi Toplamı (gün)"),
+        help_text=_(
+            "Tamamlanan ilanların yayından tamamlanmaya kadar geçen gün toplamı"
+        ),
+    )
+
+    class Meta:
+        managed = False
+        db_table = "raporlar_isealimhunisi"
+        verbose_name = _("İşe Alım Hunisi")
+        verbose_name_plural = _("İşe Alım Hunisi")
+        ordering = ["-ay", "firma"]
+
+    def __str__(self):
+        return f"{self.ay:%Y-%m} / {self.anahtar}"
+
+    @property
+    def ortalama_ise_alim_suresi(self):
+        """Tamamlanan ilanlarda ortalama işe alım süresi (gün)."""
+        if not self.tamamlanan_ilan:
+            return None
+        return round(self.ise_alim_gun_toplami / self.tamamlanan_ilan, 1)